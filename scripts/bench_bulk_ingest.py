@@ -0,0 +1,55 @@
+"""
+Benchmark: bulk ingestion (process_chat_bulk, chunked executemany) vs one process_chat per conversation.
+Runs in-process against a throwaway DB on one core; no server needed.
+  python scripts/bench_bulk_ingest.py [N]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.registry.store as store
+from src.ingestion.payloads import IncomingChatPayload
+from src.ingestion.pipeline import process_chat, process_chat_bulk
+from src.ingestion.router import BULK_CHUNK_SIZE
+from src.registry.connection import close_pool
+
+TURNS = [
+    {"speaker_id": "agent", "text": "Hello! This is Mira from XYZ Animations. How may I help you?"},
+    {"speaker_id": "user", "text": "Hi,   I need a quote for a 2-minute   animated ad."},
+    {"speaker_id": "agent", "text": "Sure. May I know your name?"},
+    {"speaker_id": "user", "text": "My name is Arjun, calling from Pune."},
+]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "bench.db"
+    store.init_db()
+    raw = [{"turns": TURNS, "conversation_id": f"bulk_{i}"} for i in range(n)]
+
+    t0 = time.perf_counter()
+    for i in range(0, n, BULK_CHUNK_SIZE):
+        batch = [IncomingChatPayload.model_validate(r) for r in raw[i : i + BULK_CHUNK_SIZE]]
+        process_chat_bulk(batch)
+    t_bulk = time.perf_counter() - t0
+
+    single_n = min(n, 1000)
+    t0 = time.perf_counter()
+    for r in raw[:single_n]:
+        process_chat(IncomingChatPayload.model_validate({**r, "conversation_id": "one_" + r["conversation_id"]}))
+    t_single = time.perf_counter() - t0
+
+    with store._conn() as c:
+        stored = c.execute("SELECT COUNT(*) FROM conversations WHERE conversation_id LIKE 'bulk_%'").fetchone()[0]
+    close_pool()
+    assert stored == n, f"expected {n} rows, found {stored}"
+    print(f"bulk   : {n / t_bulk:10,.0f} conversations/s ({n} in chunks of {BULK_CHUNK_SIZE})")
+    print(f"single : {single_n / t_single:10,.0f} conversations/s ({single_n}, one commit each)")
+
+
+if __name__ == "__main__":
+    main()
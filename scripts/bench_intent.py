@@ -0,0 +1,100 @@
+"""
+Benchmark + regression check: compiled intent matcher vs the original per-pattern re.search scorer.
+Asserts identical detect_intent output on the corpus, then prints per-message latency.
+  python scripts/bench_intent.py [ROUNDS]
+"""
+import re
+import sys
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.nlp import intent
+from src.nlp.analysis import MessageAnalysis
+from src.nlp.intent import INTENT_SIGNALS, detect_intent
+
+CORPUS = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "How much will it cost to make a 3D short film?",
+    "What services do you offer?",
+    "whhhat do you offer",
+    "do you do 2d or 3d animation",
+    "i2d or i3d?",
+    "Tell me about your company",
+    "I'm not happy with previous delivery, there was a delay in delivery and a quality issue.",
+    "I want a refund, this is not what I expected",
+    "I have an idea, you should add a live preview. Just feedback.",
+    "Are you hiring? Any internship or job opening?",
+    "hello", "hey there, good morning", "thanks, bye",
+    "We need a budget for an explainer series, can you send a quote or estimate?",
+    "Wrong colours in the ad, I am disappointed",
+    "",
+    "   ",
+    "ok",
+    "Hellooo!!! Need animation asap",
+    "What is your process for a Pixar style 3D film?",
+]
+CORPUS.append(" ".join(CORPUS))  # long transcript-sized input
+
+
+def _legacy_normalize(text: str) -> str:
+    t = text.lower().strip()
+    if not t:
+        return t
+    t = re.sub(r"(.)\1+", r"\1", t)
+    t = re.sub(r"\bi2d\b", "i 2d", t)
+    t = re.sub(r"\bi3d\b", "i 3d", t)
+    return t
+
+
+def legacy_score(text: str) -> list[tuple[str, float]]:
+    """The scorer as it was before the compiled table (reference output)."""
+    if isinstance(text, MessageAnalysis):  # detect_intent passes its analysis through
+        text = text.text
+    text_lower = text.lower()
+    text_norm = _legacy_normalize(text)
+    scores = []
+    for name, patterns in INTENT_SIGNALS.items():
+        count = sum(1 for p in patterns if re.search(p, text_lower) or re.search(p, text_norm))
+        scores.append((name, min(1.0, count / 3.0) if count else 0.0))
+    return scores
+
+
+def _per_message_us(fn, texts: list[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for t in texts:
+            fn(t)
+    return (time.perf_counter() - start) / (rounds * len(texts)) * 1e6
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    compiled = intent._score_intent
+    mismatches = []
+    for text in CORPUS:
+        if legacy_score(text) != compiled(text):
+            mismatches.append(text)
+            continue
+        intent._score_intent = legacy_score
+        try:
+            expected = detect_intent(text)
+        finally:
+            intent._score_intent = compiled
+        if detect_intent(text) != expected:
+            mismatches.append(text)
+    assert not mismatches, f"Compiled matcher differs from legacy on: {mismatches}"
+    print(f"Regression: {len(CORPUS)} messages, identical intent output.")
+
+    short, long_ = CORPUS[:-1], CORPUS[-1:]
+    for label, texts in (("short", short), ("long", long_)):
+        r = rounds if label == "short" else max(1, rounds // 10)
+        before = _per_message_us(legacy_score, texts, r)
+        after = _per_message_us(compiled, texts, r)
+        print(f"{label:5s} messages: legacy {before:8.1f} µs  compiled {after:8.1f} µs  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
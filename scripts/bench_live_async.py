@@ -0,0 +1,116 @@
+"""
+Async LLM path check + benchmark. A slow LangChain chat model (fixed latency) stands in for the LLM.
+Runs a burst of LLM turns through aturn() (chat.ainvoke + timeout + concurrency limit) and measures
+the burst's wall time against the serial model time, and how long mic-check replies (no LLM) wait
+meanwhile compared with an idle server. Asserts the timeout fallback to rule replies and that
+cancelling a turn leaves its session unchanged.
+  python scripts/bench_live_async.py [CONCURRENT_LLM_TURNS] [LLM_LATENCY_S]
+"""
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.live import llm_chat, routing, session
+from src.live.llm_gateway import LLMGateway, set_llm_gateway
+from src.live.reply_cache import ReplyCache, set_reply_cache
+from src.live.session_store import LiveSessionStore, set_session_store
+from src.registry import store
+
+
+class SlowChat(BaseChatModel):
+    delay: float = 0.5
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-fake"
+
+    def _result(self, messages) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f"Sure — {messages[-1].content}"))])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.delay)
+        return self._result(messages)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.delay)
+        return self._result(messages)
+
+
+async def _burst(run_turn, llm_turns: int, mic_turns: int) -> tuple[list, list[float], float]:
+    llm_ids = [session.start_session()[0] for _ in range(llm_turns)]
+    mic_ids = [session.start_session()[0] for _ in range(mic_turns)]
+
+    async def timed(sid, text):
+        start = time.perf_counter()
+        out = await run_turn(sid, text)
+        return out, time.perf_counter() - start
+
+    start = time.perf_counter()
+    llm = [asyncio.ensure_future(run_turn(sid, f"tell me about 2d animation {i}")) for i, sid in enumerate(llm_ids)]
+    await asyncio.sleep(0.05)
+    mic = await asyncio.gather(*(timed(sid, "can you hear me?") for sid in mic_ids))
+    replies = await asyncio.gather(*llm)
+    wall = time.perf_counter() - start
+    return [r[0] for r in replies] + [m[0][0] for m in mic], [m[1] for m in mic], wall
+
+
+async def _checks(delay: float) -> None:
+    sid = session.start_session()[0]
+    # timeout → rule-based reply, same as with no LLM at all
+    llm_chat.LLM_TIMEOUT_S = delay / 5
+    timed_out = await session.aturn(sid, "hi")
+    llm_chat.LLM_TIMEOUT_S = 20
+    llm_chat._chat, llm_chat._llm_available = None, False
+    ref_sid = session.start_session()[0]
+    assert timed_out[0] == (await session.aturn(ref_sid, "hi"))[0]
+    llm_chat._chat, llm_chat._llm_available = SlowChat(delay=delay), True
+    # cancel mid-LLM: session unchanged, lock released
+    before = session.get_session(sid)["turn_index"]
+    task = asyncio.ensure_future(session.aturn(sid, "what do you do?"))
+    await asyncio.sleep(delay / 4)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    assert session.get_session(sid)["turn_index"] == before
+    assert (await session.aturn(sid, "what do you do?"))[0] == "Sure — what do you do?"
+    print("Checks: timeout falls back to rule reply; cancelled turn leaves session unchanged and unlocked.")
+
+
+def main():
+    set_reply_cache(ReplyCache(max_entries=0))  # every LLM turn pays model latency
+    routing.RULE_FIRST = False  # measure the LLM path, not rule-first routing
+    llm_turns = int(sys.argv[1]) if len(sys.argv) > 1 else 80
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "live.db"
+    store.init_db()
+    set_session_store(LiveSessionStore(None))
+    llm_chat._chat, llm_chat._llm_available = SlowChat(delay=delay), True
+    set_llm_gateway(LLMGateway(max_concurrency=llm_turns))  # compare latency hiding, not the cap
+
+    _, idle_mic, _ = asyncio.run(_burst(session.aturn, 0, 10))
+    replies, busy_mic, wall = asyncio.run(_burst(session.aturn, llm_turns, 10))
+    assert all(r.startswith("Sure — tell me about 2d animation") for r in replies[:llm_turns])
+    assert wall < llm_turns * delay
+    assert statistics.median(busy_mic) < delay, busy_mic  # mic checks never wait on the model
+    print(f"Regression: {llm_turns} LLM + 10 mic-check turns; model replies, mic checks not held up.")
+    asyncio.run(_checks(delay))
+
+    print(f"{llm_turns} LLM turns @ {delay:.2f}s + 10 mic checks:")
+    print(f"  burst wall {wall:6.2f}s (serial model time {llm_turns * delay:6.2f}s)")
+    print(f"  mic-check median  idle {statistics.median(idle_mic) * 1e3:7.1f} ms  during burst {statistics.median(busy_mic) * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
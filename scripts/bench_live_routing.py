@@ -0,0 +1,113 @@
+"""
+Rule-first routing check + benchmark (src/live/routing.py). A LangChain chat model with fixed
+latency stands in for the LLM. Asserts the expected route for typical messages (greeting, FAQ,
+complaint, slot answers vs ambiguous chitchat), that rule-routed replies are exactly the rule
+path's reply, and the per-route counters; then replays scripted calls LLM-first (old order) and
+rule-first, printing per-turn latency and the fraction of turns that reached the LLM.
+  python scripts/bench_live_routing.py [LLM_LATENCY_S]
+"""
+import asyncio
+import copy
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.live import llm_chat, routing, session
+from src.live.reply_cache import ReplyCache, set_reply_cache
+from src.live.session_store import LiveSessionStore, get_session_store, set_session_store
+from src.nlp.analysis import analyze
+from src.registry import store
+
+CALLS = [
+    ["hi", "what services do you offer?", "I want a 2 minute 3d promo video", "my name is Priya", "ok thanks"],
+    ["hello there", "do you do 2D or 3D?", "how much does it cost", "tell me a joke", "bye"],
+    ["I have a complaint about the delivery", "it was late by two weeks", "my name is Ravi"],
+    ["are you hiring animators?", "I have 3 years of experience", "can you hear me?", "what's the weather like"],
+]
+EXPECTED = {
+    "hi": routing.GREETING,
+    "what services do you offer?": routing.FAQ,
+    "do you do 2D or 3D?": routing.FAQ,
+    "I have a complaint about the delivery": routing.LLM,  # sales session (default intent): ambiguous
+    "I want a 2 minute 3d promo video": routing.SLOTS,
+    "my name is Priya": routing.LLM,  # no intent signal: ambiguous
+    "tell me a joke": routing.LLM,
+}
+
+
+class SlowChat(BaseChatModel):
+    delay: float = 0.3
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f"Sure — {messages[-1].content}"))])
+
+
+def _checks() -> None:
+    sid = session.start_session()[0]
+    data = get_session_store().get(sid)
+    for text, expected in EXPECTED.items():
+        msg = analyze(text)
+        route = routing.route_turn(data, msg)
+        assert route.name == expected, (text, route.name, expected)
+        if route.name != routing.LLM:  # reused intent, state and question → same reply as the plain rule path
+            a, b = copy.deepcopy(data), copy.deepcopy(data)
+            (ra, _, ia), (rb, _, ib) = session._rule_turn(sid, a, msg, text, route), session._rule_turn(sid, b, msg, text)
+            assert (ra, ia, a["history"]) == (rb, ib, b["history"]), text
+    complaint = {**data, "state": data["state"].model_copy(update={"intent": "complaint_issue"})}
+    assert routing.route_turn(complaint, analyze("I have a complaint about the delivery")).name == routing.COMPLAINT
+    routing.RULE_FIRST = False
+    assert all(routing.route_turn(data, analyze(t)).name == routing.LLM for t in EXPECTED)
+    routing.RULE_FIRST = True
+
+
+def _replay() -> tuple[list[float], dict]:
+    routing.get_route_counters().reset()
+    latencies = []
+
+    async def calls() -> None:
+        for messages in CALLS:
+            sid = session.start_session()[0]
+            for text in messages:
+                start = time.perf_counter()
+                await session.aturn(sid, text)
+                latencies.append(time.perf_counter() - start)
+
+    asyncio.run(calls())
+    return latencies, routing.get_route_counters().stats()
+
+
+def main():
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else 0.3
+    set_reply_cache(ReplyCache(max_entries=0))  # every LLM turn pays model latency
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "live.db"
+    store.init_db()
+    set_session_store(LiveSessionStore(None))
+    llm_chat._chat, llm_chat._llm_available = SlowChat(delay=delay), True
+    _checks()
+    print(f"Regression: {len(EXPECTED)} messages routed as expected; rule routes reply exactly as the rule path.")
+
+    for label, rule_first in (("LLM first", False), ("rule first", True)):
+        routing.RULE_FIRST = rule_first
+        lat, stats = _replay()
+        assert stats["turns"] == len(lat)
+        lat.sort()
+        print(f"{label:10s} turns {len(lat):3d}  reached LLM {stats['reached_llm']:3d} ({stats['llm_fraction']:4.0%})  "
+              f"median {lat[len(lat) // 2] * 1000:7.1f} ms  mean {sum(lat) / len(lat) * 1000:7.1f} ms")
+        print(f"           routes {stats['routes']}")
+
+
+if __name__ == "__main__":
+    main()
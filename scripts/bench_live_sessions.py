@@ -0,0 +1,82 @@
+"""
+Live session store check + benchmark: runs scripted conversations through aturn() with
+(a) memory-only sessions (the old module dict, unbounded), (b) LRU memory tier + SQLite
+write-behind, (c) write-through, (d) shared mode (lease + versioned write-through, the default). Asserts every session reloads from SQLite after a "restart"
+with the same state, history and turn_index, and that the memory caps hold; prints per-turn latency.
+  python scripts/bench_live_sessions.py [SESSIONS]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.live import session
+from src.live.session_store import LiveSessionStore, SQLiteSessionBackend, set_session_store
+from src.registry import store
+
+MESSAGES = [
+    "hi",
+    "we need a 3d promo video of 2 minutes for youtube",
+    "My name is Ravi",
+    "India",
+    "what is your process",
+    "budget is around 50k dollars",
+]
+
+
+def _run(sessions: int) -> tuple[list[str], float]:
+    ids = [session.start_session()[0] for _ in range(sessions)]
+
+    async def turns() -> None:
+        for text in MESSAGES:
+            for sid in ids:
+                await session.aturn(sid, text)
+
+    start = time.perf_counter()
+    asyncio.run(turns())
+    return ids, (time.perf_counter() - start) / (sessions * len(MESSAGES)) * 1e6
+
+
+def _snapshot(sid: str) -> tuple:
+    data = session.get_session(sid)
+    return data["state"].model_dump(), data["history"], data["turn_index"]
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "live.db"
+    store.init_db()
+
+    set_session_store(LiveSessionStore(None))
+    _, memory_us = _run(sessions)
+
+    set_session_store(LiveSessionStore(SQLiteSessionBackend(), shared=False, flush_interval_s=0))
+    _, through_us = _run(sessions)
+
+    set_session_store(LiveSessionStore(SQLiteSessionBackend(), shared=True))
+    _, shared_us = _run(sessions)
+
+    capped = LiveSessionStore(
+        SQLiteSessionBackend(), shared=False, max_sessions=sessions // 4, history_max=6, flush_interval_s=0.05
+    )
+    set_session_store(capped)
+    ids, behind_us = _run(sessions)
+    assert len(capped) <= sessions // 4
+    expected = {sid: _snapshot(sid) for sid in ids}  # evicted sessions reload from SQLite
+    assert all(len(h) <= 6 for _, h, _ in expected.values())
+    set_session_store(LiveSessionStore(SQLiteSessionBackend()))  # restart: flushes and drops the old tier
+    assert {sid: _snapshot(sid) for sid in ids} == expected
+    print(f"Regression: {sessions} sessions reload from SQLite after restart/eviction (state, history, turn_index).")
+
+    print(f"memory only (unbounded)   {memory_us:7.0f} µs per turn")
+    print(f"SQLite write-through      {through_us:7.0f} µs per turn")
+    print(f"shared (lease + version)  {shared_us:7.0f} µs per turn")
+    print(f"LRU + SQLite write-behind {behind_us:7.0f} µs per turn  (cap {sessions // 4} sessions in memory)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Speculative turn check + benchmark: for LLM-routed turns the local pipeline (intent, slot update,
+next question, quotation read) runs alongside the model call (src/live/session.py _speculate).
+A LangChain chat model with fixed latency stands in for the LLM. Asserts: a fast model's reply
+wins and the slots still update from the local path; past LIVE_SPECULATIVE_BUDGET_S a slow
+model is cancelled and the local answer is used (aturn and astream_turn); a turn with no
+local answer waits for the model. Then prints slow-model turn latency with and without the budget.
+  python scripts/bench_live_speculative.py [SLOW_LLM_LATENCY_S] [BUDGET_S]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.live import llm_chat, routing, session
+from src.live.reply_cache import ReplyCache, set_reply_cache
+from src.live.session_store import LiveSessionStore, get_session_store, set_session_store
+from src.nlp.analysis import analyze
+from src.registry import store
+from src.state.models import SlotStatus
+
+MESSAGE = "my name is Priya"  # no intent signal → routed to the LLM; the local path can still ask next
+
+
+class SlowChat(BaseChatModel):
+    delay: float = 0.1
+    active: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-fake"
+
+    def _result(self, messages) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f"Sure — {messages[-1].content}."))])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.delay)
+        return self._result(messages)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.active += 1
+        try:
+            await asyncio.sleep(self.delay)
+            return self._result(messages)
+        finally:
+            self.active -= 1
+
+
+def _name_filled(state) -> bool:
+    return state.get_slot("caller_name").status == SlotStatus.FILLED
+
+
+async def _stream(sid: str) -> tuple[str, list[str]]:
+    chunks, done = [], None
+    async for event, data in session.astream_turn(sid, MESSAGE):
+        if event == "chunk":
+            chunks.append(data["text"])
+        else:
+            done = data
+    return done["bot_reply"], chunks
+
+
+async def _checks(chat: SlowChat, budget: float) -> None:
+    sid = session.start_session()[0]
+    expected = session._speculate(sid, get_session_store().get(sid), analyze(MESSAGE))
+    assert expected.reply and _name_filled(expected.state)
+
+    chat.delay = budget / 4  # fast model: LLM wins, slots from the local path
+    s = session.start_session()[0]
+    reply, state, _ = await session.aturn(s, MESSAGE)
+    assert reply == f"Sure — {MESSAGE}." and _name_filled(state), reply
+    s = session.start_session()[0]
+    assert (await _stream(s))[0] == f"Sure — {MESSAGE}." and _name_filled(session.get_session(s)["state"])
+
+    chat.delay = budget * 10  # slow model: local answer after the budget, model call cancelled
+    s = session.start_session()[0]
+    start = time.perf_counter()
+    reply, state, _ = await session.aturn(s, MESSAGE)
+    assert reply == expected.reply and _name_filled(state), reply
+    assert time.perf_counter() - start < budget * 3
+    s = session.start_session()[0]
+    reply, chunks = await _stream(s)
+    assert reply == expected.reply and " ".join(chunks) == reply
+    await asyncio.sleep(0)
+    assert chat.active == 0, chat.active  # async model calls were cancelled
+    # no local answer (open quotation is the rule turn's business): wait for the model
+    s = session.start_session()[0]
+    data = get_session_store().get(s)
+    data["quotation_awaiting_acceptance"] = 1
+    get_session_store().put(s, data)
+    chat.delay = budget * 2
+    assert (await session.aturn(s, MESSAGE))[0] == f"Sure — {MESSAGE}."
+
+
+async def _timed(n: int) -> float:
+    sids = [session.start_session()[0] for _ in range(n)]
+    start = time.perf_counter()
+    for sid in sids:
+        await session.aturn(sid, MESSAGE)
+    return (time.perf_counter() - start) / n
+
+
+def main():
+    slow = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    set_reply_cache(ReplyCache(max_entries=0))  # every LLM turn pays model latency
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "live.db"
+    store.init_db()
+    set_session_store(LiveSessionStore(None))
+    chat = SlowChat()
+    llm_chat._chat, llm_chat._llm_available = chat, True
+    routing.SPECULATIVE_BUDGET_S = budget
+    asyncio.run(_checks(chat, budget))
+    print("Regression: fast model wins with local slot updates; slow model cancelled after the budget "
+          "(aturn, stream); no local answer waits for the model.")
+
+    chat.delay = slow
+    for label, b in (("wait for model", 0.0), (f"budget {budget:.1f}s", budget)):
+        routing.SPECULATIVE_BUDGET_S = b
+        routing.get_route_counters().reset()
+        per_turn = asyncio.run(_timed(3))
+        print(f"{label:15s} model {slow:.1f}s: {per_turn * 1000:7.0f} ms per turn  "
+              f"routes {routing.get_route_counters().stats()['routes']}")
+
+
+if __name__ == "__main__":
+    main()
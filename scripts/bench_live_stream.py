@@ -0,0 +1,118 @@
+"""
+/live/stream check + benchmark. A LangChain chat model that emits tokens at a fixed rate stands in for
+the LLM. Compares aturn() (whole reply via ainvoke) with astream_turn() (astream, sentence chunks):
+asserts the chunks join to the same reply and the session ends identical, that closing the stream
+mid-LLM leaves the session unchanged, then prints time-to-first-chunk (first audio) vs total time.
+  python scripts/bench_live_stream.py [TOKEN_DELAY_MS]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from src.live import llm_chat, routing, session
+from src.live.reply_cache import ReplyCache, set_reply_cache
+from src.live.session_store import LiveSessionStore, set_session_store
+from src.registry import store
+
+REPLY = (
+    "Sure — we do 2D and 3D animation, explainers and ads. A two minute promo usually takes three to four weeks. "
+    "Would you like a quote, or should I tell you more about our process?"
+)
+
+
+class TokenChat(BaseChatModel):
+    token_delay: float = 0.02
+
+    @property
+    def _llm_type(self) -> str:
+        return "token-fake"
+
+    def _tokens(self) -> list[str]:
+        words = REPLY.split(" ")
+        return [w + (" " if i < len(words) - 1 else "") for i, w in enumerate(words)]
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.token_delay * len(self._tokens()))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=REPLY))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.token_delay * len(self._tokens()))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=REPLY))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        for tok in self._tokens():
+            await asyncio.sleep(self.token_delay)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=tok))
+
+
+def _comparable(state) -> dict:
+    data = state.model_dump(mode="json", exclude={"updated_at"})
+    for slot in data["slots"].values():
+        slot.pop("timestamp", None)
+    return data
+
+
+async def _compare(messages: list[str], llm: bool) -> tuple[list[float], list[float], list[float]]:
+    a, b = session.start_session()[0], session.start_session()[0]
+    whole_ms, first_ms, total_ms = [], [], []
+    for text in messages:
+        start = time.perf_counter()
+        reply, _, intent = await session.aturn(a, text)
+        whole_ms.append((time.perf_counter() - start) * 1000)
+        chunks, done = [], None
+        async for event, data in session.astream_turn(b, text):
+            if event == "chunk":
+                chunks.append(data["text"])
+            else:
+                done = data
+        assert " ".join(chunks) == done["bot_reply"] == reply, (chunks, reply)
+        assert done["intent"] == intent
+        first_ms.append(done["first_chunk_ms"])
+        total_ms.append(done["total_ms"])
+    sa, sb = session.get_session(a), session.get_session(b)
+    assert sa["history"] == sb["history"] and sa["turn_index"] == sb["turn_index"]
+    assert _comparable(sa["state"]) == _comparable(sb["state"])
+
+    # client disconnects after the first chunk: an LLM turn is dropped, a rule turn was already saved
+    before = session.get_session(b)["turn_index"]
+    stream = session.astream_turn(b, "tell me more")
+    await stream.__anext__()
+    await stream.aclose()
+    assert session.get_session(b)["turn_index"] == before + (0 if llm else 1)
+    async for _ in session.astream_turn(b, "tell me more"):  # lock was released
+        pass
+    return whole_ms, first_ms, total_ms
+
+
+def main():
+    set_reply_cache(ReplyCache(max_entries=0))  # every LLM turn pays model latency
+    routing.RULE_FIRST = False  # measure the LLM path, not rule-first routing
+    delay_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "live.db"
+    store.init_db()
+    set_session_store(LiveSessionStore(None))
+    messages = ["hi", "can you hear me?", "what do you do?", "we need a 2 minute promo"]
+
+    llm_chat._chat, llm_chat._llm_available = None, False
+    asyncio.run(_compare(messages, llm=False))  # rule replies: chunks are the reply split into sentences
+    llm_chat._chat, llm_chat._llm_available = TokenChat(token_delay=delay_ms / 1000), True
+    whole, first, total = asyncio.run(_compare(messages, llm=True))
+    print(f"Regression: streamed chunks == aturn reply and session state ({len(messages)} turns, rule + LLM); "
+          "early close drops an unfinished LLM turn.")
+    llm = [i for i, m in enumerate(messages) if m != "can you hear me?"]
+    avg = lambda xs: sum(xs[i] for i in llm) / len(llm)
+    print(f"LLM turns ({delay_ms:.0f} ms/token): /live/message reply after {avg(whole):6.0f} ms")
+    print(f"  /live/stream first audio chunk {avg(first):6.0f} ms, total {avg(total):6.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+LLM circuit breaker check + benchmark (src/live/llm_breaker.py). Breaker rules on a fake clock:
+bad calls in a row, rolling p95 over the budget, calls still running past the budget; calls given
+up on under the budget (speculating turns) never trip it; half-open probe closes or re-opens it. Then live turns (aturn, astream_turn) against the local fake
+LLM server (scripts/fake_llm_server.py) going healthy → stalled → recovered: stalled turns fall
+back to the rule reply at the latency budget, then skip the model while the breaker is open, and
+the half-open probe restores the LLM path. Prints per-turn latency on a stalled server with and
+without the breaker.
+  python scripts/bench_llm_breaker.py [STALL_S] [BUDGET_S]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_llm_server import FakeLLMServer
+
+from src.live import llm_chat, routing, session
+from src.live.llm_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.live.llm_gateway import LLMGateway, set_llm_gateway
+from src.live.reply_cache import ReplyCache, set_reply_cache
+from src.live.session_store import LiveSessionStore, set_session_store
+from src.registry import store
+
+MESSAGE = "my name is Priya"  # no intent signal → routed to the LLM
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker_rules() -> None:
+    clock = Clock()
+    b = CircuitBreaker(latency_budget_s=1.0, window=20, min_calls=20, failures=3, cooldown_s=5.0, clock=clock)
+
+    def call(latency: float, ok: bool = True) -> None:
+        token = b.begin()
+        assert token is not None
+        clock.now += latency
+        b.end(token, ok)
+
+    # bad calls in a row: errors and over-budget replies; a good call resets the run
+    call(0.1, ok=False), call(1.5), call(0.1)
+    call(0.1, ok=False), call(1.2)
+    assert b.state == CLOSED
+    call(0.1, ok=False)
+    assert b.state == OPEN and b.begin() is None and b.is_open()
+    # cooldown → one half-open probe; others refused while it runs; a slow probe re-opens
+    clock.now += 5.0
+    assert not b.is_open()
+    probe = b.begin()
+    assert probe and b.state == HALF_OPEN and b.begin() is None and b.is_open()
+    clock.now += 1.1
+    assert b.state == OPEN  # probe still running past the budget
+    b.end(probe, ok=True)  # late: ignored
+    assert b.state == OPEN
+    clock.now += 5.0
+    call(0.2)
+    assert b.state == CLOSED and b.stats()["samples"] == 0
+    # rolling p95: two slow calls in 20 never make 3 in a row, but put the p95 over the budget
+    for i in range(20):
+        assert b.state == CLOSED
+        call(1.3 if i in (4, 12) else 0.2)
+    assert b.state == OPEN and b.stats()["trips"] == 3
+    # calls hanging past the budget count before they return; one given up on under the budget does not
+    clock.now += 5.0
+    call(0.1)
+    tokens = [b.begin() for _ in range(4)]
+    b.abandon(tokens.pop())
+    assert b.state == CLOSED
+    clock.now += 1.0
+    assert b.state == OPEN and b.stats()["abandoned"] == 1
+    b.end(tokens[0], ok=True)  # sent before the trip: not a probe
+    assert b.state == OPEN
+    # speculating turns give up on a 0.8 s model at 0.5 s: under the budget, so it never trips
+    clock.now += 5.0
+    call(0.1)
+    for _ in range(100):
+        token = b.begin()
+        clock.now += 0.5
+        b.abandon(token)
+    assert b.state == CLOSED and b.stats()["bad_in_a_row"] == 0
+    # an abandoned probe frees the half-open slot; abandoned past the budget, it re-opens
+    for _ in range(3):
+        call(1.2)
+    clock.now += 5.0
+    probe = b.begin()
+    clock.now += 0.5
+    b.abandon(probe)
+    assert b.state == HALF_OPEN and not b.is_open()
+    probe = b.begin()
+    clock.now += 0.9
+    b.abandon(probe)
+    assert b.state == HALF_OPEN
+    call(0.2)
+    assert b.state == CLOSED
+    # disabled: never refuses
+    off = CircuitBreaker(enabled=False)
+    assert all(off.begin() is not None for _ in range(3)) and not off.is_open()
+
+
+async def _turns(n: int, run) -> list[tuple[str, str, float]]:
+    """n fresh sessions, one LLM-routed turn each: (route, reply, seconds)."""
+    out = []
+    counters = routing.get_route_counters()
+    for _ in range(n):
+        sid = session.start_session()[0]
+        before = dict(counters.stats()["routes"])
+        start = time.perf_counter()
+        reply = await run(sid)
+        seconds = time.perf_counter() - start
+        after = counters.stats()["routes"]
+        (route,) = [r for r in after if after[r] != before.get(r, 0)]
+        out.append((route, reply, seconds))
+    return out
+
+
+async def _aturn(sid: str) -> str:
+    return (await session.aturn(sid, MESSAGE))[0]
+
+
+async def _stream(sid: str) -> str:
+    async for event, data in session.astream_turn(sid, MESSAGE):
+        if event == "done":
+            return data["bot_reply"]
+
+
+async def _live(server: FakeLLMServer, stall: float, budget: float) -> None:
+    breaker = CircuitBreaker(latency_budget_s=budget, failures=3, cooldown_s=1.0)
+    set_llm_gateway(LLMGateway(breaker=breaker))
+    llm_chat._chat, llm_chat._llm_available = None, None
+    llm_echo = f"Sure — {MESSAGE}"
+
+    server.delay = 0.01
+    healthy = await _turns(3, _aturn)
+    assert [(r, reply) for r, reply, _ in healthy] == [(routing.LLM, llm_echo)] * 3, healthy
+
+    server.delay = stall
+    stalled = await _turns(3, _aturn)
+    assert [r for r, _, _ in stalled] == [routing.LLM_FALLBACK] * 3 and breaker.state == OPEN, stalled
+    assert all(reply != llm_echo and s < budget + 0.5 for _, reply, s in stalled)
+    rule_reply = stalled[0][1]
+    skipped = await _turns(4, _aturn) + await _turns(1, _stream)
+    assert [(r, reply) for r, reply, _ in skipped] == [(routing.LLM_OPEN, rule_reply)] * 5, skipped
+    assert all(s < 0.2 for _, _, s in skipped)
+
+    await asyncio.sleep(1.0)  # cooldown: next LLM turn is the half-open probe
+    server.delay = 0.01
+    recovered = await _turns(2, _aturn) + await _turns(1, _stream)
+    assert [(r, reply) for r, reply, _ in recovered] == [(routing.LLM, llm_echo)] * 3, recovered
+    stats = breaker.stats()
+    assert stats["state"] == CLOSED and stats["trips"] == 1 and stats["probes"] == 1, stats
+
+
+async def _bench(server: FakeLLMServer, stall: float, budget: float, n: int) -> None:
+    server.delay = stall
+    rows = (
+        ("no breaker", CircuitBreaker(enabled=False)),
+        (f"budget {budget:.1f}s", CircuitBreaker(latency_budget_s=budget, failures=3, cooldown_s=60)),
+    )
+    for label, breaker in rows:
+        set_llm_gateway(LLMGateway(breaker=breaker))
+        llm_chat._chat, llm_chat._llm_available = None, None
+        routing.get_route_counters().reset()
+        turns = await _turns(n, _aturn)
+        per_turn = sum(s for _, _, s in turns) / n
+        print(f"{label:12s} server stalled {stall:.1f}s, {n} turns: {per_turn * 1000:7.0f} ms per turn  "
+              f"routes {routing.get_route_counters().stats()['routes']}")
+
+
+def main():
+    stall = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    _breaker_rules()
+    set_reply_cache(ReplyCache(max_entries=0))  # every LLM turn reaches the server
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "live.db"
+    store.init_db()
+    set_session_store(LiveSessionStore(None))
+    routing.SPECULATIVE_BUDGET_S = 0.0  # turns wait for the model: the breaker alone bounds them
+    llm_chat.LLM_TIMEOUT_S = stall + 1  # client timeout longer than the stall
+    with FakeLLMServer() as server:
+        os.environ.update(USE_OLLAMA="0", OPENAI_API_KEY="fake", OPENAI_BASE_URL=server.base_url)
+        asyncio.run(_live(server, stall, budget))
+        print("Regression: trips on bad calls in a row / p95 / hung calls; half-open probe closes or re-opens; "
+              "stalled turns fall back at the budget, open breaker skips the model (aturn, stream), "
+              "probe restores the LLM path.")
+        asyncio.run(_bench(server, stall, budget, 6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+LLM reply cache check + benchmark (src/live/reply_cache.py). A counting LangChain chat model with
+fixed latency stands in for the LLM. Replays many short sessions that open with the same FAQs and
+asserts: hits return the reply the model gave, a different slot state or last bot line misses,
+TTL expiry and LRU eviction, stream-path caching, and the persistence file round trip. Then prints
+model calls, hit rate and per-reply latency with and without the cache.
+  python scripts/bench_llm_cache.py [SESSIONS] [LLM_LATENCY_S]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.live import llm_chat
+from src.live.reply_cache import ReplyCache, normalize_message, set_reply_cache
+from src.state.pipeline import initial_state
+from src.state.slot_filling import update_state_from_message
+
+OPENERS = ["What services do you offer?", "what services do you offer", "Do you do 2D or 3D?", "hi", "Hello!!"]
+GREETING = [{"role": "bot", "text": "Hi, I'm Mira from XYZ Animations. How can I help?"}]
+
+
+class CountingChat(BaseChatModel):
+    delay: float = 0.05
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "counting-fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.delay)
+        self.calls += 1
+        reply = f"Sure — {messages[-1].content} (#{self.calls})"
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=reply))])
+
+
+def _reply(history: list[dict], text: str, state: dict) -> str | None:
+    return asyncio.run(llm_chat.aget_llm_reply(history, text, state=state))
+
+
+def _checks(chat: CountingChat) -> None:
+    cache = ReplyCache(max_entries=3, ttl_s=60)
+    set_reply_cache(cache)
+    state = initial_state("new_project_sales")
+    first = _reply(GREETING, "What services do you offer?", state=state)
+    assert _reply(GREETING, "what services do you offer", state=state) == first
+    assert normalize_message("  What SERVICES do you offer??? ") == normalize_message("what services do you ofer")
+    # slot state or last bot line changes the key
+    filled = update_state_from_message(state, "My name is Priya", "t1", "new_project_sales")
+    assert _reply(GREETING, "What services do you offer?", state=filled) != first
+    other_tail = GREETING + [{"role": "user", "text": "hi"}, {"role": "bot", "text": "What's your name?"}]
+    assert _reply(other_tail, "What services do you offer?", state=state) != first
+    # LRU: a 4th key evicts the least recently used
+    _reply(GREETING, "do you do 3d", state=state)
+    assert cache.evictions == 1 and len(cache) == 3
+    # TTL
+    cache.ttl_s = -1
+    _reply(GREETING, "pricing?", state=state)
+    calls = chat.calls
+    _reply(GREETING, "pricing?", state=state)
+    assert chat.calls == calls + 1 and cache.expired == 1
+    cache.ttl_s = 60
+
+    # stream path: a completed stream is cached, the hit streams the same text
+    async def streamed(text):
+        return "".join([d async for d in llm_chat.astream_llm_reply(GREETING, text, state=state)])
+
+    s1 = asyncio.run(streamed("tell me about explainers"))
+    calls = chat.calls
+    assert asyncio.run(streamed("Tell me about explainers!")) == s1 and chat.calls == calls
+    # persistence round trip
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "llm_cache.json"
+        saved = ReplyCache(max_entries=8, ttl_s=60, path=str(path))
+        key = saved.key("hi", state, GREETING)
+        saved.put(key, "Hello there!")
+        assert saved.save() == 1
+        assert ReplyCache(max_entries=8, ttl_s=60, path=str(path)).get(key) == "Hello there!"
+        path.write_text("not json")
+        assert ReplyCache(path=str(path)).get(key) is None
+
+
+def _replay(sessions: int) -> list[float]:
+    """Short sessions: an opener, then the FAQ; returns per-reply latency."""
+    latencies = []
+    for i in range(sessions):
+        state = initial_state(None)
+        history = list(GREETING)
+        for text in (OPENERS[i % len(OPENERS)], OPENERS[(i + 2) % len(OPENERS)]):
+            start = time.perf_counter()
+            reply = _reply(history, text, state=state)
+            latencies.append(time.perf_counter() - start)
+            history += [{"role": "user", "text": text}, {"role": "bot", "text": reply}]
+    return latencies
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    chat = CountingChat(delay=delay)
+    llm_chat._chat, llm_chat._llm_available = chat, True
+    _checks(chat)
+    print("Regression: hits match model replies; state/tail-sensitive keys; TTL, LRU, stream, persistence.")
+
+    for label, cache in (("no cache", ReplyCache(max_entries=0)), ("cache", ReplyCache())):
+        set_reply_cache(cache)
+        chat.calls = 0
+        lat = sorted(_replay(sessions))
+        stats = cache.stats()
+        print(f"{label:8s} replies {len(lat):4d}  model calls {chat.calls:4d}  hit rate {stats['hit_rate']:5.0%}  "
+              f"median {lat[len(lat) // 2] * 1000:7.2f} ms  mean {sum(lat) / len(lat) * 1000:7.2f} ms")
+    set_reply_cache(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Prompt size + build time: bounded LLM context (src/live/llm_context.py) vs the original prompt
+(SYSTEM_PROMPT + entire history). Replays a long live session turn by turn the way session.py does
+(update_summary before each LLM call) and asserts every prompt is within LLM_CONTEXT_TOKENS, the
+last LLM_CONTEXT_TURNS turns are verbatim, known slots are present, and the summary survives the
+session store round trip; then prints estimated prompt tokens and build time per turn.
+  python scripts/bench_llm_context.py [TURNS]
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.live import llm_context
+from src.live.llm_chat import SYSTEM_PROMPT, _messages
+from src.live.llm_context import CONTEXT_TOKENS, CONTEXT_TURNS, context_tokens, estimate_tokens, update_summary
+from src.live.session_store import SQLiteSessionBackend
+from src.state import build_state_from_conversation
+
+USER = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "My name is Priya and we're based in India.",
+    "3D, for YouTube. Budget is around 50k and we need it by March.",
+    "Can you also do a short explainer for our onboarding flow, maybe 60 seconds, in a flat 2D style?",
+    "What would the turnaround look like if we sent the script next week?",
+]
+BOT = [
+    "Got it — a 2 minute promo. What's your name and where are you based?",
+    "Nice to meet you, Priya. What style are you thinking, 2D or 3D?",
+    "Sounds good — 3D for YouTube by March. Anything you'd like it to look like?",
+    "Sure — we do flat 2D explainers all the time. Want a quote for both?",
+]
+
+
+def legacy_messages(history, user_message):
+    """_messages as it was before llm_context (reference)."""
+    messages = [SystemMessage(content=SYSTEM_PROMPT)]
+    for h in history:
+        cls = HumanMessage if h.get("role") == "user" else AIMessage
+        messages.append(cls(content=h.get("text") or ""))
+    messages.append(HumanMessage(content=user_message.strip()))
+    return messages
+
+
+def _tokens(messages) -> int:
+    return sum(estimate_tokens(m.content) + llm_context.MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def main():
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    state = build_state_from_conversation("", [("user", t) for t in USER[:3]], "new_project_sales")
+    data = {"state": state, "turn_index": 0, "history": [{"role": "bot", "text": "Hi, I'm Mira."}]}
+    backend = SQLiteSessionBackend()
+    sizes, checkpoints = [], {}
+    build_legacy = build_new = 0.0
+    for i in range(turns):
+        user_message = f"{USER[i % len(USER)]} (turn {i})"
+        start = time.perf_counter()
+        old = legacy_messages(data["history"], user_message)
+        build_legacy += time.perf_counter() - start
+        start = time.perf_counter()
+        new = _messages(data["history"], user_message, data["state"], update_summary(data))
+        build_new += time.perf_counter() - start
+
+        size = _tokens(new)
+        assert size <= CONTEXT_TOKENS, (i, size)
+        assert size == context_tokens([("", m.content) for m in new])
+        window = data["history"][-2 * CONTEXT_TURNS:]
+        assert [m.content for m in new[-1 - len(window):-1]] == [h["text"] for h in window], i
+        assert new[0].content == SYSTEM_PROMPT and new[-1].content == user_message
+        assert "country_location: India" in new[1].content and "budget_or_range: 50k" in new[1].content, i
+        if len(data["history"]) > 2 * CONTEXT_TURNS:
+            assert "Earlier in this call:" in new[1].content, i
+        sizes.append(size)
+        if i + 1 in (10, 50, 100, 200, turns):
+            checkpoints[i + 1] = (_tokens(old), size)
+
+        data["history"] += [{"role": "user", "text": user_message}, {"role": "bot", "text": BOT[i % len(BOT)]}]
+        data["history"] = data["history"][-200:]  # LIVE_HISTORY_MAX trim, as the store does on put
+        data["turn_index"] += 1
+        if i % 50 == 49:  # summary persists with the session
+            row = backend.dump("bench", data, 1)
+            assert json.loads(row["context_summary_json"]) == data["context_summary"]
+    print(f"Regression: {turns} turns, every prompt <= {CONTEXT_TOKENS} est. tokens, "
+          f"last {CONTEXT_TURNS} turns verbatim, slots + summary present.")
+
+    for turn, (old, new) in checkpoints.items():
+        print(f"turn {turn:4d}  full history {old:6d} tokens  bounded {new:5d} tokens  ({new / old:.0%})")
+    print(f"build per turn: full {build_legacy / turns * 1e6:7.1f} µs  bounded {build_new / turns * 1e6:7.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
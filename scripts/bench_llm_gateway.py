@@ -0,0 +1,135 @@
+"""
+LLM gateway check + benchmark (src/live/llm_gateway.py) against the local fake LLM server
+(scripts/fake_llm_server.py) through the real OpenAI chat client. Asserts keep-alive connection
+reuse, single-flight for identical in-flight prompts (a cancelled caller does not cancel the
+others), bounded queue rejection and queue timeouts, and streaming through the
+same admission. Then prints per-call latency with and without keep-alive, and a burst of
+identical openers with and without coalescing.
+  python scripts/bench_llm_gateway.py [CALLS] [SERVER_DELAY_S]
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_llm_server import FakeLLMServer
+
+from src.live import llm_chat
+from src.live.llm_gateway import LLMGateway, set_llm_gateway
+from src.live.reply_cache import ReplyCache, set_reply_cache
+
+HISTORY = [{"role": "bot", "text": "Hello! This is Mira from XYZ Animations. How may I help you?"}]
+
+
+def _use(gateway: LLMGateway) -> LLMGateway:
+    """Gateway + a fresh chat model built on its HTTP client (one per asyncio.run: the client is loop-bound)."""
+    set_llm_gateway(gateway)
+    llm_chat._chat, llm_chat._llm_available = None, None
+    assert llm_chat.llm_enabled()
+    return gateway
+
+
+async def _sequential(texts: list[str]) -> list:
+    return [await llm_chat.aget_llm_reply(HISTORY, text) for text in texts]
+
+
+async def _checks(server: FakeLLMServer) -> None:
+    # keep-alive: sequential calls reuse one connection
+    _use(LLMGateway())
+    server.reset()
+    replies = await _sequential([f"hello {i}" for i in range(5)])
+    assert replies == [f"Sure — hello {i}" for i in range(5)], replies
+    assert server.connections == 1 and server.requests == 5, (server.connections, server.requests)
+
+    # single-flight: 20 identical prompts → one request; a cancelled caller leaves the others waiting
+    gw = _use(LLMGateway())
+    server.reset()
+    server.delay = 0.2
+    calls = [asyncio.ensure_future(llm_chat.aget_llm_reply(HISTORY, "hi")) for _ in range(20)]
+    await asyncio.sleep(0.05)
+    calls[0].cancel()
+    replies = await asyncio.gather(*calls[1:])
+    assert set(replies) == {"Sure — hi"} and server.requests == 1, (replies[:2], server.requests)
+    assert gw.stats()["coalesced"] == 19 and gw.stats()["in_flight_prompts"] == 0
+    # all callers gone → the shared call is cancelled, nothing left in flight
+    task = asyncio.ensure_future(llm_chat.aget_llm_reply(HISTORY, "cancel me"))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.sleep(0.1)
+    assert gw.stats()["in_flight_prompts"] == 0
+
+    # backpressure: 2 in flight + 3 queued; the other 5 are rejected at once
+    gw = _use(LLMGateway(max_concurrency=2, queue_max=3, queue_wait_s=5.0))
+    server.reset()
+    server.delay = 0.3
+    start = time.perf_counter()
+    results = [None] * 10
+
+    async def timed(i):
+        results[i] = (await llm_chat.aget_llm_reply(HISTORY, f"project {i}"), time.perf_counter() - start)
+
+    await asyncio.gather(*(timed(i) for i in range(10)))
+    rejected = [t for r, t in results if r is None]
+    assert len(rejected) == 5 and max(rejected) < 0.1, rejected
+    assert server.requests == 5 and gw.stats()["rejected"] == 5
+    # queue timeout: waiting longer than queue_wait_s → None
+    gw = _use(LLMGateway(max_concurrency=1, queue_max=8, queue_wait_s=0.1))
+    out = await asyncio.gather(*(llm_chat.aget_llm_reply(HISTORY, f"q {i}") for i in range(3)))
+    assert out[0] and out[1:] == [None, None] and gw.stats()["queue_timeouts"] == 2
+
+    # streaming uses the same admission
+    gw = _use(LLMGateway(max_concurrency=1, queue_max=0))
+    server.delay = 0.0
+    streamed = "".join([d async for d in llm_chat.astream_llm_reply(HISTORY, "tell me about 3d")])
+    assert streamed == "Sure — tell me about 3d", streamed
+
+
+def _bench(server: FakeLLMServer, calls: int, delay: float) -> None:
+    server.delay = delay
+    for label, keepalive in (("no keep-alive", 0), ("keep-alive", 16)):
+        _use(LLMGateway(pool_keepalive=keepalive))
+
+        async def sequential() -> float:
+            await llm_chat.aget_llm_reply(HISTORY, "warm up")
+            server.reset()
+            start = time.perf_counter()
+            assert all(await _sequential([f"sequential {i}" for i in range(calls)]))
+            return (time.perf_counter() - start) / calls
+
+        per_call = asyncio.run(sequential())
+        print(f"{label:14s} {calls} calls: {server.connections:3d} new connections  {per_call * 1000:6.2f} ms per call")
+
+    async def burst(n: int) -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(llm_chat.aget_llm_reply(HISTORY, "hi") for _ in range(n)))
+        return time.perf_counter() - start
+
+    gw = _use(LLMGateway())
+    server.reset()
+    wall = asyncio.run(burst(calls))
+    print(f"burst of {calls} identical 'hi': {server.requests} request(s), {gw.stats()['coalesced']} coalesced, "
+          f"wall {wall * 1000:.0f} ms")
+    _use(LLMGateway())
+    server.reset()
+    start = time.perf_counter()
+    asyncio.run(_sequential([f"hi {i}" for i in range(calls)]))  # without coalescing each caller pays its own request
+    print(f"same {calls} callers one request each: {server.requests} requests, {(time.perf_counter() - start) * 1000:.0f} ms serial")
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.005
+    set_reply_cache(ReplyCache(max_entries=0))  # every reply reaches the server
+    with FakeLLMServer() as server:
+        os.environ.update(USE_OLLAMA="0", OPENAI_API_KEY="fake", OPENAI_BASE_URL=server.base_url)
+        asyncio.run(_checks(server))
+        print("Regression: keep-alive reuse, single-flight (cancel-safe), queue bound + timeout, streaming admission.")
+        _bench(server, calls, delay)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: per-turn text checks with one shared MessageAnalysis vs passing the raw string
+(each helper lowercases/normalizes/scans on its own). Asserts both give the same results.
+  python scripts/bench_message_analysis.py [ROUNDS]
+"""
+import sys
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.live.faq import get_faq_reply
+from src.live.quotation_flow import (
+    extract_price_from_message,
+    user_agrees,
+    user_asks_for_quote,
+    user_asks_to_reduce_price,
+    user_disagrees,
+)
+from src.nlp.analysis import analyze
+from src.nlp.intent import detect_intent
+from src.state.follow_up import user_wants_closure
+from src.state.models import SlotValue
+from src.state.pipeline import initial_state
+from src.state.slot_filling import update_state_from_message
+
+MESSAGES = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "My name is Priya and we're based in India.",
+    "3D, for YouTube. Budget is around 50k and we need it by March.",
+    "How much will it cost? Can you send me a quote?",
+    "Can you reduce the price a bit, maybe 40 thousand?",
+    "I'd rather not say",
+    "ok sure",
+    "that's all, thanks",
+]
+
+
+def _checks(message) -> tuple:
+    """What a live turn (session.aturn) runs on one user message (all branches)."""
+    state = initial_state("new_project_sales").model_copy(update={"last_question_asked": "budget_or_range"})
+    state = update_state_from_message(state, message, "turn_1", "new_project_sales", is_user_turn=True)
+    return (
+        detect_intent(message),
+        get_faq_reply(message),
+        user_asks_for_quote(message),
+        user_asks_to_reduce_price(message),
+        user_agrees(message),
+        user_disagrees(message),
+        extract_price_from_message(message),
+        user_asks_for_quote(message),
+        user_wants_closure(message),
+        {k: (v.value, v.status) for k, v in state.slots.items() if isinstance(v, SlotValue)},
+    )
+
+
+def per_string(text: str) -> tuple:
+    return _checks(text)
+
+
+def shared(text: str) -> tuple:
+    return _checks(analyze(text))
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    for text in MESSAGES:
+        assert per_string(text) == shared(text), text
+    print(f"Regression: {len(MESSAGES)} messages, same results with and without a shared analysis.")
+
+    results = {}
+    for _ in range(3):  # alternate to even out warm-up
+        for label, fn in (("raw string", per_string), ("MessageAnalysis", shared)):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for text in MESSAGES:
+                    fn(text)
+            us = (time.perf_counter() - start) / (rounds * len(MESSAGES)) * 1e6
+            results[label] = min(us, results.get(label, us))
+    for label, us in results.items():
+        print(f"{label:16s} {us:7.1f} µs per turn")
+    print(f"speedup          {results['raw string'] / results['MessageAnalysis']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark + regression check: Phase 3 NLP for N stored conversations, one /process call per
+conversation (load, run, update each) vs process_conversations_nlp_batch (one read, batch run,
+one bulk update), inline and across the shared worker pool (cold: first call starts it; warm:
+reused). Asserts identical stored results.
+Uses a temporary database.
+  python scripts/bench_nlp_batch.py [N] [WORKERS]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ingestion.payloads import IncomingChatPayload
+from src.ingestion.pipeline import process_chat_bulk, process_conversations_nlp_batch
+from src.nlp.pipeline import close_nlp_pool, run_and_persist
+from src.registry import close_pool, get_conversation, store, update_nlp_results
+
+TURNS = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "My name is Priya and we're based in India.",
+    "3D, for YouTube. Budget is around 50k and we need it by March.",
+    "How much will it cost? Can you send me a quote?",
+    "I'm not happy with the previous delivery, there was a delay.",
+    "What is your process for a Pixar style 3D film?",
+]
+
+
+def _payload(i: int) -> IncomingChatPayload:
+    turns = [{"speaker_id": "user" if j % 2 == 0 else "agent", "text": TURNS[(i + j) % len(TURNS)]} for j in range(4 + i % 5)]
+    return IncomingChatPayload(turns=turns)
+
+
+def _stored(ids: list[str]) -> list[tuple]:
+    with store._conn() as c:
+        rows = c.execute(
+            "SELECT conversation_id, primary_intent, secondary_tags_json, extracted_fields_json, language "
+            "FROM conversations"
+        ).fetchall()
+    by_id = {r["conversation_id"]: tuple(r)[1:] for r in rows}
+    return [by_id[cid] for cid in ids]
+
+
+def _reset(ids: list[str]) -> None:
+    with store.transaction() as c:
+        c.executemany(
+            "UPDATE conversations SET primary_intent = NULL, secondary_tags_json = NULL, "
+            "extracted_fields_json = NULL, language = NULL WHERE conversation_id = ?",
+            [(cid,) for cid in ids],
+        )
+
+
+def per_conversation(ids: list[str]) -> None:
+    for cid in ids:
+        conv = get_conversation(cid)
+        run_and_persist(cid, conv.clean_text or conv.raw_transcript or "", [t.text for t in conv.speaker_turns], update_nlp_results)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        store.DB_PATH = Path(tmp) / "bench.db"
+        store.init_db()
+        ids = process_chat_bulk([_payload(i) for i in range(n)])
+
+        start = time.perf_counter()
+        per_conversation(ids)
+        per_conv_s = time.perf_counter() - start
+        expected = _stored(ids)
+
+        timings = {"per conversation": per_conv_s}
+        procs = {"processes": True, "workers": workers}
+        for label, kwargs in (("batch", {}), (f"x{workers} procs cold", procs), (f"x{workers} procs warm", procs)):
+            _reset(ids)
+            start = time.perf_counter()
+            pairs, missing = process_conversations_nlp_batch(ids + ["missing-id"], **kwargs)
+            timings[label] = time.perf_counter() - start
+            assert len(pairs) == n and missing == ["missing-id"], label
+            assert _stored(ids) == expected, f"{label}: stored results differ from per-conversation run"
+        close_nlp_pool()
+        close_pool()
+
+    print(f"Regression: {n} conversations, batch results == per-conversation results.")
+    for label, s in timings.items():
+        print(f"{label:20s} {s * 1e3:8.1f} ms  ({s / n * 1e3:.2f} ms/conversation, {per_conv_s / s:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark + regression check: the shared per-turn phrase automaton (TURN_PHRASES) vs per-phrase
+`any(p in msg ...)` for FAQ topics, closure, audibility and slot refusals. Asserts identical results
+on a corpus (plus random messages built from the phrases), then prints per-message latency.
+  python scripts/bench_phrases.py [ROUNDS]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.live import faq
+from src.live.session import AUDIBILITY_PHRASES
+from src.nlp.phrases import TURN_PHRASES
+from src.state.follow_up import CLOSURE_PHRASES, user_wants_closure
+from src.state.slot_registry import INTENT_SLOT_REGISTRY, get_refusal_phrases, has_refusal_phrase
+
+FAQ_KEYWORDS = (
+    faq.TWO_D_3D_KEYWORDS + faq.PROCESS_KEYWORDS + faq.COMPANY_KEYWORDS
+    + faq.LOOKING_KEYWORDS + faq.SERVICES_KEYWORDS
+)
+SLOTS = sorted({s for d in INTENT_SLOT_REGISTRY.values() for s in (d.get("slots_config") or {})})
+INTENTS = [None, *INTENT_SLOT_REGISTRY, "not_an_intent"]
+
+CORPUS = [
+    "hi, what services do you offer for my company?",
+    "can you tell me how does it work and the timeline",
+    "i want animations for a promo",
+    "do you do two d or 3d?",
+    "ok thanks, that's all, goodbye",
+    "hello can you hear me? am i audible",
+    "i'd rather not say, skip",
+    "budget is confidential",
+    "not sure yet, no preference",
+    "my budget is around fifty thousand rupees and we need it by march for youtube",
+    "",
+    "no",
+]
+
+
+def _random_corpus(n: int) -> list[str]:
+    rng = random.Random(7)
+    vocab = list(FAQ_KEYWORDS) + list(CLOSURE_PHRASES) + list(AUDIBILITY_PHRASES)
+    vocab += [p for d in INTENT_SLOT_REGISTRY.values() for c in (d.get("slots_config") or {}).values()
+              for p in c.get("refusal_phrases", [])]
+    filler = ["we", "a", "the", "video", "ok", "so", "i", "s", "ab", "out", "hear", "mic"]
+    out = []
+    for _ in range(n):
+        words = [rng.choice(vocab if rng.random() < 0.3 else filler) for _ in range(rng.randint(1, 12))]
+        out.append(" ".join(words))
+        out.append("".join(words))  # phrases overlapping across word boundaries
+    return out
+
+
+def naive_faq(msg: str) -> str | None:
+    """get_faq_reply as it was: one any() per keyword list, in precedence order."""
+    if not msg:
+        return None
+    if any(k in msg for k in faq.TWO_D_3D_KEYWORDS):
+        return faq.TWO_D_OR_3D_ANSWER
+    if any(k in msg for k in faq.PROCESS_KEYWORDS):
+        return faq.PROCESS_ANSWER
+    if any(k in msg for k in faq.COMPANY_KEYWORDS):
+        return faq.COMPANY_ANSWER
+    if any(k in msg for k in faq.LOOKING_KEYWORDS):
+        return faq.LOOKING_FOR_ANIMATION_ANSWER
+    return faq.SERVICES_ANSWER
+
+
+def naive_closure(msg: str) -> bool:
+    return any(p in msg for p in CLOSURE_PHRASES) or msg in ("no", "nope", "that's it")
+
+
+def naive_refusal(msg: str, slot: str, intent: str | None) -> bool:
+    return any(p.lower() in msg for p in get_refusal_phrases(slot, intent))
+
+
+def naive_turn(msg: str) -> None:
+    any(p in msg for p in AUDIBILITY_PHRASES)
+    naive_closure(msg)
+    naive_faq(msg)
+    naive_refusal(msg, "budget_or_range", "new_project_sales")
+
+
+def matcher_turn(msg: str) -> None:
+    "audibility" in TURN_PHRASES.match(msg)
+    user_wants_closure(msg)
+    faq.get_faq_reply(msg)
+    has_refusal_phrase(msg, "budget_or_range", "new_project_sales")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    messages = CORPUS + _random_corpus(500)
+    for msg in messages:
+        assert faq.get_faq_reply(msg) == naive_faq(msg), msg
+        assert user_wants_closure(msg) == naive_closure(msg), msg
+        assert ("audibility" in TURN_PHRASES.match(msg)) == any(p in msg for p in AUDIBILITY_PHRASES), msg
+        for slot in SLOTS:
+            for intent in INTENTS:
+                assert has_refusal_phrase(msg, slot, intent) == naive_refusal(msg, slot, intent), (msg, slot, intent)
+    print(f"Regression: {len(messages)} messages, matcher == substring checks.")
+
+    for label, fn in (("any(p in msg)", naive_turn), ("TURN_PHRASES", matcher_turn)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for msg in CORPUS:
+                fn(msg)
+        us = (time.perf_counter() - start) / (rounds * len(CORPUS)) * 1e6
+        print(f"{label:14s} {us:6.2f} µs per message (audibility + closure + FAQ + refusal)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Size + write comparison: delta-encoded processing_runs (full state snapshot every
+PROCESSING_RUN_SNAPSHOT_EVERY runs, diffs in between) vs a full state_json per run.
+Re-processes conversations repeatedly through persist_state_outputs, asserts every run's
+reconstructed state equals the state that was written, then prints stored state bytes.
+  python scripts/bench_processing_runs.py [RUNS]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ingestion.pipeline import build_state_outputs, persist_state_outputs
+from src.registry import store
+from src.schemas import ChannelSource, SpeakerTurn
+
+SCRIPT = [
+    ("user", "Hi, I am looking for animation services for a 2 minute promo video."),
+    ("agent", "Great. What's your name and where are you based?"),
+    ("user", "My name is Priya and we're based in India."),
+    ("agent", "2D or 3D, and which platform?"),
+    ("user", "3D, for YouTube. Budget is around 50k and we need it by March."),
+    ("agent", "What's your budget range?"),
+    ("user", "I'd rather not say"),
+]
+INTENTS = ("new_project_sales", "price_estimation")
+
+
+def _run(every: int, runs: int) -> tuple[int, float, list[tuple[str, dict]]]:
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "runs.db"
+    store.PROCESSING_RUN_SNAPSHOT_EVERY = every
+    store.init_db()
+    written = []
+    elapsed = 0.0
+    for i, intent in enumerate(INTENTS):
+        cid = f"bench-{i}"
+        turns = [SpeakerTurn(speaker_id=s, text=t) for s, t in SCRIPT]
+        store.register_conversation(cid, ChannelSource.CHAT, turns, raw_transcript="", clean_text="")
+        for n in range(runs):
+            # grow the conversation every few runs; switch intent once to force a fresh snapshot
+            k = min(len(SCRIPT), 1 + n // 3)
+            outputs = build_state_outputs(INTENTS[(i + (n >= runs // 2)) % 2], SCRIPT[:k], "")
+            start = time.perf_counter()
+            persist_state_outputs(cid, outputs)
+            elapsed += time.perf_counter() - start
+            written.append((cid, outputs["state"].model_dump(mode="json")))
+    with store._conn() as c:
+        size = c.execute(
+            "SELECT SUM(COALESCE(LENGTH(state_json), 0) + COALESCE(LENGTH(state_delta_json), 0)) FROM processing_runs"
+        ).fetchone()[0]
+    return size, elapsed / len(written) * 1e6, written
+
+
+def _check(written: list[tuple[str, dict]]) -> int:
+    by_cid: dict[str, list[dict]] = {}
+    for cid, state in written:
+        by_cid.setdefault(cid, []).append(state)
+    checked = 0
+    for cid, states in by_cid.items():
+        runs = store.list_processing_runs(cid)
+        assert [r["state"] for r in runs] == states, cid
+        for r in runs:
+            assert store.get_processing_run(r["run_id"])["state"] == r["state"], r["run_id"]
+        checked += len(runs)
+    return checked
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    full_size, full_us, written = _run(1, runs)
+    assert _check(written) == len(written)
+    delta_size, delta_us, written = _run(16, runs)
+    checked = _check(written)
+    with store._conn() as c:
+        snapshots = c.execute("SELECT COUNT(*) FROM processing_runs WHERE state_json IS NOT NULL").fetchone()[0]
+    print(f"Regression: {checked} runs reconstructed == state written ({snapshots} full snapshots).")
+    print(f"state bytes  full {full_size:8d}  delta-encoded {delta_size:7d}  ({delta_size / full_size:.0%})")
+    print(f"append       full {full_us:8.0f} µs  delta-encoded {delta_us:7.0f} µs per persist_state_outputs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark + regression check: copy-on-write slot merge in update_state_from_message vs the
+original merge (a validated SlotValue rebuilt for every slot and a validated ConversationState
+on every message). Replays conversations through both and asserts identical states
+(timestamps aside), then prints per-turn latency.
+  python scripts/bench_slot_merge.py [ROUNDS]
+"""
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.nlp.analysis import analyze
+from src.nlp.entities import extract_entities
+from src.state.models import ConversationStage, ConversationState, SlotStatus, SlotValue
+from src.state.pipeline import initial_state
+from src.state.slot_filling import (
+    BUDGET_PATTERNS,
+    COUNTRY_PATTERNS,
+    ENTITY_TO_SLOT,
+    NAME_PATTERNS,
+    TIMELINE_PATTERNS,
+    _extract_slot_from_text,
+    _is_refusal,
+    recompute_slot_status,
+    update_state_from_message,
+)
+from src.state.slot_registry import INTENT_SLOT_REGISTRY, get_optional_slots, get_required_slots
+
+MESSAGES = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "My name is Priya and we're based in India.",
+    "3D, for YouTube. Budget is around 50k and we need it by March.",
+    "I'd rather not say",
+    "ok sure",
+    "Actually the budget is 80k USD, call me Priya Sharma",
+    "",
+    "no",
+]
+
+
+def legacy_extract(text, source_id, confidence_base=0.8):
+    now = datetime.utcnow().isoformat() + "Z"
+    out = {}
+    text = analyze(text)
+    entities = extract_entities(text)
+    for entity_key, slot_name in ENTITY_TO_SLOT.items():
+        val = entities.get(entity_key)
+        if val is not None:
+            sv = SlotValue(value=val, status=SlotStatus.FILLED, confidence=confidence_base, source=source_id, timestamp=now)
+            out[slot_name] = sv
+            if slot_name == "approx_duration":
+                out["duration"] = sv
+    for patterns, names in (
+        (NAME_PATTERNS, ("name", "caller_name")),
+        (COUNTRY_PATTERNS, ("country_location",)),
+        (BUDGET_PATTERNS, ("budget_or_range",)),
+        (TIMELINE_PATTERNS, ("deadline",)),
+    ):
+        val = _extract_slot_from_text(text.text, patterns)
+        if val:
+            sv = SlotValue(value=val, status=SlotStatus.FILLED, confidence=confidence_base, source=source_id, timestamp=now)
+            for n in names:
+                out[n] = sv
+    return out
+
+
+def _legacy_status(new_slots, all_slots):
+    for name in all_slots:
+        sv = new_slots.get(name) or SlotValue()
+        if sv.status in (SlotStatus.UNAVAILABLE, SlotStatus.REFUSED):
+            continue
+        if sv.value is not None and sv.value != "":
+            new_slots[name] = SlotValue(
+                value=sv.value, status=SlotStatus.FILLED, confidence=sv.confidence, source=sv.source, timestamp=sv.timestamp
+            )
+        else:
+            new_slots[name] = SlotValue(status=SlotStatus.MISSING)
+
+
+def legacy_update(state, message_text, source_id, intent, *, is_user_turn=True):
+    """update_state_from_message as it was before the copy-on-write slot table (reference)."""
+    now = datetime.utcnow().isoformat() + "Z"
+    intent = intent or state.intent or "new_project_sales"
+    required = set(get_required_slots(intent))
+    all_slots = required | set(get_optional_slots(intent))
+    message_text = analyze(message_text)
+    new_slots = dict(state.slots)
+    if is_user_turn and state.last_question_asked and _is_refusal(message_text, state.last_question_asked, intent):
+        slot = new_slots.get(state.last_question_asked) or SlotValue()
+        new_slots[state.last_question_asked] = SlotValue(
+            value=slot.value, status=SlotStatus.REFUSED, confidence=slot.confidence, source=slot.source, timestamp=now
+        )
+    for slot_name, new_sv in legacy_extract(message_text, source_id).items():
+        if slot_name not in all_slots:
+            continue
+        existing = new_slots.get(slot_name)
+        if existing and existing.status in (SlotStatus.UNAVAILABLE, SlotStatus.REFUSED):
+            continue
+        if existing and existing.value is not None and new_sv.confidence <= existing.confidence:
+            continue
+        new_slots[slot_name] = new_sv
+    _legacy_status(new_slots, all_slots)
+    required_filled = all((new_slots.get(r) or SlotValue()).status == SlotStatus.FILLED for r in required)
+    stage = ConversationStage.MINIMUM_COMPLETENESS_REACHED if required_filled else ConversationStage.SLOT_FILLING
+    return ConversationState(
+        intent=intent, slots=new_slots, last_question_asked=state.last_question_asked,
+        last_question_at=state.last_question_at, stage=stage, updated_at=now,
+    )
+
+
+def _comparable(state: ConversationState) -> dict:
+    data = state.model_dump(mode="json", exclude={"updated_at"})
+    data["slots"] = {k: {f: v for f, v in s.items() if f != "timestamp"} for k, s in sorted(data["slots"].items())}
+    return data
+
+
+def _replay(update, intent: str, asked: str | None) -> list[ConversationState]:
+    state = initial_state(intent).model_copy(update={"last_question_asked": asked})
+    states = []
+    for i, text in enumerate(MESSAGES):
+        state = update(state, text, f"turn_{i}", intent, is_user_turn=i % 3 != 2)
+        states.append(state)
+    return states
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cases = [(intent, asked) for intent in INTENT_SLOT_REGISTRY for asked in (None, "budget_or_range", "name")]
+    for intent, asked in cases:
+        old, new = _replay(legacy_update, intent, asked), _replay(update_state_from_message, intent, asked)
+        assert [_comparable(s) for s in old] == [_comparable(s) for s in new], (intent, asked)
+    # recompute_slot_status: same as the legacy status pass, incl. a slot that must be reset
+    for intent, asked in cases:
+        for s in _replay(update_state_from_message, intent, asked):
+            slots = dict(s.slots)
+            slots["project_type"] = SlotValue(value="", status=SlotStatus.FILLED, confidence=0.5)
+            s = s.model_copy(update={"slots": slots})
+            expected = dict(s.slots)
+            _legacy_status(expected, set(get_required_slots(intent)) | set(get_optional_slots(intent)))
+            got = recompute_slot_status(s, intent)
+            assert {k: v.model_dump() for k, v in got.slots.items()} == {k: v.model_dump() for k, v in expected.items()}
+    print(f"Regression: {len(cases)} replays of {len(MESSAGES)} messages, identical states.")
+
+    results = {}
+    for _ in range(3):
+        for label, fn in (("validated", legacy_update), ("copy-on-write", update_state_from_message)):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                _replay(fn, "new_project_sales", "budget_or_range")
+            us = (time.perf_counter() - start) / (rounds * len(MESSAGES)) * 1e6
+            results[label] = min(us, results.get(label, us))
+    for label, us in results.items():
+        print(f"{label:14s} {us:7.1f} µs per turn")
+    print(f"speedup        {results['validated'] / results['copy-on-write']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark + regression check: compiled slot-registry lookups vs the original per-call list
+copies / linear config search / FOLLOW_UP_PRIORITY filtering. Asserts identical results for
+every intent (plus unknown / None) and slot, then prints per-call latency.
+  python scripts/bench_slot_registry.py [ROUNDS]
+"""
+import sys
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.state.models import ConversationState
+from src.state.follow_up import get_next_question
+from src.state.slot_registry import (
+    FOLLOW_UP_PRIORITY,
+    INTENT_SLOT_REGISTRY,
+    get_follow_up_order,
+    get_optional_slots,
+    get_question_templates,
+    get_refusal_phrases,
+    get_required_slots,
+    get_slot_config,
+)
+
+INTENTS = [*INTENT_SLOT_REGISTRY, "not_an_intent", None]
+SLOTS = sorted(
+    set(FOLLOW_UP_PRIORITY)
+    | {s for d in INTENT_SLOT_REGISTRY.values() for s in (d.get("slots_config") or {})}
+    | {"no_such_slot"}
+)
+
+
+def legacy_required(intent):
+    entry = INTENT_SLOT_REGISTRY.get(intent) or INTENT_SLOT_REGISTRY.get("unknown_chitchat", {})
+    return list(entry.get("required_slots", []))
+
+
+def legacy_optional(intent):
+    entry = INTENT_SLOT_REGISTRY.get(intent) or INTENT_SLOT_REGISTRY.get("unknown_chitchat", {})
+    return list(entry.get("optional_slots", []))
+
+
+def legacy_config(slot_name, intent=None):
+    if intent and slot_name in (INTENT_SLOT_REGISTRY.get(intent, {}).get("slots_config") or {}):
+        return INTENT_SLOT_REGISTRY[intent]["slots_config"][slot_name]
+    for data in INTENT_SLOT_REGISTRY.values():
+        if slot_name in (data.get("slots_config") or {}):
+            return data["slots_config"][slot_name]
+    return {}
+
+
+def legacy_templates(slot_name, intent=None):
+    return list(legacy_config(slot_name, intent).get("question_templates", ["Could you share that with me?"]))
+
+
+def legacy_refusals(slot_name, intent=None):
+    return list(legacy_config(slot_name, intent).get("refusal_phrases", []))
+
+
+def legacy_order(intent):
+    required, optional = legacy_required(intent), legacy_optional(intent)
+    return [s for s in FOLLOW_UP_PRIORITY if s in required] + [
+        s for s in FOLLOW_UP_PRIORITY if s in optional and s not in required
+    ]
+
+
+def _time(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for intent in INTENTS:
+        assert list(get_required_slots(intent)) == legacy_required(intent), intent
+        assert list(get_optional_slots(intent)) == legacy_optional(intent), intent
+        assert list(get_follow_up_order(intent)) == legacy_order(intent), intent
+        for slot in SLOTS:
+            config = {k: list(v) for k, v in get_slot_config(slot, intent).items()}
+            assert config == legacy_config(slot, intent), (slot, intent)
+            assert list(get_question_templates(slot, intent)) == legacy_templates(slot, intent), (slot, intent)
+            assert list(get_refusal_phrases(slot, intent)) == legacy_refusals(slot, intent), (slot, intent)
+    print(f"Regression: {len(INTENTS)} intents x {len(SLOTS)} slots, identical lookups.")
+
+    intents = [i for i in INTENTS if i]
+
+    def legacy_all():
+        for intent in intents:
+            legacy_required(intent), legacy_optional(intent), legacy_order(intent)
+            for slot in SLOTS:
+                legacy_templates(slot, intent), legacy_refusals(slot, intent)
+
+    def compiled_all():
+        for intent in intents:
+            get_required_slots(intent), get_optional_slots(intent), get_follow_up_order(intent)
+            for slot in SLOTS:
+                get_question_templates(slot, intent), get_refusal_phrases(slot, intent)
+
+    calls = len(intents) * (3 + 2 * len(SLOTS))
+    r = max(1, rounds // 20)
+    before, after = _time(legacy_all, r) / calls, _time(compiled_all, r) / calls
+    print(f"registry lookups : legacy {before:6.3f} µs  compiled {after:6.3f} µs per call  ({before / after:.1f}x)")
+
+    states = [ConversationState(intent=i) for i in intents]
+    nq = _time(lambda: [get_next_question(s, turn_index=1) for s in states], rounds) / len(states)
+    print(f"get_next_question: {nq:6.2f} µs per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark + regression check: incremental state build from a saved checkpoint vs full turn replay.
+For each conversation length, the state for the first N-1 turns is saved (JSON round trip, as
+POST /state stores it) and the last turn applied on top; asserts the result equals a full replay
+(timestamps aside), then prints per-build latency.
+  python scripts/bench_state_checkpoint.py [ROUNDS]
+"""
+import sys
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.state import apply_turns, build_state_from_conversation
+from src.state.models import ConversationState
+
+INTENT = "new_project_sales"
+SCRIPT = [
+    ("agent", "Hi! How can I help you today?"),
+    ("user", "Hi, I am looking for animation services for a 2 minute promo video."),
+    ("agent", "Great. What's your name and where are you based?"),
+    ("user", "My name is Priya and we're based in India."),
+    ("agent", "2D or 3D, and which platform?"),
+    ("user", "3D, for YouTube. Budget is around 50k and we need it by March."),
+    ("agent", "What's your budget range?"),
+    ("user", "I'd rather not say"),
+    ("user", "Can you reduce the price a bit, maybe 40 thousand?"),
+    ("agent", "Anything else?"),
+    ("user", "ok sure, thanks"),
+]
+
+
+def _turns(n: int) -> list[tuple[str, str]]:
+    return [SCRIPT[i % len(SCRIPT)] for i in range(n)]
+
+
+def _comparable(state: ConversationState) -> dict:
+    data = state.model_dump(mode="json", exclude={"updated_at", "last_question_at"})
+    for slot in data["slots"].values():
+        slot.pop("timestamp", None)
+    return data
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for n in range(1, 3 * len(SCRIPT)):
+        turns = _turns(n)
+        full = build_state_from_conversation("", turns, INTENT)
+        for k in range(n + 1):
+            saved = build_state_from_conversation("", turns[:k], INTENT).model_dump_json()
+            resumed = apply_turns(ConversationState.model_validate_json(saved), turns, INTENT, start=k)
+            assert _comparable(resumed) == _comparable(full), (n, k)
+    print(f"Regression: every checkpoint of conversations up to {3 * len(SCRIPT) - 1} turns == full replay.")
+
+    for n in (10, 50, 200):
+        turns = _turns(n)
+        saved = build_state_from_conversation("", turns[:-1], INTENT).model_dump_json()
+        r = max(1, rounds * 10 // n)
+        start = time.perf_counter()
+        for _ in range(r):
+            build_state_from_conversation("", turns, INTENT)
+        full_ms = (time.perf_counter() - start) / r * 1e3
+        start = time.perf_counter()
+        for _ in range(r):
+            apply_turns(ConversationState.model_validate_json(saved), turns, INTENT, start=n - 1)
+        inc_ms = (time.perf_counter() - start) / r * 1e3
+        print(f"{n:4d} turns, 1 new: full replay {full_ms:8.2f} ms  incremental {inc_ms:6.2f} ms  ({full_ms / inc_ms:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
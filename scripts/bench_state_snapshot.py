@@ -0,0 +1,71 @@
+"""
+Size + latency comparison: compact state snapshots (src/state/snapshot.py) vs state_json
+(model_dump_json / json.loads + model_validate). Asserts snapshots decode to the same state,
+JSON dump and qualification results, including from legacy JSON text.
+  python scripts/bench_state_snapshot.py [ROUNDS]
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.qualification import completeness_summary, lead_score_summary
+from src.state import build_state_from_conversation
+from src.state.models import ConversationState
+from src.state.slot_registry import INTENT_SLOT_REGISTRY
+from src.state.snapshot import encode_state, encode_state_json, load_state, msgpack
+
+TURNS = [
+    ("user", "Hi, I am looking for animation services for a 2 minute promo video."),
+    ("agent", "Great. What's your name and where are you based?"),
+    ("user", "My name is Priya and we're based in India."),
+    ("user", "3D, for YouTube. Budget is around 50k and we need it by March."),
+]
+
+
+def _us(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    states = [build_state_from_conversation("", TURNS[:n], intent) for intent in INTENT_SLOT_REGISTRY for n in (0, 2, 4)]
+    for st in states:
+        text, blob = st.model_dump_json(), encode_state(st)
+        for snap in (load_state(blob), load_state(text)):
+            assert snap.to_dict() == st.model_dump(mode="json")
+            assert snap.to_state().model_dump() == st.model_dump()
+            assert completeness_summary(snap) == completeness_summary(st)
+            assert lead_score_summary(snap, num_turns=4) == lead_score_summary(st, num_turns=4)
+        assert encode_state_json(text) == blob
+    print(f"Regression: {len(states)} states, snapshot == JSON (state, dump, completeness, lead score).")
+
+    st = build_state_from_conversation("", TURNS, "new_project_sales")
+    text, blob = st.model_dump_json(), encode_state(st)
+    body = "msgpack" if msgpack is not None else "compact JSON"
+    avg_json = sum(len(s.model_dump_json().encode()) for s in states) / len(states)
+    avg_snap = sum(len(encode_state(s)) for s in states) / len(states)
+    print(f"size  state_json {len(text.encode()):5d} B  snapshot ({body}) {len(blob):4d} B  "
+          f"(avg over states {avg_json:.0f} B vs {avg_snap:.0f} B, {avg_snap / avg_json:.0%})")
+
+    rows = [
+        ("write", lambda: st.model_dump_json(), lambda: encode_state(st)),
+        ("GET /state", lambda: ConversationState.model_validate(json.loads(text)).model_dump(mode="json"),
+         lambda: load_state(blob).to_dict()),
+        ("qualification", lambda: completeness_summary(ConversationState.model_validate(json.loads(text))),
+         lambda: completeness_summary(load_state(blob))),
+        ("full model", lambda: ConversationState.model_validate(json.loads(text)), lambda: load_state(blob).to_state()),
+    ]
+    for label, old, new in rows:
+        before, after = _us(old, rounds), _us(new, rounds)
+        print(f"{label:14s} json {before:7.2f} µs  snapshot {after:7.2f} µs  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
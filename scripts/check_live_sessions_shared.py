@@ -0,0 +1,92 @@
+"""
+Multi-worker check: several processes (as with uvicorn --workers N) and threads run turns on the
+same live sessions against one SQLite DB. Shared mode (per-session lease + version check) must
+serialize them: every session ends with turn_index == total turns and every message in its history.
+Also runs the per-process (non-shared) store for comparison, which loses turns, and prints throughput.
+  python scripts/check_live_sessions_shared.py [PROCESSES] [TURNS_PER_PROCESS]
+"""
+import asyncio
+import multiprocessing as mp
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+THREADS = 2
+
+
+def _worker(db_path: str, session_ids: list[str], turns: int, shared: bool, tag: str) -> None:
+    from src.live import session
+    from src.live.session_store import LiveSessionStore, SQLiteSessionBackend, set_session_store
+    from src.registry import store
+
+    store.DB_PATH = Path(db_path)
+    set_session_store(LiveSessionStore(SQLiteSessionBackend(), shared=shared, flush_interval_s=0, history_max=0))
+
+    async def run(t: int) -> None:
+        for i in range(turns // THREADS):
+            for sid in session_ids:
+                await session.aturn(sid, f"hi {tag}-{t}-{i}")
+
+    threads = [threading.Thread(target=asyncio.run, args=(run(t),)) for t in range(THREADS)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    set_session_store(None)
+
+
+def _round(processes: int, turns: int, sessions: int, shared: bool) -> tuple[list[dict], float]:
+    from src.live import session
+    from src.live.session_store import LiveSessionStore, SQLiteSessionBackend, set_session_store
+    from src.registry import store
+
+    store.DB_PATH = Path(tempfile.mkdtemp()) / "live.db"
+    store.init_db()
+    set_session_store(LiveSessionStore(SQLiteSessionBackend(), shared=True, flush_interval_s=0, history_max=0))
+    ids = [session.start_session()[0] for _ in range(sessions)]
+    ctx = mp.get_context("spawn")
+    start = time.perf_counter()
+    procs = [
+        ctx.Process(target=_worker, args=(str(store.DB_PATH), ids, turns, shared, f"p{p}")) for p in range(processes)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0, p.exitcode
+    elapsed = time.perf_counter() - start
+    return [session.get_session(sid) for sid in ids], elapsed
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    turns -= turns % THREADS
+    total = processes * turns
+
+    results, elapsed = _round(processes, turns, 4, shared=True)
+    for data in results:
+        user_texts = [h["text"] for h in data["history"] if h["role"] == "user"]
+        assert data["turn_index"] == total, (data["turn_index"], total)
+        assert len(user_texts) == len(set(user_texts)) == total
+        writers: dict[str, list[int]] = {}
+        for text in user_texts:
+            writer, _, i = text[3:].rpartition("-")
+            writers.setdefault(writer, []).append(int(i))
+        assert all(seq == sorted(seq) for seq in writers.values())
+    print(f"Regression: {processes} processes x {THREADS} threads, {len(results)} sessions: "
+          f"every session has all {total} turns, in order per writer.")
+    print(f"shared      {len(results) * total / elapsed:7.0f} turns/s (incl. process start)")
+
+    results, elapsed = _round(processes, turns, 4, shared=False)
+    kept = sum(d["turn_index"] for d in results)
+    print(f"per-process {len(results) * total / elapsed:7.0f} turns/s, kept {kept}/{len(results) * total} turns (lost updates)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Check that dashboard/admin registry queries use indexes (EXPLAIN QUERY PLAN, no full scans or sorts).
+Runs against a throwaway DB; no server needed.
+  python scripts/check_query_plans.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import src.registry.store as store
+from src.registry.connection import close_pool
+
+
+def _plan(c, sql: str) -> list[str]:
+    return [row[3] for row in c.execute("EXPLAIN QUERY PLAN " + sql).fetchall()]
+
+
+def _is_bad(step: str) -> bool:
+    # Full-table scan ("SCAN conversations") or a sort the index should have provided.
+    # Index-order walks ("SCAN ... USING INDEX") are fine: partial index or unfiltered list.
+    if step.startswith("SCAN ") and "USING" not in step:
+        return True
+    return "TEMP B-TREE" in step
+
+
+def main():
+    tmp = Path(tempfile.mkdtemp()) / "plans.db"
+    store.DB_PATH = tmp
+    store.init_db()
+
+    calls = [
+        ("list_conversations_today", lambda: store.list_conversations_today()),
+        ("list_hot_leads", lambda: store.list_hot_leads()),
+        ("list_conversations_by_intent", lambda: store.list_conversations_by_intent("price_estimation")),
+        ("get_quotation_by_session", lambda: store.get_quotation_by_session("live_x")),
+        ("list_quotation_requests", lambda: store.list_quotation_requests()),
+        ("list_quotation_requests(urgent)", lambda: store.list_quotation_requests(urgent_only=True)),
+    ]
+    # Same queries with a keyset cursor (page 2+)
+    conv_cursor = store.encode_cursor("9999-12-31", "conv_zzzz")
+    quote_cursor = store.encode_cursor("9999-12-31", 1 << 31)
+    calls += [
+        ("list_conversations_today(cursor)", lambda: store.list_conversations_today(cursor=conv_cursor)),
+        ("list_hot_leads(cursor)", lambda: store.list_hot_leads(cursor=conv_cursor)),
+        ("list_conversations_by_intent(cursor)", lambda: store.list_conversations_by_intent("complaint_issue", cursor=conv_cursor)),
+        ("list_quotation_requests(cursor)", lambda: store.list_quotation_requests(cursor=quote_cursor)),
+        ("list_quotation_requests(urgent, cursor)", lambda: store.list_quotation_requests(urgent_only=True, cursor=quote_cursor)),
+    ]
+    failures = []
+    with store._conn() as c:
+        for name, call in calls:
+            seen: list[str] = []
+            c.set_trace_callback(seen.append)
+            try:
+                call()
+            finally:
+                c.set_trace_callback(None)
+            selects = [s for s in seen if s.lstrip().upper().startswith("SELECT")]
+            assert selects, f"{name}: no SELECT captured"
+            for sql in selects:
+                steps = _plan(c, sql)
+                bad = [s for s in steps if _is_bad(s)]
+                status = "FAIL" if bad else "OK"
+                print(f"{status} {name}: {' | '.join(steps)}")
+                if bad:
+                    failures.append(name)
+    close_pool()
+    assert not failures, f"Queries without index: {failures}"
+    print("All registry list queries use indexes.")
+
+
+if __name__ == "__main__":
+    main()
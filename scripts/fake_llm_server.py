@@ -0,0 +1,129 @@
+"""
+Local fake LLM server (OpenAI-compatible POST /v1/chat/completions, plain and stream=true) for
+exercising the LLM gateway without a model: fixed latency, echo replies, counts of requests and
+TCP connections. Point the app at it with
+  USE_OLLAMA=0 OPENAI_API_KEY=fake OPENAI_BASE_URL=http://127.0.0.1:8099/v1
+  python scripts/fake_llm_server.py [PORT] [DELAY_S]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Server(ThreadingHTTPServer):
+    def handle_error(self, request, client_address) -> None:
+        pass  # clients hanging up mid-reply (cancelled calls) are expected
+
+
+class FakeLLMServer:
+    """Threaded HTTP/1.1 server (keep-alive) on 127.0.0.1; start()/stop() or use as a context manager."""
+
+    def __init__(self, port: int = 0, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.requests = 0
+        self.connections = 0
+        self.prompts: list[str] = []
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = self.connections = 0
+            self.prompts.clear()
+
+    def start(self) -> "FakeLLMServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive unless the client closes
+            disable_nagle_algorithm = True  # headers + body are separate writes
+
+            def setup(self) -> None:
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                prompt = (body.get("messages") or [{}])[-1].get("content") or ""
+                with fake._lock:
+                    fake.requests += 1
+                    fake.prompts.append(prompt)
+                time.sleep(fake.delay)
+                reply = f"Sure — {prompt}"
+                if body.get("stream"):
+                    self._stream(body, reply)
+                    return
+                data = json.dumps({
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model") or "fake",
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self, body: dict, reply: str) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for i, word in enumerate(reply.split(" ")):
+                    chunk = {
+                        "id": "chatcmpl-fake",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": body.get("model") or "fake",
+                        "choices": [{"index": 0, "delta": {"content": word if i == 0 else " " + word}, "finish_reason": None}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.close_connection = True
+
+        return Handler
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8099
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    server = FakeLLMServer(port, delay)
+    print(f"Fake LLM at {server.base_url} ({delay:.2f}s per reply); Ctrl-C to stop")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 
 from src.registry import (
+    DEFAULT_PAGE_SIZE,
     get_quotation_by_id,
     list_quotation_requests,
     set_quotation_urgent,
@@ -82,18 +83,25 @@ ADMIN_DASHBOARD_HTML = """<!DOCTYPE html>
     </thead>
     <tbody id="tbody"></tbody>
   </table>
+  <button id="more" style="display:none; margin-top:1rem" onclick="loadMore()">Load more</button>
   <script>
     const API = '/admin';
-    async function load(urgentOnly) {
-      const url = urgentOnly ? API + '/quotations?urgent=1' : API + '/quotations';
-      const r = await fetch(url);
+    let rows = [];
+    let nextCursor = null;
+    async function load(urgentOnly, cursor) {
+      const params = new URLSearchParams();
+      if (urgentOnly) params.set('urgent', '1');
+      if (cursor) params.set('cursor', cursor);
+      const r = await fetch(API + '/quotations?' + params.toString());
       const d = await r.json();
+      nextCursor = d.next_cursor || null;
       return d.quotations || [];
     }
     function render(rows) {
       const tbody = document.getElementById('tbody');
       document.getElementById('loading').style.display = 'none';
       document.getElementById('table').style.display = 'table';
+      document.getElementById('more').style.display = nextCursor ? 'inline-block' : 'none';
       tbody.innerHTML = rows.map(q => {
         const status = (q.status || '').replace(/_/g, ' ');
         const rowClass = q.is_urgent ? 'urgent' : '';
@@ -167,7 +175,11 @@ ADMIN_DASHBOARD_HTML = """<!DOCTYPE html>
     }
     function refresh() {
       const urgentOnly = document.getElementById('urgentOnly').checked;
-      load(urgentOnly).then(render);
+      load(urgentOnly).then(page => { rows = page; render(rows); });
+    }
+    function loadMore() {
+      const urgentOnly = document.getElementById('urgentOnly').checked;
+      load(urgentOnly, nextCursor).then(page => { rows = rows.concat(page); render(rows); });
     }
     document.getElementById('urgentOnly').addEventListener('change', refresh);
     refresh();
@@ -184,10 +196,17 @@ def admin_dashboard_page():
 
 
 @router.get("/quotations")
-def admin_list_quotations(urgent: bool | None = None):
-    """List all quotation requests. ?urgent=1 for urgent only."""
-    items = list_quotation_requests(urgent_only=bool(urgent))
-    return {"quotations": items}
+def admin_list_quotations(
+    urgent: bool | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+):
+    """List quotation requests, newest first. ?urgent=1 for urgent only; pass next_cursor for the next page."""
+    try:
+        items, next_cursor = list_quotation_requests(urgent_only=bool(urgent), limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"quotations": items, "next_cursor": next_cursor}
 
 
 @router.get("/quotations/{qid}")
@@ -241,4 +260,4 @@ def admin_set_exception(qid: int, body: ExceptionBody):
     ok = update_quotation_exception(qid, exception_amount)
     if not ok:
         raise HTTPException(status_code=500, detail="Update failed")
-    return {"ok": True, "quotation": get_quotation_by_id(qid)}
\ No newline at end of file
+    return {"ok": True, "quotation": get_quotation_by_id(qid)}
\ No newline at end of file
@@ -58,24 +58,47 @@ DASHBOARD_HTML = """<!DOCTYPE html>
       const d = await r.json();
       document.getElementById('loading').style.display = 'none';
       document.getElementById('home').style.display = 'block';
-      renderList('todays', d.todays_conversations);
-      renderList('hot', d.hot_leads);
-      renderList('estimates', d.estimation_requests);
-      renderList('complaints', d.complaints);
+      const next = d.next_cursors || {};
+      renderList('todays', 'todays_conversations', d.todays_conversations, next.todays_conversations);
+      renderList('hot', 'hot_leads', d.hot_leads, next.hot_leads);
+      renderList('estimates', 'estimation_requests', d.estimation_requests, next.estimation_requests);
+      renderList('complaints', 'complaints', d.complaints, next.complaints);
     }
-    function renderList(id, items) {
-      const el = document.getElementById(id);
-      if (!items || items.length === 0) { el.innerHTML = '<div class="card">None</div>'; return; }
-      el.innerHTML = items.map(c => `
+    function cardsHtml(items) {
+      return items.map(c => `
         <div class="card">
           <a href="#" data-id="${c.conversation_id}" class="drill-link">${c.conversation_id}</a>
           <span class="meta">${c.primary_intent || '—'} · ${c.lead_band || ''} · ${c.lead_score != null ? c.lead_score + ' pts' : ''}</span>
         </div>
       `).join('');
-      el.querySelectorAll('.drill-link').forEach(a => {
+    }
+    function bindDrillLinks(el) {
+      el.querySelectorAll('.drill-link:not([data-bound])').forEach(a => {
+        a.dataset.bound = '1';
         a.addEventListener('click', e => { e.preventDefault(); drillDown(a.dataset.id); });
       });
     }
+    function renderList(id, name, items, cursor) {
+      const el = document.getElementById(id);
+      if (!items || items.length === 0) { el.innerHTML = '<div class="card">None</div>'; return; }
+      el.innerHTML = '<div class="cards">' + cardsHtml(items) + '</div>';
+      bindDrillLinks(el);
+      if (cursor) addMoreButton(el, name, cursor);
+    }
+    function addMoreButton(el, name, cursor) {
+      const btn = document.createElement('button');
+      btn.textContent = 'More';
+      btn.addEventListener('click', async () => {
+        btn.remove();
+        const r = await fetch(API + '/dashboard/lists/' + name + '?cursor=' + encodeURIComponent(cursor));
+        const d = await r.json();
+        const cards = el.querySelector('.cards');
+        cards.insertAdjacentHTML('beforeend', cardsHtml(d.items || []));
+        bindDrillLinks(cards);
+        if (d.next_cursor) addMoreButton(el, name, d.next_cursor);
+      });
+      el.appendChild(btn);
+    }
     async function drillDown(id) {
       const r = await fetch(API + '/dashboard/conversations/' + encodeURIComponent(id));
       const d = await r.json();
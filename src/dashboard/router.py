@@ -4,8 +4,6 @@ Home: today's conversations, hot leads, estimation requests, complaints.
 Drill-down: summary, intent & tags, extracted details, missing fields, full transcript.
 """
 
-import json
-
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse
 
@@ -15,12 +13,12 @@ from src.human import needs_human_takeover
 from src.qualification import completeness_summary
 from src.registry import (
     get_conversation,
-    get_state_json,
+    get_state_snapshot,
     list_conversations_by_intent,
     list_conversations_today,
     list_hot_leads,
 )
-from src.state.models import ConversationState
+from src.state.snapshot import load_state
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -31,22 +29,41 @@ def dashboard_page():
     return DASHBOARD_HTML
 
 
+# Home lists, in load order. Each: (limit, cursor) -> (rows, next_cursor).
+HOME_LISTS = {
+    "todays_conversations": list_conversations_today,
+    "hot_leads": list_hot_leads,
+    "estimation_requests": lambda limit, cursor: list_conversations_by_intent("price_estimation", limit, cursor),
+    "complaints": lambda limit, cursor: list_conversations_by_intent("complaint_issue", limit, cursor),
+}
+HOME_PAGE_SIZE = 20
+
+
 @router.get("/home")
-def dashboard_home():
+def dashboard_home(limit: int = HOME_PAGE_SIZE):
     """
     Phase 7.1: What loads first. Business urgency: today's conversations, hot leads,
-    estimation requests, complaints.
+    estimation requests, complaints. First page of each; next_cursors feed /dashboard/lists/{name}.
     """
-    today = list_conversations_today()
-    hot = list_hot_leads()
-    estimation_requests = list_conversations_by_intent("price_estimation")
-    complaints = list_conversations_by_intent("complaint_issue")
-    return {
-        "todays_conversations": today,
-        "hot_leads": hot,
-        "estimation_requests": estimation_requests,
-        "complaints": complaints,
-    }
+    out: dict = {}
+    next_cursors: dict[str, str | None] = {}
+    for name, fetch in HOME_LISTS.items():
+        out[name], next_cursors[name] = fetch(limit, None)
+    out["next_cursors"] = next_cursors
+    return out
+
+
+@router.get("/lists/{name}")
+def dashboard_list_page(name: str, limit: int = HOME_PAGE_SIZE, cursor: str | None = None):
+    """Next page of one home list (keyset cursor from /home or a previous page)."""
+    fetch = HOME_LISTS.get(name)
+    if not fetch:
+        raise HTTPException(status_code=404, detail="Unknown list")
+    try:
+        items, next_cursor = fetch(limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.get("/conversations/{conversation_id}")
@@ -58,13 +75,12 @@ def dashboard_drill_down(conversation_id: str):
     conv = get_conversation(conversation_id)
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation not found")
-    raw = get_state_json(conversation_id)
+    raw = get_state_snapshot(conversation_id)
     missing: list[str] = []
     needs_human = False
     trigger_reasons: list[str] = []
     if raw:
-        state = ConversationState.model_validate(json.loads(raw))
-        comp = completeness_summary(state)
+        comp = completeness_summary(load_state(raw))
         missing = comp["mandatory_fields_missing"]
     confidence = conv.extracted_structured_fields.get("intent_confidence") if isinstance(conv.extracted_structured_fields.get("intent_confidence"), (int, float)) else None
     full_text = conv.clean_text or conv.raw_transcript or ""
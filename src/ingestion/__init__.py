@@ -1,5 +1,11 @@
 from .payloads import IncomingChatPayload, IncomingVoicePayload, IngestionResponse
-from .pipeline import process_chat, process_voice
+from .pipeline import (
+    process_chat,
+    process_chat_bulk,
+    process_chat_full,
+    process_conversation_full,
+    process_voice,
+)
 from .router import router
 
 __all__ = [
@@ -7,6 +13,9 @@ __all__ = [
     "IncomingVoicePayload",
     "IngestionResponse",
     "process_chat",
+    "process_chat_bulk",
+    "process_chat_full",
+    "process_conversation_full",
     "process_voice",
     "router",
 ]
@@ -30,6 +30,14 @@ class IncomingVoicePayload(BaseModel):
     conversation_id: str | None = None
 
 
+class ProcessBatchRequest(BaseModel):
+    """Batch NLP over stored conversations."""
+
+    conversation_ids: list[str] = Field(..., min_length=1)
+    processes: bool = False  # spread over worker processes (CPU-bound NLP)
+    workers: int | None = Field(None, ge=1)  # default and cap: NLP_MAX_WORKERS (CPU count)
+
+
 class IngestionResponse(BaseModel):
     conversation_id: str
     status: str = "registered"
@@ -1,13 +1,36 @@
 """
 Intake pipeline: Incoming → Channel Ingestion API → Registry → (Voice?) Transcription → Normalization → Stored.
+Full pipeline: the same, then NLP → state → qualification in memory, all writes in one transaction.
 """
 
+import json
+import sqlite3
+from typing import Any
+
 from src.ingestion.payloads import IncomingChatPayload, IncomingVoicePayload
+from src.nlp.pipeline import persist_nlp_result, persist_nlp_results_batch, run_nlp_pipeline, run_nlp_pipeline_batch
+from src.qualification import completeness_summary, lead_score_summary
+from src.qualification.completeness import CompletenessStatus
 from src.registry.store import (
+    append_lead,
+    append_processing_run,
     generate_conversation_id,
+    get_conversation,
+    get_nlp_inputs,
+    get_state_checkpoint,
     register_conversation,
+    register_conversations_bulk,
+    save_state_snapshot,
+    transaction,
+    update_completeness_status,
+    update_lead_score,
+    update_nlp_results,
+    update_nlp_results_bulk,
 )
 from src.schemas import ChannelSource, SpeakerTurn
+from src.state import apply_turns, build_state_from_conversation, build_state_from_full_text, get_next_question
+from src.state.models import ConversationState
+from src.state.snapshot import encode_state, load_state
 from src.workers.normalization import normalize_turns
 from src.workers.transcription import transcribe_audio, transcribe_from_raw_text
 
@@ -23,23 +46,60 @@ def _incoming_to_turns(chat: IncomingChatPayload) -> list[SpeakerTurn]:
     ]
 
 
-def process_chat(payload: IncomingChatPayload) -> str:
-    """Chat path: turns already text → normalize → store. Returns conversation_id."""
-    cid = payload.conversation_id or generate_conversation_id()
+def _chat_registration(payload: IncomingChatPayload) -> dict[str, Any]:
+    """Normalize a chat payload into register_conversation kwargs."""
     turns = _incoming_to_turns(payload)
     raw_transcript, clean_text, normalized_turns = normalize_turns(turns)
     started = turns[0].timestamp.isoformat() if turns and turns[0].timestamp else None
     ended = turns[-1].timestamp.isoformat() if turns and turns[-1].timestamp else None
-    register_conversation(
-        conversation_id=cid,
-        channel_source=ChannelSource.CHAT,
-        speaker_turns=normalized_turns,
-        raw_transcript=raw_transcript,
-        clean_text=clean_text,
-        started_at=started,
-        ended_at=ended,
-    )
-    return cid
+    return {
+        "conversation_id": payload.conversation_id or generate_conversation_id(),
+        "channel_source": ChannelSource.CHAT,
+        "speaker_turns": normalized_turns,
+        "raw_transcript": raw_transcript,
+        "clean_text": clean_text,
+        "started_at": started,
+        "ended_at": ended,
+    }
+
+
+def process_chat(payload: IncomingChatPayload) -> str:
+    """Chat path: turns already text → normalize → store. Returns conversation_id."""
+    reg = _chat_registration(payload)
+    register_conversation(**reg)
+    return reg["conversation_id"]
+
+
+def process_chat_bulk(payloads: list[IncomingChatPayload]) -> list[str | Exception]:
+    """
+    Bulk chat path: normalize each → store the good ones in one batched transaction.
+    Returns, in order, each item's conversation_id or the exception that failed it alone
+    (bad payload, or a conversation_id already used earlier in the batch).
+    """
+    results: list[str | Exception] = []
+    regs: list[tuple[int, dict[str, Any]]] = []
+    seen: set[str] = set()
+    for p in payloads:
+        try:
+            reg = _chat_registration(p)
+            if reg["conversation_id"] in seen:
+                raise ValueError(f"duplicate conversation_id in batch: {reg['conversation_id']}")
+        except Exception as e:
+            results.append(e)
+            continue
+        seen.add(reg["conversation_id"])
+        regs.append((len(results), reg))
+        results.append(reg["conversation_id"])
+    try:
+        register_conversations_bulk([reg for _, reg in regs])
+    except sqlite3.IntegrityError:
+        # A row the constraints reject: write one by one so only that item fails.
+        for i, reg in regs:
+            try:
+                register_conversations_bulk([reg])
+            except sqlite3.IntegrityError as e:
+                results[i] = e
+    return results
 
 
 def process_voice(payload: IncomingVoicePayload) -> str:
@@ -64,3 +124,168 @@ def process_voice(payload: IncomingVoicePayload) -> str:
         ended_at=None,
     )
     return cid
+
+
+# ---------- State + qualification (Phases 4–6), shared by POST /state and the full pipeline ----------
+
+def load_state_checkpoint(conversation_id: str, intent: str, n_turns: int) -> tuple[ConversationState, int] | None:
+    """
+    Saved state + turns it covers, if usable for an incremental build: built by turn replay,
+    for the same intent, and covering no more turns than the conversation has. Else None.
+    """
+    saved = get_state_checkpoint(conversation_id)
+    if saved is None:
+        return None
+    raw, applied = saved
+    if applied > n_turns:
+        return None
+    snapshot = load_state(raw)
+    if snapshot.intent != intent:
+        return None
+    return snapshot.to_state(), applied
+
+
+def build_state_outputs(
+    intent: str,
+    turns: list[tuple[str, str]],
+    clean: str,
+    checkpoint: tuple[ConversationState, int] | None = None,
+) -> dict[str, Any]:
+    """
+    In memory: replay turns into state (only turns after `checkpoint`, if given), then
+    completeness, lead score and next question.
+    Returns dict: state, completeness, lead, next_question, next_question_slot, turns_applied, turns_replayed.
+    """
+    if turns and checkpoint is not None:
+        base, start = checkpoint
+        state = apply_turns(base, turns, intent, start=start)
+    elif turns:
+        start = 0
+        state = build_state_from_conversation(clean, turns, intent)
+    else:
+        start = 0
+        state = build_state_from_full_text(clean, intent)
+    comp = completeness_summary(state)
+    lead = lead_score_summary(state, num_turns=len(turns), full_text=clean)
+    question, slot = get_next_question(state, turn_index=len(turns))
+    return {
+        "state": state,
+        "completeness": comp,
+        "lead": lead,
+        "next_question": question,
+        "next_question_slot": slot,
+        "turns_applied": len(turns) if turns else None,  # checkpoint; None for full-text state
+        "turns_replayed": len(turns) - start,
+    }
+
+
+def persist_state_outputs(conversation_id: str, outputs: dict[str, Any]) -> bool:
+    """
+    Phase 6 writes for build_state_outputs: state, completeness status, lead score,
+    append-only processing run, and lead when actionable. One transaction.
+    Returns False if the conversation does not exist.
+    """
+    state = outputs["state"]
+    comp = outputs["completeness"]
+    lead = outputs["lead"]
+    label = comp["status"]  # complete | actionable | incomplete | info_only
+    state_json_str = state.model_dump_json()
+    breakdown_json = json.dumps(lead["breakdown"])
+    with transaction():
+        if not save_state_snapshot(conversation_id, encode_state(state), outputs.get("turns_applied")):
+            return False
+        update_completeness_status(conversation_id, label)
+        update_lead_score(conversation_id, lead["lead_score"], lead["lead_band"])
+        append_processing_run(
+            conversation_id,
+            state_json=state_json_str,
+            completeness_pct=comp["completeness_pct"],
+            mandatory_missing_json=json.dumps(comp["mandatory_fields_missing"]),
+            completeness_label=label,
+            lead_score=lead["lead_score"],
+            lead_band=lead["lead_band"],
+            lead_breakdown_json=breakdown_json,
+        )
+        if label in (CompletenessStatus.COMPLETE.value, CompletenessStatus.ACTIONABLE.value):
+            slots_ser = json.dumps({k: v.model_dump(mode="json") for k, v in state.slots.items()})
+            append_lead(
+                conversation_id,
+                intent=state.intent,
+                slots_json=slots_ser,
+                completeness_pct=comp["completeness_pct"],
+                completeness_label=label,
+                lead_score=lead["lead_score"],
+                lead_band=lead["lead_band"],
+                lead_breakdown_json=breakdown_json,
+            )
+    return True
+
+
+# ---------- Full pipeline: ingest → NLP → state → qualification ----------
+
+def _run_stages(turns: list[SpeakerTurn], clean: str) -> tuple[dict, dict[str, Any]]:
+    """NLP then state/qualification on in-memory turns. No DB access."""
+    nlp = run_nlp_pipeline(clean, [t.text for t in turns])
+    intent = nlp["final_intent"]["primary_intent"] or "new_project_sales"
+    outputs = build_state_outputs(intent, [(t.speaker_id, t.text) for t in turns], clean)
+    return nlp, outputs
+
+
+def prepare_chat_full(payload: IncomingChatPayload) -> tuple[dict[str, Any], dict, dict[str, Any]]:
+    """CPU half of process_chat_full (no DB): (registration kwargs, nlp result, state outputs)."""
+    reg = _chat_registration(payload)
+    nlp, outputs = _run_stages(reg["speaker_turns"], reg["clean_text"] or reg["raw_transcript"] or "")
+    return reg, nlp, outputs
+
+
+def persist_chat_full_batch(prepared: list[tuple[dict[str, Any], dict, dict[str, Any]]]) -> None:
+    """Write prepare_chat_full results: batched registration + NLP + state/qualification, one transaction."""
+    with transaction():
+        register_conversations_bulk([reg for reg, _, _ in prepared])
+        for reg, nlp, outputs in prepared:
+            cid = reg["conversation_id"]
+            persist_nlp_result(cid, nlp, update_nlp_results)
+            persist_state_outputs(cid, outputs)
+
+
+def process_chat_full(payload: IncomingChatPayload) -> dict[str, Any]:
+    """
+    Chat → normalize → NLP → state → qualification, without re-reading the row.
+    Registration and every derived write commit together. Returns conversation_id, nlp + state outputs.
+    """
+    reg, nlp, outputs = prepare_chat_full(payload)
+    persist_chat_full_batch([(reg, nlp, outputs)])
+    return {"conversation_id": reg["conversation_id"], "nlp": nlp, **outputs}
+
+
+def process_conversation_full(conversation_id: str) -> dict[str, Any] | None:
+    """Stored conversation: load once, NLP → state → qualification, one transaction. None if not found."""
+    conv = get_conversation(conversation_id)
+    if not conv:
+        return None
+    nlp, outputs = _run_stages(conv.speaker_turns, conv.clean_text or conv.raw_transcript or "")
+    with transaction():
+        persist_nlp_result(conversation_id, nlp, update_nlp_results)
+        persist_state_outputs(conversation_id, outputs)
+    return {"conversation_id": conversation_id, "nlp": nlp, **outputs}
+
+# ---------- Batch NLP: many stored conversations, one read, one write transaction ----------
+
+def process_conversations_nlp_batch(
+    conversation_ids: list[str],
+    *,
+    processes: bool = False,
+    workers: int | None = None,
+) -> tuple[list[tuple[str, dict]], list[str]]:
+    """
+    Phase 3 NLP for many stored conversations: inputs loaded in one query, pipeline run in
+    batch (optionally in worker processes), results written with one bulk update.
+    Returns ([(conversation_id, nlp result)], not_found ids).
+    """
+    ids = list(dict.fromkeys(conversation_ids))
+    inputs = get_nlp_inputs(ids)
+    found = [cid for cid in ids if cid in inputs]
+    results = run_nlp_pipeline_batch([inputs[cid] for cid in found], processes=processes, workers=workers)
+    pairs = list(zip(found, results))
+    persist_nlp_results_batch(pairs, update_nlp_results_bulk)
+    return pairs, [cid for cid in ids if cid not in inputs]
@@ -1,37 +1,46 @@
 """Channel Ingestion API: receive chat or voice, run intake pipeline, return conversation_id."""
 
 import json
+from typing import Any, AsyncIterator
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 
 from src.ingestion.payloads import (
     IncomingChatPayload,
     IncomingVoicePayload,
     IngestionResponse,
+    ProcessBatchRequest,
+)
+from src.ingestion.pipeline import (
+    build_state_outputs,
+    load_state_checkpoint,
+    persist_state_outputs,
+    process_chat,
+    process_chat_bulk,
+    process_chat_full,
+    process_conversation_full,
+    process_conversations_nlp_batch,
+    process_voice,
 )
-from src.ingestion.pipeline import process_chat, process_voice
 from src.nlp.pipeline import run_and_persist
 from src.qualification import completeness_summary, lead_score_summary
-from src.qualification.completeness import CompletenessStatus
 from src.registry import (
     append_human_action,
-    append_lead,
-    append_processing_run,
     get_conversation,
-    get_state_json,
-    save_state_json,
-    update_completeness_status,
-    update_lead_score,
+    get_state_snapshot,
+    save_state_snapshot,
     update_nlp_results,
 )
 from src.schemas import ConversationOutput
 from src.state import (
-    build_state_from_conversation,
     build_state_from_full_text,
     get_next_question,
     update_state_from_message,
 )
-from src.state.models import ConversationState, ConversationStage
+from src.state.models import ConversationState
+from src.state.snapshot import encode_state, load_state
 
 router = APIRouter(prefix="/ingest", tags=["ingestion"])
 
@@ -47,6 +56,98 @@ def ingest_chat(payload: IncomingChatPayload) -> IngestionResponse:
     )
 
 
+# Items per executemany/transaction in bulk ingest; bounds memory for NDJSON streams.
+BULK_CHUNK_SIZE = 500
+
+
+def _bulk_error(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "invalid payload: " + "; ".join(
+            f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+        )
+    return f"{type(e).__name__}: {e}"
+
+
+def _parse_bulk_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return e
+
+
+async def _iter_bulk_items(request: Request) -> AsyncIterator[Any]:
+    """Yield decoded items (or the decode error) from a JSON array or NDJSON body. NDJSON is streamed."""
+    mode: str | None = None
+    parts: list[bytes] = []  # array mode: whole body
+    pending = b""  # ndjson mode: partial last line
+    async for data in request.stream():
+        if mode is None:
+            head = (pending + data).lstrip()
+            if not head:
+                pending += data
+                continue
+            mode = "array" if head[:1] == b"[" else "ndjson"
+        if mode == "array":
+            parts.append(data)
+            continue
+        *lines, pending = (pending + data).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _parse_bulk_line(line)
+    if mode == "array":
+        try:
+            items = json.loads(b"".join(parts))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON array: {e}")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        for item in items:
+            yield item
+    elif pending.strip():
+        yield _parse_bulk_line(pending)
+
+
+@router.post("/chat/bulk")
+async def ingest_chat_bulk(request: Request):
+    """
+    Bulk backfill: body is a JSON array or NDJSON stream of /chat payloads.
+    Normalized and written in chunks (executemany, one transaction per chunk).
+    Returns per-item conversation_id or error, in input order.
+    """
+    results: list[dict] = []
+    chunk: list[tuple[int, IncomingChatPayload]] = []
+
+    async def flush() -> None:
+        batch = list(chunk)
+        chunk.clear()
+        try:
+            outcomes = await run_in_threadpool(process_chat_bulk, [p for _, p in batch])
+        except Exception as e:
+            results.extend({"index": i, "error": _bulk_error(e)} for i, _ in batch)
+            return
+        results.extend(
+            {"index": i, "error": _bulk_error(r)} if isinstance(r, Exception) else {"index": i, "conversation_id": r}
+            for (i, _), r in zip(batch, outcomes)
+        )
+
+    index = 0
+    async for item in _iter_bulk_items(request):
+        try:
+            if isinstance(item, Exception):
+                raise item
+            chunk.append((index, IncomingChatPayload.model_validate(item)))
+        except (ValueError, ValidationError) as e:
+            results.append({"index": index, "error": _bulk_error(e)})
+        index += 1
+        if len(chunk) >= BULK_CHUNK_SIZE:
+            await flush()
+    if chunk:
+        await flush()
+    results.sort(key=lambda r: r["index"])
+    failed = sum(1 for r in results if "error" in r)
+    return {"registered": len(results) - failed, "failed": failed, "results": results}
+
+
 @router.post("/voice", response_model=IngestionResponse)
 def ingest_voice(payload: IncomingVoicePayload) -> IngestionResponse:
     """Incoming call/voice → (Transcription Worker) → Text Normalization → Raw + Clean stored."""
@@ -95,6 +196,29 @@ def process_conversation_nlp(conversation_id: str):
     }
 
 
+# Max conversation ids per /process/batch request.
+MAX_NLP_BATCH = 1000
+
+
+@router.post("/process/batch")
+def process_conversations_batch(body: ProcessBatchRequest):
+    """
+    Phase 3 NLP for many stored conversations in one call: one read, optional worker
+    processes, one write transaction. Same per-conversation results as /conversations/{id}/process.
+    """
+    if len(body.conversation_ids) > MAX_NLP_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_NLP_BATCH} conversation_ids per batch")
+    pairs, not_found = process_conversations_nlp_batch(
+        body.conversation_ids, processes=body.processes, workers=body.workers
+    )
+    return {
+        "status": "processed",
+        "processed": len(pairs),
+        "not_found": not_found,
+        "results": [{"conversation_id": cid, **_nlp_response(nlp)} for cid, nlp in pairs],
+    }
+
+
 def _state_to_response(state: ConversationState) -> dict:
     return state.model_dump(mode="json")
 
@@ -105,11 +229,10 @@ def get_conversation_state(conversation_id: str):
     conv = get_conversation(conversation_id)
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation not found")
-    raw = get_state_json(conversation_id)
+    raw = get_state_snapshot(conversation_id)
     if not raw:
         return {"conversation_id": conversation_id, "state": None, "message": "State not built yet. POST to /state to build."}
-    state = ConversationState.model_validate(json.loads(raw))
-    return {"conversation_id": conversation_id, "state": _state_to_response(state)}
+    return {"conversation_id": conversation_id, "state": load_state(raw).to_dict()}
 
 
 @router.get("/conversations/{conversation_id}/qualification")
@@ -118,7 +241,7 @@ def get_conversation_qualification(conversation_id: str):
     conv = get_conversation(conversation_id)
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation not found")
-    raw = get_state_json(conversation_id)
+    raw = get_state_snapshot(conversation_id)
     if not raw:
         return {
             "conversation_id": conversation_id,
@@ -126,7 +249,7 @@ def get_conversation_qualification(conversation_id: str):
             "lead": None,
             "message": "State not built yet. POST to /state to build.",
         }
-    state = ConversationState.model_validate(json.loads(raw))
+    state = load_state(raw)  # slot reads only; no models built
     comp = completeness_summary(state)
     clean = conv.clean_text or conv.raw_transcript or ""
     turn_count = len(conv.speaker_turns)
@@ -139,10 +262,12 @@ def get_conversation_qualification(conversation_id: str):
 
 
 @router.post("/conversations/{conversation_id}/state")
-def build_and_save_state(conversation_id: str):
+def build_and_save_state(conversation_id: str, rebuild: bool = False):
     """
     Phase 4: Build state from conversation (turn-by-turn slot filling), save, return state + next question.
     Run after NLP process so primary_intent is set.
+    Incremental: resumes from the saved state and applies only turns added since it was built.
+    ?rebuild=true replays every turn from scratch.
     """
     try:
         conv = get_conversation(conversation_id)
@@ -151,54 +276,15 @@ def build_and_save_state(conversation_id: str):
         intent = conv.primary_intent or "new_project_sales"
         turns = [(t.speaker_id, t.text) for t in conv.speaker_turns]
         clean = conv.clean_text or conv.raw_transcript or ""
-        if turns:
-            state = build_state_from_conversation(clean, turns, intent)
-        else:
-            state = build_state_from_full_text(clean, intent)
-        state_json_str = state.model_dump_json()
-        ok = save_state_json(conversation_id, state_json_str)
-        if not ok:
+        checkpoint = None if rebuild else load_state_checkpoint(conversation_id, intent, len(turns))
+        # Phase 5 & 6: completeness, lead score, append-only runs/leads (one transaction)
+        outputs = build_state_outputs(intent, turns, clean, checkpoint)
+        if not persist_state_outputs(conversation_id, outputs):
             raise HTTPException(status_code=500, detail="Failed to save state (conversation not found or DB error)")
-        if state.stage == ConversationStage.MINIMUM_COMPLETENESS_REACHED:
-            update_completeness_status(conversation_id, "complete")
-        # Phase 5 & 6: completeness, lead score, append-only runs/leads
-        comp = completeness_summary(state)
-        clean = conv.clean_text or conv.raw_transcript or ""
-        lead = lead_score_summary(state, num_turns=len(turns), full_text=clean)
-        label = comp["status"]
-        status_for_db = label  # complete | actionable | incomplete | info_only
-        update_completeness_status(conversation_id, status_for_db)
-        update_lead_score(conversation_id, lead["lead_score"], lead["lead_band"])
-        append_processing_run(
-            conversation_id,
-            state_json=state_json_str,
-            completeness_pct=comp["completeness_pct"],
-            mandatory_missing_json=json.dumps(comp["mandatory_fields_missing"]),
-            completeness_label=label,
-            lead_score=lead["lead_score"],
-            lead_band=lead["lead_band"],
-            lead_breakdown_json=json.dumps(lead["breakdown"]),
-        )
-        if label in (CompletenessStatus.COMPLETE.value, CompletenessStatus.ACTIONABLE.value):
-            slots_ser = json.dumps({k: v.model_dump(mode="json") for k, v in state.slots.items()})
-            append_lead(
-                conversation_id,
-                intent=state.intent,
-                slots_json=slots_ser,
-                completeness_pct=comp["completeness_pct"],
-                completeness_label=label,
-                lead_score=lead["lead_score"],
-                lead_band=lead["lead_band"],
-                lead_breakdown_json=json.dumps(lead["breakdown"]),
-            )
-        question, slot = get_next_question(state, turn_index=len(turns))
         return {
-            "conversation_id": conversation_id,
-            "state": _state_to_response(state),
-            "completeness": comp,
-            "lead": lead,
-            "next_question": question,
-            "next_question_slot": slot,
+            **_state_outputs_response(conversation_id, outputs),
+            "mode": "rebuild" if checkpoint is None else "incremental",
+            "turns_replayed": outputs["turns_replayed"],
         }
     except HTTPException:
         raise
@@ -206,6 +292,53 @@ def build_and_save_state(conversation_id: str):
         raise HTTPException(status_code=500, detail=f"State build failed: {type(e).__name__}: {e}")
 
 
+def _state_outputs_response(conversation_id: str, outputs: dict) -> dict:
+    return {
+        "conversation_id": conversation_id,
+        "state": _state_to_response(outputs["state"]),
+        "completeness": outputs["completeness"],
+        "lead": outputs["lead"],
+        "next_question": outputs["next_question"],
+        "next_question_slot": outputs["next_question_slot"],
+    }
+
+
+def _nlp_response(nlp: dict) -> dict:
+    return {
+        "language": nlp["language"],
+        "tentative_intent": nlp["tentative_intent"],
+        "final_intent": nlp["final_intent"],
+        "extracted_entities": nlp["extracted_entities"],
+    }
+
+
+@router.post("/chat/full")
+def ingest_chat_full(payload: IncomingChatPayload):
+    """
+    Ingest → NLP → state → qualification in one call. Same results as /chat, /process, /state
+    but the conversation is never re-read and all writes commit in one transaction.
+    """
+    result = process_chat_full(payload)
+    return {
+        **_state_outputs_response(result["conversation_id"], result),
+        "status": "processed",
+        "nlp": _nlp_response(result["nlp"]),
+    }
+
+
+@router.post("/conversations/{conversation_id}/full")
+def process_conversation_everything(conversation_id: str):
+    """Stored conversation: /process + /state in one pass (row loaded once, one transaction)."""
+    result = process_conversation_full(conversation_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    return {
+        **_state_outputs_response(conversation_id, result),
+        "status": "processed",
+        "nlp": _nlp_response(result["nlp"]),
+    }
+
+
 @router.post("/conversations/{conversation_id}/state/message")
 def append_message_and_update_state(conversation_id: str, body: dict):
     """
@@ -219,14 +352,14 @@ def append_message_and_update_state(conversation_id: str, body: dict):
     if not text:
         raise HTTPException(status_code=400, detail="text required")
     intent = conv.primary_intent or "new_project_sales"
-    raw = get_state_json(conversation_id)
+    raw = get_state_snapshot(conversation_id)
     if raw:
-        state = ConversationState.model_validate(json.loads(raw))
+        state = load_state(raw).to_state()
     else:
         state = build_state_from_full_text(conv.clean_text or conv.raw_transcript or "", intent)
     turn_index = len(conv.speaker_turns) + 1
     state = update_state_from_message(state, text, f"turn_{turn_index}", intent, is_user_turn=True)
-    save_state_json(conversation_id, state.model_dump_json())
+    save_state_snapshot(conversation_id, encode_state(state))
     question, slot = get_next_question(state, turn_index=turn_index, last_user_message=text)
     return {
         "conversation_id": conversation_id,
@@ -1,3 +1,8 @@
-from src.live.session import start_session, turn, get_session
+from src.live.llm_breaker import CircuitBreaker
+from src.live.llm_gateway import LLMGateway, get_llm_gateway, set_llm_gateway
+from src.live.reply_cache import ReplyCache, get_reply_cache, set_reply_cache
+from src.live.routing import get_route_counters, route_turn
+from src.live.session import astream_turn, aturn, start_session, get_session
+from src.live.session_store import LiveSessionStore, SessionBusyError, get_session_store, set_session_store
 
-__all__ = ["start_session", "turn", "get_session"]
+__all__ = ["start_session", "aturn", "astream_turn", "get_session", "LiveSessionStore", "SessionBusyError", "get_session_store", "set_session_store", "ReplyCache", "get_reply_cache", "set_reply_cache", "route_turn", "get_route_counters", "LLMGateway", "get_llm_gateway", "set_llm_gateway", "CircuitBreaker"]
@@ -1,5 +1,8 @@
 """FAQ for General Services Query — conversational answers about company, services, process."""
 
+from src.nlp.analysis import MessageAnalysis, analyze
+from src.nlp.phrases import TURN_PHRASES
+
 SERVICES_ANSWER = (
     "We do 2D and 3D animation, short films, explainer videos, and ads. "
     "What kind of project would you like to go for?"
@@ -32,25 +35,40 @@ PROCESS_KEYWORDS = ["process", "how do you", "how does it work", "timeline", "st
 TWO_D_3D_KEYWORDS = ["2d", "3d", "two d", "three d", "animation style"]
 LOOKING_KEYWORDS = ["looking for", "need animation", "want animation", "animations"]
 
+# Topics are matched in one scan of the message (shared with the other per-turn checks);
+# precedence is applied afterwards.
+_TWO_D_3D = TURN_PHRASES.register("faq:two_d_3d", TWO_D_3D_KEYWORDS)
+_PROCESS = TURN_PHRASES.register("faq:process", PROCESS_KEYWORDS)
+_COMPANY = TURN_PHRASES.register("faq:company", COMPANY_KEYWORDS)
+_LOOKING = TURN_PHRASES.register("faq:looking", LOOKING_KEYWORDS)
+_SERVICES = TURN_PHRASES.register("faq:services", SERVICES_KEYWORDS)
+_TOPICS = (_TWO_D_3D, _PROCESS, _COMPANY, _LOOKING, _SERVICES)
+
 
-def get_faq_reply(user_message: str) -> str | None:
-    msg = (user_message or "").strip().lower()
-    if not msg:
+def get_faq_reply(user_message: str | MessageAnalysis) -> str | None:
+    msg = analyze(user_message)
+    if not msg.lower:
         return None
-    if any(k in msg for k in TWO_D_3D_KEYWORDS):
+    topics = msg.phrases
+    if _TWO_D_3D in topics:
         return TWO_D_OR_3D_ANSWER
-    if any(k in msg for k in PROCESS_KEYWORDS):
+    if _PROCESS in topics:
         return PROCESS_ANSWER
-    if any(k in msg for k in COMPANY_KEYWORDS):
+    if _COMPANY in topics:
         return COMPANY_ANSWER
-    if any(k in msg for k in LOOKING_KEYWORDS):
+    if _LOOKING in topics:
         return LOOKING_FOR_ANIMATION_ANSWER
-    if any(k in msg for k in SERVICES_KEYWORDS):
-        return SERVICES_ANSWER
+    # Services keywords, or nothing specific: general services answer
     return SERVICES_ANSWER
 
 
-def get_faq_reply_varied(user_message: str, turn_index: int = 0) -> str | None:
+def matches_faq_topic(user_message: str | MessageAnalysis) -> bool:
+    """True when the message names an FAQ topic (get_faq_reply otherwise falls back to the services answer)."""
+    topics = analyze(user_message).phrases
+    return any(t in topics for t in _TOPICS)
+
+
+def get_faq_reply_varied(user_message: str | MessageAnalysis, turn_index: int = 0) -> str | None:
     """Same as get_faq_reply but picks an alternate when available so we don't repeat."""
     base = get_faq_reply(user_message)
     if not base:
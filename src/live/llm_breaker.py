@@ -0,0 +1,195 @@
+"""
+Circuit breaker for live LLM calls. A stalled or failing model server must not add seconds to
+every turn: the breaker tracks a rolling window of call latencies and, when the p95 reaches
+LLM_LATENCY_BUDGET_S or LLM_BREAKER_FAILURES calls in a row are bad (error, over budget, or still
+running past the budget), opens. While open, turns skip the model and take the rule-based reply at
+once. After LLM_BREAKER_COOLDOWN_S one half-open probe call is let through; a good probe closes the
+breaker, a bad one opens it again.
+Calls hold a token from begin() and report it with end() (outcome) or abandon() (caller gave up).
+A call given up on under the budget (a speculative turn's local answer won) says nothing about the
+model: it is neither good nor bad, so a model slower than the speculative budget but within the
+latency budget never trips the breaker.
+"""
+
+import itertools
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+# Tunables (env overrides)
+BREAKER_ENABLED = os.environ.get("LLM_BREAKER", "1").lower() not in ("0", "false", "no")
+LATENCY_BUDGET_S = float(os.environ.get("LLM_LATENCY_BUDGET_S", "4.0"))  # p95 / per-call budget
+BREAKER_WINDOW = int(os.environ.get("LLM_BREAKER_WINDOW", "50"))  # latency samples kept
+BREAKER_MIN_CALLS = int(os.environ.get("LLM_BREAKER_MIN_CALLS", "20"))  # samples before p95 can trip it
+BREAKER_FAILURES = int(os.environ.get("LLM_BREAKER_FAILURES", "3"))  # bad calls in a row
+BREAKER_COOLDOWN_S = float(os.environ.get("LLM_BREAKER_COOLDOWN_S", "10"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe closed → open → half-open breaker over call latency and outcomes."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = BREAKER_ENABLED,
+        latency_budget_s: float = LATENCY_BUDGET_S,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        failures: int = BREAKER_FAILURES,
+        cooldown_s: float = BREAKER_COOLDOWN_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled
+        self.latency_budget_s = latency_budget_s
+        self.min_calls = min_calls
+        self.failures = failures
+        self.cooldown_s = cooldown_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = itertools.count(1)
+        self._samples: deque[float] = deque(maxlen=window)
+        self._inflight: dict[int, float] = {}  # token -> start time
+        self._state = CLOSED
+        self._bad = 0  # bad calls in a row (closed state)
+        self._opened_at = 0.0
+        self._probe: int | None = None
+        self.trips = self.probes = self.abandoned = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._update(self._clock())
+            return self._state
+
+    def is_open(self) -> bool:
+        """True when a call now would be refused (open and cooling down, or a probe in flight). Takes no probe."""
+        if not self.enabled:
+            return False
+        now = self._clock()
+        with self._lock:
+            self._update(now)
+            if self._state == OPEN:
+                return now - self._opened_at < self.cooldown_s
+            return self._state == HALF_OPEN and self._probe is not None
+
+    def begin(self) -> int | None:
+        """Token for a call about to be sent, or None when the breaker refuses it (use the fallback)."""
+        if not self.enabled:
+            return 0
+        now = self._clock()
+        with self._lock:
+            self._update(now)
+            if self._state == OPEN:
+                if now - self._opened_at < self.cooldown_s:
+                    return None
+                self._state, self._probe = HALF_OPEN, None
+            token = next(self._tokens)
+            if self._state == HALF_OPEN:
+                if self._probe is not None:
+                    return None
+                self._probe = token
+                self.probes += 1
+            self._inflight[token] = now
+            return token
+
+    def end(self, token: int | None, ok: bool) -> None:
+        """Outcome of a call: ok=False for errors and timeouts; a reply over the budget is also bad."""
+        now = self._clock()
+        with self._lock:
+            start = self._inflight.pop(token, None)
+            if start is None:
+                return
+            latency = now - start
+            self._samples.append(latency)
+            self._resolve(token, now, bad=not ok or latency >= self.latency_budget_s)
+
+    def abandon(self, token: int | None) -> None:
+        """
+        The caller stopped waiting (cancelled, local answer won). Past the budget it is a bad call;
+        before it, no outcome: no sample, the bad run is unchanged and an abandoned probe frees the
+        half-open slot for the next call. No-op once ended.
+        """
+        now = self._clock()
+        with self._lock:
+            start = self._inflight.pop(token, None)
+            if start is None:
+                return
+            self.abandoned += 1
+            latency = now - start
+            if latency >= self.latency_budget_s:
+                self._samples.append(latency)
+                self._resolve(token, now, bad=True)
+            elif token == self._probe:
+                self._probe = None
+
+    def p95(self) -> float | None:
+        with self._lock:
+            return self._p95()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._inflight.clear()
+            self._state, self._bad, self._probe = CLOSED, 0, None
+
+    def stats(self) -> dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            self._update(now)
+            p95 = self._p95()
+            return {
+                "enabled": self.enabled,
+                "state": self._state,
+                "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "samples": len(self._samples),
+                "bad_in_a_row": self._bad,
+                "in_flight": len(self._inflight),
+                "trips": self.trips,
+                "probes": self.probes,
+                "abandoned": self.abandoned,
+                "latency_budget_s": self.latency_budget_s,
+                "cooldown_s": self.cooldown_s,
+            }
+
+    # ---------- Internals (lock held) ----------
+
+    def _p95(self) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def _resolve(self, token: int, now: float, bad: bool) -> None:
+        if token == self._probe:
+            self._probe = None
+            if bad:
+                self._open(now)
+            else:
+                self._state, self._bad = CLOSED, 0
+                self._samples.clear()  # slow samples from before the outage must not re-trip it
+        elif self._state == CLOSED:
+            self._bad = self._bad + 1 if bad else 0
+            self._update(now)
+        # late results of calls sent before the breaker opened are not probes: ignored
+
+    def _update(self, now: float) -> None:
+        """Trip on bad calls in a row (counting calls still running past the budget) or on p95."""
+        overdue = sum(1 for start in self._inflight.values() if now - start >= self.latency_budget_s)
+        if self._state == CLOSED:
+            p95 = self._p95() if len(self._samples) >= self.min_calls else None
+            if self._bad + overdue >= self.failures or p95 is not None and p95 >= self.latency_budget_s:
+                self._open(now)
+        elif self._state == HALF_OPEN and self._probe is not None and overdue:
+            self._open(now)  # probe still running past the budget: server not back yet
+
+    def _open(self, now: float) -> None:
+        self._state, self._opened_at, self._probe = OPEN, now, None
+        self._inflight.clear()  # calls sent before the trip no longer count
+        self.trips += 1
@@ -1,14 +1,32 @@
 """
 LLM-backed reply for Mira using LangChain. Uses conversation history so the bot
 understands and responds to what the user actually said instead of fixed templates.
+aget_llm_reply (ainvoke) is the only call path: per-call timeout and a per-loop concurrency
+limit, so slow model calls never hold threadpool threads or block rule-based replies.
+astream_llm_reply is the same with token streaming (astream) for /live/stream.
+All calls go through src.live.llm_gateway: keep-alive HTTP pool, single-flight for identical
+prompts, bounded queue with backpressure, and a circuit breaker (src.live.llm_breaker) that
+skips the model while it is down or slower than LLM_LATENCY_BUDGET_S. OPENAI_BASE_URL points the OpenAI client at any
+OpenAI-compatible server (vLLM, llama.cpp, Ollama /v1, a local fake).
+Prompts are bounded by src.live.llm_context: last turns verbatim, older ones as a rolling summary
+plus known slots (pass state= and summary=), within a hard token budget.
+Replies are cached (src.live.reply_cache) by normalized message + slot/history fingerprint.
 """
 
+import asyncio
 import os
-from typing import Any
+from typing import Any, AsyncIterator
+
+from src.live.llm_context import build_context
+from src.live.llm_gateway import LLM_TIMEOUT_S, get_llm_gateway
+from src.live.reply_cache import get_reply_cache
+from src.state.models import ConversationState
 
 _llm_available: bool | None = None
 _chat = None
 
+# Call limits and HTTP pool settings live in llm_gateway (LLM_TIMEOUT_S, LLM_MAX_CONCURRENCY, LLM_QUEUE_*, LLM_POOL_*).
+
 
 def _get_chat():
     global _chat, _llm_available
@@ -22,11 +40,18 @@ def _get_chat():
     # 1) Ollama: use if USE_OLLAMA=1 or if not disabled and no OpenAI key (default to local)
     if not ollama_disabled:
         try:
-            from langchain_community.chat_models import ChatOllama
+            try:  # langchain-ollama takes httpx client kwargs (gateway keep-alive pool)
+                from langchain_ollama import ChatOllama
+
+                pool = {"client_kwargs": get_llm_gateway().client_kwargs()}
+            except ImportError:
+                from langchain_community.chat_models import ChatOllama
 
+                pool = {}
             _chat = ChatOllama(
                 model=os.environ.get("OLLAMA_MODEL", "mistral"),
                 temperature=0.8,
+                **pool,
             )
             _llm_available = True
             return _chat
@@ -41,10 +66,13 @@ def _get_chat():
         if not key:
             _llm_available = False
             return None
+        gateway = get_llm_gateway()
         _chat = ChatOpenAI(
             model=os.environ.get("OPENAI_CHAT_MODEL", "gpt-4o-mini"),
             temperature=0.7,
             api_key=key,
+            base_url=os.environ.get("OPENAI_BASE_URL") or None,
+            http_async_client=gateway.async_http_client(),
         )
         _llm_available = True
         return _chat
@@ -63,29 +91,130 @@ CRITICAL: Respond directly to what the user JUST said. Acknowledge briefly (e.g.
 - Stay in character as Mira. Do not say you're an AI or a language model."""
 
 
-def get_llm_reply(history: list[dict[str, str]], user_message: str) -> str | None:
+async def aget_llm_reply(
+    history: list[dict[str, str]],
+    user_message: str,
+    *,
+    state: ConversationState | None = None,
+    summary: list[str] | None = None,
+    timeout: float | None = None,
+) -> str | None:
     """
-    Get a reply from the LLM given conversation history and the latest user message.
+    Reply from the LLM (chat.ainvoke) given conversation history and the latest user message.
     history: list of {"role": "user"|"bot", "text": "..."}
-    Returns reply string or None if LLM not available or error.
+    state / summary: slot state and rolling summary lines (llm_context.update_summary) for older turns.
+    None (caller falls back to rules) when the LLM is unavailable, errors, exceeds `timeout` (default
+    LLM_TIMEOUT_S, capped at LLM_LATENCY_BUDGET_S), or the gateway rejects it (breaker open, queue
+    full, or no slot within LLM_QUEUE_WAIT_S). Cancellation (client gone) propagates; the model call
+    is aborted unless other turns are waiting on the same prompt.
     """
     chat = _get_chat()
     if not chat:
         return None
     if not (user_message or "").strip():
         return None
+    cache = get_reply_cache()
+    key = cache.key(user_message, state, history)
+    cached = cache.get(key)
+    if cached:
+        return cached
     try:
-        from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
-
-        messages = [SystemMessage(content=SYSTEM_PROMPT)]
-        for h in history:
-            if h.get("role") == "user":
-                messages.append(HumanMessage(content=h.get("text") or ""))
-            else:
-                messages.append(AIMessage(content=h.get("text") or ""))
-        messages.append(HumanMessage(content=user_message.strip()))
-        response = chat.invoke(messages)
-        content = getattr(response, "content", None) or str(response)
-        return (content or "").strip() or None
+        messages = _messages(history, user_message, state, summary)
     except Exception:
         return None
+    response = await get_llm_gateway().ainvoke(chat, messages, LLM_TIMEOUT_S if timeout is None else timeout)
+    reply = _reply_text(response)
+    cache.put(key, reply)
+    return reply
+
+
+async def astream_llm_reply(
+    history: list[dict[str, str]],
+    user_message: str,
+    *,
+    state: ConversationState | None = None,
+    summary: list[str] | None = None,
+    timeout: float | None = None,
+) -> AsyncIterator[str]:
+    """
+    aget_llm_reply as text deltas (chat.astream). Same admission (not single-flight); `timeout`
+    bounds the whole stream, the first token must arrive within LLM_LATENCY_BUDGET_S (the breaker
+    sees time to first token).
+    Yields nothing when the LLM is unavailable or fails before the first token; a stream that
+    fails or times out later just ends (the caller keeps what it has). A cache hit is one delta;
+    only streams that run to completion are cached.
+    """
+    chat = _get_chat()
+    if not chat:
+        return
+    if not (user_message or "").strip():
+        return
+    cache = get_reply_cache()
+    key = cache.key(user_message, state, history)
+    cached = cache.get(key)
+    if cached:
+        yield cached
+        return
+    gateway = get_llm_gateway()
+    async with gateway.admit() as token:
+        if token is None:
+            return
+        stream = None
+        parts: list[str] = []
+        try:
+            loop = asyncio.get_running_loop()
+            timeout = LLM_TIMEOUT_S if timeout is None else timeout
+            deadline = loop.time() + timeout
+            first_deadline = loop.time() + gateway.call_timeout(timeout)
+            stream = chat.astream(_messages(history, user_message, state, summary)).__aiter__()
+            while True:
+                remaining = (deadline if parts else first_deadline) - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    chunk = await asyncio.wait_for(stream.__anext__(), remaining)
+                except StopAsyncIteration:
+                    gateway.breaker.end(token, ok=True)
+                    cache.put(key, "".join(parts).strip())
+                    break
+                text = getattr(chunk, "content", None)
+                if isinstance(text, str) and text:
+                    if not parts:
+                        gateway.breaker.end(token, ok=True)
+                    parts.append(text)
+                    yield text
+            gateway.breaker.end(token, ok=False)  # no-op once the first token arrived
+        except Exception:
+            gateway.breaker.end(token, ok=False)
+            return
+        finally:
+            if stream is not None and hasattr(stream, "aclose"):
+                try:
+                    await stream.aclose()
+                except Exception:
+                    pass
+
+
+def llm_enabled() -> bool:
+    """True when a chat model is configured (Ollama or OpenAI)."""
+    return _get_chat() is not None
+
+
+def _messages(
+    history: list[dict[str, str]],
+    user_message: str,
+    state: ConversationState | None = None,
+    summary: list[str] | None = None,
+) -> list:
+    from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+    kinds = {"system": SystemMessage, "user": HumanMessage, "bot": AIMessage}
+    context = build_context(SYSTEM_PROMPT, history, user_message, state=state, summary=summary)
+    return [kinds[role](content=text) for role, text in context]
+
+
+def _reply_text(response: Any) -> str | None:
+    if response is None:
+        return None
+    content = getattr(response, "content", None) or str(response)
+    return (content or "").strip() or None
@@ -0,0 +1,140 @@
+"""
+Bounded LLM context for live turns. The prompt is: system prompt, what we know (slot state from
+ConversationState), a rolling summary of older turns, the last LLM_CONTEXT_TURNS turns verbatim,
+and the new message — trimmed to a hard LLM_CONTEXT_TOKENS budget by a local token estimate.
+The summary is extractive (no extra model call): turns leaving the verbatim window are folded in
+as short lines, oldest lines dropped past LLM_SUMMARY_TOKENS. It is kept on the session dict.
+"""
+
+import os
+import re
+from typing import Any
+
+from src.state.models import ConversationState, SlotStatus
+
+# Tunables (env overrides)
+CONTEXT_TURNS = int(os.environ.get("LLM_CONTEXT_TURNS", "6"))  # user/bot exchanges kept verbatim
+CONTEXT_TOKENS = int(os.environ.get("LLM_CONTEXT_TOKENS", "1500"))  # hard cap for the whole prompt
+SUMMARY_TOKENS = int(os.environ.get("LLM_SUMMARY_TOKENS", "300"))
+SUMMARY_LINE_CHARS = 160
+
+# Rough BPE estimate: words split into ≤4-char pieces, punctuation on its own; plus per-message overhead.
+_TOKEN_RE = re.compile(r"\w{1,4}|[^\w\s]")
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(_TOKEN_RE.findall(text or ""))
+
+
+def _message_tokens(text: str) -> int:
+    return estimate_tokens(text) + MESSAGE_OVERHEAD_TOKENS
+
+
+def _clip(text: str, limit: int = SUMMARY_LINE_CHARS) -> str:
+    text = " ".join((text or "").split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+def update_summary(data: dict[str, Any]) -> list[str]:
+    """
+    Fold history entries older than the verbatim window into data["context_summary"]
+    ({"lines": [...], "upto": absolute entry index}); returns the summary lines.
+    History may already be trimmed at the front (LIVE_HISTORY_MAX): absolute index of history[0]
+    is (1 greeting + 2 per turn) - len(history).
+    """
+    history = data.get("history") or []
+    summary = data.get("context_summary") or {"lines": [], "upto": 0}
+    offset = max(0, 1 + 2 * data.get("turn_index", 0) - len(history))
+    window_start = max(0, len(history) - 2 * CONTEXT_TURNS)
+    first = max(summary["upto"] - offset, 0)
+    if first >= window_start:
+        return summary["lines"]
+    lines = list(summary["lines"])
+    for h in history[first:window_start]:
+        who = "User" if h.get("role") == "user" else "Mira"
+        lines.append(f"{who}: {_clip(h.get('text') or '')}")
+    while lines and sum(estimate_tokens(line) for line in lines) > SUMMARY_TOKENS:
+        lines.pop(0)
+    data["context_summary"] = {"lines": lines, "upto": offset + window_start}
+    return lines
+
+
+def slot_summary(state: ConversationState | None) -> str:
+    """One line of what we know: intent plus filled / declined slots."""
+    if state is None:
+        return ""
+    known = []
+    for name, sv in state.slots.items():
+        if sv.status == SlotStatus.FILLED and sv.value not in (None, ""):
+            known.append(f"{name}: {_clip(str(sv.value), 60)}")
+        elif sv.status == SlotStatus.REFUSED:
+            known.append(f"{name}: (prefers not to say)")
+    if not known and not state.intent:
+        return ""
+    parts = [f"intent: {state.intent}"] if state.intent else []
+    return "Known so far — " + "; ".join(parts + known)
+
+
+def build_context(
+    system_prompt: str,
+    history: list[dict[str, str]],
+    user_message: str,
+    *,
+    state: ConversationState | None = None,
+    summary: list[str] | None = None,
+    budget: int = CONTEXT_TOKENS,
+) -> list[tuple[str, str]]:
+    """
+    (role, text) messages — role "system" | "user" | "bot" — within `budget` estimated tokens.
+    Priority: system prompt and new message, known slots, summary (newest lines first, up to
+    SUMMARY_TOKENS), then verbatim turns newest first (at most CONTEXT_TURNS).
+    """
+    user_message = user_message.strip()
+    used = _message_tokens(system_prompt)
+    if used + _message_tokens(user_message) > budget:  # oversized message: keep its start
+        room = max(budget - used - MESSAGE_OVERHEAD_TOKENS, 1)
+        pieces = list(_TOKEN_RE.finditer(user_message))
+        if len(pieces) > room:
+            user_message = user_message[: pieces[room - 1].end()]
+    used += _message_tokens(user_message)
+
+    context_lines: list[str] = []
+    known = slot_summary(state)
+    if known and used + _message_tokens(known) <= budget:
+        context_lines.append(known)
+        used += estimate_tokens(known)
+    kept: list[str] = []
+    summary_used = 0
+    for line in reversed(summary or []):
+        cost = estimate_tokens(line) + 1
+        if summary_used + cost > SUMMARY_TOKENS or used + MESSAGE_OVERHEAD_TOKENS + cost > budget:
+            break
+        kept.append(line)
+        summary_used += cost
+    if kept:
+        context_lines.append("Earlier in this call:")
+        context_lines.extend(reversed(kept))
+        used += summary_used + estimate_tokens("Earlier in this call:")
+    if context_lines:
+        used += MESSAGE_OVERHEAD_TOKENS
+
+    window: list[tuple[str, str]] = []
+    for h in reversed(history[-2 * CONTEXT_TURNS:] if CONTEXT_TURNS > 0 else []):
+        text = h.get("text") or ""
+        cost = _message_tokens(text)
+        if used + cost > budget:
+            break
+        window.append(("user" if h.get("role") == "user" else "bot", text))
+        used += cost
+    window.reverse()
+
+    messages = [("system", system_prompt)]
+    if context_lines:
+        messages.append(("system", "\n".join(context_lines)))
+    return messages + window + [("user", user_message)]
+
+
+def context_tokens(messages: list[tuple[str, str]]) -> int:
+    """Estimated prompt size of build_context() output."""
+    return sum(_message_tokens(text) for _, text in messages)
@@ -0,0 +1,277 @@
+"""
+LLM gateway: how live model calls reach the server.
+- HTTP: a shared httpx.AsyncClient with a tunable keep-alive pool (LLM_POOL_*), handed to the chat model.
+- Single-flight: identical prompts in flight at the same time (same model + messages, e.g. many
+  sessions opening with "hi") share one model call.
+- Admission: at most LLM_MAX_CONCURRENCY calls in flight; callers beyond that wait up to
+  LLM_QUEUE_WAIT_S, and at most LLM_QUEUE_MAX of them (more are rejected at once). A rejected call
+  returns None so the turn uses the rule-based reply instead of piling onto a slow server.
+- Circuit breaker (src.live.llm_breaker): calls are refused while the model is down or over its
+  latency budget; async calls are also cut at LLM_LATENCY_BUDGET_S.
+Limits apply per event loop. Calls are async only (ainvoke, admit); scripts use asyncio.run.
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from src.live.llm_breaker import CircuitBreaker
+
+# Tunables (env overrides)
+LLM_TIMEOUT_S = float(os.environ.get("LLM_TIMEOUT_S", "20"))
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "32"))
+LLM_QUEUE_WAIT_S = float(os.environ.get("LLM_QUEUE_WAIT_S", "1.0"))
+LLM_QUEUE_MAX = int(os.environ.get("LLM_QUEUE_MAX", "64"))
+LLM_POOL_CONNECTIONS = int(os.environ.get("LLM_POOL_CONNECTIONS", "32"))
+LLM_POOL_KEEPALIVE = int(os.environ.get("LLM_POOL_KEEPALIVE", "16"))  # idle connections kept open
+LLM_KEEPALIVE_S = float(os.environ.get("LLM_KEEPALIVE_S", "60"))
+LLM_CONNECT_TIMEOUT_S = float(os.environ.get("LLM_CONNECT_TIMEOUT_S", "3"))
+
+_COUNTERS = ("calls", "coalesced", "rejected", "queue_timeouts", "errors", "short_circuited")
+
+
+def prompt_key(chat: Any, messages: list) -> str:
+    """Single-flight key: chat model instance + message types and contents."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{type(chat).__name__}:{id(chat)}".encode())
+    for m in messages:
+        h.update(b"\x1e" + type(m).__name__.encode() + b"\x1f" + str(getattr(m, "content", m)).encode("utf-8"))
+    return h.hexdigest()
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class _LoopState:
+    """Per event loop: admission semaphore, waiting count, in-flight prompts."""
+
+    __slots__ = ("slots", "waiting", "flights", "__weakref__")
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.slots = asyncio.Semaphore(max_concurrency)
+        self.waiting = 0
+        self.flights: dict[str, _Flight] = {}
+
+
+class LLMGateway:
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        queue_max: int = LLM_QUEUE_MAX,
+        queue_wait_s: float = LLM_QUEUE_WAIT_S,
+        pool_connections: int = LLM_POOL_CONNECTIONS,
+        pool_keepalive: int = LLM_POOL_KEEPALIVE,
+        keepalive_s: float = LLM_KEEPALIVE_S,
+        timeout_s: float = LLM_TIMEOUT_S,
+        connect_timeout_s: float = LLM_CONNECT_TIMEOUT_S,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.queue_max = queue_max
+        self.queue_wait_s = queue_wait_s
+        self.pool_connections = pool_connections
+        self.pool_keepalive = pool_keepalive
+        self.keepalive_s = keepalive_s
+        self.timeout_s = timeout_s
+        self.connect_timeout_s = connect_timeout_s
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(_COUNTERS, 0)
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+        self._ahttp = None
+
+    # ---------- HTTP pool ----------
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """httpx client settings (limits, timeouts) for chat models that take client kwargs."""
+        import httpx
+
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.pool_connections,
+                max_keepalive_connections=self.pool_keepalive,
+                keepalive_expiry=self.keepalive_s,
+            ),
+            "timeout": httpx.Timeout(self.timeout_s, connect=self.connect_timeout_s),
+        }
+
+    def async_http_client(self):
+        """Shared httpx.AsyncClient (keep-alive pool)."""
+        with self._lock:
+            if self._ahttp is None:
+                import httpx
+
+                self._ahttp = httpx.AsyncClient(**self.client_kwargs())
+            return self._ahttp
+
+    async def aclose(self) -> None:
+        with self._lock:
+            ahttp, self._ahttp = self._ahttp, None
+        if ahttp is not None:
+            await ahttp.aclose()
+
+    # ---------- Async calls ----------
+
+    async def ainvoke(self, chat: Any, messages: list, timeout: float) -> Any | None:
+        """
+        chat.ainvoke(messages) with single-flight, admission and `timeout`; None when rejected,
+        timed out or failed. A cancelled caller stops waiting; the shared call is cancelled only
+        when no caller is left.
+        """
+        st = self._loop_state()
+        key = prompt_key(chat, messages)
+        flight = st.flights.get(key)
+        if flight is None:
+            flight = st.flights[key] = _Flight(asyncio.ensure_future(self._ainvoke_admitted(chat, messages, timeout)))
+
+            def _forget(_task: "asyncio.Task[Any]", f: _Flight = flight) -> None:
+                if st.flights.get(key) is f:
+                    del st.flights[key]
+
+            flight.task.add_done_callback(_forget)
+        else:
+            self._count("coalesced")
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters:
+                flight.task.cancel()  # no-op once done
+
+    async def _ainvoke_admitted(self, chat: Any, messages: list, timeout: float) -> Any | None:
+        async with self.admit() as token:
+            if token is None:
+                return None
+            self._count("calls")
+            try:
+                result = await asyncio.wait_for(chat.ainvoke(messages), self.call_timeout(timeout))
+            except Exception:  # includes TimeoutError; CancelledError is not an Exception
+                self._count("errors")
+                self.breaker.end(token, ok=False)
+                return None
+            self.breaker.end(token, ok=True)
+            return result
+
+    def call_timeout(self, timeout: float) -> float:
+        """`timeout` capped at the breaker's latency budget: past it the turn is better off with the rules."""
+        return min(timeout, self.breaker.latency_budget_s) if self.breaker.enabled else timeout
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[int | None]:
+        """
+        Async admission slot (streams use it directly): yields the breaker token, None when refused
+        (breaker open, queue full, no slot in time). Report the outcome with breaker.end(token, ok);
+        leaving without one (cancelled) counts as abandoned.
+        """
+        if self._short_circuit():
+            yield None
+            return
+        st = self._loop_state()
+        acquired = True
+        if st.slots.locked():
+            if st.waiting >= self.queue_max:
+                self._count("rejected")
+                acquired = False
+            else:
+                st.waiting += 1
+                try:
+                    await asyncio.wait_for(st.slots.acquire(), self.queue_wait_s)
+                except asyncio.TimeoutError:
+                    self._count("queue_timeouts")
+                    acquired = False
+                finally:
+                    st.waiting -= 1
+        else:
+            await st.slots.acquire()
+        if not acquired:
+            yield None
+            return
+        token = None
+        try:
+            token = self._begin()  # after the queue: latency is the model's, not the wait
+            yield token
+        finally:
+            st.slots.release()
+            self.breaker.abandon(token)  # no-op once the caller reported the outcome
+
+    def _loop_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        st = self._loops.get(loop)
+        if st is None:
+            st = self._loops[loop] = _LoopState(self.max_concurrency)
+        return st
+
+    # ---------- Counters ----------
+
+    def _short_circuit(self) -> bool:
+        """Breaker open: refuse before queueing."""
+        if self.breaker.is_open():
+            self._count("short_circuited")
+            return True
+        return False
+
+    def _begin(self) -> int | None:
+        token = self.breaker.begin()  # None: another caller took the half-open probe
+        if token is None:
+            self._count("short_circuited")
+        return token
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        loops = list(self._loops.values())
+        return {
+            **counts,
+            "waiting": sum(st.waiting for st in loops),
+            "in_flight_prompts": sum(len(st.flights) for st in loops),
+            "max_concurrency": self.max_concurrency,
+            "queue_max": self.queue_max,
+            "breaker": self.breaker.stats(),
+            "pool": {
+                "connections": self.pool_connections,
+                "keepalive": self.pool_keepalive,
+                "keepalive_s": self.keepalive_s,
+            },
+        }
+
+
+_gateway: LLMGateway | None = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Process-wide gateway (settings from env)."""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway()
+    return _gateway
+
+
+def set_llm_gateway(gateway: LLMGateway | None) -> None:
+    """Replace the process-wide gateway (tests, benchmarks). Chat models built on the old one keep its clients."""
+    global _gateway
+    with _gateway_lock:
+        _gateway = gateway
+
+
+async def close_llm_gateway() -> None:
+    """Close the shared HTTP clients (app shutdown)."""
+    if _gateway is not None:
+        await _gateway.aclose()
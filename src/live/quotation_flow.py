@@ -4,13 +4,11 @@ Quotation flow helpers: detect user intent (quote request, reduce price, agree/r
 
 import re
 
+from src.nlp.analysis import MessageAnalysis, PatternSet, analyze
 
-def user_asks_for_quote(message: str) -> bool:
-    """True if message clearly asks for a quote/price/quotation."""
-    m = (message or "").strip().lower()
-    if not m:
-        return False
-    patterns = [
+QUOTE_REQUEST_PATTERNS = [
+    re.compile(p)
+    for p in (
         r"\b(quote|quotation|estimate|estimation|quoted)\b",
         r"asking\s+for\s+(a\s+)?(quote|quotation)",
         r"want\s+(a\s+)?(quote|quotation)",
@@ -21,58 +19,75 @@ def user_asks_for_quote(message: str) -> bool:
         r"send\s+(me\s+)?(the\s+)?(quote|quotation|price)",
         r"(get|need|want)\s+(a\s+)?(quote|quotation|estimate|price)",
         r"price\s+(for|quote)",
-    ]
-    return any(re.search(p, m) for p in patterns)
-
-
-def user_asks_to_reduce_price(message: str) -> bool:
-    """True if user is asking to reduce price / more discount."""
-    m = (message or "").strip().lower()
-    if not m:
-        return False
-    patterns = [
+    )
+]
+REDUCE_PRICE_PATTERNS = [
+    re.compile(p)
+    for p in (
         r"\b(reduce|lower|discount|cheaper|less|bring\s+down)\b",
         r"can(\s+you)?\s+(reduce|lower|give\s+more\s+discount)",
         r"any\s+discount",
         r"reduce\s+(the\s+)?price",
-    ]
-    return any(re.search(p, m) for p in patterns)
+    )
+]
+_QUOTE_REQUEST_SET = PatternSet(QUOTE_REQUEST_PATTERNS)
+_REDUCE_PRICE_SET = PatternSet(REDUCE_PRICE_PATTERNS)
+PRICE_K_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*k\b", re.I)
+PRICE_THOUSAND_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:thousand|thou)\b", re.I)
+PRICE_NUMBER_PATTERN = re.compile(r"\d{2,}(?:\.\d+)?")
+PRICE_SINGLE_PATTERN = re.compile(r"\b(\d+(?:\.\d+)?)\b")
+
+
+def user_asks_for_quote(message: str | MessageAnalysis) -> bool:
+    """True if message clearly asks for a quote/price/quotation."""
+    a = analyze(message)
+    if not a.lower:
+        return False
+    return a.any(_QUOTE_REQUEST_SET, lower=True)
+
+
+def user_asks_to_reduce_price(message: str | MessageAnalysis) -> bool:
+    """True if user is asking to reduce price / more discount."""
+    a = analyze(message)
+    if not a.lower:
+        return False
+    return a.any(_REDUCE_PRICE_SET, lower=True)
 
 
-def user_agrees(message: str) -> bool:
+def user_agrees(message: str | MessageAnalysis) -> bool:
     """True if user is accepting (yes, ok, sure, agreed)."""
-    m = (message or "").strip().lower()
+    m = analyze(message).lower
     if not m:
         return False
     return m in ("yes", "ok", "sure", "agreed", "done", "fine", "sounds good", "go ahead") or m.startswith(("yes ", "ok ", "sure "))
 
 
-def user_disagrees(message: str) -> bool:
+def user_disagrees(message: str | MessageAnalysis) -> bool:
     """True if user is declining (no, not really, can't)."""
-    m = (message or "").strip().lower()
+    m = analyze(message).lower
     if not m:
         return False
     return m in ("no", "nope", "not really", "can't", "cannot", "too high", "won't work") or m.startswith(("no ", "not "))
 
 
-def extract_price_from_message(message: str) -> float | None:
+def extract_price_from_message(message: str | MessageAnalysis) -> float | None:
     """Extract a numeric price from message (e.g. 50k, 50000, 40 thousand). Returns None if not found."""
-    if not (message or "").strip():
+    a = analyze(message)
+    if not a.lower:
         return None
-    m = message.strip()
     # 50k, 50K, 1.5k -> 50000, 1500
-    k_match = re.search(r"(\d+(?:\.\d+)?)\s*k\b", m, re.I)
+    k_match = a.search(PRICE_K_PATTERN)
     if k_match:
         return float(k_match.group(1)) * 1000
     # 50 thousand, 40 lakh (optional)
-    thou_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:thousand|thou)\b", m, re.I)
+    thou_match = a.search(PRICE_THOUSAND_PATTERN)
     if thou_match:
         return float(thou_match.group(1)) * 1000
     # Plain number (last number in message often is the price when they say "my budget is 50000")
-    numbers = re.findall(r"\d{2,}(?:\.\d+)?", m)
+    numbers = a.finditer(PRICE_NUMBER_PATTERN)
     if numbers:
-        return float(numbers[-1])
-    single = re.findall(r"\b(\d+(?:\.\d+)?)\b", m)
+        return float(numbers[-1].group(0))
+    single = a.finditer(PRICE_SINGLE_PATTERN)
     if single:
-        return float(single[-1])
+        return float(single[-1].group(1))
     return None
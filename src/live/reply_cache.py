@@ -0,0 +1,199 @@
+"""
+LLM reply cache for live turns. Openers and FAQs ("what services do you offer", "do you do 2D
+or 3D") repeat across sessions; a hit skips the model round trip. Key: normalized user message
+plus a fingerprint of what the reply depends on beyond it — intent, slot statuses and captured
+values (the prompt lists them), the question last asked and the last bot line. LRU + TTL, hit/miss counters, optional JSON file (LLM_CACHE_PATH)
+loaded on first use and written on shutdown so the cache survives restarts.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from src.nlp.analysis import normalize_for_intent
+from src.state.models import ConversationState, SlotStatus
+
+# Tunables (env overrides)
+CACHE_SIZE = int(os.environ.get("LLM_CACHE_SIZE", "1024"))  # entries; 0 disables the cache
+CACHE_TTL_S = float(os.environ.get("LLM_CACHE_TTL_S", "3600"))
+CACHE_PATH = os.environ.get("LLM_CACHE_PATH", "")  # optional persistence file
+MAX_MESSAGE_CHARS = 200  # longer messages are rarely repeated verbatim; not cached
+
+_NON_WORD = re.compile(r"[^\w\s]")
+_STATUS_MARK = {SlotStatus.FILLED: "f", SlotStatus.REFUSED: "r", SlotStatus.UNAVAILABLE: "u"}
+
+
+def normalize_message(text: str) -> str:
+    """Lowercase, collapse repeated letters, drop punctuation and extra whitespace."""
+    return " ".join(_NON_WORD.sub(" ", normalize_for_intent(text or "")).split())
+
+
+def fingerprint(state: ConversationState | None, history: list[dict[str, str]]) -> str:
+    """
+    Compact digest of slot state and the history tail (last bot line). Captured values are part of
+    it: the prompt carries them ("Known so far — name: ..."), so one session's reply never serves another's.
+    """
+    parts = []
+    if state is not None:
+        parts.append(state.intent or "")
+        parts.append(state.last_question_asked or "")
+        marks = (
+            f"{n}:{_STATUS_MARK[sv.status]}:{json.dumps(sv.value, sort_keys=True, default=str)}"
+            for n, sv in sorted(state.slots.items())
+            if sv.status in _STATUS_MARK
+        )
+        parts.append("\x1e".join(marks))
+    tail = next((h.get("text") or "" for h in reversed(history or ()) if h.get("role") != "user"), "")
+    parts.append(normalize_message(tail))
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+class ReplyCache:
+    """Thread-safe LRU of (normalized message, fingerprint) -> reply with per-entry expiry."""
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_SIZE,
+        ttl_s: float = CACHE_TTL_S,
+        path: str | None = CACHE_PATH,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.path = Path(path) if path else None
+        self._entries: "OrderedDict[tuple[str, str], tuple[str, float]]" = OrderedDict()  # value: (reply, expires wall time)
+        self._lock = threading.Lock()
+        self._loaded = self.path is None
+        self.hits = self.misses = self.expired = self.evictions = self.stores = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def key(
+        self,
+        user_message: str,
+        state: ConversationState | None,
+        history: list[dict[str, str]],
+    ) -> tuple[str, str] | None:
+        """Cache key, or None when the message is not cacheable (empty, too long, cache off)."""
+        if not self.enabled:
+            return None
+        message = normalize_message(user_message)
+        if not message or len(message) > MAX_MESSAGE_CHARS:
+            return None
+        return message, fingerprint(state, history)
+
+    def get(self, key: tuple[str, str] | None) -> str | None:
+        if key is None:
+            return None
+        with self._lock:
+            self._load()
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            reply, expires = item
+            if expires <= time.time():
+                del self._entries[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return reply
+
+    def put(self, key: tuple[str, str] | None, reply: str | None) -> None:
+        if key is None or not reply:
+            return
+        with self._lock:
+            self._load()
+            self._entries[key] = (reply, time.time() + self.ttl_s)
+            self._entries.move_to_end(key)
+            self.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "stores": self.stores,
+        }
+
+    def save(self) -> int:
+        """Write live entries to `path` (atomic replace); returns the count written."""
+        if self.path is None:
+            return 0
+        now = time.time()
+        with self._lock:
+            rows = [[m, fp, reply, expires] for (m, fp), (reply, expires) in self._entries.items() if expires > now]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": 1, "entries": rows}), encoding="utf-8")
+        os.replace(tmp, self.path)
+        return len(rows)
+
+    def _load(self) -> None:
+        """Read `path` once (caller holds the lock); a missing or unreadable file starts empty."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            doc = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(doc, dict) or doc.get("version") != 1:
+            return
+        now = time.time()
+        for m, fp, reply, expires in doc.get("entries") or ():
+            if expires > now:
+                self._entries[(m, fp)] = (reply, expires)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_cache: ReplyCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_reply_cache() -> ReplyCache:
+    """Process-wide cache (settings from env)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ReplyCache()
+    return _cache
+
+
+def set_reply_cache(cache: ReplyCache | None) -> None:
+    """Replace the process-wide cache (tests, benchmarks)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def close_reply_cache() -> None:
+    """Persist the cache (when LLM_CACHE_PATH is set); called on app shutdown."""
+    if _cache is not None:
+        _cache.save()
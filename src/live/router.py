@@ -3,16 +3,42 @@ Live conversation API — localhost. Greet first, then each user message returns
 Full-duplex: POST /live/audio for STT → turn → optional TTS; interrupt = stop playback and send next.
 """
 
+import asyncio
 import base64
-from typing import Optional
+from typing import Any, Awaitable, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
 
-from src.live.session import get_session, start_session, turn
+from src.live.llm_gateway import get_llm_gateway
+from src.live.reply_cache import get_reply_cache
+from src.live.routing import get_route_counters
+from src.live.session import astream_turn, aturn, get_session, start_session
+from src.live.session_store import SessionBusyError
+from src.live.streaming import sse_event
 
 router = APIRouter(prefix="/live", tags=["live"])
 
+# How often an in-flight turn checks whether the client is still connected
+DISCONNECT_POLL_S = 0.25
+
+
+async def _until_disconnect(request: Request, coro: Awaitable[Any]) -> Any:
+    """Await coro; cancel it (and its LLM call) if the client disconnects first."""
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_S)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                raise HTTPException(status_code=499, detail="Client disconnected")
+    finally:
+        if not task.done():
+            task.cancel()
+
 
 @router.post("/start")
 def live_start():
@@ -22,10 +48,11 @@ def live_start():
 
 
 @router.post("/message")
-def live_message(body: dict):
+async def live_message(body: dict, request: Request):
     """
     Send user message, get bot reply. Body: { "session_id": "...", "user_message": "..." }.
     Bot checks required slots, answers services queries, notes complaints, remembers context.
+    Async: the LLM call does not hold a threadpool thread; it is cancelled if the client disconnects.
     """
     session_id = body.get("session_id")
     user_message = (body.get("user_message") or "").strip()
@@ -33,7 +60,10 @@ def live_message(body: dict):
         raise HTTPException(status_code=400, detail="session_id required")
     if not user_message:
         raise HTTPException(status_code=400, detail="user_message required")
-    bot_reply, state, intent = turn(session_id, user_message)
+    try:
+        bot_reply, state, intent = await _until_disconnect(request, aturn(session_id, user_message))
+    except SessionBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     return {
         "session_id": session_id,
         "bot_reply": bot_reply,
@@ -42,6 +72,34 @@ def live_message(body: dict):
     }
 
 
+@router.post("/stream")
+async def live_stream(body: dict):
+    """
+    /live/message as Server-Sent Events, so the client can start speaking before the reply is complete.
+    Events: "chunk" {text} per sentence-sized piece (LLM tokens as they arrive), then "done"
+    {bot_reply, intent, state, first_chunk_ms, total_ms}; "error" {detail} if the session is busy.
+    """
+    session_id = body.get("session_id")
+    user_message = (body.get("user_message") or "").strip()
+    if not session_id:
+        raise HTTPException(status_code=400, detail="session_id required")
+    if not user_message:
+        raise HTTPException(status_code=400, detail="user_message required")
+
+    async def events():
+        try:
+            async for event, data in astream_turn(session_id, user_message):
+                yield sse_event(event, data)
+        except SessionBusyError as e:
+            yield sse_event("error", {"detail": str(e), "status_code": 409})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/session/{session_id}")
 def live_get_session(session_id: str):
     """Get current session state and history (for debugging)."""
@@ -56,8 +114,45 @@ def live_get_session(session_id: str):
     }
 
 
+@router.get("/stats")
+def live_stats():
+    """Live path counters (debugging): turn routes (rules vs LLM), the LLM reply cache and gateway."""
+    return {
+        "routes": get_route_counters().stats(),
+        "llm_cache": get_reply_cache().stats(),
+        "llm_gateway": get_llm_gateway().stats(),
+    }
+
+
 # ---------- Full-duplex voice agent: STT → turn → optional TTS ----------
 
+def _transcribe(audio_bytes: bytes) -> str:
+    """STT (blocking; run in the threadpool so the event loop keeps serving turns)."""
+    try:
+        from src.voice_agent.stt import transcribe_audio_file
+
+        return transcribe_audio_file(audio_bytes, sample_rate=16000)
+    except Exception:
+        try:
+            from src.voice_agent.stt import transcribe_audio
+
+            return transcribe_audio(audio_bytes, sample_rate=16000)
+        except Exception:
+            return ""
+
+
+def _tts_base64(text: str) -> str | None:
+    try:
+        from src.voice_agent import text_to_speech_bytes
+
+        wav = text_to_speech_bytes(text)
+        if wav:
+            return base64.b64encode(wav).decode("ascii")
+    except Exception:
+        pass
+    return None
+
+
 def _audio_bytes_from_upload(file: UploadFile) -> bytes:
     """Read upload as raw bytes (WebM from MediaRecorder, WAV, or raw PCM)."""
     body = file.file.read()
@@ -71,7 +166,7 @@ async def live_audio(
     return_tts: Optional[str] = Form("false"),
 ):
     """
-    Voice in: upload audio → STT (faster-whisper) → turn(session, transcript) → bot reply.
+    Voice in: upload audio → STT (faster-whisper) → aturn(session, transcript) → bot reply.
     Optionally return TTS audio (base64) when return_tts=true so client can play local female voice.
     Interrupt: client stops TTS playback and sends next audio; no extra API needed.
     """
@@ -80,18 +175,7 @@ async def live_audio(
     audio_bytes = _audio_bytes_from_upload(audio)
     if not audio_bytes:
         raise HTTPException(status_code=400, detail="No audio data")
-    transcript = ""
-    try:
-        from src.voice_agent.stt import transcribe_audio_file
-
-        transcript = transcribe_audio_file(audio_bytes, sample_rate=16000)
-    except Exception:
-        try:
-            from src.voice_agent.stt import transcribe_audio
-
-            transcript = transcribe_audio(audio_bytes, sample_rate=16000)
-        except Exception:
-            pass
+    transcript = await run_in_threadpool(_transcribe, audio_bytes)
     if not transcript.strip():
         return {
             "session_id": session_id,
@@ -99,17 +183,13 @@ async def live_audio(
             "bot_reply": "I didn't catch that. Could you say it again?",
             "tts_audio_base64": None,
         }
-    bot_reply, state, intent = turn(session_id, transcript)
+    try:
+        bot_reply, state, intent = await aturn(session_id, transcript)
+    except SessionBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     tts_b64 = None
     if str(return_tts).lower() in ("true", "1", "yes"):
-        try:
-            from src.voice_agent import text_to_speech_bytes
-
-            wav = text_to_speech_bytes(bot_reply)
-            if wav:
-                tts_b64 = base64.b64encode(wav).decode("ascii")
-        except Exception:
-            pass
+        tts_b64 = await run_in_threadpool(_tts_base64, bot_reply)
     return {
         "session_id": session_id,
         "transcript": transcript,
@@ -0,0 +1,125 @@
+"""
+Rule-first routing for live turns. Decides, before any model call, whether the deterministic
+handlers can answer: greetings, FAQ matches, complaints and slot questions are answered locally;
+only ambiguous turns (no confident intent, no FAQ or next-question match) go to the LLM.
+LLM-routed turns are speculative: the local pipeline runs alongside the model call and its
+answer wins once LIVE_SPECULATIVE_BUDGET_S passes without a model reply (session._speculate).
+While the LLM circuit breaker is open (src.live.llm_breaker) they are answered by the rules.
+Per-route counters show what fraction of turns reached the LLM (GET /live/stats).
+"""
+
+import os
+import threading
+from collections import Counter
+from typing import Any, NamedTuple
+
+from src.live.faq import matches_faq_topic
+from src.nlp.analysis import MessageAnalysis
+from src.nlp.intent import IntentResult, detect_intent
+from src.state import get_next_question, update_state_from_message
+from src.state.models import ConversationState
+from src.state.slot_registry import get_required_slots
+
+# Tunables (env overrides)
+RULE_FIRST = os.environ.get("LIVE_RULE_FIRST", "1").lower() not in ("0", "false", "no")  # 0 = LLM first (old order)
+# Intent confidence is matched signals / 3; 0.33 = at least one explicit signal for the intent
+MIN_CONFIDENCE = float(os.environ.get("LIVE_ROUTE_MIN_CONFIDENCE", "0.33"))
+# LLM-routed turns: the model has this long to answer before an acceptable local answer wins; 0 = always wait
+SPECULATIVE_BUDGET_S = float(os.environ.get("LIVE_SPECULATIVE_BUDGET_S", "1.5"))
+
+GREETINGS = ("hi", "hello", "hey", "hi there", "hello there")
+
+# Route names: answered before routing, answered by rules, or sent to the model
+PRE_LLM = "pre_llm"  # mic check / quotation request (always local)
+NO_LLM = "no_llm"  # no model configured
+GREETING = "greeting"
+FAQ = "faq"
+COMPLAINT = "complaint"
+SLOTS = "slots"
+LLM = "llm"
+LLM_FALLBACK = "llm_fallback"  # routed to the model, no reply (error / timeout / busy) → rules
+SPECULATIVE_LOCAL = "speculative_local"  # routed to the model, local answer won on the latency budget
+LLM_OPEN = "llm_open"  # routed to the model while its circuit breaker is open → rules, no call
+RULE_ROUTES = (GREETING, FAQ, COMPLAINT, SLOTS)
+
+
+class Route(NamedTuple):
+    """Route name plus the work done to pick it, reused by the rule turn (session._rule_turn)."""
+
+    name: str
+    intent: IntentResult
+    state: ConversationState | None = None  # state after this message's slot update, when computed
+    question: tuple[str | None, str | None] | None = None  # get_next_question(state): (text, slot)
+
+
+def is_greeting(msg: MessageAnalysis) -> bool:
+    m = msg.lower
+    return m in GREETINGS or len(msg.tokens) <= 2 and any(g in m for g in ("hi", "hello", "hey"))
+
+
+def route_turn(data: dict[str, Any], msg: MessageAnalysis) -> Route:
+    """Route for a turn that passed session._turn_before_llm; intent, state and question are reused by the rule turn."""
+    intent_result = detect_intent(msg)
+    if not RULE_FIRST:
+        return Route(LLM, intent_result)
+    intent = intent_result.primary_intent
+    turn_index = data["turn_index"]
+    if intent == "unknown_chitchat":
+        if is_greeting(msg):
+            return Route(GREETING, intent_result)
+        return Route(FAQ if matches_faq_topic(msg) else LLM, intent_result)
+    if intent_result.confidence < MIN_CONFIDENCE:
+        return Route(LLM, intent_result)
+    if intent == "general_services_query":  # FAQ reply; without a named topic it is only the generic answer
+        return Route(FAQ if matches_faq_topic(msg) else LLM, intent_result)
+
+    # Same intent carry-over as the rule turn, then: would the slot engine ask a question?
+    state = data["state"]
+    current_intent = intent if state.intent is None or state.intent == "unknown_chitchat" else state.intent
+    if current_intent == "complaint_issue":
+        return Route(COMPLAINT, intent_result)
+    if intent != current_intent:  # message points elsewhere than the session's flow: ambiguous
+        return Route(LLM, intent_result)
+    if not get_required_slots(current_intent):
+        return Route(LLM, intent_result)
+    if state.intent != current_intent:
+        state = state.model_copy(update={"intent": current_intent})
+    state = update_state_from_message(state, msg, f"turn_{turn_index}", current_intent, is_user_turn=True)
+    question = get_next_question(state, turn_index=turn_index, last_user_message=msg)
+    return Route(SLOTS if question[0] else LLM, intent_result, state, question)
+
+
+class RouteCounters:
+    """Thread-safe per-route turn counts."""
+
+    def __init__(self) -> None:
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, route: str) -> None:
+        with self._lock:
+            self._counts[route] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        turns = sum(counts.values())
+        reached = counts.get(LLM, 0) + counts.get(LLM_FALLBACK, 0) + counts.get(SPECULATIVE_LOCAL, 0)
+        return {
+            "turns": turns,
+            "routes": counts,
+            "rules": sum(counts.get(r, 0) for r in RULE_ROUTES),
+            "reached_llm": reached,
+            "llm_fraction": round(reached / turns, 4) if turns else 0.0,
+        }
+
+
+_counters = RouteCounters()
+
+
+def get_route_counters() -> RouteCounters:
+    return _counters
@@ -1,15 +1,23 @@
 """
-Live conversation session — in-memory (localhost). Greet first, then capture slots, answer queries, remember context.
+Live conversation session — sessions live in src/live/session_store.py (LRU memory tier + SQLite). Greet first, then capture slots, answer queries, remember context.
 Quotation flow: create request on quote ask, 'few minutes'; admin sets quote → send amount + half discount;
 bargain (half then full); ask user's price; admin exception → tell user, agree/reject.
 """
 
+import asyncio
+import time
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator, NamedTuple
+
+from fastapi.concurrency import run_in_threadpool
 
 from src.live.faq import get_faq_reply, get_faq_reply_varied, LOOKING_FOR_ANIMATION_ANSWER, SERVICES_ANSWER
-from src.live.llm_chat import get_llm_reply
+from src.live import routing
+from src.live.llm_chat import aget_llm_reply, astream_llm_reply, llm_enabled
+from src.live.llm_gateway import get_llm_gateway
+from src.live.llm_context import update_summary
 from src.live.quotation_flow import (
     extract_price_from_message,
     user_agrees,
@@ -17,7 +25,23 @@ from src.live.quotation_flow import (
     user_asks_to_reduce_price,
     user_disagrees,
 )
+from src.live.routing import (
+    LLM,
+    LLM_FALLBACK,
+    LLM_OPEN,
+    NO_LLM,
+    PRE_LLM,
+    SPECULATIVE_LOCAL,
+    Route,
+    get_route_counters,
+    is_greeting,
+    route_turn,
+)
+from src.live.session_store import get_session_store
+from src.live.streaming import SentenceChunker, split_sentences
+from src.nlp.analysis import MessageAnalysis, analyze
 from src.nlp.intent import detect_intent
+from src.nlp.phrases import TURN_PHRASES
 from src.registry import (
     create_quotation_request,
     get_quotation_by_id,
@@ -31,9 +55,6 @@ from src.state.models import ConversationState, SlotStatus
 from src.state.pipeline import initial_state
 from src.state.slot_registry import get_question_templates, get_required_slots
 
-# In-memory sessions (localhost only)
-_sessions: dict[str, dict[str, Any]] = {}
-
 # Sim 1 – Sales: Mira from XYZ Animations
 GREETING = "Hello! This is Mira from XYZ Animations. How may I help you?"
 # Sim 2 – Interrupted query
@@ -53,60 +74,235 @@ QUOTE_USER_PRICE_SAVED = "Noted. I'll get back to you with our best offer."
 QUOTE_EXCEPTION_OFFER = "We can do it at Rs {amount:,.0f}. Would that work for you?"
 QUOTE_AGREED = "Great, we'll process your order. You will receive confirmation shortly."
 QUOTE_REJECTED = "Understood. If you change your mind or have another budget in mind, feel free to reach out."
+# "Am I audible?" / "Can you hear me?" — answer so user knows mic is working
+AUDIBILITY_PHRASES = (
+    "am i audible",
+    "am i being heard",
+    "can you hear me",
+    "can u hear me",
+    "do you hear me",
+    "is my mic working",
+    "mic check",
+    "testing 1 2 3",
+    "testing one two three",
+    "hello can you hear",
+    "are you there",
+)
+_AUDIBILITY = TURN_PHRASES.register("audibility", AUDIBILITY_PHRASES)
 
 
 def start_session() -> tuple[str, str]:
     """Returns (session_id, bot_reply). Bot says greeting first."""
     session_id = f"live_{uuid.uuid4().hex[:12]}"
     state = initial_state(None)
-    _sessions[session_id] = {
-        "state": state,
-        "turn_index": 0,
-        "history": [{"role": "bot", "text": GREETING}],
-        "created_at": datetime.utcnow().isoformat() + "Z",
-    }
+    get_session_store().put(
+        session_id,
+        {
+            "state": state,
+            "turn_index": 0,
+            "history": [{"role": "bot", "text": GREETING}],
+            "created_at": datetime.utcnow().isoformat() + "Z",
+        },
+    )
     return session_id, GREETING
 
 
-def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, str]:
+async def aturn(session_id: str, user_message: str) -> tuple[str, ConversationState, str]:
     """
     Process one user message. Returns (bot_reply, updated_state, intent).
     - General query → FAQ answer; optionally "Go ahead sir" if mid-flow.
     - Else update slots; if missing required → ask next; if all filled → acknowledgment.
     - Complaint → note and ask name/reference if missing.
+    The LLM call is awaited (ainvoke, timeout, concurrency limit; see llm_chat.aget_llm_reply) on the
+    event loop; session lock, DB and rule steps run in the threadpool. Cancelling it (client
+    disconnect) leaves the session unchanged.
     """
-    if session_id not in _sessions:
-        return "Session not found. Please start a new conversation.", initial_state(None), "unknown_chitchat"
-    data = _sessions[session_id]
+    async with _locked_session(session_id) as data:
+        if data is None:
+            return "Session not found. Please start a new conversation.", initial_state(None), "unknown_chitchat"
+        msg = analyze(user_message)
+        result = await run_in_threadpool(_local_turn, session_id, data, msg, user_message)
+        if result is None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + routing.SPECULATIVE_BUDGET_S
+            llm = asyncio.ensure_future(
+                aget_llm_reply(data["history"], user_message, state=data["state"], summary=update_summary(data))
+            )
+            try:
+                spec = await run_in_threadpool(_speculate, session_id, data, msg)
+                if spec.reply is not None and routing.SPECULATIVE_BUDGET_S > 0:
+                    await asyncio.wait({llm}, timeout=max(0.0, deadline - loop.time()))
+                    if not llm.done():
+                        get_route_counters().record(SPECULATIVE_LOCAL)
+                        return _speculative_turn(data, user_message, spec)
+                llm_reply = await llm
+            finally:
+                llm.cancel()  # no-op once done
+            if llm_reply:
+                get_route_counters().record(LLM)
+                result = _llm_turn(data, user_message, llm_reply, spec.state)
+            else:
+                get_route_counters().record(LLM_FALLBACK)
+                result = await run_in_threadpool(_rule_turn, session_id, data, msg, user_message)
+    return result
+
+
+async def astream_turn(session_id: str, user_message: str) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """
+    aturn() as a stream of (event, data): "chunk" {text} for each sentence-sized piece of the reply
+    as soon as it is complete (LLM tokens via astream; rule replies split at once), then "done"
+    {bot_reply, intent, state, first_chunk_ms, total_ms} after the session is saved.
+    Closing the stream during LLM tokens (client gone) leaves the session unchanged; rule replies
+    are saved before their chunks are sent.
+    """
+    start = time.perf_counter()
+    first_chunk_ms: float | None = None
+    streamed = False
+
+    def _chunk(text: str) -> tuple[str, dict[str, Any]]:
+        nonlocal first_chunk_ms
+        if first_chunk_ms is None:
+            first_chunk_ms = (time.perf_counter() - start) * 1000
+        return "chunk", {"text": text}
+
+    async with _locked_session(session_id) as data:
+        if data is None:
+            result = "Session not found. Please start a new conversation.", initial_state(None), "unknown_chitchat"
+        else:
+            msg = analyze(user_message)
+            result = await run_in_threadpool(_local_turn, session_id, data, msg, user_message)
+            if result is None:
+                # First token within the budget wins for the LLM; else the local answer (if any)
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + routing.SPECULATIVE_BUDGET_S
+                stream = astream_llm_reply(
+                    data["history"], user_message, state=data["state"], summary=update_summary(data)
+                )
+                first = asyncio.ensure_future(stream.__anext__())
+                chunker = SentenceChunker()
+                parts: list[str] = []
+                try:
+                    spec = await run_in_threadpool(_speculate, session_id, data, msg)
+                    speculating = spec.reply is not None and routing.SPECULATIVE_BUDGET_S > 0
+                    if speculating:
+                        await asyncio.wait({first}, timeout=max(0.0, deadline - loop.time()))
+                    if speculating and not first.done():
+                        get_route_counters().record(SPECULATIVE_LOCAL)
+                        result = _speculative_turn(data, user_message, spec)
+                    else:
+                        try:
+                            parts.append(await first)
+                        except StopAsyncIteration:
+                            pass
+                        else:
+                            for text in chunker.feed(parts[0]):
+                                streamed = True
+                                yield _chunk(text)
+                            async for delta in stream:
+                                parts.append(delta)
+                                for text in chunker.feed(delta):
+                                    streamed = True
+                                    yield _chunk(text)
+                finally:
+                    if not first.done():
+                        first.cancel()
+                        await asyncio.wait({first})  # let the generator unwind before closing it
+                    await stream.aclose()
+                if result is None:
+                    llm_reply = "".join(parts).strip()
+                    if llm_reply:
+                        for text in chunker.flush():
+                            streamed = True
+                            yield _chunk(text)
+                        get_route_counters().record(LLM)
+                        result = _llm_turn(data, user_message, llm_reply, spec.state)
+                    else:
+                        get_route_counters().record(LLM_FALLBACK)
+                        result = await run_in_threadpool(_rule_turn, session_id, data, msg, user_message)
+    if not streamed:
+        for text in split_sentences(result[0]):
+            yield _chunk(text)
+    reply, state, intent = result
+    yield "done", {
+        "session_id": session_id,
+        "bot_reply": reply,
+        "intent": intent,
+        "state": state.model_dump(mode="json"),
+        "first_chunk_ms": round(first_chunk_ms, 1) if first_chunk_ms is not None else None,
+        "total_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+@asynccontextmanager
+async def _locked_session(session_id: str) -> AsyncIterator[dict[str, Any] | None]:
+    """
+    Working copy of the session under its lock (acquired and released in the threadpool: both
+    are SQLite I/O in shared mode). Saved on normal exit; on error or cancellation the stored
+    session is untouched. Released always, also when cancelled while still acquiring.
+    """
+    store = get_session_store()
+    acquiring = asyncio.ensure_future(run_in_threadpool(store.acquire, session_id))
+
+    async def _release() -> None:
+        try:
+            await acquiring  # a cancelled turn's acquire still finishes in its thread
+        except BaseException:
+            return  # never held (busy, error)
+        await run_in_threadpool(store.release, session_id)
+
+    try:
+        await asyncio.shield(acquiring)
+        data = await run_in_threadpool(store.get, session_id)
+        if data is not None:
+            data = {**data, "history": list(data["history"])}
+        yield data
+        if data is not None:
+            await run_in_threadpool(store.put, session_id, data)
+    finally:
+        await asyncio.shield(_release())  # a second cancel does not stop the release
+
+
+def _local_turn(
+    session_id: str, data: dict[str, Any], msg: MessageAnalysis, user_message: str
+) -> tuple[str, ConversationState, str] | None:
+    """
+    Everything answered without the model: always-local replies, then rule-first routing
+    (src.live.routing) — greeting, FAQ, complaint and slot-question turns — and LLM turns while
+    the circuit breaker is open (src.live.llm_breaker). None: ask the LLM.
+    """
+    counters = get_route_counters()
+    result = _turn_before_llm(session_id, data, msg, user_message)
+    if result is not None:
+        counters.record(PRE_LLM)
+        return result
+    if not llm_enabled():
+        counters.record(NO_LLM)
+        return _rule_turn(session_id, data, msg, user_message)
+    route = route_turn(data, msg)
+    if route.name == LLM:
+        if not get_llm_gateway().breaker.is_open():
+            return None
+        route = route._replace(name=LLM_OPEN)
+    counters.record(route.name)
+    return _rule_turn(session_id, data, msg, user_message, route)
+
+
+def _turn_before_llm(
+    session_id: str, data: dict[str, Any], msg: MessageAnalysis, user_message: str
+) -> tuple[str, ConversationState, str] | None:
+    """Replies that always win over the LLM (mic check, quotation request). None to continue."""
     state: ConversationState = data["state"]
     turn_index = data["turn_index"]
     # "Am I audible?" / "Can you hear me?" — answer so user knows mic is working
-    _msg = (user_message or "").strip().lower()
-    if any(
-        phrase in _msg
-        for phrase in (
-            "am i audible",
-            "am i being heard",
-            "can you hear me",
-            "can u hear me",
-            "do you hear me",
-            "is my mic working",
-            "mic check",
-            "testing 1 2 3",
-            "testing one two three",
-            "hello can you hear",
-            "are you there",
-        )
-    ):
+    if _AUDIBILITY in msg.phrases:
         reply = "Yes, I can hear you. Go ahead."
         data["history"].append({"role": "user", "text": user_message})
         data["history"].append({"role": "bot", "text": reply})
         data["turn_index"] = turn_index + 1
-        _sessions[session_id] = data
         return reply, state, "general_services_query"
 
     # Quotation request: handle before LLM so "I want a quotation" always creates request
-    if user_asks_for_quote(user_message):
+    if user_asks_for_quote(msg):
         q = get_quotation_by_session(session_id)
         if not q or q["status"] in ("agreed", "rejected"):
             req_id = create_quotation_request(session_id)
@@ -115,33 +311,98 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
             data["history"].append({"role": "user", "text": user_message})
             data["history"].append({"role": "bot", "text": reply})
             data["turn_index"] = turn_index + 1
-            _sessions[session_id] = data
             return reply, state, "price_estimation"
+    return None
 
-    # LLM reply: capture what user said and respond naturally (LangChain)
-    llm_reply = get_llm_reply(data["history"], user_message)
-    if llm_reply:
-        data["history"].append({"role": "user", "text": user_message})
-        data["history"].append({"role": "bot", "text": llm_reply})
-        data["turn_index"] = turn_index + 1
-        _sessions[session_id] = data
-        return llm_reply, state, "general_services_query"
 
-    intent_result = detect_intent(user_message)
+class _Speculation(NamedTuple):
+    state: ConversationState  # slots updated from the message (applied whichever answer wins)
+    reply: str | None  # local answer; None when only the full rule turn may answer
+    intent: str
+
+
+def _speculate(session_id: str, data: dict[str, Any], msg: MessageAnalysis) -> _Speculation:
+    """
+    Local pipeline for an LLM-routed turn, run alongside the model call: intent, slot update,
+    next question. No writes (quotation is only read): reply is None when the rule turn would act
+    on an open quotation, the flow has no slot questions, or nothing is left to ask.
+    """
+    state: ConversationState = data["state"]
+    turn_index = data["turn_index"]
+    intent = detect_intent(msg).primary_intent
+    current_intent = intent if state.intent is None or state.intent == "unknown_chitchat" else state.intent
+    if state.intent != current_intent:
+        state = state.model_copy(update={"intent": current_intent})
+    state = update_state_from_message(state, msg, f"turn_{turn_index}", current_intent, is_user_turn=True)
+    if current_intent == "complaint_issue" or not get_required_slots(current_intent):
+        return _Speculation(state, None, current_intent)
+    q = get_quotation_by_session(session_id)
+    open_quote = q and q["status"] in ("quote_ready", "sent_to_user", "negotiating")
+    if open_quote or data.get("quotation_awaiting_acceptance"):
+        return _Speculation(state, None, current_intent)
+    question, slot = get_next_question(state, turn_index=turn_index, last_user_message=msg)
+    if not question:
+        return _Speculation(state, None, current_intent)
+    if (
+        current_intent == "new_project_sales"
+        and slot
+        and not state.get_slot(slot).value
+        and ("looking for" in msg.lower or "animation" in msg.lower)
+    ):
+        question = LOOKING_FOR_ANIMATION_ANSWER + " " + question
+    return _Speculation(state, question, current_intent)
+
+
+def _speculative_turn(
+    data: dict[str, Any], user_message: str, spec: _Speculation
+) -> tuple[str, ConversationState, str]:
+    """The local answer won (model over the latency budget)."""
+    data["state"] = spec.state
+    data["history"].append({"role": "user", "text": user_message})
+    data["history"].append({"role": "bot", "text": spec.reply})
+    data["turn_index"] = data["turn_index"] + 1
+    return spec.reply, spec.state, spec.intent
+
+
+def _llm_turn(
+    data: dict[str, Any], user_message: str, llm_reply: str, state: ConversationState | None = None
+) -> tuple[str, ConversationState, str]:
+    if state is not None:  # slots from the local pipeline
+        data["state"] = state
+    data["history"].append({"role": "user", "text": user_message})
+    data["history"].append({"role": "bot", "text": llm_reply})
+    data["turn_index"] = data["turn_index"] + 1
+    return llm_reply, data["state"], "general_services_query"
+
+
+def _rule_turn(
+    session_id: str,
+    data: dict[str, Any],
+    msg: MessageAnalysis,
+    user_message: str,
+    route: Route | None = None,
+) -> tuple[str, ConversationState, str]:
+    """
+    Rule-based reply: intent, FAQ, slot filling, complaint and quotation flows.
+    route (routing.route_turn for this message) supplies the intent, and the updated state and
+    next question when routing already computed them.
+    """
+    state: ConversationState = data["state"]
+    turn_index = data["turn_index"]
+    intent_result = route.intent if route is not None else detect_intent(msg)
     intent = intent_result.primary_intent
     confidence = intent_result.confidence
 
         # Acknowledge so the bot clearly responds to what they said (no same line again)
     def _ack_then(s: str) -> str:
-        return f"Got it — {s}" if (user_message or "").strip() else s
+        return f"Got it — {s}" if msg.lower else s
 
     # Sim 4 – Unknown/chitchat: short greeting → brief reply; else try FAQ, then varied clarification
     if intent == "unknown_chitchat":
-        _m = _msg.strip()
-        if _m in ("hi", "hello", "hey", "hi there", "hello there") or len(_m.split()) <= 2 and any(g in _m for g in ("hi", "hello", "hey")):
+        if is_greeting(msg):
             reply = "Hi! What can I help you with?"
         else:
-            faq = get_faq_reply(user_message)
+            faq = get_faq_reply(msg)
             if faq:
                 reply = _ack_then(faq)
             else:
@@ -154,12 +415,11 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
         data["history"].append({"role": "user", "text": user_message})
         data["history"].append({"role": "bot", "text": reply})
         data["turn_index"] = turn_index + 1
-        _sessions[session_id] = data
         return reply, state, intent
 
     # Sim 2 – General services query → varied FAQ; always acknowledge so we answer to what they said
     if intent == "general_services_query":
-        faq = get_faq_reply_varied(user_message, turn_index) or get_faq_reply(user_message)
+        faq = get_faq_reply_varied(msg, turn_index) or get_faq_reply(msg)
         base = (GO_AHEAD + " " + (faq or "")) if state.last_question_asked else (faq or "We do such projects — animation, short films, ads. What would you like to go for?")
         reply = _ack_then(base)
         data["history"].append({"role": "user", "text": user_message})
@@ -167,20 +427,22 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
         data["turn_index"] = turn_index + 1
         return reply, state, intent
 
-    # Update intent if we had unknown/chitchat and now we have a clear intent
-    if (state.intent is None or state.intent == "unknown_chitchat") and intent != "unknown_chitchat":
-        state = state.model_copy(update={"intent": intent})
-    elif state.intent is None:
-        state = state.model_copy(update={"intent": intent})
-
+    if route is not None and route.state is not None:  # same carry-over and slot update, done while routing
+        state = route.state
+    else:
+        # Update intent if we had unknown/chitchat and now we have a clear intent
+        if (state.intent is None or state.intent == "unknown_chitchat") and intent != "unknown_chitchat":
+            state = state.model_copy(update={"intent": intent})
+        elif state.intent is None:
+            state = state.model_copy(update={"intent": intent})
+        state = update_state_from_message(
+            state,
+            msg,
+            f"turn_{turn_index}",
+            state.intent or intent,
+            is_user_turn=True,
+        )
     current_intent = state.intent or intent
-    state = update_state_from_message(
-        state,
-        user_message,
-        f"turn_{turn_index}",
-        current_intent,
-        is_user_turn=True,
-    )
 
     # Sim 3 – Complaint: "I'm sorry to hear that. May I know your name..." (logs + escalates)
     if current_intent == "complaint_issue":
@@ -196,7 +458,6 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
         data["history"].append({"role": "user", "text": user_message})
         data["history"].append({"role": "bot", "text": reply})
         data["turn_index"] = turn_index + 1
-        _sessions[session_id] = data
         return reply, state, current_intent
 
     # ---------- Quotation flow ----------
@@ -205,11 +466,11 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
 
     if awaiting_qid and q and q["id"] == awaiting_qid:
         # User is responding to exception offer
-        if user_agrees(user_message):
+        if user_agrees(msg):
             update_quotation_status(q["id"], "agreed")
             data["quotation_awaiting_acceptance"] = None
             reply = QUOTE_AGREED
-        elif user_disagrees(user_message):
+        elif user_disagrees(msg):
             reason = f"User declined exception price of Rs {q.get('admin_exception_amount') or 0:,.0f}"
             update_quotation_status(q["id"], "rejected", rejection_reason=reason)
             data["quotation_awaiting_acceptance"] = None
@@ -220,7 +481,6 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
         data["history"].append({"role": "user", "text": user_message})
         data["history"].append({"role": "bot", "text": reply})
         data["turn_index"] = turn_index + 1
-        _sessions[session_id] = data
         return reply, state, current_intent
 
     if q and q["status"] == "quote_ready":
@@ -234,7 +494,6 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
         data["history"].append({"role": "user", "text": user_message})
         data["history"].append({"role": "bot", "text": reply})
         data["turn_index"] = turn_index + 1
-        _sessions[session_id] = data
         return reply, state, current_intent
 
     if q and q["status"] in ("sent_to_user", "negotiating"):
@@ -251,10 +510,9 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
             data["history"].append({"role": "user", "text": user_message})
             data["history"].append({"role": "bot", "text": reply})
             data["turn_index"] = turn_index + 1
-            _sessions[session_id] = data
             return reply, state, current_intent
 
-        if user_asks_to_reduce_price(user_message):
+        if user_asks_to_reduce_price(msg):
             if offered < max_disc:
                 # Offer more: half of remaining, then full (human-like)
                 remaining = max_disc - offered
@@ -265,7 +523,7 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
                 reply = QUOTE_MORE_DISCOUNT.format(discount_pct=new_offered, final=final_price)
             else:
                 reply = QUOTE_GET_BACK
-                price = extract_price_from_message(user_message)
+                price = extract_price_from_message(msg)
                 if price is not None:
                     update_quotation_user_price(q["id"], price)
                     reply = QUOTE_GET_BACK + " " + QUOTE_USER_PRICE_SAVED
@@ -273,10 +531,9 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
             data["history"].append({"role": "user", "text": user_message})
             data["history"].append({"role": "bot", "text": reply})
             data["turn_index"] = turn_index + 1
-            _sessions[session_id] = data
             return reply, state, current_intent
 
-        price = extract_price_from_message(user_message)
+        price = extract_price_from_message(msg)
         if price is not None and q.get("user_counter_price") is None:
             update_quotation_user_price(q["id"], price)
             reply = QUOTE_USER_PRICE_SAVED
@@ -284,11 +541,10 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
             data["history"].append({"role": "user", "text": user_message})
             data["history"].append({"role": "bot", "text": reply})
             data["turn_index"] = turn_index + 1
-            _sessions[session_id] = data
             return reply, state, current_intent
 
     # Create new quotation request when user asks for quote (price_estimation)
-    if current_intent == "price_estimation" and user_asks_for_quote(user_message):
+    if current_intent == "price_estimation" and user_asks_for_quote(msg):
         if not q or q["status"] in ("agreed", "rejected"):
             req_id = create_quotation_request(session_id)
             data["quotation_request_id"] = req_id
@@ -297,7 +553,6 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
             data["history"].append({"role": "user", "text": user_message})
             data["history"].append({"role": "bot", "text": reply})
             data["turn_index"] = turn_index + 1
-            _sessions[session_id] = data
             return reply, state, current_intent
 
     # Other intents: check required slots
@@ -305,7 +560,10 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
     if not required:
         reply = ALL_CAPTURED
     else:
-        question, slot = get_next_question(state, turn_index=turn_index, last_user_message=user_message)
+        if route is not None and route.question is not None:
+            question, slot = route.question
+        else:
+            question, slot = get_next_question(state, turn_index=turn_index, last_user_message=msg)
         if question:
             reply = question
             # First reply for "looking for animation" — acknowledge then ask (agentic)
@@ -313,7 +571,7 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
                 current_intent == "new_project_sales"
                 and slot
                 and not state.get_slot(slot).value
-                and ("looking for" in user_message.lower() or "animation" in user_message.lower())
+                and ("looking for" in msg.lower or "animation" in msg.lower)
             ):
                 reply = LOOKING_FOR_ANIMATION_ANSWER + " " + question
         else:
@@ -323,9 +581,8 @@ def turn(session_id: str, user_message: str) -> tuple[str, ConversationState, st
     data["history"].append({"role": "user", "text": user_message})
     data["history"].append({"role": "bot", "text": reply})
     data["turn_index"] = turn_index + 1
-    _sessions[session_id] = data
     return reply, state, current_intent
 
 
 def get_session(session_id: str) -> dict[str, Any] | None:
-    return _sessions.get(session_id)
+    return get_session_store().get(session_id)
@@ -0,0 +1,456 @@
+"""
+Live session store — in-process LRU/TTL tier in front of a durable SQLite tier (registry live_sessions).
+aturn() reads a session here and puts it back; dirty sessions are written behind in batches
+(state as a snapshot, turn_index, history, quotation flags), so sessions survive restarts and
+memory eviction. Caps (env): idle time, session count, approximate memory, history length.
+Turns of one session serialize on lock(). Shared mode (the default with the sqlite backend: any
+number of worker processes on one DB) adds a SQLite lease per session and writes through with a
+version check; the memory tier then only serves a session whose cached version matches the stored
+one. LIVE_SESSION_SHARED=0 switches to write-behind, which is only safe in a single process.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Iterator, Protocol
+
+from src.registry import (
+    acquire_live_session_lease,
+    delete_live_sessions_idle_since,
+    get_live_session,
+    release_live_session_lease,
+    save_live_sessions,
+)
+from src.state.snapshot import encode_state, load_state
+
+# Tunables (env overrides). Backend "memory" keeps sessions in-process only (lost on restart/eviction).
+BACKEND = os.environ.get("LIVE_SESSION_BACKEND", "sqlite")
+IDLE_TTL_S = float(os.environ.get("LIVE_SESSION_IDLE_TTL_S", "1800"))  # memory tier: drop after idle
+RETENTION_S = float(os.environ.get("LIVE_SESSION_RETENTION_S", "86400"))  # durable tier: delete after idle
+MAX_SESSIONS = int(os.environ.get("LIVE_SESSION_MAX", "10000"))
+MAX_MEMORY_MB = float(os.environ.get("LIVE_SESSION_MAX_MEMORY_MB", "256"))
+HISTORY_MAX = int(os.environ.get("LIVE_HISTORY_MAX", "200"))  # history entries kept; 0 = unbounded
+FLUSH_INTERVAL_S = float(os.environ.get("LIVE_SESSION_FLUSH_S", "1.0"))  # write-behind; 0 = write-through
+SWEEP_INTERVAL_S = 60.0
+# Lease + write-through (sqlite backend). Workers of `uvicorn --workers N` set no env var of their own,
+# so this is on unless turned off: LIVE_SESSION_SHARED=0 only for a single server process.
+SHARED = os.environ.get("LIVE_SESSION_SHARED", "1") == "1"
+LEASE_S = float(os.environ.get("LIVE_SESSION_LEASE_S", "30"))  # longest turn; an expired lease can be taken over
+LOCK_TIMEOUT_S = float(os.environ.get("LIVE_SESSION_LOCK_TIMEOUT_S", "10"))
+
+# Approximate footprint: fixed per session (state, dict) + per history entry + text
+_SESSION_BYTES = 4096
+_ENTRY_BYTES = 200
+
+
+class SessionBusyError(RuntimeError):
+    """The session is locked by another worker past the timeout, or was changed under an expired lease."""
+
+
+class SessionBackend(Protocol):
+    """
+    Durable tier. dump() runs under the store lock (cheap encode); write() does the I/O and skips
+    rows whose version is not newer than the stored one. acquire/release implement the shared-mode lease.
+    """
+
+    def load(self, session_id: str) -> tuple[dict[str, Any], int] | None: ...
+
+    def dump(self, session_id: str, data: dict[str, Any], version: int) -> Any: ...
+
+    def write(self, rows: list[Any]) -> int: ...
+
+    def expire(self, idle_s: float) -> int: ...
+
+    def acquire(self, session_id: str, owner: str, lease_s: float) -> tuple[bool, int | None]: ...
+
+    def release(self, session_id: str, owner: str) -> None: ...
+
+
+class SQLiteSessionBackend:
+    """Registry live_sessions table; state stored as a compact snapshot (src.state.snapshot)."""
+
+    def load(self, session_id: str) -> tuple[dict[str, Any], int] | None:
+        row = get_live_session(session_id)
+        if not row:
+            return None
+        data = {
+            "state": load_state(row["state_snapshot"]).to_state(),
+            "turn_index": row["turn_index"],
+            "history": json.loads(row["history_json"] or "[]"),
+            "created_at": row["created_at"],
+            "quotation_request_id": row["quotation_request_id"],
+            "quotation_awaiting_acceptance": row["quotation_awaiting_acceptance"],
+        }
+        if row["context_summary_json"]:
+            data["context_summary"] = json.loads(row["context_summary_json"])
+        return data, row["version"]
+
+    def dump(self, session_id: str, data: dict[str, Any], version: int) -> dict[str, Any]:
+        now = datetime.utcnow().isoformat() + "Z"
+        return {
+            "session_id": session_id,
+            "state_snapshot": encode_state(data["state"]),
+            "turn_index": data["turn_index"],
+            "history_json": json.dumps(data["history"]),
+            "quotation_request_id": data.get("quotation_request_id"),
+            "quotation_awaiting_acceptance": data.get("quotation_awaiting_acceptance"),
+            "created_at": data.get("created_at") or now,
+            "updated_at": now,
+            "version": version,
+            "context_summary_json": json.dumps(data["context_summary"]) if data.get("context_summary") else None,
+        }
+
+    def write(self, rows: list[dict[str, Any]]) -> int:
+        return save_live_sessions(rows)
+
+    def expire(self, idle_s: float) -> int:
+        before = (datetime.utcnow() - timedelta(seconds=idle_s)).isoformat() + "Z"
+        return delete_live_sessions_idle_since(before)
+
+    def acquire(self, session_id: str, owner: str, lease_s: float) -> tuple[bool, int | None]:
+        return acquire_live_session_lease(session_id, owner, lease_s)
+
+    def release(self, session_id: str, owner: str) -> None:
+        release_live_session_lease(session_id, owner)
+
+
+def _footprint(data: dict[str, Any]) -> int:
+    history = data.get("history") or ()
+    return _SESSION_BYTES + sum(_ENTRY_BYTES + len(h.get("text") or "") for h in history)
+
+
+class _Entry:
+    __slots__ = ("data", "version", "touched", "size")
+
+    def __init__(self, data: dict[str, Any], version: int, touched: float, size: int) -> None:
+        self.data = data
+        self.version = version
+        self.touched = touched
+        self.size = size
+
+
+class LiveSessionStore:
+    """
+    LRU/TTL memory tier with optional write-behind to a durable backend.
+    Sessions evicted from memory (idle, count or memory cap) reload from the backend on next get;
+    with no backend, eviction ends the session.
+    """
+
+    def __init__(
+        self,
+        backend: SessionBackend | None = None,
+        *,
+        idle_ttl_s: float = IDLE_TTL_S,
+        retention_s: float = RETENTION_S,
+        max_sessions: int = MAX_SESSIONS,
+        max_memory_mb: float = MAX_MEMORY_MB,
+        history_max: int = HISTORY_MAX,
+        flush_interval_s: float = FLUSH_INTERVAL_S,
+        shared: bool = SHARED,
+        lease_s: float = LEASE_S,
+        lock_timeout_s: float = LOCK_TIMEOUT_S,
+    ) -> None:
+        self.backend = backend
+        self.idle_ttl_s = idle_ttl_s
+        self.retention_s = retention_s
+        self.max_sessions = max(1, max_sessions)
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self.history_max = history_max
+        self.flush_interval_s = flush_interval_s
+        self.shared = shared and backend is not None
+        self.lease_s = lease_s
+        self.lock_timeout_s = lock_timeout_s
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._lru: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._dirty: dict[str, _Entry] = {}  # written behind; also served to get() after eviction
+        self._inflight: dict[str, _Entry] = {}  # being written by flush()
+        self._session_locks: dict[str, list] = {}  # session_id -> [lock, holders]
+        self._leases: dict[str, int | None] = {}  # shared mode: session_id -> stored version under our lease
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._pid = os.getpid()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+    @contextmanager
+    def lock(self, session_id: str) -> Iterator[None]:
+        """
+        Serialize turns of one session (get → change → put inside). Different sessions do not contend.
+        Shared mode also holds the session's SQLite lease; raises SessionBusyError after lock_timeout_s.
+        """
+        self.acquire(session_id)
+        try:
+            yield
+        finally:
+            self.release(session_id)
+
+    def acquire(self, session_id: str) -> None:
+        """lock() without the context manager (async callers); pair with release(), from any thread."""
+        with self._lock:
+            slot = self._session_locks.setdefault(session_id, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            if not slot[0].acquire(timeout=self.lock_timeout_s):
+                raise SessionBusyError(f"Session {session_id} is busy")
+            try:
+                if self.shared:
+                    self._leases[session_id] = self._acquire_lease(session_id)
+            except BaseException:
+                slot[0].release()
+                raise
+        except BaseException:
+            self._unref(session_id, slot)
+            raise
+
+    def release(self, session_id: str) -> None:
+        with self._lock:
+            slot = self._session_locks[session_id]
+        try:
+            if self.shared:
+                self._leases.pop(session_id, None)
+                self.backend.release(session_id, self._owner)
+        finally:
+            slot[0].release()
+            self._unref(session_id, slot)
+
+    def _unref(self, session_id: str, slot: list) -> None:
+        with self._lock:
+            slot[1] -= 1
+            if not slot[1]:
+                self._session_locks.pop(session_id, None)
+
+    def get(self, session_id: str) -> dict[str, Any] | None:
+        """
+        Session dict (mutable; put() it back after changing it), or None if unknown or expired.
+        Its "version" key is the stored version, so a copy put() back after eviction still writes the next one.
+        """
+        now = time.monotonic()
+        if self.shared:
+            return self._get_shared(session_id, now)
+        with self._lock:
+            entry = self._lru.get(session_id)
+            if entry is not None:
+                if now - entry.touched <= self.idle_ttl_s:
+                    entry.touched = now
+                    self._lru.move_to_end(session_id)
+                    return entry.data
+                self._drop(session_id)
+                if self.backend is None:
+                    return None
+            entry = self._dirty.get(session_id) or self._inflight.get(session_id)
+        if entry is not None:
+            data, version = entry.data, entry.version
+        else:
+            loaded = self.backend.load(session_id) if self.backend is not None else None
+            if loaded is None:
+                return None
+            data, version = loaded
+        with self._lock:
+            entry = self._lru.get(session_id)
+            if entry is not None:  # loaded concurrently
+                return entry.data
+            self._cache(session_id, data, version, now)
+            self._evict()
+        return data
+
+    def put(self, session_id: str, data: dict[str, Any]) -> None:
+        """Store a new or updated session: trims history, enforces caps, queues the durable write."""
+        history = data.get("history")
+        if self.history_max and history and len(history) > self.history_max:
+            del history[: len(history) - self.history_max]
+        if self.shared:
+            self._put_shared(session_id, data)
+            return
+        with self._lock:
+            old = self._lru.get(session_id) or self._dirty.get(session_id) or self._inflight.get(session_id)
+            version = max(old.version if old else 0, data.get("version") or 0) + 1
+            entry = self._cache(session_id, data, version, time.monotonic())
+            if self.backend is not None:
+                self._dirty[session_id] = entry
+            self._evict()
+        if self.backend is None:
+            return
+        if self.flush_interval_s > 0:
+            self._ensure_flusher()
+        else:
+            self.flush()
+
+    def _acquire_lease(self, session_id: str) -> int | None:
+        deadline = time.monotonic() + self.lock_timeout_s
+        delay = 0.002
+        while True:
+            acquired, version = self.backend.acquire(session_id, self._owner, self.lease_s)
+            if acquired:
+                return version
+            if time.monotonic() >= deadline:
+                raise SessionBusyError(f"Session {session_id} is locked by another worker")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+    def _get_shared(self, session_id: str, now: float) -> dict[str, Any] | None:
+        """Cached copy only if it is the stored version (known under our lease); else load."""
+        leased = session_id in self._leases
+        with self._lock:
+            entry = self._lru.get(session_id)
+            if leased and entry is not None and entry.version == self._leases[session_id]:
+                entry.touched = now
+                self._lru.move_to_end(session_id)
+                return entry.data
+        if leased and self._leases[session_id] is None:
+            return None
+        loaded = self.backend.load(session_id)
+        if loaded is None:
+            return None
+        data, version = loaded
+        with self._lock:
+            self._cache(session_id, data, version, now)
+            self._evict()
+        return data
+
+    def _put_shared(self, session_id: str, data: dict[str, Any]) -> None:
+        """Write-through with the next version; losing to a newer stored version raises SessionBusyError."""
+        with self._lock:
+            old = self._lru.get(session_id)
+            version = max(old.version if old else 0, self._leases.get(session_id) or 0) + 1
+            row = self.backend.dump(session_id, data, version)
+        if not self.backend.write([row]):
+            with self._lock:
+                self._drop(session_id)
+            raise SessionBusyError(f"Session {session_id} was changed by another worker")
+        with self._lock:
+            self._cache(session_id, data, version, time.monotonic())
+            self._evict()
+        if session_id in self._leases:
+            self._leases[session_id] = version
+
+    def flush(self) -> int:
+        """Write dirty sessions to the backend in one batch. Returns sessions written."""
+        if self.backend is None:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return 0
+                pending, self._dirty = self._dirty, {}
+                rows = [self.backend.dump(sid, entry.data, entry.version) for sid, entry in pending.items()]
+                self._inflight = pending
+            try:
+                return self.backend.write(rows)
+            except Exception:
+                with self._lock:
+                    for sid, entry in pending.items():
+                        self._dirty.setdefault(sid, entry)
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = {}
+
+    def sweep(self) -> int:
+        """Drop idle sessions from memory and expire old ones from the backend. Returns sessions dropped from memory."""
+        now = time.monotonic()
+        dropped = 0
+        with self._lock:
+            while self._lru:
+                sid, entry = next(iter(self._lru.items()))
+                if now - entry.touched <= self.idle_ttl_s:
+                    break
+                self._drop(sid)
+                dropped += 1
+        if self.backend is not None and self.retention_s > 0:
+            self.backend.expire(self.retention_s)
+        return dropped
+
+    def close(self) -> None:
+        """Stop the flusher and write everything still dirty."""
+        self._stop.set()
+        flusher = self._flusher
+        if flusher is not None and flusher.is_alive() and self._pid == os.getpid():
+            flusher.join(timeout=max(1.0, self.flush_interval_s * 2))
+        self._flusher = None
+        self.flush()
+
+    def _cache(self, session_id: str, data: dict[str, Any], version: int, now: float) -> _Entry:
+        data["version"] = version
+        entry = _Entry(data, version, now, _footprint(data))
+        old = self._lru.pop(session_id, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._lru[session_id] = entry
+        self._bytes += entry.size
+        return entry
+
+    def _drop(self, session_id: str) -> None:
+        entry = self._lru.pop(session_id, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        """Least recently used first, keeping the newest session even if it alone exceeds the memory cap."""
+        while len(self._lru) > self.max_sessions or (self._bytes > self.max_bytes and len(self._lru) > 1):
+            _, entry = self._lru.popitem(last=False)
+            self._bytes -= entry.size
+
+    def _ensure_flusher(self) -> None:
+        flusher = self._flusher
+        if flusher is not None and flusher.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            flusher = self._flusher
+            if flusher is not None and flusher.is_alive() and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._stop.clear()
+            self._flusher = threading.Thread(target=self._run_flusher, name="live-session-flush", daemon=True)
+            self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        last_sweep = time.monotonic()
+        while not self._stop.wait(self.flush_interval_s):
+            try:
+                self.flush()
+                if time.monotonic() - last_sweep >= SWEEP_INTERVAL_S:
+                    last_sweep = time.monotonic()
+                    self.sweep()
+            except Exception:
+                pass  # sessions stay dirty; retried next interval
+
+
+_store: LiveSessionStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_session_store() -> LiveSessionStore:
+    """Process-wide store, built from LIVE_SESSION_BACKEND on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = LiveSessionStore(SQLiteSessionBackend() if BACKEND == "sqlite" else None)
+    return _store
+
+
+def set_session_store(store: LiveSessionStore | None) -> None:
+    """Swap the process-wide store (e.g. another backend); the previous one is flushed and closed."""
+    global _store
+    with _store_lock:
+        old, _store = _store, store
+    if old is not None and old is not store:
+        old.close()
+
+
+def close_session_store() -> None:
+    """Flush and close the live session store (app shutdown)."""
+    set_session_store(None)
@@ -0,0 +1,55 @@
+"""
+Streaming helpers for /live/stream: cut LLM token deltas into sentence-sized chunks the client can
+speak as soon as each one is complete, and format Server-Sent Events.
+"""
+
+import json
+import re
+from typing import Any
+
+# A chunk ends at sentence punctuation followed by whitespace; long runs break at a comma or space.
+_SENTENCE_END = re.compile(r"(?<=[.!?…])[\"')\]]*\s+")
+MAX_CHUNK_CHARS = 160
+
+
+def split_sentences(text: str) -> list[str]:
+    """Whole text as speakable chunks (rule-based replies)."""
+    chunker = SentenceChunker()
+    return chunker.feed(text) + chunker.flush()
+
+
+class SentenceChunker:
+    """Feed text deltas; get back complete chunks. flush() returns the remainder at end of stream."""
+
+    def __init__(self, max_chars: int = MAX_CHUNK_CHARS) -> None:
+        self.max_chars = max_chars
+        self._buf = ""
+
+    def feed(self, delta: str) -> list[str]:
+        self._buf += delta
+        chunks: list[str] = []
+        while True:
+            m = _SENTENCE_END.search(self._buf)
+            if m:
+                cut, rest = m.end(), m.end()
+            elif len(self._buf) > self.max_chars:
+                cut = self._buf.rfind(", ", 0, self.max_chars) + 1 or self._buf.rfind(" ", 0, self.max_chars)
+                if cut <= 0:
+                    cut = self.max_chars
+                rest = cut
+            else:
+                break
+            chunk = self._buf[:cut].strip()
+            self._buf = self._buf[rest:]
+            if chunk:
+                chunks.append(chunk)
+        return chunks
+
+    def flush(self) -> list[str]:
+        chunk, self._buf = self._buf.strip(), ""
+        return [chunk] if chunk else []
+
+
+def sse_event(event: str, data: dict[str, Any]) -> str:
+    """One Server-Sent Event (JSON data)."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
@@ -14,8 +14,12 @@ from fastapi.responses import HTMLResponse
 from src.admin.router import router as admin_router
 from src.dashboard.router import router as dashboard_router
 from src.ingestion import router as ingest_router
+from src.live.llm_gateway import close_llm_gateway
+from src.live.reply_cache import close_reply_cache
 from src.live.router import router as live_router
-from src.registry import init_db
+from src.live.session_store import close_session_store
+from src.nlp import close_nlp_pool
+from src.registry import close_pool, init_db
 from src.user_page import router as user_router
 
 
@@ -23,6 +27,11 @@ from src.user_page import router as user_router
 async def lifespan(app: FastAPI):
     init_db()
     yield
+    close_session_store()
+    close_reply_cache()
+    await close_llm_gateway()
+    close_nlp_pool()
+    close_pool()
 
 
 app = FastAPI(
@@ -1,15 +1,34 @@
+from .analysis import MessageAnalysis, PatternSet, analyze
 from .entities import extract_entities, merge_entities
 from .intent import detect_intent, get_final_intent, get_tentative_intent
-from .pipeline import run_nlp_pipeline, run_and_persist
+from .phrases import PhraseMatcher, SharedPhraseMatcher, TURN_PHRASES
+from .pipeline import (
+    close_nlp_pool,
+    persist_nlp_result,
+    persist_nlp_results_batch,
+    run_and_persist,
+    run_nlp_pipeline,
+    run_nlp_pipeline_batch,
+)
 from .preprocessing import preprocess, PreprocessResult
 
 __all__ = [
+    "MessageAnalysis",
+    "PatternSet",
+    "analyze",
     "extract_entities",
     "merge_entities",
     "detect_intent",
     "get_final_intent",
     "get_tentative_intent",
+    "PhraseMatcher",
+    "SharedPhraseMatcher",
+    "TURN_PHRASES",
+    "close_nlp_pool",
+    "persist_nlp_result",
+    "persist_nlp_results_batch",
     "run_nlp_pipeline",
+    "run_nlp_pipeline_batch",
     "run_and_persist",
     "preprocess",
     "PreprocessResult",
@@ -0,0 +1,143 @@
+"""
+Per-message analysis: lowered, normalized and tokenized views plus cached regex matches.
+Built once per user message and passed to intent, entity, slot, FAQ and quotation checks,
+which otherwise each lowercase/strip/scan the same text again. All of them also accept a str.
+"""
+
+import re
+from typing import Iterable
+
+from src.nlp.phrases import TURN_PHRASES
+
+_REPEATED_CHAR = re.compile(r"(.)\1+")
+_I2D = re.compile(r"\bi2d\b")
+_I3D = re.compile(r"\bi3d\b")
+_MISS = object()
+
+
+def normalize_for_intent(text: str) -> str:
+    """Collapse repeated letters; fix 'i2d'/'i3d' so 2d/3d are detected."""
+    t = text.lower().strip()
+    if not t:
+        return t
+    t = _REPEATED_CHAR.sub(r"\1", t)
+    if "i2d" in t:
+        t = _I2D.sub("i 2d", t)
+    if "i3d" in t:
+        t = _I3D.sub("i 3d", t)
+    return t
+
+
+class PatternSet:
+    """
+    Ordered patterns (same flags, no backreferences) plus one alternation of all of them.
+    The alternation matches iff some pattern does, so a message that hits none of the
+    family costs one search instead of one per pattern; its match position also bounds
+    where the other patterns can match, so they need not be searched from the start.
+    """
+
+    def __init__(self, patterns: Iterable[re.Pattern[str]]) -> None:
+        self.patterns = tuple(patterns)
+        flags = {p.flags for p in self.patterns}
+        if len(flags) != 1:
+            raise ValueError("PatternSet patterns must share flags")
+        # Non-capturing: capture groups in the alternation make the search markedly slower
+        self.gate = re.compile("|".join(f"(?:{p.pattern})" for p in self.patterns), flags.pop())
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+
+class MessageAnalysis:
+    """
+    One message, analysed lazily and at most once per view.
+      text        original text
+      lower       text.strip().lower() (FAQ, closure, refusal, quotation checks)
+      normalized  normalize_for_intent(text)
+      tokens      lower.split()
+      phrases     TURN_PHRASES families present in `lower`
+    search() caches per pattern and view; first/any/matching go through a PatternSet gate.
+    """
+
+    __slots__ = ("text", "lower", "_normalized", "_tokens", "_phrases", "_text_hits", "_lower_hits", "_all_hits")
+
+    def __init__(self, text: str | None) -> None:
+        self.text = text or ""
+        self.lower = self.text.strip().lower()
+        self._normalized: str | None = None
+        self._tokens: tuple[str, ...] | None = None
+        self._phrases: frozenset[str] | None = None
+        self._text_hits: dict[re.Pattern[str], re.Match[str] | None] = {}
+        self._lower_hits: dict[re.Pattern[str], re.Match[str] | None] = {}
+        self._all_hits: dict[tuple[re.Pattern[str], bool], list[re.Match[str]]] = {}
+
+    def __repr__(self) -> str:
+        return f"MessageAnalysis({self.text!r})"
+
+    @property
+    def normalized(self) -> str:
+        if self._normalized is None:
+            self._normalized = normalize_for_intent(self.lower)
+        return self._normalized
+
+    @property
+    def tokens(self) -> tuple[str, ...]:
+        if self._tokens is None:
+            self._tokens = tuple(self.lower.split())
+        return self._tokens
+
+    @property
+    def phrases(self) -> frozenset[str]:
+        if self._phrases is None:
+            self._phrases = TURN_PHRASES.match(self.lower)
+        return self._phrases
+
+    def search(self, pattern: re.Pattern[str], *, lower: bool = False) -> re.Match[str] | None:
+        """pattern.search over the original text (or `lower`), cached."""
+        hits = self._lower_hits if lower else self._text_hits
+        m = hits.get(pattern, _MISS)
+        if m is _MISS:
+            m = hits[pattern] = pattern.search(self.lower if lower else self.text)
+        return m  # type: ignore[return-value]
+
+    def finditer(self, pattern: re.Pattern[str], *, lower: bool = False) -> list[re.Match[str]]:
+        """All matches of pattern over the original text (or `lower`), cached."""
+        key = (pattern, lower)
+        ms = self._all_hits.get(key)
+        if ms is None:
+            ms = self._all_hits[key] = list(pattern.finditer(self.lower if lower else self.text))
+        return ms
+
+    def any(self, patterns: PatternSet, *, lower: bool = False) -> bool:
+        """True if any pattern of the set matches."""
+        return self.search(patterns.gate, lower=lower) is not None
+
+    def first(self, patterns: PatternSet, *, lower: bool = False) -> tuple[int, re.Match[str]] | None:
+        """(index, match) of the first pattern in set order that matches, else None."""
+        gm = self.search(patterns.gate, lower=lower)
+        if gm is None:
+            return None
+        # No pattern matches left of the gate hit, so each search can start there
+        text = self.lower if lower else self.text
+        start = gm.start()
+        for i, pat in enumerate(patterns.patterns):
+            m = pat.search(text, start)
+            if m:
+                return i, m
+        return None
+
+    def matching(self, patterns: PatternSet, *, lower: bool = False) -> list[int]:
+        """Indexes of every pattern in the set that matches."""
+        gm = self.search(patterns.gate, lower=lower)
+        if gm is None:
+            return []
+        text = self.lower if lower else self.text
+        start = gm.start()
+        return [i for i, pat in enumerate(patterns.patterns) if pat.search(text, start)]
+
+
+def analyze(message: "str | MessageAnalysis | None") -> MessageAnalysis:
+    """Return `message` if already analysed, else analyse it."""
+    if isinstance(message, MessageAnalysis):
+        return message
+    return MessageAnalysis(message)
@@ -6,6 +6,8 @@ Map free text → structured fields. Store even if incomplete.
 import re
 from typing import Any
 
+from src.nlp.analysis import MessageAnalysis, PatternSet, analyze
+
 # Content type signals
 CONTENT_TYPE_PATTERNS = [
     ("short_film", re.compile(r"\b(short\s+film|short\s+video|short\s+clip|advertisement|\bad)\b", re.I)),
@@ -39,6 +41,12 @@ PLATFORM_PATTERNS = [
 ]
 
 
+# One gate search per family; per-pattern order (first match wins) only when the gate hits
+_CONTENT_TYPE_SET = PatternSet(p for _, p in CONTENT_TYPE_PATTERNS)
+_STYLE_SET = PatternSet(p for _, p in STYLE_PATTERNS)
+_PLATFORM_SET = PatternSet(p for _, p in PLATFORM_PATTERNS)
+
+
 def _normalize_duration_to_minutes(match: re.Match) -> float:
     val = float(match.group(1))
     unit = match.group(2).lower()
@@ -49,7 +57,7 @@ def _normalize_duration_to_minutes(match: re.Match) -> float:
     return val
 
 
-def extract_entities(text: str) -> dict[str, Any]:
+def extract_entities(text: str | MessageAnalysis) -> dict[str, Any]:
     """
     Extract structured fields from conversation text.
     Returns dict with content_type, style, duration_minutes, platform, etc.
@@ -62,36 +70,33 @@ def extract_entities(text: str) -> dict[str, Any]:
         "platform": None,
         "raw_duration_mentions": [],
     }
-    if not text:
+    a = analyze(text)
+    if not a.text:
         return result
 
     # Content type (first match)
-    for name, pat in CONTENT_TYPE_PATTERNS:
-        if pat.search(text):
-            result["content_type"] = name
-            break
+    hit = a.first(_CONTENT_TYPE_SET)
+    if hit:
+        result["content_type"] = CONTENT_TYPE_PATTERNS[hit[0]][0]
 
     # Style (first match)
-    for name, pat in STYLE_PATTERNS:
-        if pat.search(text):
-            result["style"] = name
-            break
+    hit = a.first(_STYLE_SET)
+    if hit:
+        result["style"] = STYLE_PATTERNS[hit[0]][0]
 
     # Duration: collect all mentions, store primary as minutes
-    for m in DURATION_PATTERN.finditer(text):
+    durations = a.finditer(DURATION_PATTERN)
+    for m in durations:
         mins = _normalize_duration_to_minutes(m)
         result["raw_duration_mentions"].append(f"{m.group(0).strip()} (~{mins} min)")
-    if result["raw_duration_mentions"]:
+    if durations:
         # Use first full-match duration in minutes
-        first = re.search(DURATION_PATTERN, text)
-        if first:
-            result["duration_minutes"] = round(_normalize_duration_to_minutes(first), 2)
+        result["duration_minutes"] = round(_normalize_duration_to_minutes(durations[0]), 2)
 
     # Platform (first match)
-    for name, pat in PLATFORM_PATTERNS:
-        if pat.search(text):
-            result["platform"] = name
-            break
+    hit = a.first(_PLATFORM_SET)
+    if hit:
+        result["platform"] = PLATFORM_PATTERNS[hit[0]][0]
 
     return result
 
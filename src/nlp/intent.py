@@ -6,6 +6,14 @@ One primary intent active at any moment.
 import re
 from dataclasses import dataclass
 
+from src.nlp.analysis import MessageAnalysis, PatternSet, analyze
+
+try:  # pattern parser, only used to pull literal anchors out of INTENT_SIGNALS
+    from re import _parser as _sre_parser
+    from re._constants import LITERAL as _LITERAL
+except ImportError:  # pragma: no cover - older interpreters: no anchors, every pattern is searched
+    _sre_parser = None
+
 # MVP – Primary intents only
 PRIMARY_INTENTS = [
     "new_project_sales",
@@ -82,6 +90,7 @@ TAG_PATTERNS = [
     ("3d", re.compile(r"\b3d\b", re.I)),
     ("pixar_style", re.compile(r"\b(pixar|anime|realistic)\b", re.I)),
 ]
+_TAG_SET = PatternSet(p for _, p in TAG_PATTERNS)
 
 
 @dataclass
@@ -92,28 +101,64 @@ class IntentResult:
     is_tentative: bool
 
 
-def _normalize_for_intent(text: str) -> str:
-    """Collapse repeated letters; fix 'i2d'/'i3d' so 2d/3d are detected."""
-    t = text.lower().strip()
-    if not t:
-        return t
-    t = re.sub(r"(.)\1+", r"\1", t)
-    t = re.sub(r"\bi2d\b", "i 2d", t)
-    t = re.sub(r"\bi3d\b", "i 3d", t)
-    return t
-
-
-def _score_intent(text: str) -> list[tuple[str, float]]:
-    text_lower = text.lower()
-    text_norm = _normalize_for_intent(text)
-    scores: list[tuple[str, float]] = []
-    for intent, patterns in INTENT_SIGNALS.items():
-        count = sum(
-            1 for p in patterns if re.search(p, text_lower) or re.search(p, text_norm)
-        )
-        conf = min(1.0, count / 3.0) if count else 0.0
-        scores.append((intent, conf))
-    return scores
+# Joins the lowercased and normalized text into one scan string. No signal can match
+# across it (it is neither a word char nor whitespace), so one search over the joined
+# text == search(lower) or search(norm).
+_SCAN_SEP = "\x00"
+
+
+def _literal_anchor(pattern: str) -> str | None:
+    """Longest literal run every match must contain (None if the pattern has no such run)."""
+    if _sre_parser is None:
+        return None
+    runs: list[str] = []
+    cur = ""
+    for op, av in _sre_parser.parse(pattern):
+        if op is _LITERAL:
+            cur += chr(av)
+        else:
+            if cur:
+                runs.append(cur)
+            cur = ""
+    if cur:
+        runs.append(cur)
+    return max(runs, key=len) if runs else None
+
+
+def _compile_signals() -> list[tuple[re.Pattern[str] | None, str | None, int]]:
+    """
+    Flatten INTENT_SIGNALS into (regex, anchor, intent index) rows, compiled once.
+    Pure-literal patterns keep only the substring test (regex is None); the rest are
+    gated on their anchor so most patterns cost one `in` check on a miss.
+    """
+    table = []
+    for idx, patterns in enumerate(INTENT_SIGNALS.values()):
+        for p in patterns:
+            anchor = _literal_anchor(p)
+            rx = None if anchor == p else re.compile(p)
+            table.append((rx, anchor, idx))
+    return table
+
+
+_INTENT_NAMES = list(INTENT_SIGNALS)
+_COMPILED_SIGNALS = _compile_signals()
+
+
+def _score_intent(text: str | MessageAnalysis) -> list[tuple[str, float]]:
+    # Single pass over the precompiled table; a pattern counts once whether it hits
+    # the lowercased or the normalized text.
+    a = analyze(text)
+    scan = a.text.lower() + _SCAN_SEP + a.normalized
+    counts = [0] * len(_INTENT_NAMES)
+    for rx, anchor, idx in _COMPILED_SIGNALS:
+        if anchor is not None and anchor not in scan:
+            continue
+        if rx is None or rx.search(scan):
+            counts[idx] += 1
+    return [
+        (intent, min(1.0, count / 3.0) if count else 0.0)
+        for intent, count in zip(_INTENT_NAMES, counts)
+    ]
 
 
 def _pick_primary(scores: list[tuple[str, float]]) -> tuple[str, float]:
@@ -123,12 +168,13 @@ def _pick_primary(scores: list[tuple[str, float]]) -> tuple[str, float]:
     return best[0], round(best[1], 2)
 
 
-def _extract_secondary_tags(text: str) -> list[str]:
-    return [name for name, pat in TAG_PATTERNS if pat.search(text)]
+def _extract_secondary_tags(text: str | MessageAnalysis) -> list[str]:
+    return [TAG_PATTERNS[i][0] for i in analyze(text).matching(_TAG_SET)]
 
 
-def detect_intent(text: str, is_tentative: bool = False) -> IntentResult:
-    if not text or not text.strip():
+def detect_intent(text: str | MessageAnalysis, is_tentative: bool = False) -> IntentResult:
+    text = analyze(text)
+    if not text.lower:
         return IntentResult(
             primary_intent="unknown_chitchat",
             confidence=0.0,
@@ -0,0 +1,124 @@
+"""
+Multi-pattern phrase matcher (Aho-Corasick) for the per-turn keyword checks.
+One pass over a message reports every family with at least one phrase in it.
+Plain substring semantics: `family in matcher.match(msg)` == `any(p in msg for p in phrases)`.
+"""
+
+import threading
+from collections import deque
+from typing import Iterable, Mapping
+
+
+class PhraseMatcher:
+    """Automaton over lowercased phrases, keyed by family name. Match input is expected lowercased."""
+
+    def __init__(self, families: Mapping[str, Iterable[str]]) -> None:
+        self.families = tuple(families)
+        goto: list[dict[str, int]] = [{}]
+        out = [0]
+        for bit, name in enumerate(self.families):
+            for phrase in families[name]:
+                phrase = phrase.lower()
+                if not phrase:
+                    continue
+                s = 0
+                for ch in phrase:
+                    nxt = goto[s].get(ch)
+                    if nxt is None:
+                        goto.append({})
+                        out.append(0)
+                        nxt = goto[s][ch] = len(goto) - 1
+                    s = nxt
+                out[s] |= 1 << bit
+
+        # Failure links (BFS), then fold them into a full transition table so scanning
+        # is one dict lookup per character with no backtracking.
+        fail = [0] * len(goto)
+        order: list[int] = []
+        queue = deque(goto[0].values())
+        while queue:
+            s = queue.popleft()
+            order.append(s)
+            for ch, t in goto[s].items():
+                f = fail[s]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[t] = target if target != t else 0
+                out[t] |= out[fail[t]]
+                queue.append(t)
+        delta = [dict(g) for g in goto]
+        for s in order:
+            d = delta[s]
+            for ch, t in delta[fail[s]].items():
+                d.setdefault(ch, t)
+
+        self._delta = delta
+        self._out = out
+        self._all = (1 << len(self.families)) - 1
+        self._sets: dict[int, frozenset[str]] = {}
+
+    def scan(self, text: str) -> int:
+        """Bitmask of matched families (bit i = self.families[i]). Stops early once all matched."""
+        delta, out, full = self._delta, self._out, self._all
+        s = mask = 0
+        for ch in text:
+            s = delta[s].get(ch, 0)
+            if out[s]:
+                mask |= out[s]
+                if mask == full:
+                    break
+        return mask
+
+    def match(self, text: str) -> frozenset[str]:
+        """Names of all families with a phrase occurring in `text`."""
+        mask = self.scan(text)
+        found = self._sets.get(mask)
+        if found is None:
+            found = frozenset(name for i, name in enumerate(self.families) if mask >> i & 1)
+            self._sets[mask] = found
+        return found
+
+
+class SharedPhraseMatcher:
+    """
+    One automaton for many phrase families registered from different modules (at import).
+    Rebuilt lazily on the first match after a registration. The last text's result is kept,
+    so several checks on the same user message (audibility, closure, FAQ, refusal) share one scan.
+    """
+
+    def __init__(self) -> None:
+        self._families: dict[str, tuple[str, ...]] = {}
+        self._matcher: PhraseMatcher | None = None
+        self._last: tuple[str, frozenset[str]] | None = None
+        self._lock = threading.Lock()
+
+    def register(self, family: str, phrases: Iterable[str]) -> str:
+        """Add (or replace) a family. Returns the family name for use with `in match(...)`."""
+        with self._lock:
+            self._families[family] = tuple(phrases)
+            self._matcher = None
+            self._last = None
+        return family
+
+    def _get_matcher(self) -> PhraseMatcher:
+        matcher = self._matcher
+        if matcher is None:
+            with self._lock:
+                if self._matcher is None:
+                    self._matcher = PhraseMatcher(self._families)
+                matcher = self._matcher
+        return matcher
+
+    def match(self, text: str) -> frozenset[str]:
+        """Families with a phrase in `text` (expected lowercased)."""
+        last = self._last
+        if last is not None and last[0] == text:
+            return last[1]
+        found = self._get_matcher().match(text)
+        self._last = (text, found)
+        return found
+
+
+# Per-turn phrase families of the live/state modules (FAQ topics, closure, audibility, refusals).
+TURN_PHRASES = SharedPhraseMatcher()
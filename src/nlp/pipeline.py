@@ -1,8 +1,15 @@
 """
 Phase 3 NLP pipeline: Preprocess (re-runnable) → Intent (tentative + final) → Entity extraction.
 Updates conversation with primary intent, confidence, secondary tags, extracted fields.
+Batch: many conversations per call, optionally across worker processes, persisted in one transaction.
 """
 
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
 from src.nlp.entities import extract_entities, merge_entities
 from src.nlp.intent import get_final_intent, get_tentative_intent
 from src.nlp.preprocessing import preprocess
@@ -10,6 +17,13 @@ from src.nlp.preprocessing import preprocess
 # Number of turns used for tentative intent
 TENTATIVE_N_TURNS = 3
 
+# Worker processes for batch NLP: one long-lived pool per server process, never above the core count
+_CORES = os.cpu_count() or 1
+NLP_MAX_WORKERS = max(1, min(int(os.environ.get("NLP_MAX_WORKERS", _CORES)), _CORES))
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
 
 def run_nlp_pipeline(
     clean_text: str,
@@ -52,21 +66,82 @@ def run_nlp_pipeline(
     }
 
 
+def _run_nlp_item(item: tuple[str, list[str]]) -> dict:
+    """Top-level (picklable) worker for run_nlp_pipeline_batch."""
+    return run_nlp_pipeline(*item)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Shared NLP process pool, started on first use (spawn: no forked server threads or sockets)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=NLP_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def close_nlp_pool() -> None:
+    """Shut the shared NLP process pool down (app shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = None
+
+
+def run_nlp_pipeline_batch(
+    items: list[tuple[str, list[str]]],
+    *,
+    processes: bool = False,
+    workers: int | None = None,
+) -> list[dict]:
+    """
+    run_nlp_pipeline over many (clean_text, speaker_turns_texts) pairs; results in input order.
+    processes=True spreads the items over the shared process pool; workers (default and cap:
+    NLP_MAX_WORKERS) bounds how many of its processes this call keeps busy.
+    """
+    if not items:
+        return []
+    n_workers = min(workers or NLP_MAX_WORKERS, NLP_MAX_WORKERS)
+    if not processes or n_workers == 1 or len(items) == 1:
+        return [_run_nlp_item(item) for item in items]
+    if n_workers < NLP_MAX_WORKERS:
+        chunksize = math.ceil(len(items) / n_workers)  # at most n_workers chunks in flight
+    else:
+        chunksize = max(1, len(items) // (n_workers * 4))
+    return list(_get_pool().map(_run_nlp_item, items, chunksize=chunksize))
+
+
 def run_and_persist(conversation_id: str, clean_text: str, speaker_turns_texts: list[str], update_registry) -> dict:
     """
     Run pipeline and persist final intent + entities to registry.
     Uses final intent as the single primary intent; secondary_tags merged.
     """
     result = run_nlp_pipeline(clean_text, speaker_turns_texts)
+    persist_nlp_result(conversation_id, result, update_registry)
+    return result
+
+
+def _nlp_update_fields(result: dict) -> dict:
+    """update_nlp_results keyword fields for a run_nlp_pipeline result."""
     final = result["final_intent"]
     entities = dict(result["extracted_entities"])
     entities["intent_confidence"] = final["confidence"]
+    return {
+        "primary_intent": final["primary_intent"],
+        "secondary_tags": final["secondary_tags"],
+        "extracted_fields": entities,
+        "language": result["language"],
+    }
+
+
+def persist_nlp_result(conversation_id: str, result: dict, update_registry) -> None:
+    """Write a run_nlp_pipeline result: final intent, secondary tags, entities (+ intent_confidence), language."""
+    update_registry(conversation_id, **_nlp_update_fields(result))
 
-    update_registry(
-        conversation_id,
-        primary_intent=final["primary_intent"],
-        secondary_tags=final["secondary_tags"],
-        extracted_fields=entities,
-        language=result["language"],
+
+def persist_nlp_results_batch(results: list[tuple[str, dict]], update_registry_bulk) -> int:
+    """persist_nlp_result for many (conversation_id, result) pairs in one bulk call. Returns rows updated."""
+    return update_registry_bulk(
+        [{"conversation_id": cid, **_nlp_update_fields(result)} for cid, result in results]
     )
-    return result
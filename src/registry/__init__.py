@@ -1,24 +1,46 @@
+from .connection import close_pool
 from .store import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    acquire_live_session_lease,
     append_human_action,
     append_lead,
     append_processing_run,
     create_quotation_request,
+    decode_cursor,
+    delete_live_sessions_idle_since,
+    encode_cursor,
     get_conversation,
     generate_conversation_id,
+    get_live_session,
+    get_nlp_inputs,
+    get_processing_run,
     get_quotation_by_id,
     get_quotation_by_session,
+    get_state_checkpoint,
     get_state_json,
+    get_state_snapshot,
     init_db,
+    iter_conversations,
     list_conversations_by_intent,
     list_conversations_today,
     list_hot_leads,
+    list_processing_runs,
     list_quotation_requests,
+    migrate_state_snapshots,
     register_conversation,
+    register_conversations_bulk,
+    restore_conversations_bulk,
+    release_live_session_lease,
+    save_live_sessions,
     save_state_json,
+    save_state_snapshot,
     set_quotation_urgent,
+    transaction,
     update_completeness_status,
     update_lead_score,
     update_nlp_results,
+    update_nlp_results_bulk,
     update_quotation_discount_offered,
     update_quotation_exception,
     update_quotation_quote,
@@ -27,26 +49,48 @@ from .store import (
 )
 
 __all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
+    "acquire_live_session_lease",
     "append_human_action",
     "append_lead",
     "append_processing_run",
+    "close_pool",
     "create_quotation_request",
+    "decode_cursor",
+    "delete_live_sessions_idle_since",
+    "encode_cursor",
     "get_conversation",
     "generate_conversation_id",
+    "get_live_session",
+    "get_nlp_inputs",
+    "get_processing_run",
     "get_quotation_by_id",
     "get_quotation_by_session",
+    "get_state_checkpoint",
     "get_state_json",
+    "get_state_snapshot",
     "init_db",
+    "iter_conversations",
     "list_conversations_by_intent",
     "list_conversations_today",
     "list_hot_leads",
+    "list_processing_runs",
     "list_quotation_requests",
+    "migrate_state_snapshots",
     "register_conversation",
+    "register_conversations_bulk",
+    "restore_conversations_bulk",
+    "release_live_session_lease",
+    "save_live_sessions",
     "save_state_json",
+    "save_state_snapshot",
     "set_quotation_urgent",
+    "transaction",
     "update_completeness_status",
     "update_lead_score",
     "update_nlp_results",
+    "update_nlp_results_bulk",
     "update_quotation_discount_offered",
     "update_quotation_exception",
     "update_quotation_quote",
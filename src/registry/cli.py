@@ -0,0 +1,222 @@
+"""
+Registry NDJSON import/export (streaming, constant memory).
+
+  python -m src.registry.cli export [-o conversations.ndjson]
+  python -m src.registry.cli import conversations.ndjson [--process] [--workers N]
+  python -m src.registry.cli migrate-state
+
+Import lines are /ingest/chat payloads ({"turns": [...], "conversation_id": ...}) or lines of
+a previous export. Exported lines carry the stored NLP fields, state, score and timestamps and
+are restored as stored (never re-processed), so an export re-imports as-is.
+--process runs NLP → state → qualification inline for chat payloads, spread over a spawn-context
+process pool of at most NLP_MAX_WORKERS processes.
+migrate-state converts legacy state_json rows to compact state snapshots.
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any, Iterator
+
+from pydantic import BaseModel, ValidationError
+
+from src.ingestion.payloads import IncomingChatPayload
+from src.ingestion.pipeline import persist_chat_full_batch, prepare_chat_full, process_chat_bulk
+from src.nlp.pipeline import NLP_MAX_WORKERS
+from src.registry.connection import close_pool
+from src.registry.store import init_db, iter_conversations, migrate_state_snapshots, restore_conversations_bulk
+from src.schemas import ChannelSource, SpeakerTurn
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class ExportedConversation(BaseModel):
+    """One export line (store.iter_conversations); validated, then restored from the raw dict."""
+
+    conversation_id: str
+    channel: ChannelSource
+    turns: list[SpeakerTurn]
+    raw_transcript: str
+    clean_text: str | None = None
+    started_at: str | None = None
+    ended_at: str | None = None
+    language: str | None = None
+    primary_intent: str | None = None
+    secondary_tags: list[str] = []
+    extracted_fields: dict[str, Any] = {}
+    completeness_status: str | None = None
+    auto_summary: str | None = None
+    lead_score: float | None = None
+    lead_band: str | None = None
+    state: dict[str, Any] | None = None
+    created_at: str
+    updated_at: str | None = None
+
+
+def export_ndjson(out: IO[str], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Write every conversation as one JSON line. Returns count."""
+    n = 0
+    for row in iter_conversations(batch_size=batch_size):
+        out.write(json.dumps(row, separators=(",", ":"), default=str))
+        out.write("\n")
+        n += 1
+    return n
+
+
+def _read_batches(src: IO[str], batch_size: int) -> Iterator[list[tuple[int, str]]]:
+    batch: list[tuple[int, str]] = []
+    for line_no, line in enumerate(src, start=1):
+        if not line.strip():
+            continue
+        batch.append((line_no, line))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _parse(line: str) -> IncomingChatPayload | dict:
+    """Chat payload, or a validated export record (dict, restored as-is)."""
+    data = json.loads(line)
+    if isinstance(data, dict) and "created_at" in data:
+        ExportedConversation.model_validate(data)
+        return data
+    return IncomingChatPayload.model_validate(data)
+
+
+def _error_text(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "invalid payload: " + "; ".join(err["msg"] for err in e.errors())
+    return f"{type(e).__name__}: {e}"
+
+
+def _prepare_line(line: str) -> tuple[Any, str | None]:
+    """
+    Worker: parse + run all stages for one line. Returns (prepared, None), (export record, None)
+    or (None, error).
+    """
+    try:
+        item = _parse(line)
+        return (item if isinstance(item, dict) else prepare_chat_full(item)), None
+    except Exception as e:
+        return None, _error_text(e)
+
+
+def import_ndjson(
+    src: IO[str],
+    *,
+    process: bool = False,
+    workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    errors: IO[str] | None = None,
+) -> tuple[int, int]:
+    """
+    Stream NDJSON into the registry, one transaction per batch. Returns (imported, failed).
+    Bad lines are reported to `errors` as {"line": n, "error": "..."} and skipped.
+    """
+    imported = failed = 0
+    errors = errors or sys.stderr
+
+    def report(line_no: int, err: str) -> None:
+        errors.write(json.dumps({"line": line_no, "error": err}) + "\n")
+
+    n_workers = min(workers or NLP_MAX_WORKERS, NLP_MAX_WORKERS)
+    pool = (
+        ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context("spawn"))
+        if process
+        else None
+    )
+    try:
+        for batch in _read_batches(src, batch_size):
+            if pool is not None:
+                # Chunked map: workers share the batch; memory bounded by batch_size.
+                chunksize = max(1, len(batch) // (n_workers * 4))
+                prepared, records = [], []
+                results = pool.map(_prepare_line, [line for _, line in batch], chunksize=chunksize)
+                for (line_no, _), (item, err) in zip(batch, results):
+                    if err:
+                        report(line_no, err)
+                        failed += 1
+                    else:
+                        (records if isinstance(item, dict) else prepared).append(item)
+                if prepared:
+                    persist_chat_full_batch(prepared)
+                restore_conversations_bulk(records)
+                imported += len(prepared) + len(records)
+                continue
+            payloads, payload_lines, records = [], [], []
+            for line_no, line in batch:
+                try:
+                    item = _parse(line)
+                except Exception as e:
+                    report(line_no, _error_text(e))
+                    failed += 1
+                    continue
+                if isinstance(item, dict):
+                    records.append(item)
+                else:
+                    payloads.append(item)
+                    payload_lines.append(line_no)
+            for line_no, r in zip(payload_lines, process_chat_bulk(payloads) if payloads else []):
+                if isinstance(r, Exception):
+                    report(line_no, _error_text(r))
+                    failed += 1
+                else:
+                    imported += 1
+            restore_conversations_bulk(records)
+            imported += len(records)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return imported, failed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.registry.cli", description="Registry NDJSON import/export")
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="Stream all conversations as NDJSON")
+    exp.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    exp.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    imp = sub.add_parser("import", help="Import NDJSON chat payloads")
+    imp.add_argument("input", nargs="?", default="-", help="Input file (default: stdin)")
+    imp.add_argument("--process", action="store_true", help="Also run NLP, state and lead scoring")
+    imp.add_argument("--workers", type=int, default=None, help="Process pool size for --process (default and cap: NLP_MAX_WORKERS)")
+    imp.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    mig = sub.add_parser("migrate-state", help="Convert legacy state_json rows to state snapshots")
+    mig.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    init_db()
+    try:
+        if args.command == "export":
+            out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+            try:
+                n = export_ndjson(out, batch_size=args.batch_size)
+            finally:
+                if out is not sys.stdout:
+                    out.close()
+            print(f"Exported {n} conversations", file=sys.stderr)
+            return 0
+        if args.command == "migrate-state":
+            n = migrate_state_snapshots(batch_size=args.batch_size)
+            print(f"Migrated {n} states", file=sys.stderr)
+            return 0
+        src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+        try:
+            imported, failed = import_ndjson(
+                src, process=args.process, workers=args.workers, batch_size=args.batch_size
+            )
+        finally:
+            if src is not sys.stdin:
+                src.close()
+        print(f"Imported {imported} conversations ({failed} failed)", file=sys.stderr)
+        return 1 if failed and not imported else 0
+    finally:
+        close_pool()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Registry connection layer: bounded pool of WAL-mode SQLite connections.
+One connection per thread at a time (re-entrant); the outermost block commits or rolls back.
+WAL lets dashboard readers run while the ingest path writes.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# Tunables (env overrides). Cache is in KiB, mmap in MiB.
+POOL_SIZE = int(os.environ.get("REGISTRY_POOL_SIZE", "16"))
+BUSY_TIMEOUT_MS = int(os.environ.get("REGISTRY_BUSY_TIMEOUT_MS", "5000"))
+CACHE_SIZE_KB = int(os.environ.get("REGISTRY_CACHE_KB", "16384"))
+MMAP_SIZE_MB = int(os.environ.get("REGISTRY_MMAP_MB", "128"))
+
+
+class ConnectionPool:
+    """At most `size` open connections; idle ones are reused LIFO so the hottest cache wins."""
+
+    def __init__(self, path: Path, size: int = POOL_SIZE) -> None:
+        self.path = Path(path)
+        self.size = max(1, size)
+        self.pid = os.getpid()
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._local = threading.local()
+        self._closed = False
+
+    def _open(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE_MB * 1024 * 1024}")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        if not self._slots.acquire(timeout=BUSY_TIMEOUT_MS / 1000):
+            raise sqlite3.OperationalError("Registry connection pool exhausted")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._open()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if self._closed:
+            conn.close()
+        else:
+            self._idle.put(conn)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out this thread's connection. Nested use shares it; only the outermost commits."""
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            yield held
+            return
+        conn = self._acquire()
+        self._local.conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    def close(self) -> None:
+        """Close idle connections; connections still checked out close on release."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(path: Path) -> ConnectionPool:
+    """Pool for the DB at `path`. Rebuilt if the path changes or after fork (never share across processes)."""
+    global _pool
+    pool = _pool
+    if pool is not None and pool.path == Path(path) and pool.pid == os.getpid():
+        return pool
+    with _pool_lock:
+        pool = _pool
+        if pool is None or pool.path != Path(path) or pool.pid != os.getpid():
+            if pool is not None and pool.pid == os.getpid():
+                pool.close()
+            pool = ConnectionPool(path)
+            _pool = pool
+        return pool
+
+
+def close_pool() -> None:
+    """Close the registry pool (app shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.pid == os.getpid():
+            _pool.close()
+        _pool = None
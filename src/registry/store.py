@@ -1,34 +1,42 @@
 """Conversation Registry: persist conversation ID, speaker turns, timestamps, channel."""
 
+import base64
 import json
+import os
 import sqlite3
+import time
 import uuid
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Iterator
 
+from src.registry.connection import get_pool
 from src.schemas import ChannelSource, ConversationOutput, SpeakerTurn
 from src.schemas.contract import CompletenessStatus, ConversationMetadata
+from src.state.snapshot import encode_state_json, load_state
 
 DB_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "conversations.db"
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 
 
-def _ensure_data_dir() -> None:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-
-
 @contextmanager
 def _conn() -> Iterator[sqlite3.Connection]:
-    _ensure_data_dir()
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    try:
+    """Pooled WAL connection (see connection.py). Commits on exit, rolls back on error."""
+    with get_pool(DB_PATH).connection() as conn:
         yield conn
-        conn.commit()
-    finally:
-        conn.close()
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Group several registry writes into one transaction (one commit, write lock taken up front).
+    Registry functions called inside share this connection.
+    """
+    with _conn() as c:
+        if not c.in_transaction:
+            c.execute("BEGIN IMMEDIATE")
+        yield c
 
 
 def init_db() -> None:
@@ -52,17 +60,23 @@ def init_db() -> None:
                 lead_score REAL,
                 geo_metadata_json TEXT,
                 state_json TEXT,
+                state_turns_applied INTEGER,
+                state_snapshot BLOB,
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL
             )
             """
         )
-        # Add state_json if missing (e.g. table created by older code)
+        # Add state columns if missing (e.g. table created by older code)
         try:
             info = c.execute("PRAGMA table_info(conversations)").fetchall()
             cols = [row[1] for row in info]
             if "state_json" not in cols:
                 c.execute("ALTER TABLE conversations ADD COLUMN state_json TEXT")
+            if "state_turns_applied" not in cols:
+                c.execute("ALTER TABLE conversations ADD COLUMN state_turns_applied INTEGER")
+            if "state_snapshot" not in cols:
+                c.execute("ALTER TABLE conversations ADD COLUMN state_snapshot BLOB")
         except sqlite3.OperationalError:
             pass
         # Phase 6: append-only tables (never overwrite)
@@ -79,10 +93,18 @@ def init_db() -> None:
                 completeness_label TEXT,
                 lead_score REAL,
                 lead_band TEXT,
-                lead_breakdown_json TEXT
+                lead_breakdown_json TEXT,
+                state_base_run_id INTEGER,
+                state_delta_json TEXT
             )
             """
         )
+        # Delta-encoded run state: existing DBs get the columns
+        run_cols = [row[1] for row in c.execute("PRAGMA table_info(processing_runs)").fetchall()]
+        if "state_base_run_id" not in run_cols:
+            c.execute("ALTER TABLE processing_runs ADD COLUMN state_base_run_id INTEGER")
+        if "state_delta_json" not in run_cols:
+            c.execute("ALTER TABLE processing_runs ADD COLUMN state_delta_json TEXT")
         c.execute(
             """
             CREATE TABLE IF NOT EXISTS leads (
@@ -142,6 +164,68 @@ def init_db() -> None:
             )
             """
         )
+        # Live sessions (src/live/session_store.py durable tier)
+        c.execute(
+            """
+            CREATE TABLE IF NOT EXISTS live_sessions (
+                session_id TEXT PRIMARY KEY,
+                state_snapshot BLOB,
+                turn_index INTEGER NOT NULL DEFAULT 0,
+                history_json TEXT,
+                quotation_request_id INTEGER,
+                quotation_awaiting_acceptance INTEGER,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                version INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_until REAL,
+                context_summary_json TEXT
+            )
+            """
+        )
+        live_cols = [row[1] for row in c.execute("PRAGMA table_info(live_sessions)").fetchall()]
+        for col, decl in (
+            ("version", "INTEGER NOT NULL DEFAULT 0"),
+            ("lease_owner", "TEXT"),
+            ("lease_until", "REAL"),
+            ("context_summary_json", "TEXT"),
+        ):
+            if col not in live_cols:
+                c.execute(f"ALTER TABLE live_sessions ADD COLUMN {col} {decl}")
+        _apply_index_migrations(c)
+
+
+# Dashboard "hot lead" rule. Shared by the partial index and the query so SQLite can match them.
+HOT_LEAD_PREDICATE = "lead_band = 'hot' OR lead_score >= 71"
+
+# Secondary indexes, versioned via PRAGMA user_version. Append new versions; never edit shipped ones.
+INDEX_MIGRATIONS: list[tuple[int, list[str]]] = [
+    (
+        1,
+        [
+            "CREATE INDEX IF NOT EXISTS idx_conversations_created ON conversations(created_at, conversation_id)",
+            "CREATE INDEX IF NOT EXISTS idx_conversations_intent_created ON conversations(primary_intent, created_at, conversation_id)",
+            f"CREATE INDEX IF NOT EXISTS idx_conversations_hot_created ON conversations(created_at, conversation_id) WHERE {HOT_LEAD_PREDICATE}",
+            "CREATE INDEX IF NOT EXISTS idx_quotation_session ON quotation_requests(session_id, id)",
+            "CREATE INDEX IF NOT EXISTS idx_quotation_urgent_created ON quotation_requests(is_urgent, created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_quotation_created ON quotation_requests(created_at)",
+        ],
+    ),
+    (2, ["CREATE INDEX IF NOT EXISTS idx_processing_runs_conversation ON processing_runs(conversation_id, run_id)"]),
+    (3, ["CREATE INDEX IF NOT EXISTS idx_live_sessions_updated ON live_sessions(updated_at)"]),
+]
+
+
+def _apply_index_migrations(c: sqlite3.Connection) -> None:
+    version = c.execute("PRAGMA user_version").fetchone()[0]
+    for target, statements in INDEX_MIGRATIONS:
+        if target <= version:
+            continue
+        for sql in statements:
+            c.execute(sql)
+        c.execute(f"PRAGMA user_version = {target}")
+        version = target
+    c.execute("PRAGMA optimize")
 
 
 def _turns_from_row(row: sqlite3.Row) -> list[SpeakerTurn]:
@@ -152,7 +236,18 @@ def _turns_from_row(row: sqlite3.Row) -> list[SpeakerTurn]:
     return [SpeakerTurn(**t) for t in data]
 
 
-def register_conversation(
+_REGISTER_SQL = """
+    INSERT OR REPLACE INTO conversations (
+        conversation_id, channel_source, raw_transcript, clean_text,
+        speaker_turns_json, started_at, ended_at, language,
+        primary_intent, secondary_tags_json, extracted_fields_json,
+        completeness_status, auto_summary, lead_score, geo_metadata_json,
+        created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, 'en', NULL, '[]', '{}', ?, NULL, NULL, '{}', ?, ?)
+"""
+
+
+def _registration_params(
     conversation_id: str,
     channel_source: ChannelSource,
     speaker_turns: list[SpeakerTurn],
@@ -160,36 +255,109 @@ def register_conversation(
     clean_text: str | None = None,
     started_at: str | None = None,
     ended_at: str | None = None,
-) -> None:
+    *,
+    now: str,
+) -> tuple:
     turns_json = json.dumps(
         [t.model_dump(mode="json") for t in speaker_turns],
         default=str,
     )
+    return (
+        conversation_id,
+        channel_source.value,
+        raw_transcript,
+        clean_text,
+        turns_json,
+        started_at,
+        ended_at,
+        CompletenessStatus.UNKNOWN.value,
+        now,
+        now,
+    )
+
+
+def register_conversation(
+    conversation_id: str,
+    channel_source: ChannelSource,
+    speaker_turns: list[SpeakerTurn],
+    raw_transcript: str,
+    clean_text: str | None = None,
+    started_at: str | None = None,
+    ended_at: str | None = None,
+) -> None:
     now = datetime.utcnow().isoformat() + "Z"
+    params = _registration_params(
+        conversation_id,
+        channel_source,
+        speaker_turns,
+        raw_transcript,
+        clean_text,
+        started_at,
+        ended_at,
+        now=now,
+    )
     with _conn() as c:
-        c.execute(
-            """
-            INSERT OR REPLACE INTO conversations (
-                conversation_id, channel_source, raw_transcript, clean_text,
-                speaker_turns_json, started_at, ended_at, language,
-                primary_intent, secondary_tags_json, extracted_fields_json,
-                completeness_status, auto_summary, lead_score, geo_metadata_json,
-                created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, 'en', NULL, '[]', '{}', ?, NULL, NULL, '{}', ?, ?)
-            """,
-            (
-                conversation_id,
-                channel_source.value,
-                raw_transcript,
-                clean_text,
-                turns_json,
-                started_at,
-                ended_at,
-                CompletenessStatus.UNKNOWN.value,
-                now,
-                now,
-            ),
+        c.execute(_REGISTER_SQL, params)
+
+
+def register_conversations_bulk(registrations: list[dict]) -> int:
+    """
+    Register many conversations (each dict = register_conversation kwargs) with one
+    executemany in one transaction. Returns number of rows written.
+    """
+    if not registrations:
+        return 0
+    now = datetime.utcnow().isoformat() + "Z"
+    params = [_registration_params(**r, now=now) for r in registrations]
+    with transaction() as c:
+        c.executemany(_REGISTER_SQL, params)
+    return len(params)
+
+
+_RESTORE_SQL = """
+    INSERT OR REPLACE INTO conversations (
+        conversation_id, channel_source, raw_transcript, clean_text,
+        speaker_turns_json, started_at, ended_at, language,
+        primary_intent, secondary_tags_json, extracted_fields_json,
+        completeness_status, auto_summary, lead_score, lead_band, geo_metadata_json,
+        state_snapshot, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '{}', ?, ?, ?)
+"""
+
+
+def restore_conversations_bulk(records: list[dict]) -> int:
+    """
+    Write exported conversations (iter_conversations dicts) back as stored: NLP fields, score,
+    state and timestamps kept, nothing re-run. One executemany, one transaction. Returns rows written.
+    """
+    if not records:
+        return 0
+    params = [
+        (
+            r["conversation_id"],
+            r["channel"],
+            r["raw_transcript"],
+            r.get("clean_text"),
+            json.dumps(r["turns"], default=str),
+            r.get("started_at"),
+            r.get("ended_at"),
+            r.get("language") or "en",
+            r.get("primary_intent"),
+            json.dumps(r.get("secondary_tags") or []),
+            json.dumps(r.get("extracted_fields") or {}),
+            r.get("completeness_status") or CompletenessStatus.UNKNOWN.value,
+            r.get("auto_summary"),
+            r.get("lead_score"),
+            r.get("lead_band"),
+            encode_state_json(json.dumps(r["state"])) if r.get("state") else None,
+            r["created_at"],
+            r.get("updated_at") or r["created_at"],
         )
+        for r in records
+    ]
+    with transaction() as c:
+        c.executemany(_RESTORE_SQL, params)
+    return len(params)
 
 
 def _parse_iso(s: str | None) -> datetime | None:
@@ -201,6 +369,14 @@ def _parse_iso(s: str | None) -> datetime | None:
         return None
 
 
+def _completeness_status(value: str | None) -> CompletenessStatus:
+    # Column also holds Phase 5 labels (actionable, incomplete, info_only) not in the contract enum
+    try:
+        return CompletenessStatus(value or "unknown")
+    except ValueError:
+        return CompletenessStatus.UNKNOWN
+
+
 def get_conversation(conversation_id: str) -> ConversationOutput | None:
     with _conn() as c:
         row = c.execute(
@@ -224,7 +400,7 @@ def get_conversation(conversation_id: str) -> ConversationOutput | None:
         primary_intent=row["primary_intent"],
         secondary_tags=json.loads(row["secondary_tags_json"] or "[]"),
         extracted_structured_fields=json.loads(row["extracted_fields_json"] or "{}"),
-        completeness_status=CompletenessStatus(row["completeness_status"] or "unknown"),
+        completeness_status=_completeness_status(row["completeness_status"]),
         auto_generated_summary=row["auto_summary"],
         lead_score=row["lead_score"],
         conversation_metadata=meta,
@@ -233,6 +409,48 @@ def get_conversation(conversation_id: str) -> ConversationOutput | None:
     )
 
 
+def iter_conversations(batch_size: int = 500) -> Iterator[dict]:
+    """
+    Stream every conversation (oldest first) as a plain dict for export.
+    Rows are pulled with fetchmany from one open cursor, so memory stays constant.
+    """
+    with _conn() as c:
+        cur = c.execute(
+            """
+            SELECT conversation_id, channel_source, raw_transcript, clean_text, speaker_turns_json,
+                   started_at, ended_at, language, primary_intent, secondary_tags_json,
+                   extracted_fields_json, completeness_status, auto_summary, lead_score, lead_band,
+                   state_snapshot, state_json, created_at, updated_at
+            FROM conversations ORDER BY created_at, conversation_id
+            """
+        )
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            for r in rows:
+                yield {
+                    "conversation_id": r["conversation_id"],
+                    "channel": r["channel_source"],
+                    "turns": json.loads(r["speaker_turns_json"] or "[]"),
+                    "raw_transcript": r["raw_transcript"],
+                    "clean_text": r["clean_text"],
+                    "started_at": r["started_at"],
+                    "ended_at": r["ended_at"],
+                    "language": r["language"],
+                    "primary_intent": r["primary_intent"],
+                    "secondary_tags": json.loads(r["secondary_tags_json"] or "[]"),
+                    "extracted_fields": json.loads(r["extracted_fields_json"] or "{}"),
+                    "completeness_status": r["completeness_status"],
+                    "auto_summary": r["auto_summary"],
+                    "lead_score": r["lead_score"],
+                    "lead_band": r["lead_band"],
+                    "state": _state_dict(r["state_snapshot"] or r["state_json"]),
+                    "created_at": r["created_at"],
+                    "updated_at": r["updated_at"],
+                }
+
+
 def update_nlp_results(
     conversation_id: str,
     *,
@@ -265,26 +483,153 @@ def update_nlp_results(
     return True
 
 
+_NLP_BULK_SQL = """
+    UPDATE conversations
+    SET primary_intent = COALESCE(?, primary_intent),
+        secondary_tags_json = COALESCE(?, secondary_tags_json),
+        extracted_fields_json = COALESCE(?, extracted_fields_json),
+        language = COALESCE(?, language),
+        updated_at = ?
+    WHERE conversation_id = ?
+"""
+
+
+def update_nlp_results_bulk(updates: list[dict]) -> int:
+    """
+    Batched update_nlp_results: each dict = conversation_id + the same keyword fields
+    (None keeps the stored value). One executemany, one transaction. Returns rows updated.
+    """
+    if not updates:
+        return 0
+    now = datetime.utcnow().isoformat() + "Z"
+    params = [
+        (
+            u.get("primary_intent"),
+            json.dumps(u["secondary_tags"]) if u.get("secondary_tags") is not None else None,
+            json.dumps(u["extracted_fields"]) if u.get("extracted_fields") is not None else None,
+            u.get("language"),
+            now,
+            u["conversation_id"],
+        )
+        for u in updates
+    ]
+    with transaction() as c:
+        cur = c.executemany(_NLP_BULK_SQL, params)
+        return cur.rowcount
+
+
+# Max ids per "IN (...)" lookup (well under SQLite's bound-parameter limit).
+IN_CHUNK_SIZE = 500
+
+
+def get_nlp_inputs(conversation_ids: list[str]) -> dict[str, tuple[str, list[str]]]:
+    """
+    NLP inputs for many conversations without building full ConversationOutput objects:
+    conversation_id → (clean text or raw transcript, turn texts). Unknown ids are absent.
+    """
+    out: dict[str, tuple[str, list[str]]] = {}
+    ids = list(dict.fromkeys(conversation_ids))
+    with _conn() as c:
+        for i in range(0, len(ids), IN_CHUNK_SIZE):
+            chunk = ids[i : i + IN_CHUNK_SIZE]
+            rows = c.execute(
+                "SELECT conversation_id, clean_text, raw_transcript, speaker_turns_json FROM conversations "
+                f"WHERE conversation_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for r in rows:
+                turns = json.loads(r["speaker_turns_json"] or "[]")
+                out[r["conversation_id"]] = (
+                    r["clean_text"] or r["raw_transcript"] or "",
+                    [t.get("text", "") for t in turns],
+                )
+    return out
+
+
+def _state_dict(raw: bytes | str | None) -> dict | None:
+    return load_state(raw).to_dict() if raw else None
+
+
 def get_state_json(conversation_id: str) -> str | None:
-    """Raw state JSON for conversation. None if not set."""
+    """State as JSON text (decoded from the snapshot if stored as one). None if not set."""
+    raw = get_state_snapshot(conversation_id)
+    if raw is None or isinstance(raw, str):
+        return raw
+    return json.dumps(_state_dict(raw), separators=(",", ":"), ensure_ascii=False)
+
+
+def get_state_snapshot(conversation_id: str) -> bytes | str | None:
+    """Stored state: snapshot bytes, or legacy state_json text for rows not yet migrated. None if not set."""
     with _conn() as c:
         row = c.execute(
-            "SELECT state_json FROM conversations WHERE conversation_id = ?",
+            "SELECT state_snapshot, state_json FROM conversations WHERE conversation_id = ?",
             (conversation_id,),
         ).fetchone()
-    return row["state_json"] if row and row["state_json"] else None
+    if not row:
+        return None
+    return row["state_snapshot"] or row["state_json"] or None
 
 
-def save_state_json(conversation_id: str, state_json: str) -> bool:
+def get_state_checkpoint(conversation_id: str) -> tuple[bytes | str, int] | None:
+    """(stored state as get_state_snapshot, number of speaker turns it covers). None if state was not built by turn replay."""
+    with _conn() as c:
+        row = c.execute(
+            "SELECT state_snapshot, state_json, state_turns_applied FROM conversations WHERE conversation_id = ?",
+            (conversation_id,),
+        ).fetchone()
+    raw = row and (row["state_snapshot"] or row["state_json"])
+    if not raw or row["state_turns_applied"] is None:
+        return None
+    return raw, row["state_turns_applied"]
+
+
+def save_state_snapshot(conversation_id: str, snapshot: bytes, turns_applied: int | None = None) -> bool:
+    """
+    Save state as snapshot bytes (src.state.snapshot) and drop any legacy state_json.
+    turns_applied = speaker turns replayed into it (the checkpoint for incremental builds);
+    None when the state is not a pure replay of the stored turns (clears the checkpoint).
+    """
+    with _conn() as c:
+        now = datetime.utcnow().isoformat() + "Z"
+        cur = c.execute(
+            "UPDATE conversations SET state_snapshot = ?, state_json = NULL, state_turns_applied = ?, updated_at = ? "
+            "WHERE conversation_id = ?",
+            (snapshot, turns_applied, now, conversation_id),
+        )
+        return cur.rowcount > 0
+
+
+def save_state_json(conversation_id: str, state_json: str, turns_applied: int | None = None) -> bool:
+    """Save state as JSON text (legacy format; clears any snapshot). See save_state_snapshot."""
     with _conn() as c:
         now = datetime.utcnow().isoformat() + "Z"
         cur = c.execute(
-            "UPDATE conversations SET state_json = ?, updated_at = ? WHERE conversation_id = ?",
-            (state_json, now, conversation_id),
+            "UPDATE conversations SET state_json = ?, state_snapshot = NULL, state_turns_applied = ?, updated_at = ? "
+            "WHERE conversation_id = ?",
+            (state_json, turns_applied, now, conversation_id),
         )
         return cur.rowcount > 0
 
 
+def migrate_state_snapshots(batch_size: int = 500) -> int:
+    """Convert legacy state_json rows to snapshots, one transaction per batch. Returns rows converted."""
+    converted = 0
+    while True:
+        with transaction() as c:
+            rows = c.execute(
+                "SELECT conversation_id, state_json FROM conversations "
+                "WHERE state_json IS NOT NULL AND state_snapshot IS NULL LIMIT ?",
+                (batch_size,),
+            ).fetchall()
+            if not rows:
+                return converted
+            c.executemany(
+                "UPDATE conversations SET state_snapshot = ?, state_json = NULL WHERE conversation_id = ?",
+                [(encode_state_json(r["state_json"]), r["conversation_id"]) for r in rows],
+            )
+        converted += len(rows)
+
+
 def update_completeness_status(conversation_id: str, status: str) -> bool:
     with _conn() as c:
         now = datetime.utcnow().isoformat() + "Z"
@@ -311,6 +656,132 @@ def update_lead_score(conversation_id: str, lead_score: float, lead_band: str |
         return cur.rowcount > 0
 
 
+# Full state snapshot every N runs per conversation; runs in between store a diff from it (1 = always full).
+PROCESSING_RUN_SNAPSHOT_EVERY = int(os.environ.get("PROCESSING_RUN_SNAPSHOT_EVERY", "16"))
+
+PROCESSING_RUN_COLUMNS = (
+    "run_id, conversation_id, created_at, nlp_output_json, state_json, state_base_run_id, state_delta_json, "
+    "completeness_pct, mandatory_missing_json, completeness_label, lead_score, lead_band, lead_breakdown_json"
+)
+
+
+def _state_delta(base: dict, state: dict) -> dict:
+    """
+    Diff of two state dumps: changed top-level fields, changed fields per slot (whole slot when new),
+    removed slots/fields. Empty parts are omitted.
+    """
+    delta: dict = {}
+    fields = {k: v for k, v in state.items() if k != "slots" and (k not in base or base[k] != v)}
+    dropped = [k for k in base if k != "slots" and k not in state]
+    base_slots, slots = base.get("slots") or {}, state.get("slots") or {}
+    changed: dict = {}
+    removed = [name for name in base_slots if name not in slots]
+    for name, sv in slots.items():
+        old = base_slots.get(name)
+        if old == sv:
+            continue
+        if old is None or not old.keys() <= sv.keys():
+            changed[name] = sv
+            if old is not None:
+                removed.append(name)  # replaced whole: drop, then re-add
+        else:
+            changed[name] = {f: v for f, v in sv.items() if f not in old or old[f] != v}
+    for key, part in (("fields", fields), ("drop", dropped), ("slots", changed), ("removed", removed)):
+        if part:
+            delta[key] = part
+    return delta
+
+
+def _apply_state_delta(base: dict, delta: dict) -> dict:
+    """Inverse of _state_delta: base + delta -> state dump."""
+    state = {k: v for k, v in base.items() if k not in delta.get("drop", ())}
+    state.update(delta.get("fields", {}))
+    removed = set(delta.get("removed", ()))
+    slots = {name: sv for name, sv in (base.get("slots") or {}).items() if name not in removed}
+    for name, changes in delta.get("slots", {}).items():
+        slots[name] = {**slots.get(name, {}), **changes}
+    if "slots" in base or slots:
+        state["slots"] = slots
+    return state
+
+
+def _run_state_delta(c: sqlite3.Connection, conversation_id: str, state_json: str) -> tuple[int | None, str | None]:
+    """(base run_id, delta JSON) against the conversation's latest full snapshot; (None, None) to store in full."""
+    base = c.execute(
+        "SELECT run_id, state_json FROM processing_runs WHERE conversation_id = ? AND state_json IS NOT NULL "
+        "ORDER BY run_id DESC LIMIT 1",
+        (conversation_id,),
+    ).fetchone()
+    if not base:
+        return None, None
+    since = c.execute(
+        "SELECT COUNT(*) FROM processing_runs WHERE conversation_id = ? AND run_id > ?",
+        (conversation_id, base["run_id"]),
+    ).fetchone()[0]
+    if since + 1 >= PROCESSING_RUN_SNAPSHOT_EVERY:
+        return None, None
+    base_state, state = json.loads(base["state_json"]), json.loads(state_json)
+    if not isinstance(base_state, dict) or not isinstance(state, dict):
+        return None, None
+    delta_json = json.dumps(_state_delta(base_state, state), separators=(",", ":"))
+    if len(delta_json) >= len(state_json):
+        return None, None
+    return base["run_id"], delta_json
+
+
+def _processing_run_to_dict(row: sqlite3.Row, state: dict | None) -> dict:
+    return {
+        "run_id": row["run_id"],
+        "conversation_id": row["conversation_id"],
+        "created_at": row["created_at"],
+        "nlp_output_json": row["nlp_output_json"],
+        "state": state,
+        "state_base_run_id": row["state_base_run_id"],
+        "completeness_pct": row["completeness_pct"],
+        "mandatory_missing_json": row["mandatory_missing_json"],
+        "completeness_label": row["completeness_label"],
+        "lead_score": row["lead_score"],
+        "lead_band": row["lead_band"],
+        "lead_breakdown_json": row["lead_breakdown_json"],
+    }
+
+
+def get_processing_run(run_id: int) -> dict | None:
+    """One processing run with its state reconstructed (snapshot, or base snapshot + diff). None if not found."""
+    with _conn() as c:
+        row = c.execute(f"SELECT {PROCESSING_RUN_COLUMNS} FROM processing_runs WHERE run_id = ?", (run_id,)).fetchone()
+        if not row:
+            return None
+        state = None
+        if row["state_json"] is not None:
+            state = json.loads(row["state_json"])
+        elif row["state_delta_json"] is not None:
+            base = c.execute(
+                "SELECT state_json FROM processing_runs WHERE run_id = ?", (row["state_base_run_id"],)
+            ).fetchone()
+            state = _apply_state_delta(json.loads(base["state_json"]), json.loads(row["state_delta_json"]))
+    return _processing_run_to_dict(row, state)
+
+
+def list_processing_runs(conversation_id: str) -> list[dict]:
+    """All processing runs of a conversation, oldest first, states reconstructed (see get_processing_run)."""
+    with _conn() as c:
+        rows = c.execute(
+            f"SELECT {PROCESSING_RUN_COLUMNS} FROM processing_runs WHERE conversation_id = ? ORDER BY run_id",
+            (conversation_id,),
+        ).fetchall()
+    bases: dict[int, dict] = {}
+    out = []
+    for row in rows:
+        state = None
+        if row["state_json"] is not None:
+            state = bases[row["run_id"]] = json.loads(row["state_json"])
+        elif row["state_delta_json"] is not None:
+            state = _apply_state_delta(bases[row["state_base_run_id"]], json.loads(row["state_delta_json"]))
+        out.append(_processing_run_to_dict(row, state))
+    return out
+
+
 def append_processing_run(
     conversation_id: str,
     *,
@@ -323,22 +794,34 @@ def append_processing_run(
     lead_band: str | None = None,
     lead_breakdown_json: str | None = None,
 ) -> int:
-    """Phase 6: Append one processing run (versioned). Never overwrite. Returns run_id."""
+    """
+    Phase 6: Append one processing run (versioned). Never overwrite. Returns run_id.
+    state_json is stored in full every PROCESSING_RUN_SNAPSHOT_EVERY runs of a conversation;
+    runs in between store only its diff from that snapshot (see get_processing_run).
+    """
     now = datetime.utcnow().isoformat() + "Z"
     with _conn() as c:
+        base_run_id, delta_json = None, None
+        if state_json is not None and PROCESSING_RUN_SNAPSHOT_EVERY > 1:
+            base_run_id, delta_json = _run_state_delta(c, conversation_id, state_json)
+            if delta_json is not None:
+                state_json = None
         cur = c.execute(
             """
             INSERT INTO processing_runs (
                 conversation_id, created_at, nlp_output_json, state_json,
+                state_base_run_id, state_delta_json,
                 completeness_pct, mandatory_missing_json, completeness_label,
                 lead_score, lead_band, lead_breakdown_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 conversation_id,
                 now,
                 nlp_output_json,
                 state_json,
+                base_run_id,
+                delta_json,
                 completeness_pct,
                 mandatory_missing_json,
                 completeness_label,
@@ -386,72 +869,96 @@ def append_lead(
         return cur.lastrowid or 0
 
 
-def list_conversations_today() -> list[dict]:
-    """Phase 7: Conversations created today (UTC date)."""
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-    with _conn() as c:
-        try:
-            cur = c.execute(
-                """
-                SELECT conversation_id, created_at, primary_intent, lead_score, lead_band, completeness_status
-                FROM conversations WHERE date(created_at) = ?
-                ORDER BY created_at DESC
-                """,
-                (today,),
-            )
-        except sqlite3.OperationalError:
-            cur = c.execute(
-                """
-                SELECT conversation_id, created_at, primary_intent, lead_score, completeness_status
-                FROM conversations WHERE date(created_at) = ?
-                ORDER BY created_at DESC
-                """,
-                (today,),
-            )
-        rows = cur.fetchall()
-    return [_row_to_dashboard_row(r) for r in rows]
+def _utc_day_bounds(day: datetime) -> tuple[str, str]:
+    """[start, end) ISO strings for a UTC day; compares correctly against stored created_at."""
+    start = day.strftime("%Y-%m-%d")
+    end = (day + timedelta(days=1)).strftime("%Y-%m-%d")
+    return start, end
 
 
-def list_hot_leads() -> list[dict]:
-    """Phase 7: Hot leads (lead_band = 'hot' or lead_score >= 71)."""
-    with _conn() as c:
-        try:
-            cur = c.execute(
-                """
-                SELECT conversation_id, created_at, primary_intent, lead_score, lead_band, completeness_status
-                FROM conversations WHERE lead_band = 'hot' OR lead_score >= 71
-                ORDER BY created_at DESC
-                """
-            )
-        except sqlite3.OperationalError:
-            cur = c.execute(
-                """
-                SELECT conversation_id, created_at, primary_intent, lead_score, completeness_status
-                FROM conversations WHERE lead_score >= 71
-                ORDER BY created_at DESC
-                """
-            )
-        rows = cur.fetchall()
-    return [_row_to_dashboard_row(r) for r in rows]
+# ---------- Keyset pagination (cursor = last row's (created_at, id)) ----------
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(created_at: str, key: str | int) -> str:
+    """Opaque cursor for the row after which the next page starts."""
+    raw = json.dumps([created_at, key], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str | int]:
+    """Inverse of encode_cursor. Raises ValueError if the cursor is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, key = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(created_at, str) or not isinstance(key, (str, int)):
+        raise ValueError("Invalid cursor")
+    return created_at, key
 
 
-def list_conversations_by_intent(intent: str) -> list[dict]:
-    """Phase 7: Filter by primary_intent (e.g. estimation_request, complaint)."""
+def _clamp_limit(limit: int) -> int:
+    return max(1, min(MAX_PAGE_SIZE, int(limit)))
+
+
+# Only what the dashboard cards render (created_at is read for the cursor, not returned).
+DASHBOARD_FIELDS = ("conversation_id", "primary_intent", "lead_score", "lead_band")
+
+
+def _conversation_page(
+    where: str, params: tuple, limit: int, cursor: str | None
+) -> tuple[list[dict], str | None]:
+    limit = _clamp_limit(limit)
+    args: list = list(params)
+    clause = f"({where})"
+    if cursor:
+        created_at, cid = decode_cursor(cursor)
+        clause += " AND (created_at, conversation_id) < (?, ?)"
+        args += [created_at, str(cid)]
     with _conn() as c:
-        cur = c.execute(
-            """
-            SELECT conversation_id, created_at, primary_intent, lead_score, lead_band, completeness_status
-            FROM conversations WHERE primary_intent = ?
-            ORDER BY created_at DESC
+        rows = c.execute(
+            f"""
+            SELECT conversation_id, created_at, primary_intent, lead_score, lead_band
+            FROM conversations WHERE {clause}
+            ORDER BY created_at DESC, conversation_id DESC
+            LIMIT ?
             """,
-            (intent,),
-        )
-        rows = cur.fetchall()
-    return [_row_to_dashboard_row(r) for r in rows]
+            (*args, limit + 1),
+        ).fetchall()
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(page[-1]["created_at"], page[-1]["conversation_id"])
+    return [_row_to_dashboard_row(r) for r in page], next_cursor
+
+
+def list_conversations_today(
+    limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+) -> tuple[list[dict], str | None]:
+    """Phase 7: Conversations created today (UTC date). Returns (rows, next_cursor)."""
+    start, end = _utc_day_bounds(datetime.utcnow())
+    return _conversation_page("created_at >= ? AND created_at < ?", (start, end), limit, cursor)
+
+
+def list_hot_leads(
+    limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+) -> tuple[list[dict], str | None]:
+    """Phase 7: Hot leads (lead_band = 'hot' or lead_score >= 71). Returns (rows, next_cursor)."""
+    return _conversation_page(HOT_LEAD_PREDICATE, (), limit, cursor)
+
+
+def list_conversations_by_intent(
+    intent: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None
+) -> tuple[list[dict], str | None]:
+    """Phase 7: Filter by primary_intent (e.g. estimation_request, complaint). Returns (rows, next_cursor)."""
+    return _conversation_page("primary_intent = ?", (intent,), limit, cursor)
 
 
 def _row_to_dashboard_row(r: sqlite3.Row) -> dict:
-    return {k: r[k] for k in r.keys()}
+    return {k: r[k] for k in DASHBOARD_FIELDS}
 
 
 def append_human_action(
@@ -538,21 +1045,58 @@ def _quotation_row_to_dict(row: sqlite3.Row | None) -> dict | None:
     }
 
 
-def list_quotation_requests(urgent_only: bool = False) -> list[dict]:
+# Columns the admin table renders (no updated_at / request_summary).
+QUOTATION_LIST_COLUMNS = (
+    "id, session_id, status, created_at, admin_quoted_amount, admin_max_discount_pct, "
+    "discount_offered_to_user_pct, user_counter_price, admin_exception_amount, "
+    "rejection_reason, is_urgent"
+)
+
+
+def _quotation_list_row_to_dict(row: sqlite3.Row) -> dict:
+    return {
+        "id": row["id"],
+        "session_id": row["session_id"],
+        "status": row["status"],
+        "created_at": row["created_at"],
+        "admin_quoted_amount": row["admin_quoted_amount"],
+        "admin_max_discount_pct": row["admin_max_discount_pct"],
+        "discount_offered_to_user_pct": row["discount_offered_to_user_pct"] or 0,
+        "user_counter_price": row["user_counter_price"],
+        "admin_exception_amount": row["admin_exception_amount"],
+        "rejection_reason": row["rejection_reason"],
+        "is_urgent": bool(row["is_urgent"]),
+    }
+
+
+def list_quotation_requests(
+    urgent_only: bool = False,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> tuple[list[dict], str | None]:
+    """Newest first, keyset-paginated on (created_at, id). Returns (rows, next_cursor)."""
+    limit = _clamp_limit(limit)
+    clauses: list[str] = []
+    args: list = []
+    if urgent_only:
+        clauses.append("is_urgent = 1")
+    if cursor:
+        created_at, qid = decode_cursor(cursor)
+        clauses.append("(created_at, id) < (?, ?)")
+        args += [created_at, int(qid)]
+    where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
     with _conn() as c:
-        if urgent_only:
-            cur = c.execute(
-                """
-                SELECT * FROM quotation_requests WHERE is_urgent = 1
-                ORDER BY created_at DESC
-                """
-            )
-        else:
-            cur = c.execute(
-                "SELECT * FROM quotation_requests ORDER BY created_at DESC"
-            )
-        rows = cur.fetchall()
-    return [_quotation_row_to_dict(r) for r in rows if r]
+        rows = c.execute(
+            f"""
+            SELECT {QUOTATION_LIST_COLUMNS} FROM quotation_requests {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+            """,
+            (*args, limit + 1),
+        ).fetchall()
+    page = rows[:limit]
+    next_cursor = encode_cursor(page[-1]["created_at"], page[-1]["id"]) if len(rows) > limit else None
+    return [_quotation_list_row_to_dict(r) for r in page], next_cursor
 
 
 def update_quotation_quote(qid: int, amount: float, max_discount_pct: float) -> bool:
@@ -639,3 +1183,84 @@ def update_quotation_discount_offered(qid: int, discount_pct: float) -> bool:
             (discount_pct, now, qid),
         )
         return cur.rowcount > 0
+
+
+# ---------- Live sessions (durable tier of src/live/session_store.py) ----------
+
+LIVE_SESSION_COLUMNS = (
+    "session_id, state_snapshot, turn_index, history_json, quotation_request_id, "
+    "quotation_awaiting_acceptance, created_at, updated_at, version, context_summary_json"
+)
+
+# Optimistic check: a row only moves forward (a stale writer's older version is dropped).
+_LIVE_SESSION_UPSERT_SQL = f"""
+    INSERT INTO live_sessions ({LIVE_SESSION_COLUMNS})
+    VALUES (:session_id, :state_snapshot, :turn_index, :history_json, :quotation_request_id,
+            :quotation_awaiting_acceptance, :created_at, :updated_at, :version, :context_summary_json)
+    ON CONFLICT(session_id) DO UPDATE SET
+        state_snapshot = excluded.state_snapshot,
+        turn_index = excluded.turn_index,
+        history_json = excluded.history_json,
+        quotation_request_id = excluded.quotation_request_id,
+        quotation_awaiting_acceptance = excluded.quotation_awaiting_acceptance,
+        updated_at = excluded.updated_at,
+        version = excluded.version,
+        context_summary_json = excluded.context_summary_json
+    WHERE excluded.version > live_sessions.version
+"""
+
+
+def get_live_session(session_id: str) -> dict | None:
+    """Stored live session row (raw columns), or None."""
+    with _conn() as c:
+        row = c.execute(
+            f"SELECT {LIVE_SESSION_COLUMNS} FROM live_sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+    return dict(row) if row else None
+
+
+def save_live_sessions(rows: list[dict]) -> int:
+    """
+    Upsert live session rows (keys = LIVE_SESSION_COLUMNS) in one transaction.
+    Returns rows written; rows whose version is not newer than the stored one are skipped.
+    """
+    if not rows:
+        return 0
+    with transaction() as c:
+        cur = c.executemany(_LIVE_SESSION_UPSERT_SQL, rows)
+        return cur.rowcount
+
+
+def acquire_live_session_lease(session_id: str, owner: str, lease_s: float) -> tuple[bool, int | None]:
+    """
+    Take (or renew) the session's lease for `owner` unless another owner holds an unexpired one.
+    Returns (acquired, stored version); (True, None) when the session is not stored (nothing to lock).
+    """
+    now = time.time()
+    with _conn() as c:
+        cur = c.execute(
+            "UPDATE live_sessions SET lease_owner = ?, lease_until = ? "
+            "WHERE session_id = ? AND (lease_owner IS NULL OR lease_owner = ? OR lease_until < ?)",
+            (owner, now + lease_s, session_id, owner, now),
+        )
+        row = c.execute("SELECT version FROM live_sessions WHERE session_id = ?", (session_id,)).fetchone()
+    if row is None:
+        return True, None
+    return cur.rowcount > 0, row["version"]
+
+
+def release_live_session_lease(session_id: str, owner: str) -> bool:
+    """Drop the session's lease if `owner` still holds it."""
+    with _conn() as c:
+        cur = c.execute(
+            "UPDATE live_sessions SET lease_owner = NULL, lease_until = NULL WHERE session_id = ? AND lease_owner = ?",
+            (session_id, owner),
+        )
+        return cur.rowcount > 0
+
+
+def delete_live_sessions_idle_since(before: str) -> int:
+    """Delete live sessions not updated since `before` (ISO timestamp). Returns rows deleted."""
+    with _conn() as c:
+        cur = c.execute("DELETE FROM live_sessions WHERE updated_at < ?", (before,))
+        return cur.rowcount
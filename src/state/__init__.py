@@ -11,16 +11,21 @@ from src.state.models import (
     SlotValue,
 )
 from src.state.pipeline import (
+    apply_turns,
     build_state_from_conversation,
     build_state_from_full_text,
     initial_state,
 )
+from src.state.snapshot import StateSnapshot, encode_state, load_state
 from src.state.slot_filling import (
     extract_slot_values_from_message,
     update_state_from_message,
 )
 from src.state.slot_registry import (
     FOLLOW_UP_PRIORITY,
+    IntentSlots,
+    get_follow_up_order,
+    get_intent_slots,
     get_optional_slots,
     get_question_templates,
     get_required_slots,
@@ -35,12 +40,19 @@ __all__ = [
     "ConversationState",
     "SlotStatus",
     "SlotValue",
+    "apply_turns",
     "build_state_from_conversation",
     "build_state_from_full_text",
     "initial_state",
+    "StateSnapshot",
+    "encode_state",
+    "load_state",
     "extract_slot_values_from_message",
     "update_state_from_message",
     "FOLLOW_UP_PRIORITY",
+    "IntentSlots",
+    "get_follow_up_order",
+    "get_intent_slots",
     "get_optional_slots",
     "get_question_templates",
     "get_required_slots",
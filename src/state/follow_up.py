@@ -5,13 +5,10 @@ Priority engine: one question at a time. Question templates, refusal handled. St
 
 from datetime import datetime
 
+from src.nlp.analysis import MessageAnalysis, analyze
+from src.nlp.phrases import TURN_PHRASES
 from src.state.models import ConversationStage, ConversationState, SlotStatus
-from src.state.slot_registry import (
-    FOLLOW_UP_PRIORITY,
-    get_optional_slots,
-    get_question_templates,
-    get_required_slots,
-)
+from src.state.slot_registry import get_follow_up_order, get_question_templates, get_required_slots
 
 # Don't re-ask same slot for at least this many "turns" (we use state.last_question_asked only; re-ask only if we have a different slot to try first)
 RECENT_ASK_WINDOW = 1  # treat as "recent" if we just asked this slot
@@ -29,11 +26,12 @@ CLOSURE_PHRASES = (
     "we're done",
     "we are done",
 )
+_CLOSURE = TURN_PHRASES.register("closure", CLOSURE_PHRASES)
 
 
-def user_wants_closure(message: str) -> bool:
-    msg = (message or "").strip().lower()
-    return any(p in msg for p in CLOSURE_PHRASES) or msg in ("no", "nope", "that's it")
+def user_wants_closure(message: str | MessageAnalysis) -> bool:
+    a = analyze(message)
+    return a.lower in ("no", "nope", "that's it") or _CLOSURE in a.phrases
 
 
 def should_stop_asking(state: ConversationState) -> bool:
@@ -58,7 +56,7 @@ def get_next_question(
     state: ConversationState,
     *,
     turn_index: int = 0,
-    last_user_message: str | None = None,
+    last_user_message: str | MessageAnalysis | None = None,
 ) -> tuple[str | None, str | None]:
     """
     Returns (question_text, slot_name) or (None, None) if no question to ask.
@@ -70,14 +68,8 @@ def get_next_question(
         return None, None
 
     intent = state.intent or "new_project_sales"
-    required = get_required_slots(intent)
-    optional = get_optional_slots(intent)
     # Priority: required first (in FOLLOW_UP_PRIORITY order), then optional
-    ordered = [s for s in FOLLOW_UP_PRIORITY if s in required] + [
-        s for s in FOLLOW_UP_PRIORITY if s in optional and s not in required
-    ]
-
-    for slot_name in ordered:
+    for slot_name in get_follow_up_order(intent):
         sv = state.get_slot(slot_name)
         if sv.status != SlotStatus.MISSING:
             continue
@@ -1,6 +1,7 @@
 """
 Phase 4 — State pipeline: build/update conversation state from conversation or new message.
 Replay turn-by-turn for accuracy (refusal, last_question_asked). Recalculates after every user message.
+A saved state plus the number of turns it covers is a checkpoint: apply_turns resumes from it.
 """
 
 from src.state.models import ConversationState, ConversationStage
@@ -26,8 +27,21 @@ def build_state_from_conversation(
     Replay conversation turn-by-turn: for each user turn, run slot map execution.
     Assumes speaker_turns are (speaker_id, text); treats non-'agent' as user for refusal/flow.
     """
-    state = initial_state(intent)
-    for i, (speaker_id, text) in enumerate(speaker_turns):
+    return apply_turns(initial_state(intent), speaker_turns, intent)
+
+
+def apply_turns(
+    state: ConversationState,
+    speaker_turns: list[tuple[str, str]],
+    intent: str,
+    start: int = 0,
+) -> ConversationState:
+    """
+    Apply speaker_turns[start:] to state (a checkpoint covering the first `start` turns).
+    Same result as build_state_from_conversation on all turns; only the new turns are processed.
+    """
+    for i in range(start, len(speaker_turns)):
+        speaker_id, text = speaker_turns[i]
         if not text or not text.strip():
             continue
         source_id = f"turn_{i}"
@@ -2,15 +2,18 @@
 Phase 4 — Step 4.1: Slot Map Execution.
 After every (simulated or real) user message: update state from extractions + refusal handling.
 Slot ownership: source, confidence, timestamp. Nothing overwritten blindly.
+Slot tables are copy-on-write: SlotValues are never mutated, so a new state shares every
+unchanged slot with the previous one and only changed slots get a new (unvalidated) SlotValue.
 """
 
 import re
 from datetime import datetime
 from typing import Any
 
+from src.nlp.analysis import MessageAnalysis, analyze
 from src.nlp.entities import extract_entities
 from src.state.models import ConversationStage, ConversationState, SlotStatus, SlotValue
-from src.state.slot_registry import get_optional_slots, get_refusal_phrases, get_required_slots
+from src.state.slot_registry import get_intent_slots, has_refusal_phrase
 
 # Entity key → slot name (MVP frozen slots)
 ENTITY_TO_SLOT = {
@@ -20,6 +23,15 @@ ENTITY_TO_SLOT = {
     "platform": "usage",
 }
 
+# Shared default (missing) slot; safe to share because SlotValues are never mutated
+_MISSING = SlotValue.model_construct(status=SlotStatus.MISSING)
+
+
+def _slot(value: Any, confidence: float, source: str | None, timestamp: str | None, status: SlotStatus = SlotStatus.FILLED) -> SlotValue:
+    """Internal SlotValue construction (fields already typed; skips validation)."""
+    return SlotValue.model_construct(value=value, status=status, confidence=confidence, source=source, timestamp=timestamp)
+
+
 # Simple patterns for name, country, budget, timeline (single message)
 NAME_PATTERNS = [
     re.compile(r"(?:my name is|i'm|i am|this is|call me)\s+([A-Za-z][A-Za-z\s\-']{1,48})\b", re.I),
@@ -47,54 +59,48 @@ def _extract_slot_from_text(text: str, patterns: list) -> str | None:
     return None
 
 
-def extract_slot_values_from_message(text: str, source_id: str, confidence_base: float = 0.8) -> dict[str, SlotValue]:
+def extract_slot_values_from_message(
+    text: str | MessageAnalysis, source_id: str, confidence_base: float = 0.8
+) -> dict[str, SlotValue]:
     """
     From one message: run entity extraction + simple name/country/budget/timeline.
     Returns dict slot_name → SlotValue (for slots that got a value). Ownership: source, confidence, timestamp.
     """
     now = datetime.utcnow().isoformat() + "Z"
     out: dict[str, SlotValue] = {}
+    text = analyze(text)
     entities = extract_entities(text)
 
     for entity_key, slot_name in ENTITY_TO_SLOT.items():
         val = entities.get(entity_key)
         if val is not None:
-            sv = SlotValue(
-                value=val,
-                status=SlotStatus.FILLED,
-                confidence=confidence_base,
-                source=source_id,
-                timestamp=now,
-            )
+            sv = _slot(val, confidence_base, source_id, now)
             out[slot_name] = sv
             if slot_name == "approx_duration":
                 out["duration"] = sv
 
-    name = _extract_slot_from_text(text, NAME_PATTERNS)
+    name = _extract_slot_from_text(text.text, NAME_PATTERNS)
     if name:
-        sv = SlotValue(value=name, status=SlotStatus.FILLED, confidence=confidence_base, source=source_id, timestamp=now)
-        out["name"] = out["caller_name"] = sv
-    country = _extract_slot_from_text(text, COUNTRY_PATTERNS)
+        out["name"] = out["caller_name"] = _slot(name, confidence_base, source_id, now)
+    country = _extract_slot_from_text(text.text, COUNTRY_PATTERNS)
     if country:
-        out["country_location"] = SlotValue(value=country, status=SlotStatus.FILLED, confidence=confidence_base, source=source_id, timestamp=now)
-    budget = _extract_slot_from_text(text, BUDGET_PATTERNS)
+        out["country_location"] = _slot(country, confidence_base, source_id, now)
+    budget = _extract_slot_from_text(text.text, BUDGET_PATTERNS)
     if budget:
-        out["budget_or_range"] = SlotValue(value=budget, status=SlotStatus.FILLED, confidence=confidence_base, source=source_id, timestamp=now)
-    timeline = _extract_slot_from_text(text, TIMELINE_PATTERNS)
+        out["budget_or_range"] = _slot(budget, confidence_base, source_id, now)
+    timeline = _extract_slot_from_text(text.text, TIMELINE_PATTERNS)
     if timeline:
-        out["deadline"] = SlotValue(value=timeline, status=SlotStatus.FILLED, confidence=confidence_base, source=source_id, timestamp=now)
+        out["deadline"] = _slot(timeline, confidence_base, source_id, now)
 
     return out
 
 
-def _is_refusal(message: str, slot_name: str, intent: str | None) -> bool:
-    phrases = get_refusal_phrases(slot_name, intent)
-    msg_lower = message.lower().strip()
+def _is_refusal(message: MessageAnalysis, slot_name: str, intent: str | None) -> bool:
+    msg_lower = message.lower
     if len(msg_lower) < 3:
         return False
-    for p in phrases:
-        if p.lower() in msg_lower:
-            return True
+    if has_refusal_phrase(msg_lower, slot_name, intent):
+        return True
     if msg_lower in ("no", "nope", "skip", "pass", "rather not"):
         return True
     return False
@@ -102,7 +108,7 @@ def _is_refusal(message: str, slot_name: str, intent: str | None) -> bool:
 
 def update_state_from_message(
     state: ConversationState,
-    message_text: str,
+    message_text: str | MessageAnalysis,
     source_id: str,
     intent: str | None,
     *,
@@ -117,22 +123,15 @@ def update_state_from_message(
     """
     now = datetime.utcnow().isoformat() + "Z"
     intent = intent or state.intent or "new_project_sales"
-    required = set(get_required_slots(intent))
-    optional = set(get_optional_slots(intent))
-    all_slots = required | optional
+    required, all_slots = _slot_sets(intent)
+    message_text = analyze(message_text)
 
-    new_slots = dict(state.slots)
+    new_slots = dict(state.slots)  # shallow: unchanged SlotValues are shared with `state`
 
     # Refusal: mark last_question_asked slot as refused
     if is_user_turn and state.last_question_asked and _is_refusal(message_text, state.last_question_asked, intent):
-        slot = new_slots.get(state.last_question_asked) or SlotValue()
-        new_slots[state.last_question_asked] = SlotValue(
-            value=slot.value,
-            status=SlotStatus.REFUSED,
-            confidence=slot.confidence,
-            source=slot.source,
-            timestamp=now,
-        )
+        slot = new_slots.get(state.last_question_asked) or _MISSING
+        new_slots[state.last_question_asked] = _slot(slot.value, slot.confidence, slot.source, now, SlotStatus.REFUSED)
 
     # New extractions from this message
     from_message = extract_slot_values_from_message(message_text, source_id)
@@ -147,32 +146,9 @@ def update_state_from_message(
         new_slots[slot_name] = new_sv
 
     # Ensure all required/optional have an entry; set status
-    for name in all_slots:
-        sv = new_slots.get(name) or SlotValue()
-        if sv.status in (SlotStatus.UNAVAILABLE, SlotStatus.REFUSED):
-            continue
-        if sv.value is not None and sv.value != "":
-            new_slots[name] = SlotValue(
-                value=sv.value,
-                status=SlotStatus.FILLED,
-                confidence=sv.confidence,
-                source=sv.source,
-                timestamp=sv.timestamp,
-            )
-        else:
-            new_slots[name] = SlotValue(status=SlotStatus.MISSING)
-
-    # Stage
-    required_filled = all(
-        (new_slots.get(r) or SlotValue()).status == SlotStatus.FILLED for r in required
-    )
-    stage = (
-        ConversationStage.MINIMUM_COMPLETENESS_REACHED
-        if required_filled
-        else ConversationStage.SLOT_FILLING
-    )
+    stage = _apply_slot_status(new_slots, required, all_slots)
 
-    return ConversationState(
+    return ConversationState.model_construct(
         intent=intent,
         slots=new_slots,
         last_question_asked=state.last_question_asked,
@@ -182,30 +158,44 @@ def update_state_from_message(
     )
 
 
-def recompute_slot_status(state: ConversationState, intent: str) -> ConversationState:
-    """Recompute status for all slots from required/optional. Keep values and ownership."""
-    required = set(get_required_slots(intent))
-    optional = set(get_optional_slots(intent))
-    all_slots = required | optional
-    new_slots = dict(state.slots)
+def _slot_sets(intent: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """(required, required + optional) slot names in registry order."""
+    slots = get_intent_slots(intent)
+    return slots.required, slots.all_slots
+
+
+def _apply_slot_status(slots: dict[str, SlotValue], required: tuple[str, ...], all_slots: tuple[str, ...]) -> ConversationStage:
+    """
+    In place on a copied slot table: refused/unavailable kept, a slot with a value is filled,
+    anything else is missing. Replaces only entries whose status/fields change. Returns the stage.
+    """
     for name in all_slots:
-        sv = new_slots.get(name) or SlotValue()
-        if sv.status in (SlotStatus.UNAVAILABLE, SlotStatus.REFUSED):
+        sv = slots.get(name)
+        if sv is None:
+            slots[name] = _MISSING
+            continue
+        status = sv.status
+        if status == SlotStatus.UNAVAILABLE or status == SlotStatus.REFUSED:
             continue
         if sv.value is not None and sv.value != "":
-            new_slots[name] = SlotValue(
-                value=sv.value,
-                status=SlotStatus.FILLED,
-                confidence=sv.confidence,
-                source=sv.source,
-                timestamp=sv.timestamp,
-            )
-        else:
-            new_slots[name] = SlotValue(status=SlotStatus.MISSING)
-    required_filled = all((new_slots.get(r) or SlotValue()).status == SlotStatus.FILLED for r in required)
-    stage = (
-        ConversationStage.MINIMUM_COMPLETENESS_REACHED
-        if required_filled
-        else ConversationStage.SLOT_FILLING
-    )
+            if status != SlotStatus.FILLED:
+                slots[name] = _slot(sv.value, sv.confidence, sv.source, sv.timestamp)
+        elif sv is not _MISSING and (
+            status != SlotStatus.MISSING
+            or sv.value is not None
+            or sv.confidence != 0.0
+            or sv.source is not None
+            or sv.timestamp is not None
+        ):
+            slots[name] = _MISSING
+    if all(slots[r].status == SlotStatus.FILLED for r in required):
+        return ConversationStage.MINIMUM_COMPLETENESS_REACHED
+    return ConversationStage.SLOT_FILLING
+
+
+def recompute_slot_status(state: ConversationState, intent: str) -> ConversationState:
+    """Recompute status for all slots from required/optional. Keep values and ownership."""
+    required, all_slots = _slot_sets(intent)
+    new_slots = dict(state.slots)
+    stage = _apply_slot_status(new_slots, required, all_slots)
     return state.model_copy(update={"slots": new_slots, "stage": stage, "intent": intent})
@@ -1,9 +1,14 @@
 """
 Slot maps — FROZEN CONTRACT. Business truth, not NLP guesswork.
 Slot state values: missing | filled | refused | unavailable (system-wide).
+Compiled once at import into frozen per-intent lookup tables; getters return immutable views.
 """
 
-from typing import TypedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, TypedDict
+
+from src.nlp.phrases import TURN_PHRASES
 
 
 class SlotConfig(TypedDict, total=False):
@@ -113,34 +118,134 @@ FOLLOW_UP_PRIORITY = [
 ]
 
 
-def get_required_slots(intent: str) -> list[str]:
-    entry = INTENT_SLOT_REGISTRY.get(intent) or INTENT_SLOT_REGISTRY.get("unknown_chitchat", {})
-    return list(entry.get("required_slots", []))
+DEFAULT_QUESTION_TEMPLATES: tuple[str, ...] = ("Could you share that with me?",)
+
+
+@dataclass(frozen=True)
+class IntentSlots:
+    """One intent's slot map, compiled: ordered tuples, sets for membership, follow-up order."""
+
+    required: tuple[str, ...]
+    optional: tuple[str, ...]
+    required_set: frozenset[str]
+    optional_set: frozenset[str]
+    all_slots: tuple[str, ...]  # required then optional, each once
+    follow_up: tuple[str, ...]  # required then optional, each in FOLLOW_UP_PRIORITY order
+
+
+@dataclass(frozen=True)
+class ResolvedSlot:
+    """A slot's config as seen from one intent: owning intent, templates, refusal phrases."""
+
+    owner: str
+    config: Mapping[str, tuple[str, ...]]
+    question_templates: tuple[str, ...]
+    refusal_phrases: tuple[str, ...]
+    refusal_family: str | None  # TURN_PHRASES family name, None if no refusal phrases
+
+
+def _compile_slots(entry: dict) -> IntentSlots:
+    required = tuple(entry.get("required_slots", []))
+    optional = tuple(entry.get("optional_slots", []))
+    req, opt = frozenset(required), frozenset(optional)
+    follow_up = tuple(s for s in FOLLOW_UP_PRIORITY if s in req) + tuple(
+        s for s in FOLLOW_UP_PRIORITY if s in opt and s not in req
+    )
+    all_slots = tuple(dict.fromkeys(required + optional))
+    return IntentSlots(required, optional, req, opt, all_slots, follow_up)
+
+
+def _resolve(owner: str, slot_name: str) -> ResolvedSlot:
+    cfg = INTENT_SLOT_REGISTRY[owner]["slots_config"][slot_name]
+    refusals = tuple(cfg.get("refusal_phrases", []))
+    return ResolvedSlot(
+        owner=owner,
+        config=MappingProxyType({k: tuple(v) if isinstance(v, list) else v for k, v in cfg.items()}),
+        question_templates=tuple(cfg.get("question_templates", DEFAULT_QUESTION_TEMPLATES)),
+        refusal_phrases=refusals,
+        refusal_family=f"refusal:{owner}/{slot_name}" if refusals else None,
+    )
+
+
+# Slot lists: unknown (or empty) intents fall back to unknown_chitchat
+_FALLBACK_SLOTS = _compile_slots(INTENT_SLOT_REGISTRY.get("unknown_chitchat", {}))
+_INTENT_SLOTS: Mapping[str, IntentSlots] = MappingProxyType(
+    {name: _compile_slots(entry) if entry else _FALLBACK_SLOTS for name, entry in INTENT_SLOT_REGISTRY.items()}
+)
+
+# Slot configs: the intent's own config first, else the first intent (registry order) that has one
+_FIRST_OWNER: Mapping[str, ResolvedSlot] = MappingProxyType(
+    {
+        slot: _resolve(name, slot)
+        for name, data in reversed(INTENT_SLOT_REGISTRY.items())
+        for slot in (data.get("slots_config") or {})
+    }
+)
+_RESOLVED: Mapping[str, Mapping[str, ResolvedSlot]] = MappingProxyType(
+    {
+        name: MappingProxyType(
+            {**_FIRST_OWNER, **{slot: _resolve(name, slot) for slot in (data.get("slots_config") or {})}}
+        )
+        for name, data in INTENT_SLOT_REGISTRY.items()
+    }
+)
+_NO_CONFIG: Mapping[str, tuple[str, ...]] = MappingProxyType({})
+
+
+def get_intent_slots(intent: str) -> IntentSlots:
+    """Compiled slot map for intent (unknown_chitchat's if the intent is not registered)."""
+    return _INTENT_SLOTS.get(intent) or _FALLBACK_SLOTS
+
+
+def get_required_slots(intent: str) -> tuple[str, ...]:
+    return get_intent_slots(intent).required
+
+
+def get_optional_slots(intent: str) -> tuple[str, ...]:
+    return get_intent_slots(intent).optional
+
+
+def get_follow_up_order(intent: str) -> tuple[str, ...]:
+    """Slots to ask about, in order: required then optional, each in FOLLOW_UP_PRIORITY order."""
+    return get_intent_slots(intent).follow_up
+
+
+def resolve_slot(slot_name: str, intent: str | None = None) -> ResolvedSlot | None:
+    """slot_name's config as seen from intent; None if no intent configures it."""
+    return (_RESOLVED.get(intent) or _FIRST_OWNER).get(slot_name)  # type: ignore[arg-type]
+
+
+def _config_owner(slot_name: str, intent: str | None = None) -> str | None:
+    """Intent whose slots_config defines slot_name: the given intent first, else the first that has it."""
+    resolved = resolve_slot(slot_name, intent)
+    return resolved.owner if resolved else None
+
+
+def get_slot_config(slot_name: str, intent: str | None = None) -> Mapping[str, tuple[str, ...]]:
+    resolved = resolve_slot(slot_name, intent)
+    return resolved.config if resolved else _NO_CONFIG
 
 
-def get_optional_slots(intent: str) -> list[str]:
-    entry = INTENT_SLOT_REGISTRY.get(intent) or INTENT_SLOT_REGISTRY.get("unknown_chitchat", {})
-    return list(entry.get("optional_slots", []))
+def get_question_templates(slot_name: str, intent: str | None = None) -> tuple[str, ...]:
+    resolved = resolve_slot(slot_name, intent)
+    return resolved.question_templates if resolved else DEFAULT_QUESTION_TEMPLATES
 
 
-def get_slot_config(slot_name: str, intent: str | None = None) -> SlotConfig:
-    if intent:
-        entry = INTENT_SLOT_REGISTRY.get(intent, {})
-        sc = entry.get("slots_config") or {}
-        if slot_name in sc:
-            return sc[slot_name]
-    for _intent, data in INTENT_SLOT_REGISTRY.items():
-        sc = data.get("slots_config") or {}
-        if slot_name in sc:
-            return sc[slot_name]
-    return {}
+def get_refusal_phrases(slot_name: str, intent: str | None = None) -> tuple[str, ...]:
+    resolved = resolve_slot(slot_name, intent)
+    return resolved.refusal_phrases if resolved else ()
 
 
-def get_question_templates(slot_name: str, intent: str | None = None) -> list[str]:
-    cfg = get_slot_config(slot_name, intent)
-    return list(cfg.get("question_templates", ["Could you share that with me?"]))
+# Every slot's refusal phrases join the per-turn automaton as "refusal:<intent>/<slot>",
+# keyed by the intent that owns the config (same lookup as get_slot_config).
+for _name, _data in INTENT_SLOT_REGISTRY.items():
+    for _slot, _cfg in (_data.get("slots_config") or {}).items():
+        if _cfg.get("refusal_phrases"):
+            TURN_PHRASES.register(f"refusal:{_name}/{_slot}", _cfg["refusal_phrases"])
 
 
-def get_refusal_phrases(slot_name: str, intent: str | None = None) -> list[str]:
-    cfg = get_slot_config(slot_name, intent)
-    return list(cfg.get("refusal_phrases", []))
+def has_refusal_phrase(message_lower: str, slot_name: str, intent: str | None = None) -> bool:
+    """True if the (lowercased) message contains one of the slot's refusal phrases."""
+    resolved = resolve_slot(slot_name, intent)
+    family = resolved.refusal_family if resolved else None
+    return family is not None and family in TURN_PHRASES.match(message_lower)
@@ -0,0 +1,204 @@
+"""
+Phase 4 — Compact state snapshots (registry state_snapshot column).
+ConversationState as a positional record: slot names, intents and enums are small integer codes,
+untouched (missing) slots are a bare code. Body is msgpack when installed, else compact JSON.
+StateSnapshot decodes lazily: completeness/lead scoring read slot status and value from the
+decoded rows; SlotValue/ConversationState models are built only by to_state().
+Legacy state_json text loads through the same interface.
+"""
+
+from typing import Any, Iterable, NamedTuple
+
+from pydantic_core import from_json, to_json, to_jsonable_python
+
+from src.state.models import ConversationStage, ConversationState, SlotStatus
+
+try:
+    import msgpack
+except ImportError:  # optional; snapshots fall back to a compact JSON body
+    msgpack = None
+
+# Code tables are part of the stored format: append only, never reorder.
+SLOT_NAMES: tuple[str, ...] = (
+    "caller_name", "name", "country_location", "project_type", "animation_type", "budget_or_range",
+    "approx_duration", "duration", "deadline", "target_audience", "style_reference", "company_or_individual",
+    "budget_expectation", "usage", "area_of_interest", "project_reference", "issue_category",
+    "desired_resolution", "suggestion_summary", "role_interest", "experience_level", "portfolio_mention",
+)
+INTENT_NAMES: tuple[str, ...] = (
+    "new_project_sales", "price_estimation", "general_services_query", "complaint_issue",
+    "suggestion_feedback", "career_hiring", "unknown_chitchat",
+)
+STATUS_CODES: tuple[SlotStatus, ...] = (SlotStatus.MISSING, SlotStatus.FILLED, SlotStatus.REFUSED, SlotStatus.UNAVAILABLE)
+STAGE_CODES: tuple[ConversationStage, ...] = (
+    ConversationStage.INTENT_DISCOVERY,
+    ConversationStage.SLOT_FILLING,
+    ConversationStage.MINIMUM_COMPLETENESS_REACHED,
+    ConversationStage.OPTIONAL_ENRICHMENT,
+    ConversationStage.CONVERSATION_CLOSURE,
+)
+
+# Header: marker byte (legacy JSON starts with "{"), format version, body encoding
+_MARKER = 0
+VERSION = 1
+FORMAT_MSGPACK = 1
+FORMAT_JSON = 2
+
+_SLOT_CODE = {n: i for i, n in enumerate(SLOT_NAMES)}
+_INTENT_CODE = {n: i for i, n in enumerate(INTENT_NAMES)}
+_STATUS_CODE = {s: i for i, s in enumerate(STATUS_CODES)}
+_STAGE_CODE = {s: i for i, s in enumerate(STAGE_CODES)}
+
+
+class SlotView(NamedTuple):
+    """Read-only slot (same fields as SlotValue) without model construction."""
+
+    value: Any = None
+    status: SlotStatus = SlotStatus.MISSING
+    confidence: float = 0.0
+    source: str | None = None
+    timestamp: str | None = None
+
+
+_MISSING_VIEW = SlotView()
+
+
+def _code(table: dict[str, int], name: str | None) -> int | str | None:
+    return table.get(name, name) if name is not None else None
+
+
+def _name(table: tuple[str, ...], code: int | str | None) -> str | None:
+    return table[code] if isinstance(code, int) else code
+
+
+def _slot_row(name: str, status: Any, value: Any, confidence: float, source: Any, timestamp: Any) -> Any:
+    code = _code(_SLOT_CODE, name)
+    status_code = _STATUS_CODE[status]
+    if status_code == 0 and value is None and not confidence and source is None and timestamp is None:
+        return code  # default missing slot
+    return [code, status_code, value, confidence, source, timestamp]
+
+
+def _pack(body: list) -> bytes:
+    if msgpack is not None:
+        return bytes((_MARKER, VERSION, FORMAT_MSGPACK)) + msgpack.packb(body, use_bin_type=True, default=to_jsonable_python)
+    return bytes((_MARKER, VERSION, FORMAT_JSON)) + to_json(body)
+
+
+def _body(intent, slot_rows: Iterable[Any], last_q, last_q_at, stage, updated_at) -> list:
+    return [_code(_INTENT_CODE, intent), list(slot_rows), _code(_SLOT_CODE, last_q), last_q_at, _STAGE_CODE[stage], updated_at]
+
+
+def encode_state(state: ConversationState) -> bytes:
+    """Snapshot bytes for state (no model_dump)."""
+    rows = (
+        _slot_row(name, sv.status, sv.value, sv.confidence, sv.source, sv.timestamp)
+        for name, sv in state.slots.items()
+    )
+    return _pack(_body(state.intent, rows, state.last_question_asked, state.last_question_at, state.stage, state.updated_at))
+
+
+def _legacy_body(state_json: str) -> list:
+    d = from_json(state_json)
+    rows = (
+        _slot_row(
+            name,
+            SlotStatus(sv.get("status", "missing")),
+            sv.get("value"),
+            sv.get("confidence", 0.0),
+            sv.get("source"),
+            sv.get("timestamp"),
+        )
+        for name, sv in (d.get("slots") or {}).items()
+    )
+    stage = ConversationStage(d.get("stage", ConversationStage.INTENT_DISCOVERY.value))
+    return _body(d.get("intent"), rows, d.get("last_question_asked"), d.get("last_question_at"), stage, d.get("updated_at"))
+
+
+def encode_state_json(state_json: str) -> bytes:
+    """Snapshot bytes for a legacy state_json document (migration; no model validation)."""
+    return _pack(_legacy_body(state_json))
+
+
+class StateSnapshot:
+    """
+    Decoded snapshot. Duck-types ConversationState for readers (intent, stage, get_slot, ...);
+    get_slot returns a SlotView. to_state() builds the model, to_dict() its JSON dump.
+    """
+
+    __slots__ = ("intent", "last_question_asked", "last_question_at", "stage", "updated_at", "_rows", "_state")
+
+    def __init__(self, body: list) -> None:
+        intent, rows, last_q, last_q_at, stage, updated_at = body
+        self.intent: str | None = _name(INTENT_NAMES, intent)
+        self.last_question_asked: str | None = _name(SLOT_NAMES, last_q)
+        self.last_question_at: str | None = last_q_at
+        self.stage: ConversationStage = STAGE_CODES[stage]
+        self.updated_at: str | None = updated_at
+        self._rows: dict[str, list | None] = {}
+        for row in rows:
+            if isinstance(row, list):
+                self._rows[_name(SLOT_NAMES, row[0])] = row
+            else:
+                self._rows[_name(SLOT_NAMES, row)] = None
+        self._state: ConversationState | None = None
+
+    def __repr__(self) -> str:
+        return f"StateSnapshot(intent={self.intent!r}, slots={len(self._rows)})"
+
+    @property
+    def slot_names(self) -> tuple[str, ...]:
+        return tuple(self._rows)
+
+    def get_slot(self, name: str) -> SlotView:
+        row = self._rows.get(name)
+        if row is None:
+            return _MISSING_VIEW
+        _, status, value, confidence, source, timestamp = row
+        return SlotView(value, STATUS_CODES[status], confidence, source, timestamp)
+
+    def to_state(self) -> ConversationState:
+        """Full ConversationState (built once; one core validation of to_dict(), as for state_json)."""
+        if self._state is None:
+            self._state = ConversationState.model_validate(self.to_dict())
+        return self._state
+
+    def to_dict(self) -> dict[str, Any]:
+        """Same as to_state().model_dump(mode="json"), straight from the rows."""
+        slots = {}
+        for name, row in self._rows.items():
+            if row is None:
+                slots[name] = {"value": None, "status": "missing", "confidence": 0.0, "source": None, "timestamp": None}
+            else:
+                _, status, value, confidence, source, timestamp = row
+                slots[name] = {
+                    "value": value,
+                    "status": STATUS_CODES[status].value,
+                    "confidence": confidence,
+                    "source": source,
+                    "timestamp": timestamp,
+                }
+        return {
+            "intent": self.intent,
+            "slots": slots,
+            "last_question_asked": self.last_question_asked,
+            "last_question_at": self.last_question_at,
+            "stage": self.stage.value,
+            "updated_at": self.updated_at,
+        }
+
+
+def load_state(raw: bytes | str) -> StateSnapshot:
+    """Decode a stored state: snapshot bytes or legacy state_json text."""
+    if isinstance(raw, str) or raw[:1] == b"{":
+        return StateSnapshot(_legacy_body(raw if isinstance(raw, str) else raw.decode("utf-8")))
+    if len(raw) < 3 or raw[0] != _MARKER or raw[1] != VERSION:
+        raise ValueError("Unrecognized state snapshot")
+    fmt, body = raw[2], raw[3:]
+    if fmt == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("State snapshot is msgpack-encoded; install msgpack to read it")
+        return StateSnapshot(msgpack.unpackb(body, raw=False))
+    if fmt == FORMAT_JSON:
+        return StateSnapshot(from_json(body))
+    raise ValueError(f"Unknown state snapshot format {fmt}")
@@ -54,6 +54,7 @@ USER_PAGE_HTML = """<!DOCTYPE html>
     .call-screen .call-status { font-size: 1rem; color: #8b98a5; margin-bottom: 2rem; min-height: 1.5em; }
     .call-screen .call-status.listening { color: #2ecc71; }
     .call-screen .call-status.speaking { color: #1d9bf0; }
+    .call-screen .call-status.error { color: #e0245e; }
     .call-screen .end-call { padding: 0.75rem 2rem; border-radius: 999px; border: none; background: #e74c3c; color: #fff; font-weight: 600; cursor: pointer; margin-top: 1rem; }
     .call-screen .end-call:hover { background: #c0392b; }
     .call-screen .no-voice { color: #e74c3c; margin-top: 1rem; font-size: 0.9rem; }
@@ -227,6 +228,10 @@ USER_PAGE_HTML = """<!DOCTYPE html>
       callState = STATE.PROCESSING;
       setStatus('Thinking…');
       stopRecognition();
+      streamMessage(t).then(started => { if (!started) sendMessage(t); });
+    }
+
+    function sendMessage(t) {
       fetch('/live/message', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
@@ -245,6 +250,87 @@ USER_PAGE_HTML = """<!DOCTYPE html>
         });
     }
 
+    // Speak one streamed chunk; the first one interrupts anything still playing, later ones queue.
+    function speakChunk(text, first) {
+      if (!synth || !text) return null;
+      if (first) synth.cancel();
+      const u = new SpeechSynthesisUtterance(text);
+      const voice = getFemaleVoice();
+      if (voice) u.voice = voice;
+      u.rate = 0.9;
+      u.pitch = 1.05;
+      synth.speak(u);
+      if (first) {
+        ttsStartTime = Date.now();
+        callState = STATE.SPEAKING;
+        setStatus('Mira is speaking…', 'speaking');
+        startListening();
+      }
+      return u;
+    }
+
+    // The turn failed once the stream had started (server error event, dropped connection): show why
+    // and listen again. The message is not re-sent; the server may already have applied it.
+    function turnFailed(detail) {
+      callState = STATE.CONNECTING;
+      setStatus(detail, 'error');
+      setTimeout(startListening, 1500);
+    }
+
+    // POST /live/stream (Server-Sent Events): start speaking at the first sentence, not the full reply.
+    // Resolves false only if the stream never started (request failed or rejected): then use /live/message.
+    async function streamMessage(t) {
+      const sent = performance.now();
+      let r;
+      try {
+        r = await fetch('/live/stream', {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ session_id: sessionId, user_message: t })
+        });
+      } catch (e) {
+        return false;
+      }
+      if (!r.ok || !r.body) return false;
+      const reader = r.body.getReader();
+      const decoder = new TextDecoder();
+      let buf = '', last = null, firstAudioMs = null, spoke = false, finished = false, error = null;
+      try {
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+          buf += decoder.decode(value, { stream: true });
+          let sep;
+          while ((sep = buf.indexOf('\\n\\n')) >= 0) {
+            const raw = buf.slice(0, sep);
+            buf = buf.slice(sep + 2);
+            const event = (raw.match(/^event: (.*)$/m) || [])[1];
+            const data = JSON.parse((raw.match(/^data: (.*)$/m) || [])[1] || '{}');
+            if (event === 'chunk') {
+              last = speakChunk(data.text, !spoke) || last;
+              if (!spoke) firstAudioMs = performance.now() - sent;
+              spoke = true;
+            } else if (event === 'done') {
+              finished = true;
+              console.debug('live turn: first audio ' + Math.round(firstAudioMs) + ' ms, total ' +
+                Math.round(performance.now() - sent) + ' ms (server ' + data.first_chunk_ms + ' / ' + data.total_ms + ' ms)');
+            } else if (event === 'error') {
+              error = data.detail || 'Something went wrong. Try again.';
+            }
+          }
+        }
+      } catch (e) {}
+      if (!error && !finished) error = 'Connection lost. Try again.';
+      if (error) {
+        turnFailed(error);
+      } else if (last && (synth.speaking || synth.pending)) {
+        last.onend = () => { setTimeout(startListening, 300); };
+      } else {
+        startListening();
+      }
+      return true;
+    }
+
     async function startCall() {
       setStatus('Connecting…');
       try {
@@ -0,0 +1,93 @@
+"""Shared fixtures: a throwaway registry DB per test; live turns against a fake chat model."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+# allow importing src when run from project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.live import llm_chat, routing
+from src.live.llm_gateway import LLMGateway, set_llm_gateway
+from src.live.reply_cache import ReplyCache, set_reply_cache
+from src.live.session_store import LiveSessionStore, SQLiteSessionBackend, set_session_store
+from src.registry import store
+from src.registry.connection import close_pool
+
+
+@pytest.fixture
+def registry_db(tmp_path, monkeypatch):
+    """Fresh registry DB (tables + indexes) under tmp_path; the pool is closed afterwards."""
+    monkeypatch.setattr(store, "DB_PATH", tmp_path / "registry.db")
+    store.init_db()
+    yield store
+    close_pool()
+
+
+class FakeChat(BaseChatModel):
+    """Chat model that answers "Sure — <last message>" after `delay` seconds, streamed word by word."""
+
+    delay: float = 0.2
+    calls: int = 0
+    active: int = 0  # async calls in flight
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _reply(self, messages) -> str:
+        return f"Sure — {messages[-1].content}"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.calls += 1
+        time.sleep(self.delay)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._reply(messages)))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self.calls += 1
+        self.active += 1
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self._reply(messages)))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        self.active += 1
+        try:
+            await asyncio.sleep(self.delay)
+            for i, word in enumerate(self._reply(messages).split(" ")):
+                yield ChatGenerationChunk(message=AIMessageChunk(content=word if i == 0 else " " + word))
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def fake_chat():
+    return FakeChat()
+
+
+@pytest.fixture
+def live(registry_db, fake_chat, monkeypatch):
+    """
+    Live turns on the registry DB (shared-mode session store) against a FakeChat, returned for tuning.
+    Fresh gateway and route counters; reply cache off, so every routed turn reaches the model.
+    """
+    chat = fake_chat
+    monkeypatch.setattr(llm_chat, "_chat", chat)
+    monkeypatch.setattr(llm_chat, "_llm_available", True)
+    set_session_store(LiveSessionStore(SQLiteSessionBackend()))
+    set_reply_cache(ReplyCache(max_entries=0, path=None))
+    set_llm_gateway(LLMGateway())
+    routing.get_route_counters().reset()
+    yield chat
+    set_session_store(None)
+    set_reply_cache(None)
+    set_llm_gateway(None)
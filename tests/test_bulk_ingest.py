@@ -0,0 +1,110 @@
+"""POST /ingest/chat/bulk: per-item results in input order; bad items fail alone, good ones are stored."""
+
+import importlib
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.ingestion import router as ingest_router
+from src.registry import store
+
+router_module = importlib.import_module("src.ingestion.router")
+pipeline = importlib.import_module("src.ingestion.pipeline")
+
+
+@pytest.fixture
+def client(registry_db):
+    app = FastAPI()
+    app.include_router(ingest_router)
+    with TestClient(app) as c:
+        yield c
+
+
+def _chat(text: str, cid: str | None = None) -> dict:
+    item = {"turns": [{"speaker_id": "user", "text": text}]}
+    if cid:
+        item["conversation_id"] = cid
+    return item
+
+
+ITEMS = [
+    _chat("hello", "conv_bulk0"),
+    {"turns": []},  # fails validation (min_length=1)
+    _chat("need a 3d video", "conv_bulk2"),
+    {"nope": 1},
+    _chat("pricing?"),
+]
+
+
+def _check(body: dict) -> None:
+    results = body["results"]
+    assert [r["index"] for r in results] == list(range(6))
+    assert body["registered"] == 3 and body["failed"] == 3
+    assert results[0]["conversation_id"] == "conv_bulk0" and results[2]["conversation_id"] == "conv_bulk2"
+    assert results[1]["error"].startswith("invalid payload: turns")
+    assert results[3]["error"].startswith("invalid payload")
+    assert "error" in results[5]
+    for r in results:
+        if "conversation_id" in r:
+            assert store.get_conversation(r["conversation_id"]) is not None
+
+
+@pytest.mark.parametrize("chunk_size", [500, 2])
+def test_ndjson_per_item_errors(client, monkeypatch, chunk_size):
+    monkeypatch.setattr(router_module, "BULK_CHUNK_SIZE", chunk_size)
+    lines = [json.dumps(i) for i in ITEMS] + ["", "{not json"]  # blank lines are skipped, not items
+    resp = client.post("/ingest/chat/bulk", content="\n".join(lines))
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["results"][5]["error"].startswith("JSONDecodeError")
+    _check(body)
+
+
+def test_json_array(client):
+    resp = client.post("/ingest/chat/bulk", json=ITEMS + [42])
+    assert resp.status_code == 200
+    _check(resp.json())
+
+
+def test_broken_array_is_400(client):
+    assert client.post("/ingest/chat/bulk", content="[1, 2").status_code == 400
+
+
+def test_single_object_is_one_ndjson_item(client):
+    resp = client.post("/ingest/chat/bulk", content='{"turns": []}')
+    assert resp.status_code == 200 and resp.json()["failed"] == 1
+
+
+def test_failed_chunk_reports_each_item(client, monkeypatch):
+    def boom(payloads):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(router_module, "process_chat_bulk", boom)
+    body = client.post("/ingest/chat/bulk", json=[_chat("a"), {"turns": []}, _chat("b")]).json()
+    assert body["failed"] == 3
+    assert [r["error"] for r in body["results"] if r["index"] != 1] == ["RuntimeError: disk full"] * 2
+
+
+def test_bad_item_in_chunk_fails_alone(client, monkeypatch):
+    normalize = pipeline.normalize_turns
+
+    def picky(turns):
+        if turns[0].text == "poison":
+            raise ValueError("cannot normalize")
+        return normalize(turns)
+
+    monkeypatch.setattr(pipeline, "normalize_turns", picky)
+    body = client.post("/ingest/chat/bulk", json=[_chat("a", "conv_ok0"), _chat("poison"), _chat("b", "conv_ok2")]).json()
+    assert body["registered"] == 2 and body["failed"] == 1
+    assert body["results"][1]["error"] == "ValueError: cannot normalize"
+    assert store.get_conversation("conv_ok0") and store.get_conversation("conv_ok2")
+
+
+def test_duplicate_id_in_chunk_fails_alone(client):
+    body = client.post("/ingest/chat/bulk", json=[_chat("first", "conv_dup"), _chat("second", "conv_dup"), _chat("c")]).json()
+    assert body["registered"] == 2 and body["failed"] == 1
+    assert body["results"][0]["conversation_id"] == "conv_dup"
+    assert body["results"][1]["error"].startswith("ValueError: duplicate conversation_id")
+    assert store.get_conversation("conv_dup").raw_transcript.endswith("first")
@@ -0,0 +1,72 @@
+"""POST /ingest/chat/full and /conversations/{id}/full: same outputs as the three-call flow, one transaction."""
+
+import importlib
+
+import pytest
+from fastapi import HTTPException
+
+from src.ingestion.payloads import IncomingChatPayload
+from src.registry import get_conversation, get_state_json, list_processing_runs
+
+router_module = importlib.import_module("src.ingestion.router")
+pipeline = importlib.import_module("src.ingestion.pipeline")
+
+TURNS = [
+    {"speaker_id": "agent", "text": "Hello! This is Mira from XYZ Animations. How may I help you?"},
+    {"speaker_id": "user", "text": "Hi, I am looking for animation services for a 2 minute promo video."},
+    {"speaker_id": "agent", "text": "That's great! May I know your name?"},
+    {"speaker_id": "user", "text": "My name is Priya and we're based in India."},
+    {"speaker_id": "agent", "text": "Thanks! Is this a 2D or 3D animation?"},
+    {"speaker_id": "user", "text": "3D, for YouTube. Budget is around 50k and we need it by March."},
+]
+
+
+def _payload(cid: str) -> IncomingChatPayload:
+    return IncomingChatPayload(turns=TURNS, conversation_id=cid)
+
+
+def _outputs(resp: dict) -> tuple:
+    # timestamps differ run to run; compare value/status/confidence/source
+    slots = {k: {f: v for f, v in sv.items() if f != "timestamp"} for k, sv in resp["state"]["slots"].items()}
+    return slots, resp["state"]["intent"], resp["completeness"], resp["lead"], resp["next_question_slot"]
+
+
+def _three_calls(cid: str) -> tuple[dict, dict]:
+    router_module.ingest_chat(_payload(cid))
+    nlp = router_module.process_conversation_nlp(cid)
+    return nlp, router_module.build_and_save_state(cid)
+
+
+def test_chat_full_matches_three_calls(registry_db):
+    nlp, three = _three_calls("conv_three")
+    full = router_module.ingest_chat_full(_payload("conv_full"))
+    assert full["status"] == "processed" and full["conversation_id"] == "conv_full"
+    assert _outputs(full) == _outputs(three)
+    assert full["nlp"]["final_intent"] == nlp["final_intent"]
+    a, b = get_conversation("conv_three"), get_conversation("conv_full")
+    assert (a.primary_intent, a.completeness_status, a.lead_score) == (b.primary_intent, b.completeness_status, b.lead_score)
+    assert len(list_processing_runs("conv_full")) == 1
+
+
+def test_stored_conversation_full_matches_three_calls(registry_db):
+    _, three = _three_calls("conv_three")
+    router_module.ingest_chat(_payload("conv_stored"))
+    full = router_module.process_conversation_everything("conv_stored")
+    assert _outputs(full) == _outputs(three)
+    assert get_state_json("conv_stored") is not None
+
+
+def test_stored_conversation_full_404(registry_db):
+    with pytest.raises(HTTPException) as e:
+        router_module.process_conversation_everything("conv_missing")
+    assert e.value.status_code == 404
+
+
+def test_failed_step_rolls_back_every_write(registry_db, monkeypatch):
+    def boom(*args, **kwargs):
+        raise RuntimeError("lead write failed")
+
+    monkeypatch.setattr(pipeline, "append_processing_run", boom)
+    with pytest.raises(RuntimeError):
+        router_module.ingest_chat_full(_payload("conv_rollback"))
+    assert get_conversation("conv_rollback") is None
@@ -0,0 +1,69 @@
+"""Compiled intent table: same scores and detect_intent output as the original per-pattern re.search scorer."""
+
+import re
+
+import pytest
+
+from src.nlp import intent
+from src.nlp.analysis import MessageAnalysis
+from src.nlp.intent import INTENT_SIGNALS, detect_intent
+
+CORPUS = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "How much will it cost to make a 3D short film?",
+    "What services do you offer?",
+    "whhhat do you offer",
+    "do you do 2d or 3d animation",
+    "i2d or i3d?",
+    "Tell me about your company",
+    "I'm not happy with previous delivery, there was a delay in delivery and a quality issue.",
+    "I want a refund, this is not what I expected",
+    "I have an idea, you should add a live preview. Just feedback.",
+    "Are you hiring? Any internship or job opening?",
+    "hello",
+    "hey there, good morning",
+    "thanks, bye",
+    "We need a budget for an explainer series, can you send a quote or estimate?",
+    "Wrong colours in the ad, I am disappointed",
+    "",
+    "   ",
+    "ok",
+    "Hellooo!!! Need animation asap",
+    "What is your process for a Pixar style 3D film?",
+]
+CORPUS.append(" ".join(CORPUS))  # transcript-sized input
+
+
+def _legacy_normalize(text: str) -> str:
+    t = text.lower().strip()
+    if not t:
+        return t
+    t = re.sub(r"(.)\1+", r"\1", t)
+    t = re.sub(r"\bi2d\b", "i 2d", t)
+    t = re.sub(r"\bi3d\b", "i 3d", t)
+    return t
+
+
+def legacy_score(text: str | MessageAnalysis) -> list[tuple[str, float]]:
+    """The scorer as it was before the compiled table."""
+    if isinstance(text, MessageAnalysis):
+        text = text.text
+    text_lower = text.lower()
+    text_norm = _legacy_normalize(text)
+    scores = []
+    for name, patterns in INTENT_SIGNALS.items():
+        count = sum(1 for p in patterns if re.search(p, text_lower) or re.search(p, text_norm))
+        scores.append((name, min(1.0, count / 3.0) if count else 0.0))
+    return scores
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_scores_match_legacy(text):
+    assert intent._score_intent(text) == legacy_score(text)
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_detect_intent_matches_legacy(text, monkeypatch):
+    compiled = detect_intent(text)
+    monkeypatch.setattr(intent, "_score_intent", legacy_score)
+    assert compiled == detect_intent(text)
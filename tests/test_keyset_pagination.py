@@ -0,0 +1,77 @@
+"""Keyset cursors: encode/decode round trip, and paging visits every row once in (created_at, id) order."""
+
+import pytest
+
+from src.registry import store
+from src.schemas import ChannelSource, SpeakerTurn
+
+
+def _register(n: int, prefix: str) -> list[str]:
+    ids = [f"conv_{prefix}{i:02d}" for i in range(n)]
+    turns = [SpeakerTurn(speaker_id="user", text="hi")]
+    store.register_conversations_bulk(
+        [{"conversation_id": cid, "channel_source": ChannelSource.CHAT, "speaker_turns": turns, "raw_transcript": "hi"} for cid in ids]
+    )
+    return ids
+
+
+def _all_pages(fetch, limit: int) -> list[list[dict]]:
+    pages, cursor = [], None
+    while True:
+        rows, cursor = fetch(limit=limit, cursor=cursor)
+        pages.append(rows)
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("key", ["conv_abc", 42, 0])
+def test_cursor_round_trip(key):
+    cursor = store.encode_cursor("2026-01-02T03:04:05Z", key)
+    assert "=" not in cursor
+    assert store.decode_cursor(cursor) == ("2026-01-02T03:04:05Z", key)
+
+
+@pytest.mark.parametrize("bad", ["", "not-base64!", store.encode_cursor("x", "y")[:-3], "WzEsMl0", "eyJhIjoxfQ"])
+def test_malformed_cursor_raises_value_error(bad):
+    with pytest.raises(ValueError):
+        store.decode_cursor(bad)
+
+
+@pytest.mark.parametrize("limit", [1, 3, 7, 50])
+def test_conversation_pages_visit_each_row_once(registry_db, limit):
+    ids = _register(7, "a") + _register(5, "b")  # two created_at values, ties broken by id
+    for cid in ids:
+        store.update_lead_score(cid, 90.0, "hot")
+    for fetch in (store.list_conversations_today, store.list_hot_leads):
+        pages = _all_pages(fetch, limit)
+        seen = [r["conversation_id"] for page in pages for r in page]
+        assert sorted(seen) == sorted(ids) and len(set(seen)) == len(seen)
+        assert all(len(page) <= limit for page in pages)
+        assert seen[:5] == sorted(ids[7:], reverse=True)  # newer batch first, id descending
+        assert seen[5:] == sorted(ids[:7], reverse=True)
+        assert set(pages[0][0]) == set(store.DASHBOARD_FIELDS)
+
+
+def test_intent_filter_pages(registry_db):
+    ids = _register(6, "c")
+    for i, cid in enumerate(ids):
+        store.update_nlp_results(cid, primary_intent="complaint_issue" if i % 2 else "price_estimation")
+    pages = _all_pages(lambda **kw: store.list_conversations_by_intent("complaint_issue", **kw), 2)
+    assert [r["conversation_id"] for p in pages for r in p] == sorted(ids[1::2], reverse=True)
+
+
+def test_quotation_pages_visit_each_row_once(registry_db):
+    qids = [store.create_quotation_request(f"live_{i}") for i in range(9)]
+    for qid in qids[::3]:
+        store.set_quotation_urgent(qid)
+    seen = [r["id"] for page in _all_pages(store.list_quotation_requests, 4) for r in page]
+    assert sorted(seen) == sorted(qids) and len(set(seen)) == len(seen)
+    urgent = _all_pages(lambda **kw: store.list_quotation_requests(urgent_only=True, **kw), 2)
+    assert sorted(r["id"] for p in urgent for r in p) == sorted(qids[::3])
+
+
+def test_page_size_is_clamped(registry_db):
+    _register(3, "d")
+    rows, cursor = store.list_conversations_today(limit=0)
+    assert len(rows) == 1 and cursor is not None
+    assert store._clamp_limit(10_000) == store.MAX_PAGE_SIZE
@@ -0,0 +1,81 @@
+"""Async live turns (session.aturn): model reply, timeout fallback to rules, cancelled turns leave no trace."""
+
+import asyncio
+
+import pytest
+
+from src.live import llm_chat, routing, session
+from src.live.session_store import LiveSessionStore, SessionBusyError, SQLiteSessionBackend, get_session_store
+
+
+@pytest.fixture
+def llm_first(live, monkeypatch):
+    monkeypatch.setattr(routing, "RULE_FIRST", False)  # every turn goes to the model
+    return live
+
+
+def _turn_index(sid: str) -> int:
+    return session.get_session(sid)["turn_index"]
+
+
+def _unlocked(sid: str) -> bool:
+    """Neither this process's session lock nor the SQLite lease is held."""
+    other = LiveSessionStore(SQLiteSessionBackend(), shared=True, lock_timeout_s=0.2)
+    try:
+        with other.lock(sid):
+            pass
+    except SessionBusyError:
+        return False
+    return sid not in get_session_store()._session_locks
+
+
+def test_model_reply(llm_first):
+    sid = session.start_session()[0]
+    reply, _, _ = asyncio.run(session.aturn(sid, "what do you do?"))
+    assert reply == "Sure — what do you do?"
+    assert _turn_index(sid) == 1 and _unlocked(sid)
+
+
+def test_timeout_falls_back_to_rule_reply(llm_first, monkeypatch):
+    sid = session.start_session()[0]
+    monkeypatch.setattr(llm_chat, "LLM_TIMEOUT_S", llm_first.delay / 5)
+    timed_out = asyncio.run(session.aturn(sid, "hi"))[0]
+    monkeypatch.setattr(llm_chat, "_llm_available", False)
+    monkeypatch.setattr(llm_chat, "_chat", None)
+    ref = session.start_session()[0]
+    assert timed_out == asyncio.run(session.aturn(ref, "hi"))[0]
+
+
+def test_cancelled_turn_leaves_session_unchanged_and_unlocked(llm_first):
+    sid = session.start_session()[0]
+
+    async def cancel_mid_model() -> None:
+        task = asyncio.ensure_future(session.aturn(sid, "what do you do?"))
+        await asyncio.sleep(llm_first.delay / 4)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_mid_model())
+    assert _turn_index(sid) == 0 and _unlocked(sid)
+    assert asyncio.run(session.aturn(sid, "what do you do?"))[0] == "Sure — what do you do?"
+
+
+def test_turn_cancelled_while_waiting_for_the_lock_still_releases(llm_first):
+    sid = session.start_session()[0]
+    store = get_session_store()
+
+    async def cancel_while_queued() -> None:
+        store.acquire(sid)  # another turn of this session holds it
+        try:
+            task = asyncio.ensure_future(session.aturn(sid, "what do you do?"))
+            await asyncio.sleep(0.05)
+            task.cancel()
+        finally:
+            store.release(sid)  # the queued acquire now succeeds in its thread...
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.1)  # ...and is released again
+
+    asyncio.run(cancel_while_queued())
+    assert _turn_index(sid) == 0 and _unlocked(sid)
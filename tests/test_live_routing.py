@@ -0,0 +1,78 @@
+"""Rule-first routing (src/live/routing.py): expected route per message; rule routes reply exactly as the rule path."""
+
+import asyncio
+import copy
+
+import pytest
+
+from src.live import llm_chat, routing, session
+from src.live.session_store import get_session_store
+from src.nlp.analysis import analyze
+
+EXPECTED = {
+    "hi": routing.GREETING,
+    "what services do you offer?": routing.FAQ,
+    "do you do 2D or 3D?": routing.FAQ,
+    "I have a complaint about the delivery": routing.LLM,  # sales session (default intent): ambiguous
+    "I want a 2 minute 3d promo video": routing.SLOTS,
+    "my name is Priya": routing.LLM,  # no intent signal: ambiguous
+    "tell me a joke": routing.LLM,
+}
+
+
+def _comparable(state) -> dict:
+    data = state.model_dump(mode="json", exclude={"updated_at", "last_question_at"})
+    for slot in data["slots"].values():
+        slot.pop("timestamp", None)
+    return data
+
+
+@pytest.fixture
+def rule_first(live, monkeypatch):
+    monkeypatch.setattr(routing, "RULE_FIRST", True)
+    sid = session.start_session()[0]
+    return sid, get_session_store().get(sid)
+
+
+@pytest.mark.parametrize("text, expected", EXPECTED.items())
+def test_route(rule_first, text, expected):
+    sid, data = rule_first
+    msg = analyze(text)
+    route = routing.route_turn(data, msg)
+    assert route.name == expected
+    if route.name != routing.LLM:  # reused intent, state and question → same reply as the plain rule path
+        a, b = copy.deepcopy(data), copy.deepcopy(data)
+        ra, sa, ia = session._rule_turn(sid, a, msg, text, route)
+        rb, sb, ib = session._rule_turn(sid, b, msg, text)
+        assert (ra, ia, a["history"], a["turn_index"]) == (rb, ib, b["history"], b["turn_index"])
+        assert _comparable(sa) == _comparable(sb)
+
+
+def test_complaint_session_routes_to_rules(rule_first):
+    _, data = rule_first
+    complaint = {**data, "state": data["state"].model_copy(update={"intent": "complaint_issue"})}
+    assert routing.route_turn(complaint, analyze("I have a complaint about the delivery")).name == routing.COMPLAINT
+
+
+def test_llm_first_routes_everything_to_the_model(rule_first, monkeypatch):
+    _, data = rule_first
+    monkeypatch.setattr(routing, "RULE_FIRST", False)
+    assert {routing.route_turn(data, analyze(t)).name for t in EXPECTED} == {routing.LLM}
+
+
+def test_turns_are_counted_by_route(rule_first, monkeypatch):
+    sid, _ = rule_first
+
+    async def call() -> list[str]:
+        return [(await session.aturn(sid, t))[0] for t in ("hi", "what services do you offer?", "tell me a joke")]
+
+    replies = asyncio.run(call())
+    assert replies[-1] == "Sure — tell me a joke"
+    stats = routing.get_route_counters().stats()
+    assert stats["routes"] == {routing.GREETING: 1, routing.FAQ: 1, routing.LLM: 1}
+    assert (stats["turns"], stats["rules"], stats["reached_llm"]) == (3, 2, 1)
+
+    monkeypatch.setattr(llm_chat, "_chat", None)
+    monkeypatch.setattr(llm_chat, "_llm_available", False)
+    asyncio.run(session.aturn(sid, "tell me a joke"))
+    assert routing.get_route_counters().stats()["routes"][routing.NO_LLM] == 1
@@ -0,0 +1,98 @@
+"""Live session store: versions survive eviction, stale writes are refused, shared-mode conflicts raise."""
+
+import pytest
+
+from src.live.session_store import LiveSessionStore, SessionBusyError, SQLiteSessionBackend
+from src.registry import get_live_session
+from src.state.models import ConversationState
+
+
+def _session(turn_index: int = 0) -> dict:
+    return {"state": ConversationState(), "turn_index": turn_index, "history": [], "created_at": "2026-01-01T00:00:00Z"}
+
+
+def _stored(session_id: str) -> tuple[int, int]:
+    row = get_live_session(session_id)
+    return row["version"], row["turn_index"]
+
+
+def test_put_after_eviction_writes_next_version(registry_db):
+    store = LiveSessionStore(SQLiteSessionBackend(), shared=False, max_sessions=1, flush_interval_s=0)
+    store.put("a", _session())
+    for turn in range(1, 4):
+        data = {**store.get("a")}  # working copy, as turns take it
+        store.put("b", _session())  # evicts "a" before its turn is saved
+        assert "a" not in store._lru
+        data["turn_index"] = turn
+        store.put("a", data)
+        assert _stored("a") == (turn + 1, turn)
+    store.close()
+
+
+def test_write_behind_after_eviction(registry_db):
+    store = LiveSessionStore(SQLiteSessionBackend(), shared=False, max_sessions=1, flush_interval_s=60)
+    store.put("a", _session())
+    store.flush()
+    data = {**store.get("a")}
+    store.put("b", _session())
+    store.flush()
+    data["turn_index"] = 7
+    store.put("a", data)
+    assert store.flush() == 1 and _stored("a") == (2, 7)
+    store.close()
+
+
+def test_stale_version_is_not_written(registry_db):
+    backend = SQLiteSessionBackend()
+    assert backend.write([backend.dump("a", _session(3), 3)]) == 1
+    assert backend.write([backend.dump("a", _session(2), 2)]) == 0
+    assert backend.write([backend.dump("a", _session(9), 3)]) == 0
+    assert _stored("a") == (3, 3)
+    data, version = backend.load("a")
+    assert version == 3 and data["turn_index"] == 3
+
+
+def test_shared_mode_conflict_raises(registry_db):
+    one = LiveSessionStore(SQLiteSessionBackend(), shared=True)
+    two = LiveSessionStore(SQLiteSessionBackend(), shared=True)
+    one.put("a", _session())
+    with one.lock("a"):
+        data = {**one.get("a")}
+        backend = SQLiteSessionBackend()
+        backend.write([backend.dump("a", _session(5), 5)])  # another worker, past an expired lease
+        data["turn_index"] = 1
+        with pytest.raises(SessionBusyError):
+            one.put("a", data)
+    assert _stored("a") == (5, 5)
+    with two.lock("a"):
+        data = two.get("a")
+        assert data["turn_index"] == 5 and data["version"] == 5
+        two.put("a", {**data, "turn_index": 6})
+    assert _stored("a") == (6, 6)
+
+
+def test_shared_mode_lock_timeout(registry_db):
+    one = LiveSessionStore(SQLiteSessionBackend(), shared=True)
+    two = LiveSessionStore(SQLiteSessionBackend(), shared=True, lock_timeout_s=0.05)
+    one.put("a", _session())
+    with one.lock("a"):
+        with pytest.raises(SessionBusyError):
+            with two.lock("a"):
+                pass
+    with two.lock("a"):
+        assert two.get("a")["turn_index"] == 0
+
+
+def test_workers_share_sessions_by_default(registry_db):
+    one, two = LiveSessionStore(SQLiteSessionBackend()), LiveSessionStore(SQLiteSessionBackend())
+    assert one.shared and two.shared  # uvicorn --workers N sets no env var; no stale tier by default
+    one.put("a", _session())
+    for turn in range(1, 5):
+        worker = (one, two)[turn % 2]  # turns alternate between workers, each with "a" still cached
+        with worker.lock("a"):
+            data = {**worker.get("a")}
+            assert data["turn_index"] == turn - 1
+            data["turn_index"] = turn
+            worker.put("a", data)
+        assert _stored("a") == (turn + 1, turn)
+    assert LiveSessionStore(None).shared is False
@@ -0,0 +1,87 @@
+"""Speculative turns: within the budget the model wins, after it the local answer does and the call is cancelled."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.live import routing, session
+from src.live.session_store import get_session_store
+from src.nlp.analysis import analyze
+from src.state.models import SlotStatus
+
+MESSAGE = "my name is Priya"  # no intent signal → routed to the LLM; the local path can still ask next
+BUDGET = 0.1
+
+
+@pytest.fixture
+def chat(live, monkeypatch):
+    monkeypatch.setattr(routing, "RULE_FIRST", True)
+    monkeypatch.setattr(routing, "SPECULATIVE_BUDGET_S", BUDGET)
+    return live
+
+
+def _name_filled(state) -> bool:
+    return state.get_slot("caller_name").status == SlotStatus.FILLED
+
+
+def _local_reply() -> str:
+    sid = session.start_session()[0]
+    spec = session._speculate(sid, get_session_store().get(sid), analyze(MESSAGE))
+    assert spec.reply and _name_filled(spec.state)
+    return spec.reply
+
+
+async def _stream(sid: str) -> tuple[str, list[str]]:
+    chunks, done = [], None
+    async for event, data in session.astream_turn(sid, MESSAGE):
+        if event == "chunk":
+            chunks.append(data["text"])
+        else:
+            done = data
+    return done["bot_reply"], chunks
+
+
+def test_fast_model_wins_with_local_slot_updates(chat):
+    chat.delay = BUDGET / 4
+    sid = session.start_session()[0]
+    reply, state, _ = asyncio.run(session.aturn(sid, MESSAGE))
+    assert reply == f"Sure — {MESSAGE}" and _name_filled(state)
+    sid = session.start_session()[0]
+    assert asyncio.run(_stream(sid))[0] == f"Sure — {MESSAGE}"
+    assert _name_filled(session.get_session(sid)["state"])
+    assert routing.get_route_counters().stats()["routes"] == {routing.LLM: 2}
+
+
+def test_slow_model_loses_at_the_budget_and_is_cancelled(chat):
+    expected = _local_reply()
+    chat.delay = BUDGET * 20
+
+    async def run() -> None:
+        sid = session.start_session()[0]
+        start = time.perf_counter()
+        reply, state, _ = await session.aturn(sid, MESSAGE)
+        assert reply == expected and _name_filled(state)
+        assert time.perf_counter() - start < BUDGET * 10
+        reply, chunks = await _stream(session.start_session()[0])
+        assert reply == expected and " ".join(chunks) == reply
+        await asyncio.sleep(0)
+        assert chat.active == 0  # both model calls were cancelled
+
+    asyncio.run(run())
+    assert routing.get_route_counters().stats()["routes"] == {routing.SPECULATIVE_LOCAL: 2}
+
+
+def test_no_local_answer_waits_for_the_model(chat):
+    sid = session.start_session()[0]
+    data = get_session_store().get(sid)
+    data["quotation_awaiting_acceptance"] = 1  # an open quotation is the rule turn's business
+    get_session_store().put(sid, data)
+    chat.delay = BUDGET * 2
+    assert asyncio.run(session.aturn(sid, MESSAGE))[0] == f"Sure — {MESSAGE}"
+
+
+def test_zero_budget_always_waits(chat, monkeypatch):
+    monkeypatch.setattr(routing, "SPECULATIVE_BUDGET_S", 0.0)
+    chat.delay = BUDGET * 2
+    assert asyncio.run(session.aturn(session.start_session()[0], MESSAGE))[0] == f"Sure — {MESSAGE}"
@@ -0,0 +1,100 @@
+"""/live/stream (session.astream_turn): chunks join to the /live/message reply; a dropped stream drops its LLM turn."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.live import llm_chat, routing, session
+from src.live.session_store import get_session_store
+from src.live.router import router as live_router
+from src.live.streaming import SentenceChunker, split_sentences
+
+MESSAGES = ["hi", "can you hear me?", "what do you do?", "we need a 2 minute promo"]
+
+
+@pytest.fixture(params=[False, True], ids=["rules", "llm"])
+def llm(request, live, monkeypatch):
+    monkeypatch.setattr(routing, "RULE_FIRST", False)
+    if not request.param:
+        monkeypatch.setattr(llm_chat, "_chat", None)
+        monkeypatch.setattr(llm_chat, "_llm_available", False)
+    return request.param
+
+
+def _comparable(state) -> dict:
+    data = state.model_dump(mode="json", exclude={"updated_at"})
+    for slot in data["slots"].values():
+        slot.pop("timestamp", None)
+    return data
+
+
+async def _stream(sid: str, text: str) -> tuple[list[str], dict]:
+    chunks, done = [], None
+    async for event, data in session.astream_turn(sid, text):
+        if event == "chunk":
+            chunks.append(data["text"])
+        else:
+            done = data
+    return chunks, done
+
+
+def test_chunks_match_the_message_reply(llm):
+    a, b = session.start_session()[0], session.start_session()[0]
+
+    async def run() -> None:
+        for text in MESSAGES:
+            reply, _, intent = await session.aturn(a, text)
+            chunks, done = await _stream(b, text)
+            assert " ".join(chunks) == done["bot_reply"] == reply
+            assert done["intent"] == intent and done["first_chunk_ms"] <= done["total_ms"]
+
+    asyncio.run(run())
+    sa, sb = session.get_session(a), session.get_session(b)
+    assert sa["history"] == sb["history"] and sa["turn_index"] == sb["turn_index"]
+    assert _comparable(sa["state"]) == _comparable(sb["state"])
+
+
+def test_early_close_drops_an_unfinished_llm_turn(llm):
+    sid = session.start_session()[0]
+
+    async def run() -> None:
+        stream = session.astream_turn(sid, "Tell me more. What else do you make?")
+        await stream.__anext__()
+        await stream.aclose()
+
+    asyncio.run(run())
+    assert session.get_session(sid)["turn_index"] == (0 if llm else 1)  # a rule turn was saved before its first chunk
+    assert sid not in get_session_store()._session_locks
+    chunks, done = asyncio.run(_stream(sid, "Tell me more. What else do you make?"))
+    assert len(chunks) >= 2 and done["bot_reply"] == " ".join(chunks)
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    out = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        out.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return out
+
+
+def test_sse_endpoint(live):
+    app = FastAPI()
+    app.include_router(live_router)
+    sid = session.start_session()[0]
+    with TestClient(app) as client:
+        resp = client.post("/live/stream", json={"session_id": sid, "user_message": "what do you do?"})
+        events = _events(resp.text)
+        assert [e for e, _ in events[:-1]] == ["chunk"] * (len(events) - 1) and events[-1][0] == "done"
+        assert " ".join(d["text"] for _, d in events[:-1]) == events[-1][1]["bot_reply"]
+        assert client.post("/live/stream", json={"session_id": sid}).status_code == 400
+
+
+def test_sentence_chunker():
+    chunker = SentenceChunker(max_chars=30)
+    chunks = chunker.feed("Sure — we do 2D. And 3D") + chunker.feed("! Would you like a quote, or more about")
+    chunks += chunker.flush()
+    assert chunks == ["Sure — we do 2D.", "And 3D!", "Would you like a quote,", "or more about"]
+    assert split_sentences("One. Two? Three") == ["One.", "Two?", "Three"]
@@ -0,0 +1,150 @@
+"""LLM circuit breaker state machine on a fake clock (src/live/llm_breaker.py)."""
+
+import pytest
+
+from src.live.llm_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(latency_budget_s=1.0, window=20, min_calls=20, failures=3, cooldown_s=5.0, clock=clock)
+
+
+def _call(b: CircuitBreaker, clock: Clock, latency: float, ok: bool = True) -> None:
+    token = b.begin()
+    assert token is not None
+    clock.now += latency
+    b.end(token, ok)
+
+
+def _trip(b: CircuitBreaker, clock: Clock) -> None:
+    for _ in range(3):
+        _call(b, clock, 0.1, ok=False)
+    assert b.state == OPEN
+
+
+def test_bad_calls_in_a_row_trip_and_a_good_call_resets_the_run(breaker, clock):
+    _call(breaker, clock, 0.1, ok=False)
+    _call(breaker, clock, 1.5)  # over budget
+    _call(breaker, clock, 0.1)
+    _call(breaker, clock, 0.1, ok=False)
+    _call(breaker, clock, 1.2)
+    assert breaker.state == CLOSED
+    _call(breaker, clock, 0.1, ok=False)
+    assert breaker.state == OPEN and breaker.is_open() and breaker.begin() is None
+
+
+def test_p95_over_budget_trips(breaker, clock):
+    for i in range(20):
+        assert breaker.state == CLOSED
+        _call(breaker, clock, 1.3 if i in (4, 12) else 0.2)
+    assert breaker.state == OPEN and breaker.stats()["trips"] == 1
+
+
+def test_calls_running_past_the_budget_trip_before_returning(breaker, clock):
+    tokens = [breaker.begin() for _ in range(3)]
+    clock.now += 0.9
+    assert breaker.state == CLOSED
+    clock.now += 0.1
+    assert breaker.state == OPEN
+    breaker.end(tokens[0], ok=True)  # sent before the trip: ignored
+    assert breaker.state == OPEN
+
+
+def test_good_probe_closes(breaker, clock):
+    _trip(breaker, clock)
+    clock.now += 5.0
+    assert not breaker.is_open()
+    probe = breaker.begin()
+    assert probe and breaker.state == HALF_OPEN
+    assert breaker.begin() is None and breaker.is_open()  # one probe at a time
+    clock.now += 0.2
+    breaker.end(probe, ok=True)
+    assert breaker.state == CLOSED and breaker.stats()["samples"] == 0 and breaker.stats()["probes"] == 1
+
+
+@pytest.mark.parametrize("probe_latency, ok", [(0.2, False), (1.1, True)])
+def test_bad_probe_reopens(breaker, clock, probe_latency, ok):
+    _trip(breaker, clock)
+    clock.now += 5.0
+    probe = breaker.begin()
+    clock.now += probe_latency
+    breaker.end(probe, ok)
+    assert breaker.state == OPEN and breaker.stats()["trips"] == 2
+    assert breaker.begin() is None
+
+
+def test_probe_running_past_the_budget_reopens(breaker, clock):
+    _trip(breaker, clock)
+    clock.now += 5.0
+    probe = breaker.begin()
+    clock.now += 1.0
+    assert breaker.state == OPEN
+    breaker.end(probe, ok=True)  # late: ignored
+    assert breaker.state == OPEN
+
+
+def test_speculating_model_under_budget_never_trips(breaker, clock):
+    """The local answer wins at 0.5 s on a model that would take 0.8 s: every call is abandoned."""
+    for _ in range(200):
+        token = breaker.begin()
+        assert token is not None
+        clock.now += 0.5
+        breaker.abandon(token)
+    stats = breaker.stats()
+    assert stats["state"] == CLOSED and stats["trips"] == 0 and stats["abandoned"] == 200
+    assert stats["bad_in_a_row"] == 0 and stats["samples"] == 0
+
+
+def test_abandoned_past_the_budget_is_bad(breaker, clock):
+    for _ in range(3):
+        token = breaker.begin()
+        clock.now += 1.0
+        breaker.abandon(token)
+    assert breaker.state == OPEN
+
+
+def test_abandon_keeps_the_bad_run(breaker, clock):
+    _call(breaker, clock, 0.1, ok=False)
+    _call(breaker, clock, 0.1, ok=False)
+    token = breaker.begin()
+    breaker.abandon(token)  # no outcome: neither resets nor extends the run
+    assert breaker.stats()["bad_in_a_row"] == 2
+    _call(breaker, clock, 0.1, ok=False)
+    assert breaker.state == OPEN
+
+
+def test_abandoned_probe_frees_the_slot(breaker, clock):
+    _trip(breaker, clock)
+    clock.now += 5.0
+    probe = breaker.begin()
+    clock.now += 0.5
+    breaker.abandon(probe)
+    assert breaker.state == HALF_OPEN and not breaker.is_open()
+    _call(breaker, clock, 0.2)
+    assert breaker.state == CLOSED and breaker.stats()["probes"] == 2
+
+
+def test_abandon_after_end_is_a_no_op(breaker, clock):
+    token = breaker.begin()
+    breaker.end(token, ok=True)
+    breaker.abandon(token)
+    assert breaker.stats()["abandoned"] == 0
+
+
+def test_disabled_never_refuses():
+    off = CircuitBreaker(enabled=False)
+    assert all(off.begin() is not None for _ in range(3)) and not off.is_open()
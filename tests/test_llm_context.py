@@ -0,0 +1,91 @@
+"""Bounded LLM prompt (src/live/llm_context.py): within budget, recent turns verbatim, slots and summary kept."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.live.llm_chat import SYSTEM_PROMPT, _messages
+from src.live.llm_context import (
+    CONTEXT_TOKENS,
+    CONTEXT_TURNS,
+    SUMMARY_TOKENS,
+    build_context,
+    context_tokens,
+    estimate_tokens,
+    update_summary,
+)
+from src.live.session_store import SQLiteSessionBackend
+from src.state import build_state_from_conversation
+
+USER = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "My name is Priya and we're based in India.",
+    "3D, for YouTube. Budget is around 50k and we need it by March.",
+    "Can you also do a short explainer for our onboarding flow, maybe 60 seconds, in a flat 2D style?",
+    "What would the turnaround look like if we sent the script next week?",
+]
+BOT = [
+    "Got it — a 2 minute promo. What's your name and where are you based?",
+    "Nice to meet you, Priya. What style are you thinking, 2D or 3D?",
+    "Sounds good — 3D for YouTube by March. Anything you'd like it to look like?",
+    "Sure — we do flat 2D explainers all the time. Want a quote for both?",
+]
+
+
+def _session() -> dict:
+    state = build_state_from_conversation("", [("user", t) for t in USER[:3]], "new_project_sales")
+    return {"state": state, "turn_index": 0, "history": [{"role": "bot", "text": "Hi, I'm Mira."}]}
+
+
+def _advance(data: dict, i: int, user_message: str) -> None:
+    data["history"] += [{"role": "user", "text": user_message}, {"role": "bot", "text": BOT[i % len(BOT)]}]
+    data["history"] = data["history"][-200:]  # LIVE_HISTORY_MAX trim, as the store does on put
+    data["turn_index"] += 1
+
+
+def test_long_session_prompts_stay_bounded():
+    data = _session()
+    for i in range(150):
+        user_message = f"{USER[i % len(USER)]} (turn {i})"
+        messages = _messages(data["history"], user_message, data["state"], update_summary(data))
+        size = context_tokens([("", m.content) for m in messages])
+        assert size <= CONTEXT_TOKENS, i
+        window = data["history"][-2 * CONTEXT_TURNS:]
+        assert [m.content for m in messages[-1 - len(window):-1]] == [h["text"] for h in window], i
+        assert messages[0].content == SYSTEM_PROMPT and messages[-1].content == user_message
+        assert "country_location: India" in messages[1].content and "budget_or_range: 50k" in messages[1].content
+        if len(data["history"]) > 2 * CONTEXT_TURNS:
+            assert "Earlier in this call:" in messages[1].content, i
+        assert sum(estimate_tokens(line) for line in data.get("context_summary", {}).get("lines", [])) <= SUMMARY_TOKENS
+        _advance(data, i, user_message)
+
+
+def test_short_session_is_the_full_history():
+    history = [
+        {"role": "bot", "text": "Hi, I'm Mira."},
+        {"role": "user", "text": USER[0]},
+        {"role": "bot", "text": BOT[0]},
+    ]
+    legacy = [SystemMessage(content=SYSTEM_PROMPT), AIMessage(content=history[0]["text"])]
+    legacy += [HumanMessage(content=USER[0]), AIMessage(content=BOT[0]), HumanMessage(content=USER[1])]
+    assert _messages(history, f"  {USER[1]} ", None, None) == legacy
+
+
+def test_oversized_message_is_cut_to_the_budget():
+    text = "word " * 5000
+    messages = build_context("system", [{"role": "user", "text": "hi"}], text, budget=200)
+    assert context_tokens(messages) == 200
+    assert [role for role, _ in messages] == ["system", "user"]  # no room left for history
+    assert messages[-1][1].startswith("word word") and len(messages[-1][1]) < len(text)
+
+
+def test_summary_is_incremental_and_stored_with_the_session(registry_db):
+    data = _session()
+    for i in range(20):
+        update_summary(data)
+        _advance(data, i, USER[i % len(USER)])
+    lines = update_summary(data)
+    assert lines and update_summary(data) == lines  # nothing new to fold
+    backend = SQLiteSessionBackend()
+    assert backend.write([backend.dump("s", data, 1)]) == 1
+    loaded, _ = backend.load("s")
+    assert loaded["context_summary"] == data["context_summary"]
@@ -0,0 +1,86 @@
+"""LLM gateway: single-flight for identical in-flight prompts, bounded queue, queue timeout, open breaker."""
+
+import asyncio
+import time
+
+from langchain_core.messages import HumanMessage
+
+from src.live.llm_breaker import CircuitBreaker
+from src.live.llm_gateway import LLMGateway
+
+
+def _prompt(text: str) -> list:
+    return [HumanMessage(content=text)]
+
+
+def test_identical_prompts_share_one_call(fake_chat):
+    chat, gw = fake_chat, LLMGateway()
+    chat.delay = 0.1
+
+    async def run() -> list:
+        return await asyncio.gather(*(gw.ainvoke(chat, _prompt("hi"), 5.0) for _ in range(20)))
+
+    replies = asyncio.run(run())
+    assert {r.content for r in replies} == {"Sure — hi"}
+    assert chat.calls == 1 and gw.stats()["coalesced"] == 19 and gw.stats()["in_flight_prompts"] == 0
+
+
+def test_cancelled_caller_leaves_the_shared_call_to_the_others(fake_chat):
+    chat, gw = fake_chat, LLMGateway()
+    chat.delay = 0.1
+
+    async def run() -> tuple[list, int]:
+        calls = [asyncio.ensure_future(gw.ainvoke(chat, _prompt("hi"), 5.0)) for _ in range(3)]
+        await asyncio.sleep(0.02)
+        calls[0].cancel()
+        replies = await asyncio.gather(*calls[1:])
+        # all callers gone → the shared call is cancelled
+        last = asyncio.ensure_future(gw.ainvoke(chat, _prompt("bye"), 5.0))
+        await asyncio.sleep(0.02)
+        last.cancel()
+        await asyncio.sleep(0.02)
+        return replies, chat.active
+
+    replies, active = asyncio.run(run())
+    assert [r.content for r in replies] == ["Sure — hi"] * 2
+    assert chat.calls == 2 and active == 0 and gw.stats()["in_flight_prompts"] == 0
+
+
+def test_full_queue_rejects_at_once(fake_chat):
+    chat, gw = fake_chat, LLMGateway(max_concurrency=2, queue_max=3, queue_wait_s=5.0)
+    chat.delay = 0.2
+
+    async def timed(text: str, start: float) -> tuple:
+        return await gw.ainvoke(chat, _prompt(text), 5.0), time.perf_counter() - start
+
+    async def run() -> list:
+        start = time.perf_counter()
+        return await asyncio.gather(*(timed(f"project {i}", start) for i in range(10)))
+
+    results = asyncio.run(run())
+    rejected = [t for r, t in results if r is None]
+    assert len(rejected) == 5 and max(rejected) < 0.1
+    assert chat.calls == 5 and gw.stats()["rejected"] == 5 and gw.stats()["waiting"] == 0
+
+
+def test_queue_wait_times_out(fake_chat):
+    chat, gw = fake_chat, LLMGateway(max_concurrency=1, queue_max=8, queue_wait_s=0.05)
+    chat.delay = 0.3
+
+    async def run() -> list:
+        return await asyncio.gather(*(gw.ainvoke(chat, _prompt(f"q {i}"), 5.0) for i in range(3)))
+
+    first, *rest = asyncio.run(run())
+    assert first.content == "Sure — q 0" and rest == [None, None]
+    assert chat.calls == 1 and gw.stats()["queue_timeouts"] == 2
+
+
+def test_open_breaker_skips_the_model(fake_chat):
+    chat = fake_chat
+    gw = LLMGateway(breaker=CircuitBreaker(enabled=True, min_calls=1, failures=1, cooldown_s=60))
+
+    async def run() -> tuple:
+        return await gw.ainvoke(chat, _prompt("slow"), 0.01), await gw.ainvoke(chat, _prompt("next"), 5.0)
+
+    assert asyncio.run(run()) == (None, None)
+    assert chat.calls == 1 and gw.stats()["errors"] == 1 and gw.stats()["short_circuited"] == 1
@@ -0,0 +1,61 @@
+"""One shared MessageAnalysis per user message: every turn check answers as it does on the raw string."""
+
+import pytest
+
+from src.live.faq import get_faq_reply
+from src.live.quotation_flow import (
+    extract_price_from_message,
+    user_agrees,
+    user_asks_for_quote,
+    user_asks_to_reduce_price,
+    user_disagrees,
+)
+from src.nlp.analysis import MessageAnalysis, analyze, normalize_for_intent
+from src.nlp.intent import detect_intent
+from src.state.follow_up import user_wants_closure
+from src.state.models import SlotValue
+from src.state.pipeline import initial_state
+from src.state.slot_filling import update_state_from_message
+
+MESSAGES = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "My name is Priya and we're based in India.",
+    "3D, for YouTube. Budget is around 50k and we need it by March.",
+    "How much will it cost? Can you send me a quote?",
+    "Can you reduce the price a bit, maybe 40 thousand?",
+    "I'd rather not say",
+    "ok sure",
+    "that's all, thanks",
+    "  Whhhat do you offer, i2d?  ",
+    "",
+]
+
+
+def _checks(message: str | MessageAnalysis) -> tuple:
+    """What a live turn runs on one user message (all branches)."""
+    state = initial_state("new_project_sales").model_copy(update={"last_question_asked": "budget_or_range"})
+    state = update_state_from_message(state, message, "turn_1", "new_project_sales", is_user_turn=True)
+    return (
+        detect_intent(message),
+        get_faq_reply(message),
+        user_asks_for_quote(message),
+        user_asks_to_reduce_price(message),
+        user_agrees(message),
+        user_disagrees(message),
+        extract_price_from_message(message),
+        user_wants_closure(message),
+        {k: (v.value, v.status) for k, v in state.slots.items() if isinstance(v, SlotValue)},
+    )
+
+
+@pytest.mark.parametrize("text", MESSAGES)
+def test_shared_analysis_matches_raw_string(text):
+    assert _checks(analyze(text)) == _checks(text)
+
+
+@pytest.mark.parametrize("text", MESSAGES)
+def test_views(text):
+    a = analyze(text)
+    assert analyze(a) is a
+    lower = text.strip().lower()
+    assert (a.lower, a.normalized, a.tokens) == (lower, normalize_for_intent(text), tuple(lower.split()))
@@ -0,0 +1,96 @@
+"""Batch Phase 3 NLP: same stored results as one /process per conversation; worker count clamped."""
+
+import importlib
+
+from src.ingestion.payloads import IncomingChatPayload
+from src.ingestion.pipeline import process_chat_bulk, process_conversations_nlp_batch
+from src.nlp.pipeline import run_and_persist
+from src.registry import get_conversation, store, update_nlp_results
+
+nlp_pipeline = importlib.import_module("src.nlp.pipeline")
+
+TURNS = [
+    "Hi, I am looking for animation services for a 2 minute promo video.",
+    "My name is Priya and we're based in India.",
+    "3D, for YouTube. Budget is around 50k and we need it by March.",
+    "How much will it cost? Can you send me a quote?",
+    "I'm not happy with the previous delivery, there was a delay.",
+    "What is your process for a Pixar style 3D film?",
+]
+
+
+def _payload(i: int) -> IncomingChatPayload:
+    turns = [
+        {"speaker_id": "user" if j % 2 == 0 else "agent", "text": TURNS[(i + j) % len(TURNS)]} for j in range(4 + i % 5)
+    ]
+    return IncomingChatPayload(turns=turns)
+
+
+def _stored(ids: list[str]) -> list[tuple]:
+    with store._conn() as c:
+        rows = c.execute(
+            "SELECT conversation_id, primary_intent, secondary_tags_json, extracted_fields_json, language "
+            "FROM conversations"
+        ).fetchall()
+    by_id = {r["conversation_id"]: tuple(r)[1:] for r in rows}
+    return [by_id[cid] for cid in ids]
+
+
+def _per_conversation(n: int) -> tuple[list[str], list[tuple]]:
+    """Store n conversations, run /process on each, return ids and the stored results; then reset them."""
+    ids = process_chat_bulk([_payload(i) for i in range(n)])
+    for cid in ids:
+        conv = get_conversation(cid)
+        texts = [t.text for t in conv.speaker_turns]
+        run_and_persist(cid, conv.clean_text or conv.raw_transcript or "", texts, update_nlp_results)
+    expected = _stored(ids)
+    with store.transaction() as c:
+        c.executemany(
+            "UPDATE conversations SET primary_intent = NULL, secondary_tags_json = NULL, "
+            "extracted_fields_json = NULL, language = NULL WHERE conversation_id = ?",
+            [(cid,) for cid in ids],
+        )
+    return ids, expected
+
+
+def test_batch_matches_per_conversation(registry_db):
+    ids, expected = _per_conversation(12)
+    pairs, missing = process_conversations_nlp_batch(ids + ["missing-id", ids[0]])
+    assert [cid for cid, _ in pairs] == ids and missing == ["missing-id"]
+    assert _stored(ids) == expected
+
+
+def test_process_pool_matches_per_conversation(registry_db, monkeypatch):
+    monkeypatch.setattr(nlp_pipeline, "NLP_MAX_WORKERS", 2)
+    ids, expected = _per_conversation(6)
+    try:
+        pairs, _ = process_conversations_nlp_batch(ids, processes=True, workers=2)
+    finally:
+        nlp_pipeline.close_nlp_pool()
+    assert len(pairs) == len(ids)
+    assert _stored(ids) == expected
+
+
+class _Pool:
+    def __init__(self):
+        self.chunksizes = []
+
+    def map(self, fn, items, chunksize):
+        self.chunksizes.append(chunksize)
+        return map(fn, items)
+
+
+def test_workers_clamped_to_max(monkeypatch):
+    pool = _Pool()
+    monkeypatch.setattr(nlp_pipeline, "_get_pool", lambda: pool)
+    items = [(t, [t]) for t in TURNS * 4]
+    expected = [nlp_pipeline.run_nlp_pipeline(*item) for item in items]
+
+    monkeypatch.setattr(nlp_pipeline, "NLP_MAX_WORKERS", 1)
+    assert nlp_pipeline.run_nlp_pipeline_batch(items, processes=True, workers=64) == expected
+    assert pool.chunksizes == []  # clamped to one worker: run inline
+
+    monkeypatch.setattr(nlp_pipeline, "NLP_MAX_WORKERS", 4)
+    assert nlp_pipeline.run_nlp_pipeline_batch(items, processes=True, workers=64) == expected
+    assert nlp_pipeline.run_nlp_pipeline_batch(items, processes=True, workers=2) == expected
+    assert pool.chunksizes == [1, 12]  # all 4 workers; 2 of 4: at most 2 chunks in flight
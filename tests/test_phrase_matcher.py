@@ -0,0 +1,81 @@
+"""Shared per-turn phrase automaton (TURN_PHRASES): same answers as the per-phrase substring checks."""
+
+import random
+
+import pytest
+
+from src.live import faq
+from src.live.session import AUDIBILITY_PHRASES
+from src.nlp.phrases import TURN_PHRASES
+from src.state.follow_up import CLOSURE_PHRASES, user_wants_closure
+from src.state.slot_registry import INTENT_SLOT_REGISTRY, get_refusal_phrases, has_refusal_phrase
+
+SLOTS = sorted({s for d in INTENT_SLOT_REGISTRY.values() for s in (d.get("slots_config") or {})})
+INTENTS = [None, *INTENT_SLOT_REGISTRY, "not_an_intent"]
+
+CORPUS = [
+    "hi, what services do you offer for my company?",
+    "can you tell me how does it work and the timeline",
+    "i want animations for a promo",
+    "do you do two d or 3d?",
+    "ok thanks, that's all, goodbye",
+    "hello can you hear me? am i audible",
+    "i'd rather not say, skip",
+    "budget is confidential",
+    "not sure yet, no preference",
+    "my budget is around fifty thousand rupees and we need it by march for youtube",
+    "",
+    "no",
+]
+
+
+def _random_corpus(n: int) -> list[str]:
+    rng = random.Random(7)
+    vocab = list(faq.TWO_D_3D_KEYWORDS + faq.PROCESS_KEYWORDS + faq.COMPANY_KEYWORDS)
+    vocab += list(faq.LOOKING_KEYWORDS + faq.SERVICES_KEYWORDS) + list(CLOSURE_PHRASES) + list(AUDIBILITY_PHRASES)
+    vocab += [
+        p
+        for d in INTENT_SLOT_REGISTRY.values()
+        for c in (d.get("slots_config") or {}).values()
+        for p in c.get("refusal_phrases", [])
+    ]
+    filler = ["we", "a", "the", "video", "ok", "so", "i", "s", "ab", "out", "hear", "mic"]
+    out = []
+    for _ in range(n):
+        words = [rng.choice(vocab if rng.random() < 0.3 else filler) for _ in range(rng.randint(1, 12))]
+        out.append(" ".join(words))
+        out.append("".join(words))  # phrases overlapping across word boundaries
+    return out
+
+
+MESSAGES = CORPUS + _random_corpus(100)
+
+
+def naive_faq(msg: str) -> str | None:
+    """get_faq_reply as it was: one any() per keyword list, in precedence order."""
+    if not msg:
+        return None
+    if any(k in msg for k in faq.TWO_D_3D_KEYWORDS):
+        return faq.TWO_D_OR_3D_ANSWER
+    if any(k in msg for k in faq.PROCESS_KEYWORDS):
+        return faq.PROCESS_ANSWER
+    if any(k in msg for k in faq.COMPANY_KEYWORDS):
+        return faq.COMPANY_ANSWER
+    if any(k in msg for k in faq.LOOKING_KEYWORDS):
+        return faq.LOOKING_FOR_ANIMATION_ANSWER
+    return faq.SERVICES_ANSWER
+
+
+@pytest.mark.parametrize("msg", MESSAGES)
+def test_turn_checks_match_substring_checks(msg):
+    assert faq.get_faq_reply(msg) == naive_faq(msg)
+    assert user_wants_closure(msg) == (any(p in msg for p in CLOSURE_PHRASES) or msg in ("no", "nope", "that's it"))
+    assert ("audibility" in TURN_PHRASES.match(msg)) == any(p in msg for p in AUDIBILITY_PHRASES)
+
+
+@pytest.mark.parametrize("msg", MESSAGES)
+def test_refusals_match_substring_checks(msg):
+    for slot in SLOTS:
+        for intent in INTENTS:
+            expected = any(p.lower() in msg for p in get_refusal_phrases(slot, intent))
+            assert has_refusal_phrase(msg, slot, intent) == expected, (slot, intent)
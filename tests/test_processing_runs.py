@@ -0,0 +1,53 @@
+"""Delta-encoded processing_runs: every run reads back as the state that was written."""
+
+import pytest
+
+from src.ingestion.pipeline import build_state_outputs, persist_state_outputs
+from src.registry import store
+from src.schemas import ChannelSource, SpeakerTurn
+
+SCRIPT = [
+    ("user", "Hi, I am looking for animation services for a 2 minute promo video."),
+    ("agent", "Great. What's your name and where are you based?"),
+    ("user", "My name is Priya and we're based in India."),
+    ("agent", "2D or 3D, and which platform?"),
+    ("user", "3D, for YouTube. Budget is around 50k and we need it by March."),
+    ("agent", "What's your budget range?"),
+    ("user", "I'd rather not say"),
+]
+INTENTS = ("new_project_sales", "price_estimation")
+RUNS = 24
+
+
+def _write(cid: str) -> list[dict]:
+    turns = [SpeakerTurn(speaker_id=s, text=t) for s, t in SCRIPT]
+    store.register_conversation(cid, ChannelSource.CHAT, turns, raw_transcript="", clean_text="")
+    written = []
+    for n in range(RUNS):
+        # grow the conversation every few runs; switch intent halfway to force a fresh snapshot
+        outputs = build_state_outputs(INTENTS[n >= RUNS // 2], SCRIPT[: min(len(SCRIPT), 1 + n // 3)], "")
+        assert persist_state_outputs(cid, outputs)
+        written.append(outputs["state"].model_dump(mode="json"))
+    return written
+
+
+@pytest.mark.parametrize("every", [1, 5, 16])
+def test_runs_round_trip(registry_db, monkeypatch, every):
+    monkeypatch.setattr(store, "PROCESSING_RUN_SNAPSHOT_EVERY", every)
+    written = _write("conv_runs")
+    runs = store.list_processing_runs("conv_runs")
+    assert [r["state"] for r in runs] == written
+    for r in runs:
+        assert store.get_processing_run(r["run_id"])["state"] == r["state"]
+    with store._conn() as c:
+        snapshots = c.execute("SELECT COUNT(*) FROM processing_runs WHERE state_json IS NOT NULL").fetchone()[0]
+    assert snapshots < RUNS if every > 1 else snapshots == RUNS
+
+
+def test_runs_of_other_conversations_stay_apart(registry_db, monkeypatch):
+    monkeypatch.setattr(store, "PROCESSING_RUN_SNAPSHOT_EVERY", 4)
+    a = _write("conv_a")
+    b = _write("conv_b")
+    assert [r["state"] for r in store.list_processing_runs("conv_a")] == a
+    assert [r["state"] for r in store.list_processing_runs("conv_b")] == b
+    assert store.get_processing_run(10**9) is None
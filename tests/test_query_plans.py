@@ -0,0 +1,45 @@
+"""Dashboard/admin list queries are served by indexes (EXPLAIN QUERY PLAN: no full scans or sorts)."""
+
+import pytest
+
+from src.registry import store
+
+CONV_CURSOR = store.encode_cursor("9999-12-31", "conv_zzzz")
+QUOTE_CURSOR = store.encode_cursor("9999-12-31", 1 << 31)
+
+CALLS = {
+    "list_conversations_today": lambda: store.list_conversations_today(),
+    "list_hot_leads": lambda: store.list_hot_leads(),
+    "list_conversations_by_intent": lambda: store.list_conversations_by_intent("price_estimation"),
+    "get_quotation_by_session": lambda: store.get_quotation_by_session("live_x"),
+    "list_quotation_requests": lambda: store.list_quotation_requests(),
+    "list_quotation_requests(urgent)": lambda: store.list_quotation_requests(urgent_only=True),
+    "list_conversations_today(cursor)": lambda: store.list_conversations_today(cursor=CONV_CURSOR),
+    "list_hot_leads(cursor)": lambda: store.list_hot_leads(cursor=CONV_CURSOR),
+    "list_conversations_by_intent(cursor)": lambda: store.list_conversations_by_intent("complaint_issue", cursor=CONV_CURSOR),
+    "list_quotation_requests(cursor)": lambda: store.list_quotation_requests(cursor=QUOTE_CURSOR),
+    "list_quotation_requests(urgent, cursor)": lambda: store.list_quotation_requests(urgent_only=True, cursor=QUOTE_CURSOR),
+}
+
+
+def _is_bad(step: str) -> bool:
+    # Full-table scan or a sort the index should have provided; "SCAN ... USING INDEX" is fine.
+    if step.startswith("SCAN ") and "USING" not in step:
+        return True
+    return "TEMP B-TREE" in step
+
+
+@pytest.mark.parametrize("name", list(CALLS))
+def test_list_query_uses_index(registry_db, name):
+    with store._conn() as c:
+        seen: list[str] = []
+        c.set_trace_callback(seen.append)
+        try:
+            CALLS[name]()
+        finally:
+            c.set_trace_callback(None)
+        selects = [s for s in seen if s.lstrip().upper().startswith("SELECT")]
+        assert selects
+        for sql in selects:
+            steps = [row[3] for row in c.execute("EXPLAIN QUERY PLAN " + sql).fetchall()]
+            assert not [s for s in steps if _is_bad(s)], steps
@@ -0,0 +1,70 @@
+"""Registry NDJSON CLI: an export re-imports as-is (stored NLP, score, state, timestamps kept)."""
+
+import io
+import json
+
+from src.registry import cli, store
+
+CHATS = [
+    {"conversation_id": "conv_cli0", "turns": [{"speaker_id": "user", "text": "hi, I need a 3d product video"}]},
+    {"conversation_id": "conv_cli1", "turns": [{"speaker_id": "user", "text": "my name is Priya, budget 5000 USD"}]},
+]
+
+
+def _ndjson(items: list[dict]) -> io.StringIO:
+    return io.StringIO("".join(json.dumps(i) + "\n" for i in items))
+
+
+def _export() -> list[dict]:
+    out = io.StringIO()
+    cli.export_ndjson(out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_export_reimports_as_is(registry_db, tmp_path, monkeypatch):
+    assert cli.import_ndjson(_ndjson(CHATS), process=True, workers=1) == (2, 0)
+    first = _export()
+    assert all(r["primary_intent"] and r["state"] and r["lead_score"] is not None for r in first)
+
+    monkeypatch.setattr(store, "DB_PATH", tmp_path / "copy.db")
+    store.init_db()
+    for process in (False, True):  # export lines are restored, never re-processed
+        assert cli.import_ndjson(_ndjson(first), process=process, workers=1) == (2, 0)
+        assert _export() == first
+
+
+def test_bad_export_line_fails_alone(registry_db):
+    broken = {"conversation_id": "conv_x", "created_at": "2026-01-01T00:00:00Z"}  # no channel/turns
+    errors = io.StringIO()
+    assert cli.import_ndjson(_ndjson([broken, CHATS[0]]), errors=errors) == (1, 1)
+    assert json.loads(errors.getvalue())["line"] == 1
+
+
+def test_unexpected_error_fails_its_line_alone(registry_db, monkeypatch):
+    parse = cli._parse
+
+    def flaky(line):
+        if "boom" in line:
+            raise RuntimeError("unexpected")
+        return parse(line)
+
+    monkeypatch.setattr(cli, "_parse", flaky)
+    errors = io.StringIO()
+    poison = {"turns": [{"speaker_id": "user", "text": "boom"}]}
+    assert cli.import_ndjson(_ndjson([CHATS[0], poison, CHATS[1]]), errors=errors) == (2, 1)
+    assert json.loads(errors.getvalue()) == {"line": 2, "error": "RuntimeError: unexpected"}
+    assert cli._prepare_line(json.dumps(poison)) == (None, "RuntimeError: unexpected")
+
+
+def test_process_pool_is_spawned_and_capped(registry_db, monkeypatch):
+    created = []
+
+    class Pool(cli.ProcessPoolExecutor):
+        def __init__(self, max_workers, mp_context):
+            created.append((max_workers, mp_context.get_start_method()))
+            super().__init__(max_workers=max_workers, mp_context=mp_context)
+
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", Pool)
+    monkeypatch.setattr(cli, "NLP_MAX_WORKERS", 1)
+    assert cli.import_ndjson(_ndjson(CHATS), process=True, workers=64) == (2, 0)
+    assert created == [(1, "spawn")]
@@ -0,0 +1,36 @@
+"""LLM reply cache keys: same message and context share a key; captured slot values never do."""
+
+from src.live.reply_cache import ReplyCache
+from src.state.models import ConversationState, SlotStatus, SlotValue
+
+HISTORY = [{"role": "bot", "text": "Hi, I'm Mira. How can I help?"}]
+
+
+def _state(**values) -> ConversationState:
+    slots = {name: SlotValue(value=v, status=SlotStatus.FILLED) for name, v in values.items()}
+    return ConversationState(intent="new_project_sales", slots=slots)
+
+
+def test_key_normalizes_the_message():
+    cache = ReplyCache(max_entries=8, path=None)
+    assert cache.key("What services do you offer?", _state(), HISTORY) == cache.key("what services do you offer", _state(), HISTORY)
+
+
+def test_slot_values_are_part_of_the_key():
+    cache = ReplyCache(max_entries=8, path=None)
+    priya = cache.key("thanks", _state(caller_name="Priya", budget_or_range="50k"), HISTORY)
+    ravi = cache.key("thanks", _state(caller_name="Ravi", budget_or_range="50k"), HISTORY)
+    assert priya != ravi
+    assert priya == cache.key("thanks", _state(budget_or_range="50k", caller_name="Priya"), HISTORY)
+    cache.put(priya, "Thanks, Priya!")
+    assert cache.get(ravi) is None and cache.get(priya) == "Thanks, Priya!"
+
+
+def test_structured_values_and_statuses():
+    cache = ReplyCache(max_entries=8, path=None)
+    a = cache.key("ok", _state(budget_or_range={"amount": 50000, "currency": "INR"}), HISTORY)
+    b = cache.key("ok", _state(budget_or_range={"amount": 5000, "currency": "INR"}), HISTORY)
+    assert a != b
+    refused = ConversationState(intent="new_project_sales", slots={"budget_or_range": SlotValue(status=SlotStatus.REFUSED)})
+    assert cache.key("ok", refused, HISTORY) != cache.key("ok", _state(), HISTORY)
+    assert cache.key("ok", _state(), HISTORY) == cache.key("ok", ConversationState(intent="new_project_sales"), HISTORY)
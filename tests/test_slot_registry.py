@@ -0,0 +1,66 @@
+"""Compiled slot registry: same lookups as the original per-call list copies, and tables that cannot be mutated."""
+
+import pytest
+
+from src.state.slot_registry import (
+    FOLLOW_UP_PRIORITY,
+    INTENT_SLOT_REGISTRY,
+    get_follow_up_order,
+    get_optional_slots,
+    get_question_templates,
+    get_refusal_phrases,
+    get_required_slots,
+    get_slot_config,
+)
+
+INTENTS = [*INTENT_SLOT_REGISTRY, "not_an_intent", None]
+SLOTS = sorted(
+    set(FOLLOW_UP_PRIORITY)
+    | {s for d in INTENT_SLOT_REGISTRY.values() for s in (d.get("slots_config") or {})}
+    | {"no_such_slot"}
+)
+
+
+def legacy_entry(intent):
+    return INTENT_SLOT_REGISTRY.get(intent) or INTENT_SLOT_REGISTRY.get("unknown_chitchat", {})
+
+
+def legacy_config(slot_name, intent=None):
+    if intent and slot_name in (INTENT_SLOT_REGISTRY.get(intent, {}).get("slots_config") or {}):
+        return INTENT_SLOT_REGISTRY[intent]["slots_config"][slot_name]
+    for data in INTENT_SLOT_REGISTRY.values():
+        if slot_name in (data.get("slots_config") or {}):
+            return data["slots_config"][slot_name]
+    return {}
+
+
+@pytest.mark.parametrize("intent", INTENTS)
+def test_slot_lists_match_legacy(intent):
+    required = list(legacy_entry(intent).get("required_slots", []))
+    optional = list(legacy_entry(intent).get("optional_slots", []))
+    order = [s for s in FOLLOW_UP_PRIORITY if s in required]
+    order += [s for s in FOLLOW_UP_PRIORITY if s in optional and s not in required]
+    assert list(get_required_slots(intent)) == required
+    assert list(get_optional_slots(intent)) == optional
+    assert list(get_follow_up_order(intent)) == order
+
+
+@pytest.mark.parametrize("intent", INTENTS)
+def test_slot_configs_match_legacy(intent):
+    for slot in SLOTS:
+        cfg = legacy_config(slot, intent)
+        assert {k: list(v) for k, v in get_slot_config(slot, intent).items()} == cfg, slot
+        templates = cfg.get("question_templates", ["Could you share that with me?"])
+        assert list(get_question_templates(slot, intent)) == templates, slot
+        assert list(get_refusal_phrases(slot, intent)) == cfg.get("refusal_phrases", []), slot
+
+
+def test_tables_are_immutable():
+    config = get_slot_config("caller_name", "new_project_sales")
+    with pytest.raises(TypeError):
+        config["refusal_phrases"] = ()
+    with pytest.raises(AttributeError):
+        config["refusal_phrases"].append("nope")
+    assert all(isinstance(v, tuple) for v in config.values())
+    assert isinstance(get_required_slots("new_project_sales"), tuple)
+    assert "nope" not in INTENT_SLOT_REGISTRY["new_project_sales"]["slots_config"]["caller_name"]["refusal_phrases"]
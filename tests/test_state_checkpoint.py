@@ -0,0 +1,70 @@
+"""Incremental state from a saved checkpoint: same state as replaying every turn (timestamps aside)."""
+
+import importlib
+
+import pytest
+
+from src.ingestion.payloads import IncomingChatPayload
+from src.ingestion.pipeline import load_state_checkpoint, process_chat
+from src.state import apply_turns, build_state_from_conversation
+from src.state.models import ConversationState
+
+router_module = importlib.import_module("src.ingestion.router")
+
+INTENT = "new_project_sales"
+SCRIPT = [
+    ("agent", "Hi! How can I help you today?"),
+    ("user", "Hi, I am looking for animation services for a 2 minute promo video."),
+    ("agent", "Great. What's your name and where are you based?"),
+    ("user", "My name is Priya and we're based in India."),
+    ("agent", "2D or 3D, and which platform?"),
+    ("user", "3D, for YouTube. Budget is around 50k and we need it by March."),
+    ("agent", "What's your budget range?"),
+    ("user", "I'd rather not say"),
+    ("user", "Can you reduce the price a bit, maybe 40 thousand?"),
+    ("agent", "Anything else?"),
+    ("user", "ok sure, thanks"),
+]
+
+
+def _turns(n: int) -> list[tuple[str, str]]:
+    return [SCRIPT[i % len(SCRIPT)] for i in range(n)]
+
+
+def _comparable(state: ConversationState) -> dict:
+    data = state.model_dump(mode="json", exclude={"updated_at", "last_question_at"})
+    for slot in data["slots"].values():
+        slot.pop("timestamp", None)
+    return data
+
+
+@pytest.mark.parametrize("n", range(1, 2 * len(SCRIPT)))
+def test_every_checkpoint_matches_full_replay(n):
+    turns = _turns(n)
+    full = _comparable(build_state_from_conversation("", turns, INTENT))
+    for k in range(n + 1):
+        saved = build_state_from_conversation("", turns[:k], INTENT).model_dump_json()
+        resumed = apply_turns(ConversationState.model_validate_json(saved), turns, INTENT, start=k)
+        assert _comparable(resumed) == full, k
+
+
+def test_state_endpoint_resumes_from_checkpoint(registry_db):
+    turns = [{"speaker_id": s, "text": t} for s, t in SCRIPT]
+    cid = process_chat(IncomingChatPayload(turns=turns, conversation_id="conv_ckpt"))
+    first = router_module.build_and_save_state(cid)
+    again = router_module.build_and_save_state(cid)
+    rebuilt = router_module.build_and_save_state(cid, rebuild=True)
+    assert (first["mode"], again["mode"], rebuilt["mode"]) == ("rebuild", "incremental", "rebuild")
+    assert (first["turns_replayed"], again["turns_replayed"]) == (len(SCRIPT), 0)
+    states = [ConversationState.model_validate(r["state"]) for r in (first, again, rebuilt)]
+    assert _comparable(states[1]) == _comparable(states[0]) == _comparable(states[2])
+
+
+def test_checkpoint_for_other_intent_or_more_turns_is_ignored(registry_db):
+    turns = [{"speaker_id": s, "text": t} for s, t in SCRIPT]
+    cid = process_chat(IncomingChatPayload(turns=turns, conversation_id="conv_ckpt"))
+    router_module.build_and_save_state(cid)
+    _, applied = load_state_checkpoint(cid, INTENT, len(SCRIPT))
+    assert applied == len(SCRIPT)
+    assert load_state_checkpoint(cid, "complaint_issue", len(SCRIPT)) is None
+    assert load_state_checkpoint(cid, INTENT, len(SCRIPT) - 1) is None
@@ -0,0 +1,84 @@
+"""State snapshot codec: encode → load round trips (snapshot and legacy JSON), registry storage."""
+
+import pytest
+
+from src.schemas import ChannelSource, SpeakerTurn
+from src.state import build_state_from_conversation, snapshot
+from src.state.models import ConversationStage, ConversationState, SlotStatus, SlotValue
+from src.state.slot_registry import INTENT_SLOT_REGISTRY
+from src.state.snapshot import encode_state, encode_state_json, load_state
+
+TURNS = [
+    ("user", "Hi, I am looking for animation services for a 2 minute promo video."),
+    ("agent", "Great. What's your name and where are you based?"),
+    ("user", "My name is Priya and we're based in India."),
+    ("user", "3D, for YouTube. Budget is around 50k and we need it by March."),
+]
+
+STATES = [build_state_from_conversation("", TURNS[:n], intent) for intent in INTENT_SLOT_REGISTRY for n in (0, 2, 4)]
+
+EDGE = ConversationState(
+    intent="not_in_code_table",
+    slots={
+        "caller_name": SlotValue(value="Ana", status=SlotStatus.FILLED, confidence=0.9, source="turn_1", timestamp="t1"),
+        "budget_or_range": SlotValue(status=SlotStatus.REFUSED, confidence=1.0),
+        "brand_new_slot": SlotValue(value={"nested": [1, 2]}, status=SlotStatus.FILLED),
+        "deadline": SlotValue(),
+    },
+    last_question_asked="brand_new_slot",
+    last_question_at="2026-01-01T00:00:00Z",
+    stage=ConversationStage.CONVERSATION_CLOSURE,
+    updated_at="2026-01-01T00:00:01Z",
+)
+
+
+@pytest.fixture(params=["json", "msgpack"])
+def body_format(request, monkeypatch):
+    """Run each case with the msgpack body (when installed) and the compact JSON fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(snapshot, "msgpack", None)
+    else:
+        pytest.importorskip("msgpack")
+    return request.param
+
+
+@pytest.mark.parametrize("state", STATES + [EDGE])
+def test_round_trip(state, body_format):
+    snap = load_state(encode_state(state))
+    assert snap.to_dict() == state.model_dump(mode="json")
+    assert snap.to_state() == state
+    assert snap.intent == state.intent and snap.stage == state.stage
+    for name in list(state.slots) + ["never_set"]:
+        assert tuple(snap.get_slot(name)) == tuple(state.get_slot(name).model_dump().values())
+
+
+@pytest.mark.parametrize("state", STATES + [EDGE])
+def test_legacy_json_loads_and_converts(state, body_format):
+    text = state.model_dump_json()
+    assert load_state(text).to_dict() == state.model_dump(mode="json")
+    assert load_state(text.encode()).to_dict() == state.model_dump(mode="json")
+    assert encode_state_json(text) == encode_state(state)
+
+
+def test_missing_slots_are_a_bare_code(body_format):
+    empty = ConversationState(slots={"caller_name": SlotValue(), "deadline": SlotValue()})
+    filled = ConversationState(slots={"caller_name": SlotValue(value="x", status=SlotStatus.FILLED), "deadline": SlotValue()})
+    assert len(encode_state(empty)) < len(encode_state(filled))
+
+
+@pytest.mark.parametrize("raw", [b"", b"\x00", b"\x01\x01\x02[]", b"\x00\x09\x02[]", b"\x00\x01\x07[]"])
+def test_unrecognized_bytes_raise(raw):
+    with pytest.raises(ValueError):
+        load_state(raw)
+
+
+def test_registry_stores_and_migrates(registry_db):
+    store = registry_db
+    store.register_conversation("conv_snap", ChannelSource.CHAT, [SpeakerTurn(speaker_id="user", text="hi")], "hi")
+    state = STATES[-1]
+    assert store.save_state_json("conv_snap", state.model_dump_json())
+    assert isinstance(store.get_state_snapshot("conv_snap"), str)
+    assert store.migrate_state_snapshots() == 1 and store.migrate_state_snapshots() == 0
+    raw = store.get_state_snapshot("conv_snap")
+    assert isinstance(raw, bytes) and load_state(raw).to_state() == state
+    assert ConversationState.model_validate_json(store.get_state_json("conv_snap")) == state